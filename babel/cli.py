@@ -22,12 +22,14 @@ import os
 from pathlib import Path
 from typing import Optional
 
-from .core.events import DualEventStore, EventType
+from .core.events import DualEventStore
 from .core.graph import GraphStore, Node
-from .services.extractor import Extractor
+from .services.extractor import Extractor, Proposal
 from .config import ConfigManager
 from .services.providers import get_provider, LLMResponse
+from .services.llm_cache import with_response_cache
 from .presentation.formatters import get_node_summary, generate_summary
+from .presentation.digest import use_digest_cache
 from .presentation.symbols import get_symbols, safe_print
 from .tracking.coherence import CoherenceChecker
 from .core.refs import RefStore
@@ -37,7 +39,8 @@ from .services.scanner import Scanner
 from .tracking.tensions import TensionTracker
 from .tracking.validation import ValidationTracker
 from .tracking.ambiguity import QuestionTracker
-from .core.resolver import IDResolver, ResolveStatus
+from .tracking.proposals import ProposalTracker
+from .core.resolver import IDResolver, ResolveStatus, PrefixIndex
 from .presentation.codec import IDCodec
 from .commands.review import ReviewCommand
 from .commands.capture import CaptureCommand
@@ -91,13 +94,20 @@ class IntentCLI:
         self.symbols = get_symbols(self.config.display.symbols)
 
         # Initialize extractor with configured provider and LLM callbacks
-        provider = get_provider(self.config)
+        # Identical prompts are answered from the local response cache
+        provider = with_response_cache(
+            get_provider(self.config),
+            self.events.local_dir / "llm_cache.db"
+        )
         self.provider = provider  # Store for scanner
+        self._llm_line_open = False  # Thinking indicator awaiting its newline
         self.extractor = Extractor(
             provider=provider,
             queue_path=self.babel_dir / "extraction_queue.jsonl",
             on_llm_start=self._on_llm_start,
-            on_llm_complete=self._on_llm_complete
+            on_llm_complete=self._on_llm_complete,
+            on_proposal=self._on_llm_proposal,
+            on_llm_progress=self._on_llm_progress
         )
         
         # Initialize lazy loader for token efficiency (with vocabulary)
@@ -130,15 +140,26 @@ class IntentCLI:
         # Initialize question tracker for ambiguity management (P10)
         self.questions = QuestionTracker(self.events)
 
+        # Initialize pending-proposal index for review (HC2)
+        self.proposals = ProposalTracker(self.events)
+
         # Initialize ID resolver for fuzzy artifact lookup
         self.resolver = IDResolver(self.graph)
 
-        # Initialize session-scoped ID codec for short aliases (AI operator ergonomics)
-        self.codec = IDCodec()
+        # Initialize ID codec for short aliases (AI operator ergonomics)
+        # Backed by the persistent code index in graph.db for O(1) decode
+        self.codec = IDCodec(index=self.graph)
+        self._code_index_behind = False
+        self.events.subscribe(self._on_event_appended)
+        atexit.register(self._flush_code_index)
 
         # Initialize memo manager for user preferences (P6: token efficiency)
         self.memos = MemoManager(self.babel_dir)
 
+        # Persist semantic digests so display never re-runs YAKE on unchanged text
+        self.digest_cache = use_digest_cache(self.events.local_dir / "snapshots" / "digests.json")
+        atexit.register(self.digest_cache.save)
+
         # Initialize task orchestrator for parallelization (lazy, respects config)
         self._orchestrator = None  # Lazy init on first use
         atexit.register(self._shutdown_orchestrator)
@@ -171,15 +192,33 @@ class IntentCLI:
         # Auto-sync and index on startup (graceful, no friction)
         self._auto_sync()
         self._ensure_indexed()
+        self._ensure_code_index()
 
     def _on_llm_start(self):
         """Callback when LLM call begins — show thinking indicator."""
         print(f"{self.symbols.llm_thinking} Analyzing...", end="", flush=True)
+        self._llm_line_open = True
+
+    def _on_llm_progress(self, done: int, total: int):
+        """Callback as concurrent LLM batches finish — update the indicator in place."""
+        end = "\n" if done == total else ""
+        print(f"\r{self.symbols.llm_thinking} Analyzing... {done}/{total} batches", end=end, flush=True)
+        self._llm_line_open = done != total
+
+    def _on_llm_proposal(self, proposal: Proposal):
+        """Callback per proposal while the LLM is still responding — preview it."""
+        if self._llm_line_open:
+            print()  # End the thinking indicator line
+            self._llm_line_open = False
+        summary = proposal.content.get("summary", "")
+        safe_print(f"  {self.symbols.proposed} {proposal.artifact_type}: {summary}")
 
     def _on_llm_complete(self, response: LLMResponse):
         """Callback when LLM call completes — show token usage."""
         token_info = response.format_tokens(self.symbols)
-        print(f"\r{self.symbols.llm_done} Done  {token_info}")
+        prefix = "\r" if self._llm_line_open else ""
+        self._llm_line_open = False
+        print(f"{prefix}{self.symbols.llm_done} Done  {token_info}")
 
     @property
     def orchestrator(self):
@@ -219,6 +258,39 @@ class IntentCLI:
         except Exception:
             pass  # Fail silently
     
+    def _ensure_code_index(self):
+        """
+        Catch the code index up with events appended since its watermark.
+
+        Events written by other processes (git hooks, background capture)
+        are picked up here; a rewritten event file triggers a full rebuild.
+        """
+        try:
+            new_events = self.events.read_since(self.graph.get_meta("code_index_watermark"))
+            if new_events is None:
+                self.graph.rebuild_code_index(self.events.read_all())
+            elif new_events:
+                self.graph.index_event_codes(new_events)
+            self.graph.set_meta("code_index_watermark", self.events.watermark())
+        except Exception:
+            pass  # Fail silently (index is rebuildable)
+
+    def _on_event_appended(self, event):
+        """
+        Index each appended event directly (one insert, no file reads).
+
+        The watermark is left behind and advanced once at exit, so a
+        batch append never re-reads the event files per event.
+        """
+        self.graph.index_event_codes([event])
+        self._code_index_behind = True
+
+    def _flush_code_index(self):
+        """Advance the code index watermark past this session's appends (atexit handler)."""
+        if self._code_index_behind:
+            self._code_index_behind = False
+            self._ensure_code_index()  # Re-inserts are ignored; also catches other writers
+
     def _rebuild_refs(self):
         """Rebuild refs index from events."""
         try:
@@ -230,11 +302,14 @@ class IntentCLI:
         """Rebuild graph from events."""
         # Clear and rebuild
         self.graph = GraphStore(self.babel_dir / "graph.db")
+        self.codec.index = self.graph
+        self.resolver.graph = self.graph
         for event in self.events.read_all():
             try:
                 self.graph._project_event(event)
             except Exception:
                 continue
+        self._ensure_code_index()
 
     # NOTE: Legacy why cache methods removed - now in commands/why.py
     # NOTE: _display_purpose() removed - now in commands/status.py
@@ -491,7 +566,7 @@ class IntentCLI:
 
         Args:
             query: User input (code alias, full ID, or prefix)
-            candidates: List of valid IDs to match against (auto-gathered if None)
+            candidates: Valid IDs to match against (list or PrefixIndex; code index if None)
             entity_type: For error messages (e.g., "proposal", "memo")
 
         Returns:
@@ -503,40 +578,28 @@ class IntentCLI:
 
         query = query.strip()
 
-        # Auto-gather candidates if not provided (convenience for alias-only resolution)
+        # No candidates: alias-only resolution via the persistent code index
         if candidates is None:
             # Only resolve alias codes when no candidates provided
             if not self.codec.is_short_code(query):
                 return query  # Passthrough non-alias input
 
-            # Gather candidates from events and graph nodes
-            candidates = []
-            candidates.extend(e.id for e in self.events.read_all())
-            for node_type in ["decision", "constraint", "purpose", "principle",
-                              "requirement", "boundary", "tension"]:
-                candidates.extend(n.id for n in self.graph.get_nodes_by_type(node_type))
-
-            # Decode alias and return (passthrough if not found)
-            resolved = self.codec.decode(query, candidates)
-            return resolved  # Returns original if not found
+            # Unique hit decodes; unknown or colliding codes pass through
+            # so IDResolver can report them (not found / ambiguous)
+            return self.codec.decode(query)
 
         # 1. Codec alias resolution (AA-BB pattern)
         if self.codec.is_short_code(query):
-            resolved = self.codec.decode(query, candidates)
-            if resolved != query:  # Successfully decoded
-                return resolved
-
-        # 2. Exact match
-        if query in candidates:
-            return query
+            matches = self.codec.matches(query, candidates)
+            if len(matches) == 1:
+                return matches[0]
+            if len(matches) > 1:
+                return None  # Code collision within candidates: ambiguous
 
-        # 3. Prefix match
-        matches = [c for c in candidates if c.startswith(query)]
-        if len(matches) == 1:
-            return matches[0]
-
-        # Ambiguous or not found
-        return None
+        # 2-3. Exact or unique prefix match (bisect on sorted IDs)
+        # Callers resolving many queries pass a prebuilt PrefixIndex
+        index = candidates if isinstance(candidates, PrefixIndex) else PrefixIndex(candidates)
+        return index.resolve(query)  # None if ambiguous or not found
 
     def render(self, spec: 'OutputSpec', format: str = 'auto', full: bool = False) -> str:
         """
@@ -633,21 +696,13 @@ class IntentCLI:
         if not resolved_query:
             return False, None
 
-        # Get all proposal events
-        proposed_events = self.events.read_by_type(EventType.STRUCTURE_PROPOSED)
-
-        # Get confirmed and rejected IDs
-        confirmed_events = self.events.read_by_type(EventType.ARTIFACT_CONFIRMED)
-        confirmed_ids = {e.data.get('proposal_id') for e in confirmed_events}
-
-        rejected_events = self.events.read_by_type(EventType.PROPOSAL_REJECTED)
-        rejected_ids = {e.data.get('proposal_id') for e in rejected_events}
+        # Exact ID: direct lookup in the pending-proposal index
+        proposal = self.proposals.get_pending_proposal(resolved_query)
+        if proposal:
+            return True, proposal
 
         # Check if query matches any pending proposal
-        for proposal in proposed_events:
-            if proposal.id in confirmed_ids or proposal.id in rejected_ids:
-                continue  # Not pending
-
+        for proposal in self.proposals.get_pending():
             # Check by full ID, prefix, or alias code
             proposal_code = self.codec.encode(proposal.id)
             if (proposal.id == resolved_query or
@@ -116,6 +116,11 @@ class BaseCommand:
         """Question tracker for ambiguity (P10)."""
         return self._cli.questions
 
+    @property
+    def proposals(self):
+        """Proposal tracker for pending review (HC2)."""
+        return self._cli.proposals
+
     @property
     def resolver(self):
         """ID resolver for fuzzy artifact lookup."""
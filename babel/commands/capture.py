@@ -6,6 +6,7 @@ Supports batch mode (HC2) for queuing proposals for later review.
 """
 
 import re
+from functools import cached_property
 from typing import List, Dict, Optional
 
 from ..commands.base import BaseCommand
@@ -15,34 +16,44 @@ from ..core.events import (
     add_specification
 )
 from ..core.scope import EventScope
+from ..core.horizon import estimate_tokens
 from ..tracking.ambiguity import detect_uncertainty
 from ..presentation.symbols import safe_print
 from ..presentation.template import OutputTemplate
 
 
-class CaptureCommand(BaseCommand):
+class ExistingArtifactCache:
     """
-    Command for capturing conversations and extracting artifacts.
+    Summaries of confirmed artifacts, kept current from the event watermark.
 
-    Supports:
-    - Raw conversation capture with domain attribution (P3)
-    - Cross-domain reference detection (P10)
-    - Uncertainty flagging (P6)
-    - Batch mode for deferred review (HC2)
-    - Context-aware extraction to prevent duplicates (P7)
+    Each refresh folds in only confirmations appended since the stored
+    watermark; a rewritten history (sync, promote, merge) rebuilds it.
     """
 
-    def _get_existing_artifacts(self) -> List[ExistingArtifact]:
-        """
-        Gather existing confirmed artifacts for context injection.
-
-        Used to prevent duplicate extraction (P7: Evidence-Weighted Memory).
-        Returns summaries only - full content not needed for deduplication.
-        """
-        existing = []
-
-        # Get confirmed artifacts using type-indexed cache (O(1) vs O(n))
-        for event in self.events.read_by_type(EventType.ARTIFACT_CONFIRMED):
+    def __init__(self):
+        self.artifacts: List[ExistingArtifact] = []
+        self.watermark = None
+
+    def refresh(self, events) -> List[ExistingArtifact]:
+        """Catch up with the event store; returns a copy of the summaries."""
+        if not hasattr(events, "watermark"):
+            # Store without watermarks: rebuild every time
+            self.artifacts = []
+            self._add(events.read_by_type(EventType.ARTIFACT_CONFIRMED))
+            return list(self.artifacts)
+
+        mark = events.watermark()
+        if mark != self.watermark:
+            new_events = events.read_since(self.watermark, until=mark)
+            if new_events is None:
+                self.artifacts = []
+                new_events = events.read_by_type(EventType.ARTIFACT_CONFIRMED)
+            self._add(e for e in new_events if e.type == EventType.ARTIFACT_CONFIRMED)
+            self.watermark = mark
+        return list(self.artifacts)
+
+    def _add(self, confirmed):
+        for event in confirmed:
             data = event.data
             artifact_type = data.get('artifact_type', 'unknown')
 
@@ -56,13 +67,43 @@ class CaptureCommand(BaseCommand):
                 summary = str(content)[:100]
 
             if summary:
-                existing.append(ExistingArtifact(
+                self.artifacts.append(ExistingArtifact(
                     artifact_type=artifact_type,
                     summary=summary,
-                    artifact_id=event.id
+                    artifact_id=event.id,
+                    tokens=estimate_tokens(summary)
                 ))
 
-        return existing
+
+class CaptureCommand(BaseCommand):
+    """
+    Command for capturing conversations and extracting artifacts.
+
+    Supports:
+    - Raw conversation capture with domain attribution (P3)
+    - Cross-domain reference detection (P10)
+    - Uncertainty flagging (P6)
+    - Batch mode for deferred review (HC2)
+    - Context-aware extraction to prevent duplicates (P7)
+    """
+
+    @cached_property
+    def _existing(self) -> ExistingArtifactCache:
+        """Existing-artifact context of this command instance."""
+        return ExistingArtifactCache()
+
+    def _get_existing_artifacts(self) -> List[ExistingArtifact]:
+        """
+        Gather existing confirmed artifacts for context injection.
+
+        Used to prevent duplicate extraction (P7: Evidence-Weighted Memory).
+        Returns summaries only - full content not needed for deduplication.
+
+        The list is cached per command: confirmations appended since the
+        last call are added to it; a rewritten history (e.g. after sync)
+        rebuilds it.
+        """
+        return self._existing.refresh(self.events)
 
     def capture(
         self,
@@ -286,35 +286,23 @@ class CoherenceCommand(BaseCommand):
         # Check if orchestrator is available and enabled
         orchestrator = self.orchestrator
         if orchestrator and orchestrator.enabled and len(issues) > 1:
-            # Use parallel execution for multiple issues
-            from ..orchestrator import io_task, Priority
-
+            # Concurrent LLM calls on the orchestrator's event loop
+            # (BABEL_LLM_CONCURRENT at a time, no thread per waiting call)
             print(f"  (Parallelizing {len(issues)} LLM calls...)")
 
-            # Submit all suggestion requests as I/O tasks (LLM calls)
-            futures = []
-            for entity in issues:
-                task = io_task(
-                    fn=self.coherence.suggest_resolution,
-                    args=(entity,),
-                    priority=Priority.HIGH,
-                    name=f"suggest_{self._cli.codec.encode(entity.id)}",
-                    timeout=30.0,
-                    is_llm_call=True  # Rate limit applies to LLM calls
+            try:
+                results = orchestrator.map_async(
+                    self.coherence.asuggest_resolution,
+                    issues,
+                    item_timeout=30.0,
+                    return_exceptions=True
                 )
-                future = orchestrator.submit(task)
-                futures.append((entity.id, future))
+            except Exception:
+                results = [None] * len(issues)
 
-            # Collect results
-            for entity_id, future in futures:
-                try:
-                    result = future.result(timeout=35.0)
-                    if result.success:
-                        suggestions[entity_id] = result.result
-                    else:
-                        suggestions[entity_id] = None
-                except Exception:
-                    suggestions[entity_id] = None
+            for entity, result in zip(issues, results):
+                # Timed-out or failed calls: no suggestion
+                suggestions[entity.id] = None if isinstance(result, BaseException) else result
         else:
             # Sequential fallback
             for entity in issues:
@@ -732,7 +720,7 @@ class CoherenceCommand(BaseCommand):
         })
 
         # Run verification
-        results = self.scanner.verify_findings(scan_type)
+        results = self.scanner.verify_findings(scan_type, orchestrator=self.orchestrator)
 
         verified_true = results.get("verified_true", 0)
         verified_false = results.get("verified_false", 0)
@@ -748,6 +736,12 @@ class CoherenceCommand(BaseCommand):
         # Summary section
         summary_lines = [
             f"Verified: {total} findings",
+        ]
+        if results.get("files"):
+            summary_lines.append(
+                f"Files: {results['files']} ({results['files_per_sec']:.1f} files/sec)"
+            )
+        summary_lines += [
             "",
             f"{symbols.check_pass} True positives (safe to remove): {verified_true}",
             f"{symbols.check_warn} False positives (actually used): {verified_false}",
@@ -797,7 +791,9 @@ class CoherenceCommand(BaseCommand):
         })
 
         # Run removal (with automatic test execution)
-        result = self.scanner.remove_verified_imports(scan_type, run_tests=True)
+        result = self.scanner.remove_verified_imports(
+            scan_type, run_tests=True, orchestrator=self.orchestrator
+        )
 
         # Handle test failure (auto-reverted)
         test_results = result.get("test_results")
@@ -865,6 +861,16 @@ class CoherenceCommand(BaseCommand):
             ]
             if test_results.get("test_files"):
                 test_lines.append(f"Test files:   {len(test_results['test_files'])}")
+            reverted = result.get("reverted_files") or []
+            if reverted:
+                test_lines[0] = f"{symbols.check_warn} Tests Failed for {len(reverted)} file(s) - reverted"
+                test_lines.append(f"Tests failed: {test_results['tests_failed']}")
+                for file_path in reverted[:10]:
+                    try:
+                        rel_path = Path(file_path).relative_to(Path.cwd())
+                    except ValueError:
+                        rel_path = file_path
+                    test_lines.append(f"  - {rel_path} (reverted, findings kept)")
             template.section("TESTS", "\n".join(test_lines))
 
         # Auto-capture per file (one capture per modified file)
@@ -48,7 +48,7 @@ class ConfigCommand(BaseCommand):
 
         print(f"Processing {queued} queued item(s)...\n")
 
-        proposals = self.extractor.process_queue()
+        proposals = self.extractor.process_queue(orchestrator=self.orchestrator)
 
         if not proposals:
             print("No artifacts extracted from queued items.")
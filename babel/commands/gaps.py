@@ -15,6 +15,7 @@ from typing import List, Dict, Set
 
 from ..commands.base import BaseCommand
 from ..core.commit_links import CommitLinkStore
+from ..core.resolver import PrefixIndex
 from ..services.git import GitIntegration
 from ..presentation.template import OutputTemplate
 from ..presentation.formatters import format_timestamp
@@ -166,6 +167,9 @@ class GapsCommand(BaseCommand):
         if not output:
             return []
 
+        # Sorted SHA index: abbreviated/full SHA overlap in O(log n) per commit
+        linked_index = PrefixIndex(linked_shas)
+
         for line in output.strip().split('\n'):
             if '|' not in line:
                 continue
@@ -174,11 +178,8 @@ class GapsCommand(BaseCommand):
                 continue
             sha, date, message = parts
 
-            # Check if linked
-            is_linked = any(
-                sha.startswith(linked_sha) or linked_sha.startswith(sha)
-                for linked_sha in linked_shas
-            )
+            # Check if linked (either SHA may be abbreviated)
+            is_linked = linked_index.overlaps(sha)
 
             if not is_linked:
                 # Skip merge commits and trivial commits
@@ -19,8 +19,8 @@ Architecture:
 
 import ast
 import json
-import subprocess
 from collections import Counter
+from functools import cached_property
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
@@ -29,6 +29,7 @@ from ..commands.base import BaseCommand
 from ..presentation.symbols import safe_print
 from ..presentation.template import OutputTemplate
 from ..core.symbols import CodeSymbolStore
+from ..core.git_access import GitAccess
 
 
 class MapCommand(BaseCommand):
@@ -62,21 +63,15 @@ Last updated: {timestamp}
     # Git-Native File Operations
     # -------------------------------------------------------------------------
 
+    @cached_property
+    def _git(self) -> GitAccess:
+        """Git access shared by this command run (HEAD lookups use cat-file)."""
+        return GitAccess(self.project_dir)
+
     def _git_command(self, args: List[str], timeout: int = 30) -> Optional[str]:
         """Run a git command and return stdout, or None on failure."""
-        try:
-            result = subprocess.run(
-                ['git'] + args,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        output = self._git.run(args, timeout=timeout)
+        return output.strip() if output is not None else None
 
     def _get_tracked_files(self) -> List[Path]:
         """
@@ -408,7 +403,7 @@ Last updated: {timestamp}
         cache["last_update"] = datetime.now().isoformat()
 
         # Store current HEAD commit
-        head = self._git_command(['rev-parse', 'HEAD'])
+        head = self._git.head()
         if head:
             cache["commit_hash"] = head
 
@@ -426,7 +421,7 @@ Last updated: {timestamp}
         if not cached_commit:
             return True, "No cache found"
 
-        current_commit = self._git_command(['rev-parse', 'HEAD'])
+        current_commit = self._git.head()
         if not current_commit:
             return True, "Cannot get current commit"
 
@@ -10,11 +10,13 @@ HC2 preserved: Human approves themes (directional decisions),
 not individual atoms (micro-management).
 """
 
+from typing import Optional
 
 from .base import BaseCommand
 from ..core.events import Event, EventType, confirm_artifact, reject_proposal, require_negotiation
 from ..core.scope import EventScope
 from ..core.graph import Edge
+from ..core.resolver import PrefixIndex
 from ..presentation.formatters import generate_summary, format_timestamp
 from ..presentation.symbols import get_symbols, TableRenderer, safe_print
 from ..presentation.template import OutputTemplate
@@ -36,7 +38,9 @@ class ReviewCommand(BaseCommand):
         reject_ids: list = None,
         reject_reason: str = None,
         list_rejected: bool = False,
-        output_format: str = None
+        output_format: str = None,
+        limit: int = 0,
+        offset: int = 0
     ):
         """
         Review pending proposals.
@@ -45,7 +49,7 @@ class ReviewCommand(BaseCommand):
         Decisions are auto-registered for validation tracking.
 
         Non-interactive modes (AI-safe):
-            --list: Show proposals without prompting
+            --list: Show proposals without prompting (--limit/--offset to page)
             --accept <id>: Accept specific proposal(s) by ID
             --accept-all: Accept all proposals at once
             --reject <id>: Reject specific proposal(s) by ID with reason
@@ -62,9 +66,9 @@ class ReviewCommand(BaseCommand):
             self._list_rejected(symbols)
             return
 
-        pending = self._get_pending_proposals()
+        total = self.proposals.count_pending()
 
-        if not pending:
+        if not total:
             print("No pending proposals to review.")
             print("Queue proposals with: babel capture \"text\" --batch")
             from ..output import end_command
@@ -73,11 +77,15 @@ class ReviewCommand(BaseCommand):
 
         # Non-interactive modes (AI-safe)
         if list_only:
+            # Only the requested page is materialized
+            page = self._get_pending_proposals(offset=offset, limit=limit or None)
             if output_format:
-                return self._list_proposals_as_output(pending)
-            self._list_proposals(pending, symbols)
+                return self._list_proposals_as_output(page, total=total, offset=offset)
+            self._list_proposals(page, symbols, total=total, offset=offset)
             return
 
+        pending = self._get_pending_proposals()
+
         if accept_ids:
             self._accept_by_ids(pending, accept_ids, symbols)
             return
@@ -350,11 +358,25 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
 
         try:
             print(f"{symbols.llm_thinking} Synthesizing themes...", end="", flush=True)
-            response = self.provider.complete(system_prompt, user_prompt, max_tokens=500)
+
+            # Parse themes line by line as the response streams in
+            themes = []
+            buffer = ""
+            for chunk in self.provider.complete_stream(system_prompt, user_prompt, max_tokens=500):
+                if not isinstance(chunk, str):
+                    continue  # Final usage record
+                *lines, buffer = (buffer + chunk).split('\n')
+                for line in lines:
+                    theme = self._parse_theme_line(line.strip(), pending)
+                    if theme:
+                        themes.append(theme)
+                        print(f"\r{symbols.llm_thinking} Synthesizing themes... {len(themes)}",
+                              end="", flush=True)
+            theme = self._parse_theme_line(buffer.strip(), pending)
+            if theme:
+                themes.append(theme)
             print(f"{symbols.llm_done} Done")
 
-            # Parse response into themes
-            themes = self._parse_theme_response(response.text, pending)
             return themes if themes else None
 
         except Exception as e:
@@ -365,95 +387,101 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
         """Parse LLM response into theme structures."""
         themes = []
         for line in response_text.strip().split('\n'):
-            if line.startswith('THEME:'):
-                parts = line[6:].strip().split('|')
-                if len(parts) >= 6:
-                    # Full format: name|impact|risk|recommendation|rationale|numbers
-                    name = parts[0].strip()
-                    description = parts[1].strip()
-                    risk = parts[2].strip().lower()
-                    if risk not in ('low', 'medium', 'high'):
-                        risk = 'medium'
-                    recommendation = parts[3].strip().capitalize()
-                    if recommendation not in ('Accept', 'Review', 'Defer', 'Caution'):
-                        recommendation = 'Review'
-                    rationale = parts[4].strip()
-
-                    try:
-                        numbers = [int(n.strip()) for n in parts[5].split(',')]
-                        theme_proposals = [pending[n-1] for n in numbers if 1 <= n <= len(pending)]
-                    except (ValueError, IndexError):
-                        theme_proposals = []
-
-                    if theme_proposals:
-                        themes.append({
-                            'name': name,
-                            'description': description,
-                            'risk': risk,
-                            'recommendation': recommendation,
-                            'rationale': rationale,
-                            'proposals': theme_proposals
-                        })
-                elif len(parts) >= 4:
-                    # Fallback: old format without recommendation
-                    name = parts[0].strip()
-                    description = parts[1].strip()
-                    risk = parts[2].strip().lower()
-                    if risk not in ('low', 'medium', 'high'):
-                        risk = 'medium'
-
-                    try:
-                        numbers = [int(n.strip()) for n in parts[3].split(',')]
-                        theme_proposals = [pending[n-1] for n in numbers if 1 <= n <= len(pending)]
-                    except (ValueError, IndexError):
-                        theme_proposals = []
-
-                    if theme_proposals:
-                        themes.append({
-                            'name': name,
-                            'description': description,
-                            'risk': risk,
-                            'recommendation': 'Review',
-                            'rationale': 'No rationale provided',
-                            'proposals': theme_proposals
-                        })
+            theme = self._parse_theme_line(line, pending)
+            if theme:
+                themes.append(theme)
         return themes
 
+    def _parse_theme_line(self, line: str, pending: list) -> Optional[dict]:
+        """Parse one THEME line into a theme structure (None if not a usable theme)."""
+        if not line.startswith('THEME:'):
+            return None
+        parts = line[6:].strip().split('|')
+        if len(parts) >= 6:
+            # Full format: name|impact|risk|recommendation|rationale|numbers
+            name = parts[0].strip()
+            description = parts[1].strip()
+            risk = parts[2].strip().lower()
+            if risk not in ('low', 'medium', 'high'):
+                risk = 'medium'
+            recommendation = parts[3].strip().capitalize()
+            if recommendation not in ('Accept', 'Review', 'Defer', 'Caution'):
+                recommendation = 'Review'
+            rationale = parts[4].strip()
+
+            try:
+                numbers = [int(n.strip()) for n in parts[5].split(',')]
+                theme_proposals = [pending[n-1] for n in numbers if 1 <= n <= len(pending)]
+            except (ValueError, IndexError):
+                theme_proposals = []
+
+            if theme_proposals:
+                return {
+                    'name': name,
+                    'description': description,
+                    'risk': risk,
+                    'recommendation': recommendation,
+                    'rationale': rationale,
+                    'proposals': theme_proposals
+                }
+        elif len(parts) >= 4:
+            # Fallback: old format without recommendation
+            name = parts[0].strip()
+            description = parts[1].strip()
+            risk = parts[2].strip().lower()
+            if risk not in ('low', 'medium', 'high'):
+                risk = 'medium'
+
+            try:
+                numbers = [int(n.strip()) for n in parts[3].split(',')]
+                theme_proposals = [pending[n-1] for n in numbers if 1 <= n <= len(pending)]
+            except (ValueError, IndexError):
+                theme_proposals = []
+
+            if theme_proposals:
+                return {
+                    'name': name,
+                    'description': description,
+                    'risk': risk,
+                    'recommendation': 'Review',
+                    'rationale': 'No rationale provided',
+                    'proposals': theme_proposals
+                }
+        return None
+
     # -------------------------------------------------------------------------
     # Proposal management
     # -------------------------------------------------------------------------
 
-    def _get_pending_proposals(self):
+    def _get_pending_proposals(self, offset: int = 0, limit: int = None):
         """
         Get proposals awaiting review.
 
         Returns proposals that have STRUCTURE_PROPOSED but no ARTIFACT_CONFIRMED
-        and no PROPOSAL_REJECTED.
-        """
-        # Get all proposal events
-        proposed_events = self.events.read_by_type(EventType.STRUCTURE_PROPOSED)
+        and no PROPOSAL_REJECTED, oldest first. Served from the pending-proposal
+        index (see tracking/proposals.py) instead of diffing event types.
 
-        # Get all confirmed proposal IDs
-        confirmed_events = self.events.read_by_type(EventType.ARTIFACT_CONFIRMED)
-        confirmed_ids = {e.data.get('proposal_id') for e in confirmed_events}
-
-        # Get all rejected proposal IDs
-        rejected_events = self.events.read_by_type(EventType.PROPOSAL_REJECTED)
-        rejected_ids = {e.data.get('proposal_id') for e in rejected_events}
-
-        # Filter to pending (not confirmed and not rejected)
-        pending = [e for e in proposed_events
-                   if e.id not in confirmed_ids and e.id not in rejected_ids]
-
-        return pending
+        Args:
+            offset: Number of proposals to skip
+            limit: Maximum proposals to return (None = all)
+        """
+        return self.proposals.get_pending(offset=offset, limit=limit)
 
-    def _list_proposals(self, pending: list, symbols):
+    def _list_proposals(self, pending: list, symbols, total: int = None, offset: int = 0):
         """
         List proposals without prompting (AI-safe).
 
-        Shows all pending proposals with IDs for use with --accept.
+        Shows pending proposals with IDs for use with --accept.
         Dual-Display: [ID] + readable summary for comprehension AND action.
+
+        Args:
+            pending: Proposals to show (one page when paginated)
+            symbols: Display symbols
+            total: Total pending count (defaults to len(pending))
+            offset: Position of the first shown proposal
         """
+        total = len(pending) if total is None else total
+
         # Build template
         template = OutputTemplate(symbols=symbols)
         template.header("BABEL REVIEW", "Pending Proposals (HC2: Human Authority)")
@@ -474,13 +502,21 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
 
             # Dual-Display: [ID alias] [TYPE] summary (P12: timestamp)
             time_str = f" ({format_timestamp(proposal_event.timestamp)})" if proposal_event.timestamp else ""
-            proposal_lines.append(f"{i+1}. {formatted_id} [{artifact_type.upper()}] {summary}{time_str}")
+            proposal_lines.append(f"{offset+i+1}. {formatted_id} [{artifact_type.upper()}] {summary}{time_str}")
             if rationale:
                 rationale_display = rationale[:80] + ('...' if len(rationale) > 80 else '')
                 proposal_lines.append(f"   WHY: {rationale_display}")
             proposal_lines.append("")
 
-        template.section(f"PROPOSALS ({len(pending)} pending)", "\n".join(proposal_lines))
+        if not pending and total:
+            # Offset past the end: no range to show
+            proposal_lines.append(f"No proposals at offset {offset} ({total} pending)")
+            proposal_lines.append("-> First page: babel review --list")
+        elif len(pending) < total:
+            proposal_lines.append(f"Showing {offset + 1}-{offset + len(pending)} of {total}")
+            if offset + len(pending) < total:
+                proposal_lines.append(f"-> Next: babel review --list --limit {len(pending)} --offset {offset + len(pending)}")
+        template.section(f"PROPOSALS ({total} pending)", "\n".join(proposal_lines))
 
         # Actions section
         actions = [
@@ -497,15 +533,16 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
 
         # Footer with succession hint
         has_decisions = any(p.data.get('proposed', {}).get('type') == 'decision' for p in pending)
-        template.footer(f"{len(pending)} proposal(s) awaiting review")
+        template.footer(f"{total} proposal(s) awaiting review")
 
         output = template.render(command="review", context={"has_decisions": has_decisions})
         print(output)
 
-    def _list_proposals_as_output(self, pending: list):
-        """Return proposal list as OutputSpec for rendering."""
+    def _list_proposals_as_output(self, pending: list, total: int = None, offset: int = 0):
+        """Return proposal list (or one page of it) as OutputSpec for rendering."""
         from babel.output import OutputSpec
 
+        total = len(pending) if total is None else total
         rows = []
         for i, proposal_event in enumerate(pending):
             content = proposal_event.data.get('proposed', {})
@@ -514,7 +551,7 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
             rationale = content.get('rationale', '')
 
             rows.append({
-                "n": i + 1,
+                "n": offset + i + 1,
                 "code": self._cli.codec.encode(proposal_event.id),
                 "type": artifact_type.upper(),
                 "summary": generate_summary(summary),
@@ -532,8 +569,11 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
             shape="table",
             columns=["#", "ID", "Type", "Summary", "Rationale"],
             column_keys=["n", "id", "type", "summary", "rationale"],
-            title=f"{len(pending)} proposal(s) pending",
-            empty_message="No pending proposals to review.",
+            title=f"{total} proposal(s) pending",
+            empty_message=(
+                f"No proposals at offset {offset} ({total} pending)" if total
+                else "No pending proposals to review."
+            ),
             command="review",
             context={"has_decisions": has_decisions}
         )
@@ -560,8 +600,8 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
         not_found = []
         accepted_lines = []
 
-        # Build candidate list for centralized resolution
-        candidate_ids = [p.id for p in pending]
+        # Build prefix index once for centralized resolution of every ID
+        candidate_ids = PrefixIndex(p.id for p in pending)
         pending_by_id = {p.id: p for p in pending}
 
         for accept_id in accept_ids:
@@ -670,8 +710,8 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
         not_found = []
         rejected_lines = []
 
-        # Build candidate list for centralized resolution
-        candidate_ids = [p.id for p in pending]
+        # Build prefix index once for centralized resolution of every ID
+        candidate_ids = PrefixIndex(p.id for p in pending)
         pending_by_id = {p.id: p for p in pending}
 
         for reject_id in reject_ids:
@@ -829,23 +869,21 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
         # Auto-register decisions for validation tracking
         node_id = None
         if artifact_type == 'decision':
-            # Find the node ID from the graph projection
-            nodes = self.graph.get_nodes_by_type('decision')
-            for node in nodes:
-                if node.content.get('summary') == summary:
-                    node_id = node.id
-                    self.validation.register_decision(node_id, summary)
-
-                    # Auto-link to active purpose (reduce unlinked artifacts)
-                    active_purpose = self._cli._get_active_purpose()
-                    if active_purpose:
-                        self.graph.add_edge(Edge(
-                            source_id=active_purpose.id,
-                            target_id=node_id,
-                            relation="supports",
-                            event_id=confirm_event.id
-                        ))
-                    break
+            # Node projected from the confirmation (direct lookup, no type scan)
+            node = self.graph.get_node(f"{artifact_type}_{confirm_event.id}")
+            if node:
+                node_id = node.id
+                self.validation.register_decision(node_id, summary)
+
+                # Auto-link to active purpose (reduce unlinked artifacts)
+                active_purpose = self._cli._get_active_purpose()
+                if active_purpose:
+                    self.graph.add_edge(Edge(
+                        source_id=active_purpose.id,
+                        target_id=node_id,
+                        relation="supports",
+                        event_id=confirm_event.id
+                    ))
 
         # Check for requires_negotiation (artifact touches constrained area)
         # HC2: Warn but proceed - AI surfaces, human decides at their pace
@@ -989,11 +1027,19 @@ THEME: breaking-api-change | Old endpoints removed, clients must update | high |
         if not artifact_keywords:
             return {'required': False, 'constraint_ids': [], 'severity': None}
 
+        # Constraint keywords are extracted once per constraint, not once
+        # per confirmed proposal (--accept-all confirms many in one run)
+        keyword_cache = getattr(self, '_constraint_keywords', None)
+        if keyword_cache is None:
+            keyword_cache = self._constraint_keywords = {}
+
         # Check for overlap with constraint keywords
         overlapping_constraints = []
         for constraint in constraints:
             constraint_text = constraint.content.get('summary', '')
-            constraint_keywords = set(_extract_keywords(constraint_text))
+            constraint_keywords = keyword_cache.get(constraint.id)
+            if constraint_keywords is None:
+                constraint_keywords = keyword_cache[constraint.id] = set(_extract_keywords(constraint_text))
 
             overlap = artifact_keywords & constraint_keywords
             if overlap and len(overlap) >= 2:  # Meaningful overlap (2+ keywords)
@@ -1100,6 +1146,10 @@ def register_parser(subparsers):
                     help='List rejected proposals with reasons (P8: learn from rejections)')
     p1.add_argument('--format', '-f', choices=['auto', 'table', 'list', 'json'],
                     help='Output format for --list (overrides config)')
+    p1.add_argument('--limit', type=int, default=0, metavar='N',
+                    help='With --list: show at most N proposals (default: all)')
+    p1.add_argument('--offset', type=int, default=0, metavar='N',
+                    help='With --list: skip the first N proposals (for pagination)')
 
     # share command
     p2 = subparsers.add_parser('share', help='Share a local event with team')
@@ -1126,7 +1176,9 @@ def handle(cli, args):
             reject_ids=args.reject,
             reject_reason=args.reason,
             list_rejected=args.rejected,
-            output_format=getattr(args, 'format', None)
+            output_format=getattr(args, 'format', None),
+            limit=getattr(args, 'limit', 0),
+            offset=getattr(args, 'offset', 0)
         )
     elif args.command == 'share':
         cli.share(args.event_id)
@@ -11,14 +11,24 @@ Handles project status overview with:
 - Project health computation (adaptive pace guidance)
 """
 
+import sqlite3
+from typing import Optional
+
 from ..commands.base import BaseCommand
-from ..core.events import EventType
+from ..core.events import Event, EventType
 from ..core.commit_links import CommitLinkStore
 from ..presentation.formatters import generate_summary, format_timestamp
 from ..presentation.template import OutputTemplate
-from ..tracking.coherence import format_coherence_status
-from ..tracking.principles import PrincipleChecker, format_principles_summary
+from ..tracking.coherence import CoherenceResult, format_coherence_status
+from ..tracking.principles import PrincipleCheck, PrincipleChecker, PrincipleResult, format_principles_summary
+from ..tracking.ambiguity import QuestionTracker
+from ..tracking.proposals import ProposalTracker
+from ..tracking.summary import StatusSection, StatusSummary
+from ..tracking.tensions import TensionTracker
+from ..tracking.validation import ValidationTracker
 from ..services.providers import get_provider_status
+from ..services.llm_cache import CachedProvider
+from ..services.scan_store import ScanStore
 from ..services.git import GitIntegration
 
 
@@ -48,7 +58,7 @@ class StatusCommand(BaseCommand):
 
         # For JSON format, collect structured data and render via output system
         if format == "json":
-            data = self._collect_status_data(full=full, git=git)
+            data = self._collect_status_data(full=full, git=git, refresh=force)
             from ..output import OutputSpec, render
             spec = OutputSpec(
                 data=data,
@@ -64,9 +74,10 @@ class StatusCommand(BaseCommand):
         symbols = self.symbols
         template = OutputTemplate(symbols=symbols, full=full)
 
-        # Collect data
+        # Collect data (materialized summary - recomputed only when events moved)
+        summary = self._summary(refresh=force)
         stats = self.graph.stats()
-        shared_count, local_count = self.events.count_by_scope()
+        shared_count, local_count = summary["shared_events"], summary["local_events"]
         total_events = shared_count + local_count
         orphans = stats['orphans']
 
@@ -102,7 +113,7 @@ class StatusCommand(BaseCommand):
         template.section("PROJECT METRICS", "\n".join(metrics_lines))
 
         # === PURPOSES SECTION ===
-        all_purposes_count = len(self.graph.get_nodes_by_type('purpose'))
+        all_purposes_count = summary["purposes"]
         if limit_purposes > 0:
             purposes = self.graph.get_nodes_by_type_recent('purpose', limit=limit_purposes)
         else:
@@ -117,7 +128,7 @@ class StatusCommand(BaseCommand):
             template.section("ACTIVE PURPOSES", "\n".join(purpose_lines))
 
         # === COHERENCE SECTION ===
-        last_result = self.coherence.get_last_result()
+        last_result = self._coherence_result(summary)
         coherence_lines = []
         if last_result:
             coherence_lines.append(format_coherence_status(last_result, symbols, full=full))
@@ -133,18 +144,17 @@ class StatusCommand(BaseCommand):
         status_lines = []
 
         # Commits
-        commits = self.events.read_by_type(EventType.COMMIT_CAPTURED)
-        if commits:
-            status_lines.append(f"Commits captured: {len(commits)}")
+        if summary["commits_captured"]:
+            status_lines.append(f"Commits captured: {summary['commits_captured']}")
 
         # Tensions (P4)
-        open_tensions = self.tensions.count_open()
+        open_tensions = summary["open_tensions"]
         if open_tensions > 0:
             status_lines.append(f"{symbols.tension} Open Tensions: {open_tensions}")
             status_lines.append(f"  Run: babel tensions")
 
         # Validation (P9)
-        validation_stats = self.validation.stats()
+        validation_stats = summary["validation"]
         if validation_stats["tracked"] > 0:
             partial = validation_stats["partial"]
             validated = validation_stats["validated"]
@@ -162,7 +172,7 @@ class StatusCommand(BaseCommand):
                 status_lines.append(f"{symbols.validated} Validation: {validated} decisions validated (have both consensus + evidence)")
 
         # Questions (P10)
-        open_questions_count = self.questions.count_open()
+        open_questions_count = summary["open_questions"]
         if open_questions_count > 0:
             status_lines.append(f"? Open Questions: {open_questions_count}")
             status_lines.append(f"  (Acknowledged unknowns -- not failures)")
@@ -206,7 +216,7 @@ class StatusCommand(BaseCommand):
                     infra_lines.append(f"  Run: babel status --git (detailed sync health)")
 
         # Pending proposals
-        pending_proposals = self._count_pending_proposals()
+        pending_proposals = summary["pending_proposals"]
         if pending_proposals > 0:
             infra_lines.append(f"Pending: {pending_proposals} proposal(s) (AI insights awaiting your confirmation)")
             infra_lines.append(f"  Run: babel review")
@@ -224,17 +234,20 @@ class StatusCommand(BaseCommand):
                     infra_lines.append(f"  Impact: Raw captures exist but structured artifacts not extracted")
                     infra_lines.append(f"  Action: Set API key, then: babel process-queue (interactive) or babel process-queue --batch (AI)")
 
+        # LLM response cache (only worth mentioning once it saved something)
+        if full and isinstance(self.provider, CachedProvider):
+            cache_stats = self.provider.cache.stats()
+            if cache_stats["hits"]:
+                infra_lines.append(
+                    f"LLM cache: {cache_stats['hits']} hit(s), {cache_stats['misses']} miss(es), "
+                    f"{cache_stats['tokens_saved']} token(s) saved"
+                )
+
         if infra_lines:
             template.section("INFRASTRUCTURE", "\n".join(infra_lines))
 
         # === HEALTH SECTION ===
-        principle_checker = PrincipleChecker(
-            graph=self.graph,
-            validation=self.validation,
-            questions=self.questions,
-            vocabulary=self.vocabulary
-        )
-        principle_result = principle_checker.check_all()
+        principle_result = self._principle_result(summary)
 
         health = self._compute_project_health(
             open_tensions=open_tensions,
@@ -325,6 +338,85 @@ class StatusCommand(BaseCommand):
 
         return "\n".join(lines)
 
+    def _summary(self, refresh: bool = False) -> dict:
+        """
+        Materialized status summary (see tracking/summary.py).
+
+        Persisted in .babel/local/snapshots/status.json against the event
+        watermark: unchanged projects skip every tracker fold, event count
+        and principle check below, and new events recompute only the
+        sections fed by their event types.
+        """
+        summary = getattr(self, "_status_summary", None)
+        if summary is None:
+            summary = self._status_summary = StatusSummary(self.events, self._summary_sections())
+        return summary.get(refresh=refresh)
+
+    def _summary_sections(self) -> dict:
+        """Derived status sections with the inputs that invalidate them."""
+        node_types = (EventType.PURPOSE_DECLARED, EventType.ARTIFACT_CONFIRMED)
+        return {
+            "purposes": StatusSection(
+                lambda: {"purposes": self.graph.count_nodes_by_type('purpose')},
+                event_types=node_types
+            ),
+            "tensions": StatusSection(
+                lambda: {"open_tensions": self.tensions.count_open()},
+                event_types=TensionTracker.EVENT_TYPES
+            ),
+            "validation": StatusSection(
+                self._compute_validation_section,
+                event_types=ValidationTracker.EVENT_TYPES
+            ),
+            "questions": StatusSection(
+                lambda: {"open_questions": self.questions.count_open()},
+                event_types=QuestionTracker.EVENT_TYPES
+            ),
+            "proposals": StatusSection(
+                lambda: {"pending_proposals": self._count_pending_proposals()},
+                event_types=ProposalTracker.EVENT_TYPES
+            ),
+            # PrincipleChecker reads purposes/decisions, validation, questions
+            # and the vocabulary (P2), which lives outside the event log
+            "principles": StatusSection(
+                self._compute_principles_section,
+                event_types=node_types + ValidationTracker.EVENT_TYPES + QuestionTracker.EVENT_TYPES,
+                sources=(self.babel_dir / "shared" / "vocabulary.json",)
+            ),
+        }
+
+    def _compute_validation_section(self) -> dict:
+        validation_stats = self.validation.stats()
+        return {
+            "validation": {
+                "tracked": validation_stats.get("tracked", 0),
+                "validated": validation_stats.get("validated", 0),
+                "partial": validation_stats.get("partial", 0),
+                "groupthink_risk": validation_stats.get("groupthink_risk", 0),
+                "unreviewed_risk": validation_stats.get("unreviewed_risk", 0)
+            }
+        }
+
+    def _compute_principles_section(self) -> dict:
+        principle_checker = PrincipleChecker(
+            graph=self.graph,
+            validation=self.validation,
+            questions=self.questions,
+            vocabulary=self.vocabulary
+        )
+        return {"principles": [c.to_dict() for c in principle_checker.check_all().checks]}
+
+    def _coherence_result(self, summary: dict) -> Optional[CoherenceResult]:
+        """Last coherence result, rebuilt from the summary's checkpoint."""
+        checkpoint = summary.get("coherence_checkpoint")
+        if not checkpoint:
+            return None
+        return self.coherence._checkpoint_to_result(Event.from_dict(dict(checkpoint)))
+
+    def _principle_result(self, summary: dict) -> PrincipleResult:
+        """Principle alignment, rebuilt from the summary's stored checks."""
+        return PrincipleResult(checks=[PrincipleCheck.from_dict(c) for c in summary["principles"]])
+
     def _count_pending_proposals(self) -> int:
         """
         Count proposals awaiting confirmation.
@@ -332,92 +424,33 @@ class StatusCommand(BaseCommand):
         STRUCTURE_PROPOSED events without matching ARTIFACT_CONFIRMED
         and without PROPOSAL_REJECTED.
         These are AI insights the user hasn't reviewed yet.
+        O(1) from the pending-proposal index (see tracking/proposals.py).
         """
-        proposed = self.events.read_by_type(EventType.STRUCTURE_PROPOSED)
-        if not proposed:
-            return 0
-
-        # Get all confirmed proposal IDs
-        confirmed_ids = set()
-        for event in self.events.read_by_type(EventType.ARTIFACT_CONFIRMED):
-            proposal_id = event.data.get('proposal_id', '')
-            if proposal_id:
-                confirmed_ids.add(proposal_id)
-
-        # Get all rejected proposal IDs
-        rejected_ids = set()
-        for event in self.events.read_by_type(EventType.PROPOSAL_REJECTED):
-            proposal_id = event.data.get('proposal_id', '')
-            if proposal_id:
-                rejected_ids.add(proposal_id)
-
-        # Count unconfirmed and non-rejected proposals
-        pending = sum(1 for p in proposed if p.id not in confirmed_ids and p.id not in rejected_ids)
-        return pending
+        return self.proposals.count_pending()
 
     def _get_scan_findings_summary(self) -> dict:
         """
         Get summary of cached scan findings.
 
-        Reads .babel/scan/<type>/findings.json and exclusions.json to provide
-        counts without running a new scan. Returns empty dict if no cached findings.
+        One aggregate query over the scan store (.babel/scan/scan.db) to
+        provide counts without running a new scan. Returns empty dict if
+        no cached findings.
 
         Returns:
             dict: {scan_type: {"total": N, "pending": N, "excluded": N}}
         """
-        import json
-
         scan_dir = self.babel_dir / "scan"
         if not scan_dir.exists():
             return {}
 
-        summary = {}
-        for type_dir in scan_dir.iterdir():
-            if not type_dir.is_dir():
-                continue
-
-            scan_type = type_dir.name
-            findings_file = type_dir / "findings.json"
-            exclusions_file = type_dir / "exclusions.json"
-
-            if not findings_file.exists():
-                continue
-
+        try:
+            store = ScanStore(scan_dir / "scan.db", legacy_cache=self.babel_dir / "scan_cache.json")
             try:
-                with open(findings_file) as f:
-                    findings_data = json.load(f)
-
-                findings = findings_data.get("findings", [])
-                total = len(findings)
-
-                # Load exclusions
-                excluded_count = 0
-                if exclusions_file.exists():
-                    with open(exclusions_file) as f:
-                        excl_data = json.load(f)
-                    excluded_count = len(excl_data.get("exclusions", {}))
-
-                # Count pending (not resolved, not excluded)
-                excl_ids = set(excl_data.get("exclusions", {}).keys()) if exclusions_file.exists() else set()
-                pending = 0
-                for finding in findings:
-                    fid = finding.get("finding_id", "")
-                    status = finding.get("status", "pending")
-                    # Check if excluded (prefix matching)
-                    is_excluded = any(fid.startswith(eid) or eid.startswith(fid) for eid in excl_ids)
-                    if status != "resolved" and not is_excluded:
-                        pending += 1
-
-                if total > 0:
-                    summary[scan_type] = {
-                        "total": total,
-                        "pending": pending,
-                        "excluded": excluded_count
-                    }
-            except (json.JSONDecodeError, IOError):
-                continue
-
-        return summary
+                return store.summary()
+            finally:
+                store.close()
+        except sqlite3.Error:
+            return {}
 
     def _format_scan_type_summary(self, scan_type: str, pending: int, excluded: int) -> str:
         """
@@ -631,7 +664,7 @@ class StatusCommand(BaseCommand):
         # Growing - has maturity but needs validation
         if maturity_score >= 2:
             # Count unvalidated decisions
-            decision_nodes = len(self.graph.get_nodes_by_type('decision'))
+            decision_nodes = self.graph.count_nodes_by_type('decision')
 
             suggestion = None
             if decision_nodes > 0 and validated == 0:
@@ -731,15 +764,16 @@ class StatusCommand(BaseCommand):
 
         return "\n".join(lines)
 
-    def _collect_status_data(self, full: bool = False, git: bool = False) -> dict:
+    def _collect_status_data(self, full: bool = False, git: bool = False, refresh: bool = False) -> dict:
         """
         Collect status data as structured dict for JSON rendering.
 
         Returns dict with all status metrics suitable for machine consumption.
         Used by --format json for AI operator token efficiency.
         """
+        summary = self._summary(refresh=refresh)
         stats = self.graph.stats()
-        shared_count, local_count = self.events.count_by_scope()
+        shared_count, local_count = summary["shared_events"], summary["local_events"]
 
         # Core metrics
         data = {
@@ -776,7 +810,7 @@ class StatusCommand(BaseCommand):
             ]
 
         # Coherence
-        last_result = self.coherence.get_last_result()
+        last_result = self._coherence_result(summary)
         if last_result:
             # timestamp may be str or datetime, handle both
             ts = last_result.timestamp if hasattr(last_result, 'timestamp') else None
@@ -789,25 +823,18 @@ class StatusCommand(BaseCommand):
             }
 
         # Commits
-        commits = self.events.read_by_type(EventType.COMMIT_CAPTURED)
-        data["commits_captured"] = len(commits) if commits else 0
+        data["commits_captured"] = summary["commits_captured"]
 
         # Tensions
-        open_tensions = self.tensions.count_open()
+        open_tensions = summary["open_tensions"]
         data["open_tensions"] = open_tensions
 
         # Validation
-        validation_stats = self.validation.stats()
-        data["validation"] = {
-            "tracked": validation_stats.get("tracked", 0),
-            "validated": validation_stats.get("validated", 0),
-            "partial": validation_stats.get("partial", 0),
-            "groupthink_risk": validation_stats.get("groupthink_risk", 0),
-            "unreviewed_risk": validation_stats.get("unreviewed_risk", 0)
-        }
+        validation_stats = summary["validation"]
+        data["validation"] = dict(validation_stats)
 
         # Questions
-        data["open_questions"] = self.questions.count_open()
+        data["open_questions"] = summary["open_questions"]
 
         # Scan findings (cached)
         scan_summary = self._get_scan_findings_summary()
@@ -815,7 +842,7 @@ class StatusCommand(BaseCommand):
             data["scan_findings"] = scan_summary
 
         # Pending proposals
-        data["pending_proposals"] = self._count_pending_proposals()
+        data["pending_proposals"] = summary["pending_proposals"]
 
         # Extraction queue
         if self.extractor.queue:
@@ -823,6 +850,8 @@ class StatusCommand(BaseCommand):
 
         # Provider status
         data["provider"] = get_provider_status(self.config)
+        if isinstance(self.provider, CachedProvider):
+            data["llm_cache"] = self.provider.cache.stats()
 
         # Git sync (if requested)
         if git:
@@ -835,13 +864,7 @@ class StatusCommand(BaseCommand):
                 }
 
         # Health
-        principle_checker = PrincipleChecker(
-            graph=self.graph,
-            validation=self.validation,
-            questions=self.questions,
-            vocabulary=self.vocabulary
-        )
-        principle_result = principle_checker.check_all()
+        principle_result = self._principle_result(summary)
         health = self._compute_project_health(
             open_tensions=open_tensions,
             validation_stats=validation_stats,
@@ -15,10 +15,11 @@ Aligns with:
 - HC2: Human authority (suggests, doesn't auto-link)
 """
 
-from typing import List, Dict
+import importlib.util
+from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
 from ..commands.base import BaseCommand
 from ..core.commit_links import CommitLinkStore
@@ -28,6 +29,23 @@ from ..presentation.symbols import safe_print
 from ..presentation.template import OutputTemplate
 
 
+# Scoring weights (shared by batch and single-pair scoring)
+TEXT_SIMILARITY_FLOOR = 0.3  # Below this, text similarity adds nothing
+TEXT_WEIGHT = 0.6            # Max score contributed by text similarity
+DOMAIN_BOOST = 0.2           # Commit message mentions the decision's domain
+TYPE_BOOST = 0.1             # Commit wording fits the artifact type
+
+# Commit wording that fits an artifact type
+TYPE_SIGNALS = {
+    'constraint': (('enforce', 'require', 'must', 'cannot', 'prevent'), "constraint-related commit"),
+    'decision': (('implement', 'use', 'add', 'create', 'build'), "implementation commit"),
+}
+
+# Batch scoring needs numpy (rapidfuzz.process.cdist returns a matrix);
+# without it, pairs are scored one by one with the same weights
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
 @dataclass
 class LinkSuggestion:
     """A suggested link between a decision and a commit."""
@@ -119,11 +137,11 @@ class SuggestLinksCommand(BaseCommand):
             print(output)
             return
 
-        # Find suggestions
-        all_suggestions = []
-        for commit in unlinked_commits:
-            suggestions = self._find_matches(commit, decisions, min_score if not show_all else 0.1)
-            all_suggestions.extend(suggestions)
+        # Find suggestions (all commits scored in one batch, top 3 per commit kept)
+        all_suggestions, total_suggestions = self._find_all_matches(
+            unlinked_commits, decisions, min_score if not show_all else 0.1,
+            per_commit=3
+        )
 
         if not all_suggestions:
             template = OutputTemplate(symbols=symbols)
@@ -181,7 +199,6 @@ class SuggestLinksCommand(BaseCommand):
         template.section("SUGGESTIONS", "\n".join(suggestion_lines))
 
         # Strongest match section
-        total_suggestions = len(all_suggestions)
         if all_suggestions:
             best = max(all_suggestions, key=lambda x: x.score)
             best_alias = self._cli.codec.encode(best.decision_id)
@@ -229,7 +246,7 @@ class SuggestLinksCommand(BaseCommand):
 
         return [{
             'sha': commit_info.hash,
-            'date': commit_info.date if hasattr(commit_info, 'date') else '',  # P12: Temporal attribution
+            'date': commit_info.date,  # P12: Temporal attribution
             'message': commit_info.message
         }]
 
@@ -240,7 +257,9 @@ class SuggestLinksCommand(BaseCommand):
         for node_type in ['decision', 'constraint', 'principle', 'proposal']:
             nodes = self.graph.get_nodes_by_type(node_type)
             for node in nodes:
-                summary = node.content.get('summary', str(node.content)[:100])
+                content = node.content
+                # Stringify content only when there is no summary
+                summary = content['summary'] if 'summary' in content else str(content)[:100]
                 alias = self._cli.codec.encode(node.id)
 
                 decisions.append({
@@ -248,7 +267,7 @@ class SuggestLinksCommand(BaseCommand):
                     'short_id': alias,
                     'type': node_type,
                     'summary': summary,
-                    'domain': node.content.get('domain', ''),
+                    'domain': content.get('domain', ''),
                     'created_at': node.created_at,  # P12: Temporal attribution
                     'node': node
                 })
@@ -258,70 +277,150 @@ class SuggestLinksCommand(BaseCommand):
     def _find_matches(self, commit: Dict, decisions: List[Dict],
                       min_score: float) -> List[LinkSuggestion]:
         """Find matching decisions for a commit."""
-        suggestions = []
+        return self._find_all_matches([commit], decisions, min_score)[0]
+
+    def _find_all_matches(self, commits: List[Dict], decisions: List[Dict],
+                          min_score: float,
+                          per_commit: Optional[int] = None) -> Tuple[List[LinkSuggestion], int]:
+        """
+        Find matching decisions for each commit.
 
-        for decision in decisions:
-            score, reasons = self._calculate_match_score(commit, decision)
+        Text similarity for every commit x decision pair comes from one
+        rapidfuzz.process.cdist call over lowercased texts; domain and type
+        boosts are applied as boolean masks over the score matrix.
 
-            if score >= min_score:
-                suggestions.append(LinkSuggestion(
-                    decision_id=decision['id'],
-                    decision_summary=decision['summary'],
-                    decision_type=decision['type'],
-                    commit_sha=commit['sha'],
-                    commit_message=commit['message'],
-                    score=score,
-                    reasons=reasons,
-                    commit_date=commit.get('date', ''),  # P12: Temporal attribution
-                    decision_created_at=decision.get('created_at', '')  # P12: Temporal attribution
-                ))
+        Args:
+            commits: Commits to match
+            decisions: Linkable artifacts (see _get_linkable_decisions)
+            min_score: Minimum score for a match
+            per_commit: Keep only the best N matches per commit, highest
+                        score first (None = all, in decision order)
+
+        Returns:
+            (suggestions in commit order, total matches before per_commit)
+        """
+        if not commits or not decisions:
+            return [], 0
+
+        if not NUMPY_AVAILABLE:
+            suggestions = []
+            total = 0
+            for commit in commits:
+                matches = []
+                for decision in decisions:
+                    score, reasons = self._calculate_match_score(commit, decision)
+                    if score >= min_score:
+                        matches.append(self._suggestion(commit, decision, score, reasons))
+                total += len(matches)
+                if per_commit is not None:
+                    matches = sorted(matches, key=lambda x: x.score, reverse=True)[:per_commit]
+                suggestions.extend(matches)
+            return suggestions, total
+
+        import numpy as np
+
+        messages = [c['message'].lower() for c in commits]
+        summaries = [d['summary'].lower() for d in decisions]
+        domains = [(d.get('domain') or '').lower() for d in decisions]
+        types = np.array([d['type'] for d in decisions])
+
+        # Text similarity (main signal), scaled to TEXT_WEIGHT
+        similarity = process.cdist(
+            messages, summaries,
+            scorer=fuzz.token_set_ratio,
+            dtype=np.float64,
+            workers=-1
+        ) / 100.0
+        text_hit = similarity > TEXT_SIMILARITY_FLOOR
+        score = np.where(text_hit, np.minimum(similarity * TEXT_WEIGHT, TEXT_WEIGHT), 0.0)
+
+        # Domain match: one substring check per (commit, distinct domain)
+        domain_hit = np.zeros(score.shape, dtype=bool)
+        for domain in set(domains) - {''}:
+            rows = np.array([domain in m for m in messages])
+            if rows.any():
+                cols = np.array([d == domain for d in domains])
+                domain_hit |= np.outer(rows, cols)
+        score += np.where(domain_hit, DOMAIN_BOOST, 0.0)
+
+        # Type-specific boosts
+        type_hit = np.zeros(score.shape, dtype=bool)
+        for decision_type, (words, _) in TYPE_SIGNALS.items():
+            rows = np.array([any(w in m for w in words) for m in messages])
+            type_hit |= np.outer(rows, types == decision_type)
+        score += np.where(type_hit, TYPE_BOOST, 0.0)
 
-        return suggestions
+        np.minimum(score, 1.0, out=score)
+
+        # Build suggestions (and reasons) only for the matches kept
+        suggestions = []
+        total = 0
+        for i, commit in enumerate(commits):
+            cols = np.flatnonzero(score[i] >= min_score)
+            total += len(cols)
+            if per_commit is not None:
+                cols = cols[np.argsort(-score[i, cols], kind='stable')][:per_commit]
+            for j in cols:
+                reasons = []
+                if text_hit[i, j]:
+                    reasons.append(f"text similarity: {similarity[i, j]:.0%}")
+                if domain_hit[i, j]:
+                    reasons.append(f"domain match: {domains[j]}")
+                if type_hit[i, j]:
+                    reasons.append(TYPE_SIGNALS[decisions[j]['type']][1])
+                suggestions.append(self._suggestion(commit, decisions[j], float(score[i, j]), reasons))
+        return suggestions, total
+
+    def _suggestion(self, commit: Dict, decision: Dict, score: float,
+                    reasons: List[str]) -> LinkSuggestion:
+        return LinkSuggestion(
+            decision_id=decision['id'],
+            decision_summary=decision['summary'],
+            decision_type=decision['type'],
+            commit_sha=commit['sha'],
+            commit_message=commit['message'],
+            score=score,
+            reasons=reasons,
+            commit_date=commit.get('date', ''),  # P12: Temporal attribution
+            decision_created_at=decision.get('created_at', '')  # P12: Temporal attribution
+        )
 
     def _calculate_match_score(self, commit: Dict, decision: Dict) -> tuple:
         """
-        Calculate match score between commit and decision.
+        Calculate match score between one commit and one decision.
 
         Uses rapidfuzz for 10-100x faster matching than word overlap.
-        Returns (score, reasons) tuple.
+        Returns (score, reasons) tuple. _find_all_matches applies the same
+        weights to whole batches.
         """
         score = 0.0
         reasons = []
 
-        commit_msg = commit['message']
+        commit_msg_lower = commit['message'].lower()
         decision_summary = decision['summary']
 
         # Text similarity using rapidfuzz (main signal)
         # token_set_ratio handles word order differences
-        similarity = fuzz.token_set_ratio(commit_msg.lower(), decision_summary.lower()) / 100.0
+        similarity = fuzz.token_set_ratio(commit_msg_lower, decision_summary.lower()) / 100.0
 
-        if similarity > 0.3:
+        if similarity > TEXT_SIMILARITY_FLOOR:
             # Scale similarity to max 0.6 (same as old word overlap cap)
-            text_score = min(similarity * 0.6, 0.6)
+            text_score = min(similarity * TEXT_WEIGHT, TEXT_WEIGHT)
             score += text_score
             reasons.append(f"text similarity: {similarity:.0%}")
 
         # Domain match (if commit mentions domain)
-        domain = decision.get('domain', '').lower()
-        if domain and domain in commit_msg.lower():
-            score += 0.2
+        domain = (decision.get('domain') or '').lower()
+        if domain and domain in commit_msg_lower:
+            score += DOMAIN_BOOST
             reasons.append(f"domain match: {domain}")
 
-        # Type-specific boosts
-        decision_type = decision['type']
-        commit_msg_lower = commit_msg.lower()
-
-        # Constraints often relate to "must", "cannot", "require"
-        if decision_type == 'constraint':
-            if any(word in commit_msg_lower for word in ['enforce', 'require', 'must', 'cannot', 'prevent']):
-                score += 0.1
-                reasons.append("constraint-related commit")
-
-        # Decisions often relate to "implement", "add", "use"
-        if decision_type == 'decision':
-            if any(word in commit_msg_lower for word in ['implement', 'use', 'add', 'create', 'build']):
-                score += 0.1
-                reasons.append("implementation commit")
+        # Type-specific boosts: constraints relate to "must", "cannot", ...;
+        # decisions to "implement", "add", ...
+        signal = TYPE_SIGNALS.get(decision['type'])
+        if signal and any(word in commit_msg_lower for word in signal[0]):
+            score += TYPE_BOOST
+            reasons.append(signal[1])
 
         return min(score, 1.0), reasons
 
@@ -11,9 +11,11 @@ Handles 'why' queries with:
 
 import json
 import hashlib
+from functools import cached_property
 from typing import Optional, List, Set
 
 from ..commands.base import BaseCommand
+from ..core.budget import budget_from_env, line_tokens, pack_to_budget
 from ..core.commit_links import CommitLinkStore
 from ..core.events import EventType
 from ..core.symbols import CodeSymbolStore
@@ -31,6 +33,13 @@ class WhyCommand(BaseCommand):
     P7: Surfaces graph relationships as readable insight.
     """
 
+    # Artifact context in the synthesis prompt is packed into this many
+    # tokens, highest relevance first (BABEL_WHY_CONTEXT_TOKENS overrides)
+    DEFAULT_CONTEXT_TOKEN_BUDGET = 2000
+
+    # Relationship lines shown per artifact in the synthesis prompt
+    MAX_PROMPT_RELATIONSHIPS = 3
+
     def __init__(self, cli):
         """Initialize with cache setup."""
         super().__init__(cli)
@@ -247,9 +256,9 @@ class WhyCommand(BaseCommand):
         # Merge: keyword matches first, then traversal hits
         all_artifacts = artifacts + traversed
 
-        # Final sort and limit
+        # Final sort (synthesis packs these into its token budget)
         all_artifacts.sort(key=lambda x: (x['score'], x['related_count']), reverse=True)
-        return all_artifacts[:10]  # Limit for token efficiency
+        return all_artifacts
 
     def _gather_rejection_context(self, query: str) -> list:
         """
@@ -451,6 +460,7 @@ class WhyCommand(BaseCommand):
             target_alias = self._cli.codec.encode(target.id)
             relationships.append({
                 'relation': edge.relation,
+                'node_id': target.id,
                 'target_id': target_alias,
                 'target_type': target.type,
                 'target_summary': get_node_summary(target)
@@ -459,6 +469,7 @@ class WhyCommand(BaseCommand):
             source_alias = self._cli.codec.encode(source.id)
             relationships.append({
                 'relation': f"has_{edge.relation}",  # Reverse direction indicator
+                'node_id': source.id,
                 'target_id': source_alias,
                 'target_type': source.type,
                 'target_summary': get_node_summary(source)
@@ -484,11 +495,56 @@ class WhyCommand(BaseCommand):
             'created_at': node.created_at
         }
 
+    @staticmethod
+    def _spec_line(spec: dict) -> Optional[str]:
+        """Prompt line for a linked specification (None if it has nothing to show)."""
+        spec_parts = []
+        if spec.get('objective'):
+            spec_parts.append(f"OBJECTIVE: {spec['objective']}")
+        if spec.get('add'):
+            spec_parts.append(f"ADD: {', '.join(spec['add'][:3])}")
+        if spec.get('modify'):
+            spec_parts.append(f"MODIFY: {', '.join(spec['modify'][:3])}")
+        return f"  SPEC: {'; '.join(spec_parts)}" if spec_parts else None
+
+    @cached_property
+    def context_token_budget(self) -> int:
+        """Synthesis context budget (BABEL_WHY_CONTEXT_TOKENS or the default)."""
+        return budget_from_env("BABEL_WHY_CONTEXT_TOKENS", self.DEFAULT_CONTEXT_TOKEN_BUDGET)
+
+    def _pack_context(self, artifacts: list) -> list:
+        """
+        Artifacts (in relevance order) whose prompt lines fit context_token_budget.
+
+        Summary and relationship costs are the token counts the graph
+        stored at projection; only spec lines are estimated here.
+        """
+        node_ids = set()
+        for a in artifacts:
+            node_ids.add(a['node'].id)
+            for rel in a.get('relationships', [])[:self.MAX_PROMPT_RELATIONSHIPS]:
+                node_ids.add(rel['node_id'])
+        counts = self.graph.get_token_counts(node_ids)
+
+        def cost(a: dict) -> int:
+            tokens = line_tokens(a['summary'], counts.get(a['node'].id))
+            for rel in a.get('relationships', [])[:self.MAX_PROMPT_RELATIONSHIPS]:
+                tokens += line_tokens(rel['target_summary'], counts.get(rel['node_id']))
+            for spec in a.get('specs', []):
+                spec_line = self._spec_line(spec)
+                if spec_line:
+                    tokens += line_tokens(spec_line)
+            return tokens
+
+        packed, _ = pack_to_budget(artifacts, self.context_token_budget, cost)
+        return packed
+
     def _synthesized(self, query: str, artifacts: list, rejections: list = None, code_symbols: list = None):
         """Use LLM to synthesize explanation (with caching)."""
         symbols = self.symbols
         rejections = rejections or []
         code_symbols = code_symbols or []
+        artifacts = self._pack_context(artifacts)
 
         # Check cache first (only if no rejections or code_symbols - they add context)
         if not rejections and not code_symbols:
@@ -534,21 +590,15 @@ class WhyCommand(BaseCommand):
 
             # Include key relationships (P7: relationships carry meaning)
             relationships = a.get('relationships', [])
-            for rel in relationships[:3]:  # Limit to top 3 relationships
+            for rel in relationships[:self.MAX_PROMPT_RELATIONSHIPS]:
                 rel_line = f"  └─ {rel['relation']} → [{rel['target_id']}] {rel['target_type']}: {rel['target_summary']}"
                 context_parts.append(rel_line)
 
             # Include linked specifications (implementation plans)
             for spec in a.get('specs', []):
-                spec_parts = []
-                if spec.get('objective'):
-                    spec_parts.append(f"OBJECTIVE: {spec['objective']}")
-                if spec.get('add'):
-                    spec_parts.append(f"ADD: {', '.join(spec['add'][:3])}")
-                if spec.get('modify'):
-                    spec_parts.append(f"MODIFY: {', '.join(spec['modify'][:3])}")
-                if spec_parts:
-                    context_parts.append(f"  SPEC: {'; '.join(spec_parts)}")
+                spec_line = self._spec_line(spec)
+                if spec_line:
+                    context_parts.append(spec_line)
 
         # Add rejection context (P8: Failure Metabolism)
         rejection_parts = []
@@ -7,11 +7,14 @@ Contains the foundational data structures:
 - Scope: Shared/local layer management
 - Refs: O(1) topic lookups
 - Horizon: Token-efficient compression
+- Budget: Relevance-ordered packing into token budgets
 - Loader: Lazy loading for efficiency
 - Domains: P3 expertise governance and domain mapping
 - Vocabulary: P2 semantic term learning and expansion
 - Resolver: Fuzzy ID resolution for artifact references
 - Symbols: Processor-backed code symbol index
+- GitAccess: Batched, memoized git plumbing
+- MinHash: LSH near-duplicate candidates
 """
 
 from .scope import EventScope, get_default_scope, scope_display_marker, scope_from_string
@@ -28,6 +31,7 @@ from .events import (
 from .graph import GraphStore, Node, Edge
 from .refs import Ref, RefStore
 from .horizon import EventDigest, ArtifactDigest, estimate_tokens
+from .budget import pack_to_budget
 from .loader import LazyLoader, LoadResult
 from .domains import (
     DomainSpec, CrossDomainInfo, AIRole,
@@ -40,8 +44,10 @@ from .domains import (
     CROSS_DOMAIN_PATTERNS, EXTERNAL_DOMAINS
 )
 from .vocabulary import Vocabulary, expand_query, merge_vocabularies, DEFAULT_CLUSTERS, COMMON_PATTERNS
-from .resolver import ResolveStatus, ResolveResult, IDResolver, format_resolve_prompt, resolve_with_prompt
+from .resolver import ResolveStatus, ResolveResult, IDResolver, PrefixIndex, format_resolve_prompt, resolve_with_prompt
 from .symbols import Symbol, CodeSymbolStore
+from .git_access import GitAccess
+from .minhash import MinHashLSH, minhash_signature
 
 __all__ = [
     # Scope
@@ -61,6 +67,8 @@ __all__ = [
     "Ref", "RefStore",
     # Horizon
     "EventDigest", "ArtifactDigest", "estimate_tokens",
+    # Budget
+    "pack_to_budget",
     # Loader
     "LazyLoader", "LoadResult",
     # Domains
@@ -75,7 +83,11 @@ __all__ = [
     # Vocabulary
     "Vocabulary", "expand_query", "merge_vocabularies", "DEFAULT_CLUSTERS", "COMMON_PATTERNS",
     # Resolver
-    "ResolveStatus", "ResolveResult", "IDResolver", "format_resolve_prompt", "resolve_with_prompt",
+    "ResolveStatus", "ResolveResult", "IDResolver", "PrefixIndex", "format_resolve_prompt", "resolve_with_prompt",
     # Symbols
     "Symbol", "CodeSymbolStore",
+    # Git
+    "GitAccess",
+    # MinHash
+    "MinHashLSH", "minhash_signature",
 ]
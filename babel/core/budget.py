@@ -0,0 +1,89 @@
+"""
+Budget — Pack prompt context into a token budget by relevance
+
+Prompts used to be cut at fixed counts (first 10 artifacts, first 20
+existing summaries), whatever those items actually cost: long summaries
+overflowed the model's useful context, short ones left headroom unused.
+
+pack_to_budget() fills a budget instead. Items are taken in relevance
+order; an item that does not fit is skipped (not a stopping point), so
+smaller, less relevant items still use the remaining headroom. This is
+the greedy solution to the 0/1 knapsack with relevance as value, which
+keeps the most relevant items whenever they fit at all.
+
+Costs come from estimate_tokens(); graph nodes carry theirs from
+projection (GraphStore.get_token_counts), so packing re-estimates only
+the formatting around them.
+
+Budgets are configurable per prompt through environment variables:
+- BABEL_EXTRACT_CONTEXT_TOKENS: Existing artifacts in extraction prompts (default: 1500)
+- BABEL_WHY_CONTEXT_TOKENS: Artifact context in why synthesis (default: 2000)
+"""
+
+import os
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+from .horizon import estimate_tokens
+
+
+T = TypeVar("T")
+
+# Tokens per prompt line beyond its text (newline, bullet / ID prefix)
+LINE_OVERHEAD_TOKENS = 4
+
+
+def line_tokens(text: str, known: Optional[int] = None) -> int:
+    """
+    Cost of one prompt line.
+
+    Args:
+        text: Line text (estimated unless known is given)
+        known: Cached token count of the text, if available
+    """
+    return (estimate_tokens(text) if known is None else known) + LINE_OVERHEAD_TOKENS
+
+
+def budget_from_env(name: str, default: int) -> int:
+    """
+    Token budget from an environment variable.
+
+    Missing, non-integer or non-positive values fall back to the default.
+    """
+    try:
+        value = int(os.environ.get(name, ""))
+    except ValueError:
+        return default
+    return value if value > 0 else default
+
+
+def pack_to_budget(
+    items: Sequence[T],
+    budget: int,
+    cost: Callable[[T], int],
+    score: Optional[Callable[[T], float]] = None,
+) -> Tuple[List[T], int]:
+    """
+    Select items whose total cost fits the budget, most relevant first.
+
+    Args:
+        items: Candidates
+        budget: Token budget for the selection
+        cost: Token cost of an item
+        score: Relevance of an item (None: items are already in relevance order)
+
+    Returns:
+        (selected items in relevance order, tokens used)
+    """
+    if score is not None:
+        # Stable: equal scores keep their input order
+        items = sorted(items, key=score, reverse=True)
+
+    selected: List[T] = []
+    used = 0
+    for item in items:
+        item_cost = cost(item)
+        if used + item_cost > budget:
+            continue  # Too big for what is left; smaller items may still fit
+        selected.append(item)
+        used += item_cost
+    return selected, used
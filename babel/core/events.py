@@ -13,10 +13,11 @@ Hybrid Collaboration:
 import orjson
 import hashlib
 import os
+import xxhash
 from datetime import datetime, timezone
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from enum import Enum
 
 from .scope import EventScope, get_default_scope, scope_from_string
@@ -157,6 +158,13 @@ class EventStore:
             f.write(orjson.dumps(event.to_dict()).decode() + '\n')
         return event
 
+    def append_batch(self, events: List[Event]) -> List[Event]:
+        """Append several events with a single write."""
+        if events:
+            with open(self.path, 'a') as f:
+                f.write(''.join(orjson.dumps(e.to_dict()).decode() + '\n' for e in events))
+        return events
+
     def read_all(self) -> List[Event]:
         """Read all events in order."""
         events = []
@@ -196,6 +204,10 @@ class EventStore:
         return True
 
 
+# Bytes hashed at the end of a file to detect rewrites behind a watermark
+WATERMARK_TAIL_BYTES = 256
+
+
 class DualEventStore:
     """
     Hybrid event store with shared (git) and local (personal) layers.
@@ -204,6 +216,11 @@ class DualEventStore:
     Local:  .babel/local/events.jsonl  - Git ignored, personal
 
     Graph is built from merged view (shared + local).
+
+    Derived indexes stay current without re-reading history:
+    - subscribe(): listeners are called with every appended event
+    - watermark() / read_since(): byte-offset catch-up for indexes
+      persisted by a previous process
     """
 
     def __init__(self, project_dir: Path):
@@ -225,6 +242,9 @@ class DualEventStore:
         self._type_index: Optional[Dict[EventType, List[Event]]] = None
         self._type_index_mtime: Tuple[float, float] = (0.0, 0.0)  # (shared_mtime, local_mtime)
 
+        # Append listeners for incremental projections (see subscribe())
+        self._listeners: List[Callable[[Event], None]] = []
+
         # Create directories
         self.shared_dir.mkdir(parents=True, exist_ok=True)
         self.local_dir.mkdir(parents=True, exist_ok=True)
@@ -309,8 +329,144 @@ class DualEventStore:
         # Also invalidate type index (new event added)
         self._type_index = None
 
+        self._notify(event)
+
         return event
 
+    def append_batch(self, events: List[Event], scope: Optional[EventScope] = None) -> List[Event]:
+        """
+        Append several events with one write per file.
+
+        Caches are invalidated once for the whole batch instead of per
+        event; listeners are still called for every event, in order.
+
+        Args:
+            events: Events to store
+            scope: Override default scope for all events (if None, per event)
+        """
+        lines: Dict[Path, List[str]] = {}
+        for event in events:
+            event_scope = scope if scope is not None else event.event_scope
+            event.scope = event_scope.value
+            path = self.shared_path if event_scope == EventScope.SHARED else self.local_path
+            lines.setdefault(path, []).append(orjson.dumps(event.to_dict()).decode() + '\n')
+
+        for path, batch in lines.items():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a') as f:
+                f.write(''.join(batch))
+            self._cache.pop(path, None)
+
+        if lines:
+            self._type_index = None
+
+        for event in events:
+            self._notify(event)
+
+        return events
+
+    def subscribe(self, listener: Callable[[Event], None]):
+        """
+        Register a listener called after every append.
+
+        Listeners maintain derived indexes incrementally. They are
+        projections (rebuildable), so a failing listener never blocks
+        the append itself.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def _notify(self, event: Event):
+        """Call append listeners (fail silently - events are already durable)."""
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                pass
+
+    def watermark(self) -> Dict[str, List]:
+        """
+        Current position of both event files.
+
+        Returns a JSON-serializable marker {scope: [size, tail_hash]}.
+        Persist it next to a derived index and pass it to read_since()
+        later to fetch only the events appended in between.
+        """
+        return {
+            "shared": self._file_mark(self.shared_path),
+            "local": self._file_mark(self.local_path),
+        }
+
+    def read_since(
+        self,
+        watermark: Optional[Dict[str, List]],
+        until: Optional[Dict[str, List]] = None
+    ) -> Optional[List[Event]]:
+        """
+        Read events appended after a watermark.
+
+        Args:
+            watermark: Position returned by an earlier watermark() call
+            until: Optional later watermark() - stop there instead of at
+                   end of file, so counters folded from the result can be
+                   persisted against exactly that position
+
+        Returns None when the watermark is missing or a file was rewritten
+        behind it (sync, promote, git merge) - callers must rebuild from
+        read_all() in that case.
+        """
+        if not watermark:
+            return None
+
+        new_events = []
+        for scope, path in (("shared", self.shared_path), ("local", self.local_path)):
+            mark = watermark.get(scope)
+            if not mark or len(mark) != 2:
+                return None
+            offset, tail_hash = mark
+            size = path.stat().st_size if path.exists() else 0
+            end = size
+            if until is not None:
+                end_mark = until.get(scope)
+                if not end_mark or end_mark[0] > size:
+                    return None
+                end = end_mark[0]
+            if end < offset or self._tail_hash(path, offset) != tail_hash:
+                return None
+            if end > offset:
+                new_events.extend(self._read_from(path, offset, end))
+
+        return sorted(new_events, key=lambda e: e.timestamp)
+
+    def _file_mark(self, path: Path) -> List:
+        """Watermark entry for one file: [size, hash of trailing bytes]."""
+        size = path.stat().st_size if path.exists() else 0
+        return [size, self._tail_hash(path, size)]
+
+    def _tail_hash(self, path: Path, offset: int) -> str:
+        """Hash the bytes just before offset (detects rewritten history)."""
+        if offset <= 0 or not path.exists():
+            return ""
+        start = max(0, offset - WATERMARK_TAIL_BYTES)
+        with open(path, 'rb') as f:
+            f.seek(start)
+            return xxhash.xxh64(f.read(offset - start)).hexdigest()
+
+    def _read_from(self, path: Path, offset: int, end: Optional[int] = None) -> List[Event]:
+        """Parse events stored after a byte offset (up to end, if given)."""
+        events = []
+        with open(path, 'rb') as f:
+            f.seek(offset)
+            data = f.read() if end is None else f.read(end - offset)
+            for line in data.splitlines():
+                line = line.strip()
+                if line:
+                    try:
+                        events.append(Event.from_dict(orjson.loads(line)))
+                    except (orjson.JSONDecodeError, KeyError, ValueError):
+                        continue
+        return events
+
     def read_shared(self) -> List[Event]:
         """Read shared events only."""
         return self._read_file(self.shared_path)
@@ -0,0 +1,434 @@
+"""
+Git Access — Shared, batched git plumbing for one command run
+
+Git-backed commands used to spawn one `git` process per question, often
+several per commit (log for the message, diff-tree for files, diff-tree
+again for status, show for the patch). Linking or mapping hundreds of
+commits meant thousands of processes.
+
+GitAccess answers the same questions with a handful:
+- Object lookups (ref resolution, commit objects) go to two long-lived
+  `git cat-file --batch-check` / `--batch` processes, one line per query
+- File changes and patches for many commits come from one
+  `git log --no-walk --stdin` call each, over all requested commits
+- Results keyed by commit SHA are memoized: commits are immutable, so
+  the memo can never be stale, while refs (HEAD, branches) are
+  re-resolved on every call (cheap through the batch-check process)
+
+An instance is meant to live for one command run (GitIntegration,
+MapCommand and CodeSymbolStore each hold one); its processes exit when
+it is closed or garbage collected.
+"""
+
+import subprocess
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Object types cat-file reports (anything else in a header is an error line)
+OBJECT_TYPES = frozenset({"blob", "tree", "commit", "tag"})
+
+# Marks the start of each commit in batched log output
+_COMMIT_MARK = "\x01"
+
+# Seconds one cat-file query may take before its process is killed and
+# replaced (the one-shot commands it replaced ran with 10-30s timeouts)
+QUERY_TIMEOUT = 10.0
+
+
+@dataclass
+class CommitRecord:
+    """Commit metadata read from its object (or a log line)."""
+    sha: str
+    subject: str
+    body: str
+    author: str
+    email: str
+    date: str  # Author date, strict ISO 8601 (like %aI)
+    parents: Tuple[str, ...] = ()
+
+
+@dataclass
+class FileStatus:
+    """One changed path of a commit (name-status entry)."""
+    status: str  # A, M, D, T, R<score>, C<score>
+    path: str
+    old_path: Optional[str] = None  # Source path of renames/copies
+
+
+def _stop_process(proc: subprocess.Popen):
+    """Close a batch process's stdin (it exits on EOF) and reap it."""
+    try:
+        proc.stdin.close()
+    except OSError:
+        pass
+    try:
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    proc.stdout.close()
+
+
+class CatFile:
+    """
+    One long-lived `git cat-file --batch` (or `--batch-check`) process.
+
+    Queries are answered in order over the process's pipes; a lock keeps
+    concurrent callers from interleaving requests. A process that died is
+    restarted once per query. A query that takes longer than the timeout
+    (lock contention, a stalled network filesystem) kills the process:
+    the query fails and the next one starts a fresh process.
+    """
+
+    def __init__(self, repo_path: Path, contents: bool = True, timeout: float = QUERY_TIMEOUT):
+        self.repo_path = Path(repo_path)
+        self.contents = contents
+        self.timeout = timeout
+        self.starts = 0  # Processes spawned (for stats/tests)
+        self._proc: Optional[subprocess.Popen] = None
+        self._finalizer = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def _start(self):
+        mode = "--batch" if self.contents else "--batch-check"
+        self._proc = subprocess.Popen(
+            ["git", "cat-file", mode],
+            cwd=self.repo_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL
+        )
+        self.starts += 1
+        self._finalizer = weakref.finalize(self, _stop_process, self._proc)
+
+    def _stop(self):
+        if self._finalizer is not None:
+            self._finalizer()
+        self._proc = None
+        self._finalizer = None
+
+    def _exchange(self, rev: str) -> Optional[Tuple[str, str, int, Optional[bytes]]]:
+        """
+        One request/response on the running process, bounded by the timeout.
+
+        Pipe reads cannot time out portably, so a watchdog timer kills the
+        process on expiry; the blocked read then sees EOF.
+        """
+        proc = self._proc
+        expired = threading.Event()
+
+        def expire():
+            expired.set()
+            try:
+                proc.kill()
+            except OSError:
+                pass
+
+        watchdog = threading.Timer(self.timeout, expire)
+        watchdog.daemon = True
+        watchdog.start()
+        try:
+            proc.stdin.write(rev.encode("utf-8") + b"\n")
+            proc.stdin.flush()
+            header = proc.stdout.readline()
+            if not header:
+                raise BrokenPipeError("cat-file exited")
+
+            parts = header.split()
+            if len(parts) != 3 or not parts[2].isdigit() or parts[1].decode() not in OBJECT_TYPES:
+                return None  # "<rev> missing" / "<rev> ambiguous"
+            oid, kind, size = parts[0].decode(), parts[1].decode(), int(parts[2])
+            data = None
+            if self.contents:
+                data = proc.stdout.read(size)
+                proc.stdout.read(1)  # Trailing newline
+                if len(data) < size:
+                    raise BrokenPipeError("cat-file exited mid-object")
+            return oid, kind, size, data
+        except OSError:
+            if expired.is_set():
+                raise TimeoutError(f"cat-file query exceeded {self.timeout}s")
+            raise
+        finally:
+            watchdog.cancel()
+
+    def query(self, rev: str) -> Optional[Tuple[str, str, int, Optional[bytes]]]:
+        """
+        Look up an object by revision expression.
+
+        Returns:
+            (object ID, type, size, contents or None for --batch-check),
+            or None if the object is missing, ambiguous or git failed
+        """
+        # The protocol is one request per line, surrounding whitespace trimmed
+        if not rev or "\n" in rev or rev != rev.strip():
+            return None
+
+        with self._lock:
+            for _ in range(2):
+                if self._failed:
+                    return None
+                try:
+                    if self._proc is None or self._proc.poll() is not None:
+                        self._start()
+                    return self._exchange(rev)
+                except FileNotFoundError:
+                    self._failed = True  # No git binary
+                    return None
+                except TimeoutError:
+                    self._stop()  # Stuck: don't retry, the next query restarts it
+                    return None
+                except OSError:
+                    self._stop()
+                    continue
+        return None
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+
+def _format_date(timestamp: str, offset: str) -> str:
+    """Git's "<unix seconds> <+hhmm>" as strict ISO 8601."""
+    try:
+        sign = -1 if offset.startswith("-") else 1
+        delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[3:5]))
+        return datetime.fromtimestamp(int(timestamp), timezone(sign * delta)).isoformat()
+    except (ValueError, IndexError, OverflowError):
+        return ""
+
+
+def parse_commit_object(sha: str, data: bytes) -> CommitRecord:
+    """
+    Parse a raw commit object (headers, blank line, message).
+
+    Subject is the first paragraph of the message joined into one line
+    and body the rest, as git's %s and %b.
+    """
+    text = data.decode("utf-8", errors="replace")
+    header_text, _, message = text.partition("\n\n")
+
+    parents = []
+    author = email = date = ""
+    for line in header_text.split("\n"):
+        if line.startswith("parent "):
+            parents.append(line[7:].strip())
+        elif line.startswith("author "):
+            ident = line[7:]
+            name, _, rest = ident.partition(" <")
+            email, _, stamp = rest.partition("> ")
+            author = name
+            stamp_parts = stamp.split()
+            if len(stamp_parts) == 2:
+                date = _format_date(*stamp_parts)
+
+    paragraphs = message.strip("\n").split("\n\n", 1)
+    subject = " ".join(line.strip() for line in paragraphs[0].split("\n") if line.strip())
+    body = paragraphs[1].strip() if len(paragraphs) > 1 else ""
+
+    return CommitRecord(sha=sha, subject=subject, body=body, author=author,
+                        email=email, date=date, parents=tuple(parents))
+
+
+def parse_name_status(output: str) -> Dict[str, List[FileStatus]]:
+    """
+    Parse `git log -z --name-status --format=%x01%H` into changes per SHA.
+
+    With -z every field is NUL-terminated: the commit line, then status
+    and path(s) per change (renames/copies carry old and new path).
+    """
+    changes: Dict[str, List[FileStatus]] = {}
+    current: Optional[List[FileStatus]] = None
+    fields = output.split("\0")
+    i = 0
+    while i < len(fields):
+        field = fields[i].lstrip("\n")
+        i += 1
+        if field.startswith(_COMMIT_MARK):
+            current = changes.setdefault(field[1:].strip(), [])
+        elif field and current is not None:
+            if field[0] in "RC" and i + 1 < len(fields):
+                current.append(FileStatus(field, fields[i + 1], old_path=fields[i]))
+                i += 2
+            elif i < len(fields):
+                current.append(FileStatus(field, fields[i]))
+                i += 1
+    return changes
+
+
+class GitAccess:
+    """
+    Batched git access for one repository and one command run.
+
+    Usage:
+        git = GitAccess(repo_path)
+        sha = git.resolve("HEAD")
+        commit = git.commit(sha)
+        changes = git.changes(shas)     # one process for all of them
+    """
+
+    def __init__(self, repo_path: Path):
+        self.repo_path = Path(repo_path)
+        self.runs = 0  # One-shot processes spawned
+        self._check = CatFile(self.repo_path, contents=False)
+        self._batch = CatFile(self.repo_path, contents=True)
+        self._memo: Dict[Tuple[str, ...], Optional[str]] = {}
+        self._commits: Dict[str, CommitRecord] = {}
+        self._changes: Dict[str, List[FileStatus]] = {}
+        self._patches: Dict[str, str] = {}
+
+    @property
+    def processes(self) -> int:
+        """Git processes spawned so far (one-shot plus batch)."""
+        return self.runs + self._check.starts + self._batch.starts
+
+    # =========================================================================
+    # One-shot commands
+    # =========================================================================
+
+    def run(self, args: Sequence[str], check: bool = True, timeout: Optional[float] = None,
+            memo: bool = False, input: Optional[str] = None) -> Optional[str]:
+        """
+        Run a git command and return stdout.
+
+        Args:
+            args: Arguments after `git`
+            check: If True, a non-zero exit returns None
+            timeout: Seconds before giving up (None = no limit)
+            memo: Reuse the output of an identical earlier call (only for
+                  commands whose output cannot change during the run)
+            input: Text written to the command's stdin
+
+        Returns:
+            stdout, or None if git could not be run (or failed with check)
+        """
+        key = tuple(args)
+        if memo and key in self._memo:
+            return self._memo[key]
+        self.runs += 1
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.repo_path,
+                capture_output=True,
+                encoding="utf-8",
+                errors="replace",
+                timeout=timeout,
+                input=input
+            )
+        except (subprocess.SubprocessError, OSError):
+            return None
+        output = None if check and result.returncode != 0 else result.stdout
+        if memo:
+            self._memo[key] = output
+        return output
+
+    # =========================================================================
+    # Object lookups (long-lived cat-file processes)
+    # =========================================================================
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """Full SHA of the commit a revision names (None if it names none)."""
+        found = self._check.query(f"{rev}^{{commit}}")
+        return found[0] if found else None
+
+    def head(self) -> Optional[str]:
+        """Full SHA of HEAD (None in a repository without commits)."""
+        return self.resolve("HEAD")
+
+    def commit(self, rev: str) -> Optional[CommitRecord]:
+        """Commit metadata for a revision (memoized by SHA)."""
+        if rev in self._commits:
+            return self._commits[rev]
+        found = self._batch.query(f"{rev}^{{commit}}")
+        if found is None or found[3] is None:
+            return None
+        sha = found[0]
+        if sha not in self._commits:
+            self._commits[sha] = parse_commit_object(sha, found[3])
+        return self._commits[sha]
+
+    # =========================================================================
+    # Per-commit data for many commits (one log process per call)
+    # =========================================================================
+
+    def _resolve_all(self, revs: Iterable[str]) -> Dict[str, str]:
+        resolved = {}
+        for rev in revs:
+            sha = rev if rev in self._commits else self.resolve(rev)
+            if sha:
+                resolved[rev] = sha
+        return resolved
+
+    def _log_uncached(self, shas: Iterable[str], cache: Dict, args: List[str]) -> Optional[str]:
+        """Run one `git log --no-walk` over the SHAs not in cache."""
+        missing = list(dict.fromkeys(s for s in shas if s not in cache))
+        if not missing:
+            return None
+        return self.run(
+            ["log", "--no-walk=unsorted", "--stdin", "--root", "--no-color", "--no-ext-diff",
+             f"--format={_COMMIT_MARK}%H", *args],
+            input="\n".join(missing) + "\n"
+        )
+
+    def changes(self, revs: Iterable[str]) -> Dict[str, List[FileStatus]]:
+        """
+        Changed paths (with status, renames detected) per revision.
+
+        Merge commits have no changes (like diff-tree without -m).
+        """
+        resolved = self._resolve_all(revs)
+        output = self._log_uncached(resolved.values(), self._changes, ["-z", "--name-status", "-M"])
+        if output is not None:
+            parsed = parse_name_status(output)
+            for sha in resolved.values():
+                self._changes.setdefault(sha, parsed.get(sha, []))
+        return {rev: self._changes[sha] for rev, sha in resolved.items() if sha in self._changes}
+
+    def patches(self, revs: Iterable[str]) -> Dict[str, str]:
+        """Zero-context patch text per revision (as `git show --format= -U0`)."""
+        resolved = self._resolve_all(revs)
+        output = self._log_uncached(resolved.values(), self._patches, ["-p", "--unified=0"])
+        if output is not None:
+            parsed = {}
+            for chunk in output.split(_COMMIT_MARK)[1:]:
+                sha, _, patch = chunk.partition("\n")
+                parsed[sha.strip()] = patch.lstrip("\n")
+            for sha in resolved.values():
+                self._patches.setdefault(sha, parsed.get(sha, ""))
+        return {rev: self._patches[sha] for rev, sha in resolved.items() if sha in self._patches}
+
+    def log(self, args: Sequence[str]) -> List[CommitRecord]:
+        """
+        Commits selected by `git log <args>`, in log order, in one process.
+
+        Records are memoized by SHA, so later commit() calls for them
+        need no further git access.
+        """
+        output = self.run(["log", "-z", "--no-color",
+                           "--format=%H%x1f%P%x1f%an%x1f%ae%x1f%aI%x1f%s%x1f%b", *args])
+        if not output:
+            return []
+        records = []
+        for entry in output.split("\0"):
+            fields = entry.lstrip("\n").split("\x1f")
+            if len(fields) != 7:
+                continue
+            sha, parents, author, email, date, subject, body = fields
+            record = self._commits.setdefault(sha, CommitRecord(
+                sha=sha, subject=subject, body=body.strip(), author=author,
+                email=email, date=date, parents=tuple(parents.split())
+            ))
+            records.append(record)
+        return records
+
+    def close(self):
+        """Stop the batch processes (restarted if the instance is used again)."""
+        self._check.close()
+        self._batch.close()
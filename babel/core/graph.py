@@ -8,12 +8,35 @@ Enables fast traversal and "why?" queries.
 
 import sqlite3
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Iterable
 from dataclasses import dataclass
 
 import orjson
 
 from .events import Event, EventType, EventStore
+from .horizon import estimate_tokens
+from ..presentation.codec import IDCodec
+from ..presentation.formatters import get_node_summary
+
+
+# Code symbols are cache (not intent) and can number in the tens of thousands;
+# keeping them out of the alias index keeps the 26^4 code space uncrowded.
+UNCODED_NODE_TYPES = frozenset({'code_symbol'})
+UNCODED_EVENT_TYPES = frozenset({EventType.SYMBOL_INDEXED})
+
+
+def prefix_upper_bound(prefix: str) -> str:
+    """
+    Smallest string greater than every string starting with prefix.
+
+    Turns a prefix query into a range: prefix <= s < prefix_upper_bound(prefix).
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _summary_tokens(node: 'Node') -> int:
+    """Token count of a node's summary (what prompts quote for it)."""
+    return estimate_tokens(str(get_node_summary(node) or ""))
 
 
 @dataclass
@@ -54,9 +77,13 @@ class GraphStore:
         self.path.parent.mkdir(parents=True, exist_ok=True)
         self.conn = sqlite3.connect(str(self.path), cached_statements=256)
         self.conn.row_factory = sqlite3.Row
+        self._codec = IDCodec()
         self._configure_pragmas()
         self._init_schema()
         self._init_stats_table()
+        self._init_code_index()
+        self._init_minhash_table()
+        self._init_coherence_table()
 
     def _configure_pragmas(self):
         """
@@ -95,7 +122,8 @@ class GraphStore:
                 type TEXT NOT NULL,
                 content TEXT NOT NULL,
                 event_id TEXT NOT NULL,
-                created_at TEXT DEFAULT ''
+                created_at TEXT DEFAULT '',
+                tokens INTEGER
             );
 
             CREATE TABLE IF NOT EXISTS edges (
@@ -108,6 +136,7 @@ class GraphStore:
             );
 
             CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type);
+            CREATE INDEX IF NOT EXISTS idx_nodes_event ON nodes(event_id);
             CREATE INDEX IF NOT EXISTS idx_edges_source ON edges(source_id);
             CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id);
         """)
@@ -122,6 +151,11 @@ class GraphStore:
             self.conn.execute("ALTER TABLE edges ADD COLUMN created_at TEXT DEFAULT ''")
         except sqlite3.OperationalError:
             pass  # Column already exists
+        # Migration: summary token counts (NULL rows are filled on first read)
+        try:
+            self.conn.execute("ALTER TABLE nodes ADD COLUMN tokens INTEGER")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
 
         # Create index on created_at (after migration ensures column exists)
         self.conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_created ON nodes(created_at)")
@@ -175,6 +209,33 @@ class GraphStore:
                 AND NOT EXISTS (SELECT 1 FROM edges WHERE target_id = OLD.id);
             END;
 
+            -- Node/edge totals: BEFORE INSERT sees the existing row, so
+            -- INSERT OR REPLACE of a known id is not counted twice
+            CREATE TRIGGER IF NOT EXISTS trg_node_count_insert BEFORE INSERT ON nodes
+            WHEN NOT EXISTS (SELECT 1 FROM nodes WHERE id = NEW.id)
+            BEGIN
+                UPDATE stats SET value = value + 1 WHERE key = 'node_count';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_node_count_delete AFTER DELETE ON nodes
+            BEGIN
+                UPDATE stats SET value = value - 1 WHERE key = 'node_count';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_edge_count_insert BEFORE INSERT ON edges
+            WHEN NOT EXISTS (
+                SELECT 1 FROM edges
+                WHERE source_id = NEW.source_id AND target_id = NEW.target_id AND relation = NEW.relation
+            )
+            BEGIN
+                UPDATE stats SET value = value + 1 WHERE key = 'edge_count';
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS trg_edge_count_delete AFTER DELETE ON edges
+            BEGIN
+                UPDATE stats SET value = value - 1 WHERE key = 'edge_count';
+            END;
+
             -- Drop old triggers (migration from v1)
             DROP TRIGGER IF EXISTS trg_node_insert;
             DROP TRIGGER IF EXISTS trg_edge_insert;
@@ -194,8 +255,195 @@ class GraphStore:
             (count,)
         )
 
+        # Seed totals once (databases created before the count triggers)
+        self._seed_total_counts(only_missing=True)
+
         self.conn.commit()
 
+    def _seed_total_counts(self, only_missing: bool = False):
+        """Recompute node/edge totals kept in the stats table."""
+        verb = "INSERT OR IGNORE" if only_missing else "INSERT OR REPLACE"
+        self.conn.execute(
+            f"{verb} INTO stats (key, value) SELECT 'node_count', COUNT(*) FROM nodes"
+        )
+        self.conn.execute(
+            f"{verb} INTO stats (key, value) SELECT 'edge_count', COUNT(*) FROM edges"
+        )
+
+    def _init_code_index(self):
+        """
+        Initialize AA-BB code -> ID index and projection metadata.
+
+        Codes are many-to-one (26^4 space), so the index keeps every ID
+        per code: a lookup returning several IDs is a collision that must
+        be surfaced as ambiguity, never silently resolved.
+        """
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS codes (
+                code TEXT NOT NULL,
+                id TEXT NOT NULL,
+                PRIMARY KEY (code, id)
+            ) WITHOUT ROWID;
+
+            -- Key/value metadata for derived indexes (watermarks, versions)
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+        self.conn.commit()
+
+    def index_codes(self, ids: Iterable[str], auto_commit: bool = True):
+        """
+        Register IDs in the code index (idempotent).
+
+        Args:
+            ids: Full IDs (event IDs or node IDs)
+            auto_commit: If True, commit immediately
+        """
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO codes (code, id) VALUES (?, ?)",
+            [(self._codec.encode(i), i) for i in ids if i]
+        )
+        if auto_commit:
+            self.conn.commit()
+
+    def index_event_codes(self, events: Iterable[Event], auto_commit: bool = True):
+        """Register event IDs in the code index (code symbols excluded)."""
+        self.index_codes(
+            (e.id for e in events if e.type not in UNCODED_EVENT_TYPES),
+            auto_commit=auto_commit
+        )
+
+    def lookup_code(self, code: str) -> List[str]:
+        """
+        Get all IDs registered under a code (O(log n) index lookup).
+
+        Returns:
+            Matching IDs; more than one means a code collision
+        """
+        rows = self.conn.execute(
+            "SELECT id FROM codes WHERE code = ? ORDER BY id", (code.upper(),)
+        ).fetchall()
+        return [r['id'] for r in rows]
+
+    def rebuild_code_index(self, events: Iterable[Event]):
+        """Rebuild code index from events plus all projected node IDs."""
+        self.conn.execute("DELETE FROM codes")
+        self.index_event_codes(events, auto_commit=False)
+        placeholders = ", ".join("?" for _ in UNCODED_NODE_TYPES)
+        rows = self.conn.execute(
+            f"SELECT id FROM nodes WHERE type NOT IN ({placeholders})",
+            tuple(UNCODED_NODE_TYPES)
+        ).fetchall()
+        self.index_codes((r['id'] for r in rows), auto_commit=False)
+        self.conn.commit()
+
+    def get_meta(self, key: str) -> Any:
+        """Get JSON metadata value (None if missing)."""
+        row = self.conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (key,)
+        ).fetchone()
+        return orjson.loads(row['value']) if row else None
+
+    def set_meta(self, key: str, value: Any, auto_commit: bool = True):
+        """Set JSON metadata value."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (key, orjson.dumps(value).decode())
+        )
+        if auto_commit:
+            self.conn.commit()
+
+    def _init_minhash_table(self):
+        """
+        Initialize persisted MinHash signatures (coherence duplicate LSH).
+
+        Each row records the keyword-set key it was computed from, so a
+        signature whose artifact keywords changed is detected as stale.
+        """
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS minhash (
+                id TEXT PRIMARY KEY,
+                keys_hash TEXT NOT NULL,
+                signature BLOB NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def get_minhash_signatures(self, ids: Iterable[str]) -> Dict[str, Tuple[str, bytes]]:
+        """
+        Get persisted signatures by artifact ID.
+
+        Returns:
+            ID -> (keys_hash, packed signature) for IDs that have one
+        """
+        ids = list(ids)
+        found = {}
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT id, keys_hash, signature FROM minhash WHERE id IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for r in rows:
+                found[r['id']] = (r['keys_hash'], bytes(r['signature']))
+        return found
+
+    def set_minhash_signatures(self, rows: Iterable[Tuple[str, str, bytes]], auto_commit: bool = True):
+        """
+        Store signatures as (id, keys_hash, packed signature) rows.
+
+        Args:
+            rows: Signatures to insert or replace
+            auto_commit: If True, commit immediately
+        """
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO minhash (id, keys_hash, signature) VALUES (?, ?, ?)",
+            rows
+        )
+        if auto_commit:
+            self.conn.commit()
+
+    def _init_coherence_table(self):
+        """
+        Initialize persisted per-artifact coherence state.
+
+        Rows are JSON documents owned by CoherenceChecker; like every
+        table here they are rebuildable and cleared on rebuild.
+        """
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS coherence (
+                id TEXT PRIMARY KEY,
+                state TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        self.conn.commit()
+
+    def get_coherence_states(self) -> Dict[str, Dict[str, Any]]:
+        """Get all persisted coherence states by artifact ID."""
+        rows = self.conn.execute("SELECT id, state FROM coherence").fetchall()
+        return {r['id']: orjson.loads(r['state']) for r in rows}
+
+    def set_coherence_states(self, states: Iterable[Tuple[str, Dict[str, Any]]], auto_commit: bool = True):
+        """Insert or replace coherence states as (id, state) pairs."""
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO coherence (id, state) VALUES (?, ?)",
+            [(i, orjson.dumps(state).decode()) for i, state in states]
+        )
+        if auto_commit:
+            self.conn.commit()
+
+    def delete_coherence_states(self, ids: Iterable[str], auto_commit: bool = True):
+        """Drop coherence states (deprecated or removed artifacts)."""
+        self.conn.executemany(
+            "DELETE FROM coherence WHERE id = ?", [(i,) for i in ids]
+        )
+        if auto_commit:
+            self.conn.commit()
+
     def add_node(self, node: Node, auto_commit: bool = True):
         """
         Add node to graph.
@@ -205,10 +453,15 @@ class GraphStore:
             auto_commit: If True, commit immediately (default for backward compat).
                          Set False for batch operations, then call commit() manually.
         """
+        # Summary token count computed once here for prompt packing
+        # (code symbols are never packed by summary; filled on demand)
+        tokens = None if node.type in UNCODED_NODE_TYPES else _summary_tokens(node)
         self.conn.execute(
-            "INSERT OR REPLACE INTO nodes (id, type, content, event_id, created_at) VALUES (?, ?, ?, ?, ?)",
-            (node.id, node.type, orjson.dumps(node.content).decode(), node.event_id, node.created_at)
+            "INSERT OR REPLACE INTO nodes (id, type, content, event_id, created_at, tokens) VALUES (?, ?, ?, ?, ?, ?)",
+            (node.id, node.type, orjson.dumps(node.content).decode(), node.event_id, node.created_at, tokens)
         )
+        if node.type not in UNCODED_NODE_TYPES:
+            self.index_codes([node.id], auto_commit=False)
         if auto_commit:
             self.conn.commit()
 
@@ -260,6 +513,146 @@ class GraphStore:
             for r in rows
         ]
 
+    def get_token_counts(self, ids: Iterable[str]) -> Dict[str, int]:
+        """
+        Summary token counts by node ID (computed at projection).
+
+        Nodes projected before counts were stored are estimated once
+        here and the count is written back.
+        """
+        ids = list(ids)
+        counts = {}
+        missing = []
+        # Chunked to stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self.conn.execute(
+                f"SELECT id, type, content, event_id, tokens FROM nodes WHERE id IN ({placeholders})",
+                chunk
+            ).fetchall()
+            for r in rows:
+                if r['tokens'] is None:
+                    node = Node(id=r['id'], type=r['type'], content=orjson.loads(r['content']),
+                                event_id=r['event_id'])
+                    counts[r['id']] = _summary_tokens(node)
+                    missing.append((counts[r['id']], r['id']))
+                else:
+                    counts[r['id']] = r['tokens']
+        if missing:
+            self.conn.executemany("UPDATE nodes SET tokens = ? WHERE id = ?", missing)
+            self.conn.commit()
+        return counts
+
+    def get_node_ids_by_type(self, node_type: str) -> List[str]:
+        """Get IDs of all nodes of a type (same order as get_nodes_by_type, no content loads)."""
+        rows = self.conn.execute(
+            "SELECT id FROM nodes WHERE type = ?", (node_type,)
+        ).fetchall()
+        return [r['id'] for r in rows]
+
+    def get_symbol_ranges(self) -> List[Tuple[str, int, int, str]]:
+        """
+        Line ranges of all code symbols, without loading full node content.
+
+        Returns:
+            (file_path, line_start, line_end, qualified_name) rows; symbols
+            missing any of these fields are skipped
+        """
+        try:
+            rows = self.conn.execute(
+                "SELECT json_extract(content, '$.file_path'), json_extract(content, '$.line_start'), "
+                "json_extract(content, '$.line_end'), json_extract(content, '$.qualified_name') "
+                "FROM nodes WHERE type = 'code_symbol'"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            # SQLite built without JSON functions: decode content instead
+            rows = []
+            for node in self.get_nodes_by_type("code_symbol"):
+                c = node.content
+                rows.append((c.get('file_path'), c.get('line_start'), c.get('line_end'), c.get('qualified_name')))
+
+        return [
+            (r[0], r[1], r[2], r[3]) for r in rows
+            if r[0] and r[1] is not None and r[2] is not None and r[3]
+        ]
+
+    def get_edge_targets(self, source_ids: Iterable[str], relation: str) -> set:
+        """Get IDs of nodes reached from any source via a relation."""
+        source_ids = list(source_ids)
+        if not source_ids:
+            return set()
+        placeholders = ", ".join("?" for _ in source_ids)
+        rows = self.conn.execute(
+            f"SELECT DISTINCT target_id FROM edges "
+            f"WHERE relation = ? AND source_id IN ({placeholders})",
+            [relation, *source_ids]
+        ).fetchall()
+        return {r['target_id'] for r in rows}
+
+    def get_detected_tensions(self) -> Dict[str, List[str]]:
+        """
+        Get detected tension records (one query over tensions_with edges).
+
+        Returns:
+            Tension node ID -> IDs of the artifacts in tension
+        """
+        rows = self.conn.execute(
+            "SELECT source_id, target_id FROM edges WHERE relation = 'tensions_with'"
+        ).fetchall()
+        tensions: Dict[str, List[str]] = {}
+        for r in rows:
+            tensions.setdefault(r['target_id'], []).append(r['source_id'])
+        return tensions
+
+    def count_nodes_by_type(self, node_type: str) -> int:
+        """Count nodes of a type (answered from idx_nodes_type, no row loads)."""
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM nodes WHERE type = ?", (node_type,)
+        ).fetchone()[0]
+
+    def find_nodes_by_prefix(self, prefixes: List[str], types: Tuple[str, ...]) -> List[Node]:
+        """
+        Find nodes whose ID, event ID, or ID after the type prefix starts
+        with any of the given prefixes.
+
+        Each prefix becomes `col >= prefix AND col < upper` range scans on
+        indexed columns, so lookups are O(log n + matches).
+
+        Args:
+            prefixes: Prefixes to match (e.g., raw query and lowercased)
+            types: Node types to include (result is grouped in this order)
+        """
+        clauses = []
+        params: List[Any] = []
+        for prefix in prefixes:
+            if not prefix:
+                continue
+            ranges = [('id', prefix), ('event_id', prefix)]
+            ranges.extend(('id', f"{t}_{prefix}") for t in types)
+            for column, start in ranges:
+                clauses.append(f"SELECT * FROM nodes WHERE {column} >= ? AND {column} < ?")
+                params.extend([start, prefix_upper_bound(start)])
+
+        if not clauses or not types:
+            return []
+
+        placeholders = ", ".join("?" for _ in types)
+        params.extend(types)
+        rows = self.conn.execute(
+            f"SELECT * FROM ({' UNION '.join(clauses)}) "
+            f"WHERE type IN ({placeholders}) ORDER BY created_at",
+            params
+        ).fetchall()
+
+        order = {t: i for i, t in enumerate(types)}
+        return sorted(
+            (Node(id=r['id'], type=r['type'], content=orjson.loads(r['content']),
+                  event_id=r['event_id'], created_at=r['created_at'] or "")
+             for r in rows),
+            key=lambda n: order[n.type]
+        )
+
     def get_nodes_by_type_recent(self, node_type: str, limit: int = 10) -> List[Node]:
         """Get most recent nodes of a type, ordered by created_at descending."""
         rows = self.conn.execute(
@@ -420,16 +813,21 @@ class GraphStore:
         reducing thousands of fsyncs to one. Safe because projection is
         rebuildable — if interrupted, just rebuild again.
         """
-        # Clear existing (including stats)
+        # Clear existing (including stats, code index and coherence state)
         self.conn.executescript("""
             DELETE FROM edges;
             DELETE FROM nodes;
             DELETE FROM stats;
+            DELETE FROM codes;
+            DELETE FROM minhash;
+            DELETE FROM coherence;
         """)
 
         # Replay events with deferred commits (batch pattern)
-        for event in event_store.read_all():
+        events = event_store.read_all()
+        for event in events:
             self._project_event(event, auto_commit=False)
+        self.index_event_codes(events, auto_commit=False)
 
         # Single commit for entire rebuild (10-100x faster)
         self.conn.commit()
@@ -444,6 +842,7 @@ class GraphStore:
             "INSERT OR REPLACE INTO stats (key, value) VALUES ('orphan_count', ?)",
             (count,)
         )
+        self._seed_total_counts()
         self.conn.commit()
 
     def _project_event(self, event: Event, auto_commit: bool = True):
@@ -610,11 +1009,15 @@ class GraphStore:
                 ), auto_commit=auto_commit)
 
     def stats(self) -> Dict[str, int]:
-        """Return graph statistics (O(1) for orphan count via stats table)."""
-        nodes = self.conn.execute("SELECT COUNT(*) as c FROM nodes").fetchone()['c']
-        edges = self.conn.execute("SELECT COUNT(*) as c FROM edges").fetchone()['c']
-        orphans = self.count_orphans()  # O(1) from stats table
-        return {"nodes": nodes, "edges": edges, "orphans": orphans}
+        """Return graph statistics (O(1) via trigger-maintained stats table)."""
+        rows = dict(self.conn.execute(
+            "SELECT key, value FROM stats WHERE key IN ('node_count', 'edge_count', 'orphan_count')"
+        ).fetchall())
+        return {
+            "nodes": rows.get('node_count', 0),
+            "edges": rows.get('edge_count', 0),
+            "orphans": rows.get('orphan_count', 0),
+        }
 
     def close(self):
         """
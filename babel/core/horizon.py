@@ -12,10 +12,15 @@ Artifact digests enable cheap coherence checks.
 """
 
 import hashlib
+import re
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, Union, TYPE_CHECKING
 from dataclasses import dataclass
 from collections import defaultdict
+from functools import lru_cache
+
+import orjson
+import xxhash
 
 from .events import EventStore, Event, EventType
 from ..presentation.formatters import generate_summary
@@ -35,6 +40,22 @@ PURPOSE_DIGEST_LENGTH = 100
 ARTIFACT_DIGEST_LENGTH = 80
 MAX_ARTIFACT_DIGESTS = 20
 
+# Keyword conflict patterns: (constraint contains, artifact contains)
+# - offline constraint vs sync/online/cloud artifact
+# - simple/mvp constraint vs complex/full artifact
+# - single constraint vs multi artifact
+# - local constraint vs remote/cloud artifact
+CONFLICT_PATTERNS = [
+    ({'offline', 'local'}, {'sync', 'online', 'cloud', 'remote', 'real-time'}),
+    ({'simple', 'mvp', 'minimal'}, {'complex', 'full', 'complete', 'advanced'}),
+    ({'single'}, {'multi', 'multiple', 'distributed'}),
+    ({'local'}, {'remote', 'cloud', 'distributed', 'network'}),
+    ({'synchronous', 'blocking'}, {'async', 'asynchronous', 'background'}),
+]
+
+# Conflict indexes kept per DigestBuilder (full set + recent deltas)
+MAX_CACHED_CONFLICT_INDEXES = 4
+
 
 @dataclass
 class EventDigest:
@@ -284,22 +305,59 @@ class EventHorizon:
         }
 
 
+class ConflictIndex:
+    """
+    Inverted keyword index over constraints for conflict checks.
+
+    Conflicts only arise through CONFLICT_PATTERNS markers, so constraints
+    are indexed by the constraint markers they contain. An artifact then
+    inspects only constraints behind the patterns its own keywords
+    trigger, instead of every constraint.
+    """
+
+    def __init__(self, constraint_keywords: Dict[str, List[str]]):
+        self._order = {cid: i for i, cid in enumerate(constraint_keywords)}
+        self._by_keyword: Dict[str, List[str]] = defaultdict(list)
+        markers = set().union(*(c for c, _ in CONFLICT_PATTERNS))
+        for constraint_id, keywords in constraint_keywords.items():
+            for keyword in markers.intersection(keywords):
+                self._by_keyword[keyword].append(constraint_id)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def conflicts(self, artifact_keywords) -> List[str]:
+        """Constraint IDs conflicting with the keywords (constraint order)."""
+        artifact_kw = set(artifact_keywords)
+        found = set()
+        for constraint_markers, artifact_markers in CONFLICT_PATTERNS:
+            if artifact_kw & artifact_markers:
+                for marker in constraint_markers:
+                    found.update(self._by_keyword.get(marker, ()))
+        return sorted(found, key=self._order.__getitem__)
+
+
 class DigestBuilder:
     """Builds token-efficient digests for coherence checking."""
     
     def __init__(self, graph: 'GraphStore'):
         self.graph = graph
+        self._conflict_indexes: Dict[str, ConflictIndex] = {}
     
     def build_coherence_context(
         self,
         purposes: List['Node'],
         artifacts: List['Node'],
-        max_artifacts: int = MAX_ARTIFACT_DIGESTS
+        max_artifacts: Optional[int] = MAX_ARTIFACT_DIGESTS
     ) -> CoherenceContext:
         """
         Build compact context for coherence checking.
         
         Target: ~500 tokens instead of ~2000+
+
+        Args:
+            max_artifacts: Digest cap (None = every artifact, for checks
+                           that scale past all-pairs like duplicate LSH)
         """
         # Purpose digest
         purpose_texts = []
@@ -336,25 +394,39 @@ class DigestBuilder:
             total_artifacts=len(artifacts)
         )
     
+    def conflict_index(self, constraint_keywords: Dict[str, List[str]]) -> ConflictIndex:
+        """
+        Inverted index for a constraint set.
+
+        Cached by constraint set content, so repeated coherence runs over
+        unchanged constraints reuse the same index.
+        """
+        key = xxhash.xxh64(orjson.dumps(constraint_keywords)).hexdigest()
+        index = self._conflict_indexes.get(key)
+        if index is None:
+            index = ConflictIndex(constraint_keywords)
+            if len(self._conflict_indexes) >= MAX_CACHED_CONFLICT_INDEXES:
+                self._conflict_indexes.pop(next(iter(self._conflict_indexes)))
+            self._conflict_indexes[key] = index
+        return index
+
     def check_conflicts_fast(
         self,
         artifact: ArtifactDigest,
-        constraint_keywords: Dict[str, List[str]]
+        constraint_keywords: Union[Dict[str, List[str]], ConflictIndex]
     ) -> List[str]:
         """
         Fast conflict detection using keyword matching.
         
         Returns list of constraint IDs that may conflict.
         No LLM call needed.
+
+        Pass a ConflictIndex (see conflict_index()) when checking many
+        artifacts against the same constraints.
         """
-        conflicts = []
-        artifact_keywords = set(artifact.keywords)
-        
-        for constraint_id, keywords in constraint_keywords.items():
-            if _keywords_conflict(artifact_keywords, set(keywords)):
-                conflicts.append(constraint_id)
-        
-        return conflicts
+        if not isinstance(constraint_keywords, ConflictIndex):
+            constraint_keywords = self.conflict_index(constraint_keywords)
+        return constraint_keywords.conflicts(artifact.keywords)
 
 
 # ============================================================================
@@ -391,7 +463,12 @@ def _summarize_event(event: Event) -> str:
 
 
 def _extract_keywords(text: str) -> List[str]:
-    """Extract meaningful keywords from text."""
+    """Extract meaningful keywords from text (memoized per text)."""
+    return list(_cached_keywords(text))
+
+
+@lru_cache(maxsize=4096)
+def _cached_keywords(text: str) -> Tuple[str, ...]:
     # Lowercase and split
     words = text.lower().split()
     
@@ -418,35 +495,45 @@ def _extract_keywords(text: str) -> List[str]:
             seen.add(k)
             unique.append(k)
     
-    return unique[:10]  # Max 10 keywords
+    return tuple(unique[:10])  # Max 10 keywords
 
 
 def _keywords_conflict(artifact_kw: set, constraint_kw: set) -> bool:
     """
     Check if artifact keywords conflict with constraint keywords.
     
-    Conflict patterns:
-    - offline constraint vs sync/online/cloud artifact
-    - simple/mvp constraint vs complex/full artifact
-    - single constraint vs multi artifact
-    - local constraint vs remote/cloud artifact
+    See CONFLICT_PATTERNS (ConflictIndex applies the same rule in bulk).
     """
-    conflicts = [
-        # (constraint contains, artifact contains)
-        ({'offline', 'local'}, {'sync', 'online', 'cloud', 'remote', 'real-time'}),
-        ({'simple', 'mvp', 'minimal'}, {'complex', 'full', 'complete', 'advanced'}),
-        ({'single'}, {'multi', 'multiple', 'distributed'}),
-        ({'local'}, {'remote', 'cloud', 'distributed', 'network'}),
-        ({'synchronous', 'blocking'}, {'async', 'asynchronous', 'background'}),
-    ]
-    
-    for constraint_markers, artifact_markers in conflicts:
+    for constraint_markers, artifact_markers in CONFLICT_PATTERNS:
         if constraint_kw & constraint_markers and artifact_kw & artifact_markers:
             return True
     
     return False
 
 
+# Pieces a BPE tokenizer splits text into: letter runs, digit groups
+# (up to 3 digits), and single symbols / non-ASCII characters
+_TOKEN_PIECES = re.compile(r"[A-Za-z]+|\d{1,3}|[^\sA-Za-z\d]")
+
+# Letters per token in long words (common words up to this length are one token)
+_LETTERS_PER_TOKEN = 8
+
+
+@lru_cache(maxsize=8192)
 def estimate_tokens(text: str) -> int:
-    """Rough token estimate (1 token ≈ 4 characters for English)."""
-    return len(text) // 4
+    """
+    Token estimate modelled on BPE tokenizers (memoized: summaries recur).
+
+    Each letter run is one token per 8 letters (rounded up), each group of
+    up to 3 digits and each punctuation or non-ASCII character is one token;
+    whitespace merges into the following piece. Unlike a characters/4
+    rule, punctuation-heavy text (IDs, paths, code) and non-English text
+    are not undercounted.
+    """
+    tokens = 0
+    for piece in _TOKEN_PIECES.findall(text):
+        if piece[0].isalpha() and piece.isascii():
+            tokens += 1 + (len(piece) - 1) // _LETTERS_PER_TOKEN
+        else:
+            tokens += 1
+    return tokens
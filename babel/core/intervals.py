@@ -0,0 +1,86 @@
+"""
+Intervals — Innermost containing interval per point in O(log n)
+
+Answers "which interval most tightly contains this point?" for many
+points against a fixed set of closed intervals grouped by key (e.g.
+code symbol line ranges per file).
+
+Each key's intervals are swept once into elementary segments: sorted
+boundaries where the set of covering intervals changes, each labelled
+with its smallest covering interval (ties go to the first added).
+A lookup is then one dict access plus one bisect.
+
+Used by clean scan to attach the containing symbol to each finding.
+"""
+
+import heapq
+from bisect import bisect_right
+from collections import defaultdict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+
+class IntervalIndex:
+    """
+    Per-key index of closed integer intervals [start, end].
+
+    Intervals may nest or overlap arbitrarily. Build is O(n log n);
+    innermost() is O(log n) per query.
+    """
+
+    def __init__(self):
+        self._pending: Dict[Hashable, List[Tuple[int, int, Any]]] = defaultdict(list)
+        self._segments: Dict[Hashable, Tuple[List[int], List[Any]]] = {}
+
+    def add(self, key: Hashable, start: int, end: int, value: Any):
+        """Add interval [start, end] under key (ignored if empty)."""
+        if end < start:
+            return
+        self._pending[key].append((start, end, value))
+        self._segments.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._pending
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def innermost(self, key: Hashable, point: int) -> Optional[Any]:
+        """Value of the smallest interval under key containing point (None if none)."""
+        if key not in self._pending:
+            return None
+        segments = self._segments.get(key)
+        if segments is None:
+            segments = self._segments[key] = self._build(self._pending[key])
+
+        bounds, values = segments
+        i = bisect_right(bounds, point) - 1
+        return values[i] if i >= 0 else None
+
+    @staticmethod
+    def _build(intervals: List[Tuple[int, int, Any]]) -> Tuple[List[int], List[Any]]:
+        """Sweep intervals into (segment starts, innermost value per segment)."""
+        order = sorted(range(len(intervals)), key=lambda i: intervals[i][0])
+        points = sorted({s for s, _, _ in intervals} | {e + 1 for _, e, _ in intervals})
+
+        bounds: List[int] = []
+        values: List[Any] = []
+        active: List[Tuple[int, int, int]] = []  # (size, insertion order, end)
+        next_interval = 0
+
+        for point in points:
+            while next_interval < len(order) and intervals[order[next_interval]][0] <= point:
+                i = order[next_interval]
+                start, end, _ = intervals[i]
+                heapq.heappush(active, (end - start, i, end))
+                next_interval += 1
+            # Lazy removal: only the smallest interval needs to be live
+            while active and active[0][2] < point:
+                heapq.heappop(active)
+
+            value = intervals[active[0][1]][2] if active else None
+            if values and values[-1] is value:
+                continue  # Same label as the previous segment
+            bounds.append(point)
+            values.append(value)
+
+        return bounds, values
@@ -0,0 +1,135 @@
+"""
+JSON Stream — Complete array items from a JSON document as it arrives
+
+LLM extraction responses are one JSON object whose "artifacts" member
+is a list of objects. Waiting for the whole document before parsing
+means the first artifact is only available once the last token is
+generated. JsonArrayStream is fed the response text chunk by chunk and
+returns each object item of the named top-level array as soon as its
+closing brace arrives.
+
+Only structural characters are scanned (strings, brackets, ':' and
+','), so text before the top-level object (a ```json fence, a sentence
+of preamble) and after it is ignored. Items that are not valid JSON
+are skipped; the rest of the stream is unaffected.
+
+Used by the extractor to show (and deduplicate) proposals while the
+LLM is still responding.
+"""
+
+import json
+import re
+from typing import Any, List, Optional
+
+
+# Characters that change parser state outside / inside strings
+_STRUCTURAL = re.compile(r'["{}\[\]:,]')
+_IN_STRING = re.compile(r'["\\]')
+
+
+class JsonArrayStream:
+    """
+    Incremental parser for the items of one top-level array member.
+
+    Usage:
+        stream = JsonArrayStream("artifacts")
+        for chunk in chunks:
+            for item in stream.feed(chunk):
+                ...
+    """
+
+    def __init__(self, key: str):
+        self.key = key
+        self.count = 0          # Items returned so far
+        self._text = ""
+        self._pos = 0           # Next unscanned offset in _text
+        self._depth = 0
+        self._in_string = False
+        self._escape = False    # Previous chunk ended in a backslash
+        self._string_start = 0
+        self._last_key: Optional[str] = None
+        self._key_ready = False  # Saw '"key":' at depth 1
+        self._in_array = False
+        self._item_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Any]:
+        """Add text; returns the items completed by it, in order."""
+        self._text += chunk
+        items = []
+        text = self._text
+        pos = self._pos
+
+        while pos < len(text):
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    pos += 1
+                    continue
+                match = _IN_STRING.search(text, pos)
+                if match is None:
+                    pos = len(text)
+                    break
+                pos = match.end()
+                if match.group() == "\\":
+                    self._escape = True
+                    continue
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_key = text[self._string_start + 1:pos - 1]
+                continue
+
+            match = _STRUCTURAL.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            char = match.group()
+            i = match.start()
+            pos = match.end()
+
+            if self._depth == 0:
+                if char == "{":
+                    self._depth = 1  # Top-level object; anything before is preamble
+                continue
+
+            if char == '"':
+                self._in_string = True
+                self._string_start = i
+            elif char == ":":
+                if self._depth == 1:
+                    self._key_ready = self._last_key == self.key
+            elif char == ",":
+                if self._depth == 1:
+                    self._key_ready = False
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 2 and char == "[" and self._key_ready:
+                    self._in_array = True
+                elif self._depth == 3 and char == "{" and self._in_array:
+                    self._item_start = i
+            else:
+                if self._depth == 3 and char == "}" and self._item_start is not None:
+                    try:
+                        items.append(json.loads(text[self._item_start:pos]))
+                    except ValueError:
+                        pass
+                    self._item_start = None
+                self._depth -= 1
+                if self._depth == 1:
+                    self._in_array = False
+                    self._key_ready = False
+
+        # Keep only text still needed: an open item or a key being read
+        keep = pos
+        if self._item_start is not None:
+            keep = self._item_start
+        elif self._in_string:
+            keep = self._string_start
+        self._text = text[keep:]
+        self._pos = pos - keep
+        if self._item_start is not None:
+            self._item_start -= keep
+        if self._in_string:
+            self._string_start -= keep
+
+        self.count += len(items)
+        return items
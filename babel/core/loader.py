@@ -62,6 +62,7 @@ class LazyLoader:
         # Cache for session
         self._event_cache: Dict[str, Event] = {}
         self._summary_cache: Dict[str, str] = {}
+        self._token_cache: Dict[str, int] = {}  # Event ID -> text tokens (events are immutable)
     
     # =========================================================================
     # Primary Interface
@@ -286,11 +287,14 @@ class LazyLoader:
     # =========================================================================
     
     def _estimate_tokens(self, events: List[Event]) -> int:
-        """Estimate token count for events."""
+        """Estimate token count for events (each event estimated once per session)."""
         total = 0
+        cache = self._token_cache
         for event in events:
-            text = self._get_event_text(event)
-            total += estimate_tokens(text)
+            tokens = cache.get(event.id)
+            if tokens is None:
+                tokens = cache[event.id] = estimate_tokens(self._get_event_text(event))
+            total += tokens
         return total
     
     # =========================================================================
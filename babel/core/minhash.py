@@ -0,0 +1,111 @@
+"""
+MinHash — Near-duplicate candidates without all-pairs comparison
+
+MinHash signatures estimate Jaccard similarity between token sets;
+banded locality-sensitive hashing (LSH) buckets signatures so that
+only sets likely above a similarity threshold are ever compared.
+
+Used by coherence duplicate detection (Tier 0):
+- One signature per artifact digest (keyword set), persisted in graph.db
+- Candidates come from shared LSH buckets, then exact Jaccard decides
+
+Defaults (64 permutations, 16 bands x 4 rows) place the LSH threshold
+near 0.5, so pairs at the 0.85 duplicate threshold are missed with
+probability below 1e-5 while unrelated artifacts rarely collide.
+"""
+
+import random
+from array import array
+from collections import defaultdict
+from typing import Dict, Hashable, Iterable, List, Set
+
+import xxhash
+
+
+# Signature shape: NUM_PERMUTATIONS = LSH_BANDS * LSH_ROWS
+NUM_PERMUTATIONS = 64
+LSH_BANDS = 16
+LSH_ROWS = 4
+
+# Universal hashing (a*x + b) mod p over 61-bit Mersenne prime
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+
+# Fixed seed: signatures are persisted and must stay comparable across runs
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def minhash_signature(tokens: Iterable[str]) -> List[int]:
+    """
+    MinHash signature of a token set.
+
+    Identical sets always produce identical signatures; the fraction of
+    equal positions between two signatures estimates their Jaccard index.
+    An empty set yields a signature of max values (matches nothing useful).
+    """
+    hashes = [xxhash.xxh32_intdigest(t.encode('utf-8')) for t in set(tokens)]
+    if not hashes:
+        return [_MAX_HASH] * NUM_PERMUTATIONS
+    return [
+        min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+        for a, b in _PERMUTATIONS
+    ]
+
+
+def tokens_key(tokens: Iterable[str]) -> str:
+    """Stable key of a token set (detects stale persisted signatures)."""
+    return xxhash.xxh64("\x1f".join(sorted(set(tokens))).encode('utf-8')).hexdigest()
+
+
+def pack_signature(signature: List[int]) -> bytes:
+    return array('I', signature).tobytes()
+
+
+def unpack_signature(blob: bytes) -> List[int]:
+    signature = array('I')
+    signature.frombytes(blob)
+    return signature.tolist()
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    """Exact Jaccard index (0.0 when both are empty)."""
+    union = len(a | b)
+    return len(a & b) / union if union else 0.0
+
+
+class MinHashLSH:
+    """
+    Banded LSH index over MinHash signatures.
+
+    Keys sharing any band (LSH_ROWS consecutive signature values) with a
+    query become candidates. Candidates are a superset filter only -
+    callers verify them with exact similarity.
+    """
+
+    def __init__(self, bands: int = LSH_BANDS, rows: int = LSH_ROWS):
+        self.bands = bands
+        self.rows = rows
+        self._buckets: Dict[tuple, List[Hashable]] = defaultdict(list)
+
+    def _band_keys(self, signature: List[int]):
+        for band in range(self.bands):
+            start = band * self.rows
+            yield (band, *signature[start:start + self.rows])
+
+    def insert(self, key: Hashable, signature: List[int]):
+        """Add a key under each of its band buckets."""
+        for band_key in self._band_keys(signature):
+            self._buckets[band_key].append(key)
+
+    def query(self, signature: List[int]) -> Set[Hashable]:
+        """Keys sharing at least one band with the signature."""
+        candidates = set()
+        for band_key in self._band_keys(signature):
+            bucket = self._buckets.get(band_key)
+            if bucket:
+                candidates.update(bucket)
+        return candidates
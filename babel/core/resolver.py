@@ -7,12 +7,18 @@ Enables users to reference artifacts by:
 - Keywords in summary (case-insensitive)
 
 Provides clear feedback on ambiguous or missing matches.
+
+Prefix matching is index-backed:
+- Graph nodes: range queries on indexed id/event_id columns (GraphStore)
+- Arbitrary ID lists: PrefixIndex (sorted array + bisect)
 """
 
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, List, Iterable, Iterator, TYPE_CHECKING
 from enum import Enum
 
+from .graph import prefix_upper_bound
 from ..presentation.formatters import get_node_summary, generate_summary
 
 if TYPE_CHECKING:
@@ -39,6 +45,69 @@ class ResolveResult:
             self.candidates = []
 
 
+class PrefixIndex:
+    """
+    Sorted ID array answering prefix queries in O(log n) via bisect.
+
+    Build once, query many times (review --accept loops, commit gap
+    detection). Iterable and supports `in`, so it can stand in for the
+    candidate lists passed to resolve_id().
+    """
+
+    def __init__(self, ids: Iterable[str]):
+        self._ids = sorted({i for i in ids if i})
+        self._members = set(self._ids)
+        self._lengths = sorted({len(i) for i in self._ids})
+
+    def __contains__(self, item: str) -> bool:
+        return item in self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def with_prefix(self, prefix: str, limit: int = None) -> List[str]:
+        """
+        IDs starting with prefix, in sorted order.
+
+        Args:
+            prefix: Prefix to match (empty matches nothing)
+            limit: Stop after this many (2 is enough to detect ambiguity)
+        """
+        if not prefix:
+            return []
+        start = bisect_left(self._ids, prefix)
+        end = bisect_left(self._ids, prefix_upper_bound(prefix), lo=start)
+        if limit is not None:
+            end = min(end, start + limit)
+        return self._ids[start:end]
+
+    def resolve(self, prefix: str) -> Optional[str]:
+        """Exact or unique-prefix match, None if missing or ambiguous."""
+        if prefix in self._members:
+            return prefix
+        matches = self.with_prefix(prefix, limit=2)
+        return matches[0] if len(matches) == 1 else None
+
+    def overlaps(self, key: str) -> bool:
+        """
+        True if any indexed ID is a prefix of key or key is a prefix of one.
+
+        Matches abbreviated and full SHAs against each other in
+        O(distinct lengths + log n) instead of scanning every ID.
+        """
+        if not key:
+            return False
+        for length in self._lengths:
+            if length > len(key):
+                break
+            if key[:length] in self._members:
+                return True
+        return bool(self.with_prefix(key, limit=1))
+
+
 class IDResolver:
     """
     Universal ID resolution for artifact references.
@@ -49,6 +118,9 @@ class IDResolver:
     3. Keyword match (search summaries)
     """
 
+    # Types searched when no artifact_type filter is given
+    DEFAULT_TYPES = ('decision', 'constraint', 'principle', 'purpose', 'tension')
+
     def __init__(self, graph: 'GraphStore'):
         self.graph = graph
 
@@ -75,12 +147,16 @@ class IDResolver:
 
         # Decode short code if codec provided and query looks like AA-BB code
         if codec and codec.is_short_code(query):
-            # Get candidate IDs for decode resolution
-            candidates = self._get_candidates(artifact_type)
-            candidate_ids = [n.id for n in candidates]
-            decoded = codec.decode(query, candidate_ids)
-            if decoded != query:  # Successfully decoded
-                query = decoded
+            code_matches = self._decode_code(query, artifact_type, codec)
+            if len(code_matches) == 1:
+                query = code_matches[0].id
+            elif len(code_matches) > 1:
+                # Code collision: surface it instead of picking the first hit
+                return ResolveResult(
+                    status=ResolveStatus.AMBIGUOUS,
+                    candidates=code_matches,
+                    query=query
+                )
 
         # Strategy 1: Exact match
         node = self.graph.get_node(query)
@@ -92,21 +168,13 @@ class IDResolver:
                     query=query
                 )
 
-        # Get candidate nodes (filtered by type if specified)
-        candidates = self._get_candidates(artifact_type)
-
-        # Strategy 2: Prefix match (on node ID or event ID portion)
+        # Strategy 2: Prefix match (on node ID, event ID, or ID after type prefix)
+        # Index range queries - no full candidate scan
         if len(query) >= min_prefix_length:
-            query_lower = query.lower()
-            prefix_matches = [
-                n for n in candidates
-                if n.id.startswith(query) or n.id.startswith(query_lower)
-                or (n.event_id and n.event_id.startswith(query))
-                or (n.event_id and n.event_id.startswith(query_lower))
-                # Also check if query matches after the type prefix (e.g., decision_)
-                or ('_' in n.id and n.id.split('_', 1)[1].startswith(query))
-                or ('_' in n.id and n.id.split('_', 1)[1].startswith(query_lower))
-            ]
+            types = (artifact_type,) if artifact_type else self.DEFAULT_TYPES
+            prefix_matches = self.graph.find_nodes_by_prefix(
+                list(dict.fromkeys([query, query.lower()])), types
+            )
 
             if len(prefix_matches) == 1:
                 return ResolveResult(
@@ -121,6 +189,9 @@ class IDResolver:
                     query=query
                 )
 
+        # Get candidate nodes (filtered by type if specified)
+        candidates = self._get_candidates(artifact_type)
+
         # Strategy 3: Keyword match in summaries
         keyword_matches = self._search_by_keyword(candidates, query)
 
@@ -144,6 +215,23 @@ class IDResolver:
             query=query
         )
 
+    def _decode_code(self, code: str, artifact_type: str, codec) -> List['Node']:
+        """
+        Resolve a short code to candidate nodes.
+
+        Uses the codec's persistent code index when available (single
+        lookup); otherwise encodes every candidate node.
+        """
+        types = (artifact_type,) if artifact_type else self.DEFAULT_TYPES
+
+        if getattr(codec, 'index', None) is not None:
+            nodes = [self.graph.get_node(i) for i in codec.matches(code)]
+            return [n for n in nodes if n and n.type in types]
+
+        candidates = self._get_candidates(artifact_type)
+        matched = set(codec.matches(code, [n.id for n in candidates]))
+        return [n for n in candidates if n.id in matched]
+
     def _get_candidates(self, artifact_type: str = None) -> List['Node']:
         """Get candidate nodes, optionally filtered by type."""
         if artifact_type:
@@ -151,7 +239,7 @@ class IDResolver:
 
         # Get all decision-like types
         candidates = []
-        for node_type in ['decision', 'constraint', 'principle', 'purpose', 'tension']:
+        for node_type in self.DEFAULT_TYPES:
             candidates.extend(self.graph.get_nodes_by_type(node_type))
 
         return candidates
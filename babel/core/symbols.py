@@ -22,7 +22,6 @@ Usage:
 import ast
 import fnmatch
 import json
-import subprocess
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -30,6 +29,7 @@ from typing import List, Dict, Optional, Tuple, Any, Union, Set
 
 from .events import DualEventStore, index_symbol
 from .tokenizer import tokenize_name, tokenize_text, token_match_score
+from .git_access import GitAccess
 
 
 @dataclass
@@ -91,6 +91,10 @@ class CodeSymbolStore:
         self.graph = graph
         self.project_dir = Path(project_dir) if project_dir else self.babel_dir.parent
 
+        # Git plumbing shared by every file indexed in this run
+        self._git = GitAccess(self.project_dir)
+        self._git_roots: Dict[Path, Optional[Path]] = {}
+
         # Cache for indexed symbols (by qualified_name)
         self._cache: Dict[str, Symbol] = {}
         self._cache_path = self.babel_dir / "symbol_cache.json"
@@ -243,20 +247,8 @@ class CodeSymbolStore:
         return cache_cleared, graph_cleared
 
     def _get_git_hash(self) -> Optional[str]:
-        """Get current HEAD commit hash."""
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', 'HEAD'],
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return result.stdout.strip()
-        except Exception:
-            pass
-        return None
+        """Get current HEAD commit hash (via the batch-check process, per file)."""
+        return self._git.head()
 
     def _find_git_root(self, start_path: Path) -> Optional[Path]:
         """
@@ -267,20 +259,15 @@ class CodeSymbolStore:
 
         Returns:
             Path to git root, or None if not in a git repo
+
+        Memoized per directory: files outside the project are usually
+        indexed many to a directory.
         """
-        try:
-            result = subprocess.run(
-                ['git', 'rev-parse', '--show-toplevel'],
-                cwd=start_path,
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            if result.returncode == 0:
-                return Path(result.stdout.strip())
-        except Exception:
-            pass
-        return None
+        start_path = Path(start_path)
+        if start_path not in self._git_roots:
+            output = GitAccess(start_path).run(['rev-parse', '--show-toplevel'], timeout=10)
+            self._git_roots[start_path] = Path(output.strip()) if output else None
+        return self._git_roots[start_path]
 
     def _get_tracked_files(self, extensions: set, base_dir: Path = None) -> Optional[List[Path]]:
         """
@@ -297,27 +284,19 @@ class CodeSymbolStore:
         Returns:
             List of file paths, or None if git not available (use fallback)
         """
-        cwd = base_dir if base_dir else self.project_dir
-        try:
-            result = subprocess.run(
-                ['git', 'ls-files', '--cached', '--others', '--exclude-standard'],
-                cwd=cwd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                files = []
-                for line in result.stdout.strip().split('\n'):
-                    if not line:
-                        continue
-                    path = Path(line)
-                    if path.suffix.lower() in extensions:
-                        files.append(path)
-                return files
-        except Exception:
-            pass
-        return None  # Fall back to glob + exclusions
+        git = GitAccess(base_dir) if base_dir else self._git
+        output = git.run(['ls-files', '--cached', '--others', '--exclude-standard'], timeout=30)
+        if output is None:
+            return None  # Fall back to glob + exclusions
+
+        files = []
+        for line in output.strip().split('\n'):
+            if not line:
+                continue
+            path = Path(line)
+            if path.suffix.lower() in extensions:
+                files.append(path)
+        return files
 
     # =========================================================================
     # AST Parsing
@@ -888,21 +867,10 @@ class CodeSymbolStore:
         extensions.append('.md')  # Always include markdown
         file_patterns = [f'*{ext}' for ext in extensions]
 
-        try:
-            cmd = ['git', 'diff', '--name-only', since_hash, 'HEAD', '--'] + file_patterns
-            result = subprocess.run(
-                cmd,
-                cwd=self.project_dir,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
-            if result.returncode == 0:
-                return [Path(f) for f in result.stdout.strip().split('\n') if f]
-        except Exception:
-            pass
-
-        return []
+        output = self._git.run(['diff', '--name-only', since_hash, 'HEAD', '--'] + file_patterns, timeout=30)
+        if output is None:
+            return []
+        return [Path(f) for f in output.strip().split('\n') if f]
 
     def index_changed_files(self) -> Tuple[int, int]:
         """
@@ -27,6 +27,9 @@ Usage:
     # Parallel map for batch operations
     results = orchestrator.map_parallel(process_item, items)
 
+    # Fan-out LLM coroutines on one event loop
+    suggestions = orchestrator.map_async(provider_call, items)
+
     # Graceful shutdown
     orchestrator.shutdown()
 
@@ -38,8 +41,9 @@ Configuration via environment variables:
     BABEL_TASK_TIMEOUT=60          # Default task timeout (seconds)
 """
 
+import asyncio
 import threading
-from typing import List, Callable, Any, Optional, Dict
+from typing import Awaitable, List, Callable, Any, Optional, Dict
 from concurrent.futures import Future
 
 from .task import (
@@ -48,7 +52,7 @@ from .task import (
 )
 from .config import OrchestratorConfig
 from .scheduler import PriorityScheduler
-from .pools import IOPool, CPUPool
+from .pools import IOPool, CPUPool, AsyncPool
 from .aggregator import ResultAggregator, BatchWriter
 from .metrics import MetricsCollector
 
@@ -59,7 +63,8 @@ class TaskOrchestrator:
 
     Manages:
     - Priority scheduling (CRITICAL > HIGH > NORMAL > BACKGROUND)
-    - Typed worker pools (ThreadPool for I/O, ProcessPool for CPU)
+    - Typed worker pools (ThreadPool for I/O, ProcessPool for CPU,
+      event loop for async LLM calls)
     - Result aggregation (thread-safe collection)
     - Metrics collection (observability)
 
@@ -91,6 +96,7 @@ class TaskOrchestrator:
         self._scheduler: Optional[PriorityScheduler] = None
         self._io_pool: Optional[IOPool] = None
         self._cpu_pool: Optional[CPUPool] = None
+        self._async_pool: Optional[AsyncPool] = None  # Started on first map_async
         self._aggregator: Optional[ResultAggregator] = None
         self._metrics: Optional[MetricsCollector] = None
 
@@ -257,6 +263,58 @@ class TaskOrchestrator:
 
         return results
 
+    def map_async(
+        self,
+        fn: Callable[[Any], Awaitable[Any]],
+        items: List[Any],
+        timeout: Optional[float] = None,
+        item_timeout: Optional[float] = None,
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Concurrent map of a coroutine function (LLM calls).
+
+        Awaits fn(item) for each item on the orchestrator's event loop,
+        at most BABEL_LLM_CONCURRENT at a time, returning results in the
+        same order as items. No thread is held per waiting call.
+
+        Args:
+            fn: Coroutine function (e.g. provider.acomplete wrapper)
+            items: Items to process
+            timeout: Optional timeout for entire operation
+            item_timeout: Timeout per call (default: config.task_timeout)
+            return_exceptions: Return failures in place of results
+                instead of raising the first one
+
+        Returns:
+            List of results in same order as items
+
+        Raises:
+            RuntimeError: If orchestrator is shut down
+        """
+        self._ensure_started()
+
+        if not items:
+            return []
+
+        if self._shutdown:
+            raise RuntimeError("Orchestrator is shut down")
+
+        if item_timeout is None:
+            item_timeout = self._config.task_timeout
+
+        if not self._config.enabled:
+            # Sequential fallback (private event loop)
+            return asyncio.run(_map_sequential(fn, items, item_timeout, return_exceptions))
+
+        with self._lock:
+            if self._async_pool is None:
+                self._async_pool = AsyncPool(self._config)
+        return self._async_pool.map(
+            fn, items, timeout=timeout, item_timeout=item_timeout,
+            return_exceptions=return_exceptions
+        )
+
     def drain_results(self, timeout: float = 0.1) -> List[TaskResult]:
         """
         Drain all completed results.
@@ -316,6 +374,8 @@ class TaskOrchestrator:
             summary["io_pool"] = self._io_pool.stats().to_dict()
         if self._cpu_pool:
             summary["cpu_pool"] = self._cpu_pool.stats().to_dict()
+        if self._async_pool:
+            summary["async_pool"] = self._async_pool.stats().to_dict()
 
         return summary
 
@@ -361,6 +421,9 @@ class TaskOrchestrator:
             if self._cpu_pool:
                 self._cpu_pool.shutdown(wait=wait)
 
+            if self._async_pool:
+                self._async_pool.shutdown(wait=wait)
+
     def _execute_sequential(self, task: Task) -> Future:
         """
         Execute task sequentially (fallback mode).
@@ -423,6 +486,24 @@ class TaskOrchestrator:
                 self._metrics.record_error(task.task_type, "exception")
 
 
+async def _map_sequential(
+    fn: Callable[[Any], Awaitable[Any]],
+    items: List[Any],
+    item_timeout: Optional[float],
+    return_exceptions: bool
+) -> List[Any]:
+    """Await fn(item) one item at a time (orchestrator disabled)."""
+    results = []
+    for item in items:
+        try:
+            results.append(await asyncio.wait_for(fn(item), item_timeout))
+        except Exception as e:
+            if not return_exceptions:
+                raise
+            results.append(e)
+    return results
+
+
 # Global orchestrator instance (singleton pattern)
 _orchestrator: Optional[TaskOrchestrator] = None
 _orchestrator_lock = threading.Lock()
@@ -485,6 +566,7 @@ __all__ = [
     "PriorityScheduler",
     "IOPool",
     "CPUPool",
+    "AsyncPool",
     "ResultAggregator",
     "BatchWriter",
     "MetricsCollector",
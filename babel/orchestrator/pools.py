@@ -1,9 +1,10 @@
 """
 WorkerPools — Typed execution pools for parallel work
 
-Implements two pool types:
+Implements three pool types:
 - IOPool: ThreadPoolExecutor for I/O-bound work (LLM, file, network)
 - CPUPool: ProcessPoolExecutor for CPU-bound work (parsing, similarity)
+- AsyncPool: One asyncio event loop for fan-out LLM coroutines
 
 Design principles:
 - ThreadPool for I/O (GIL doesn't block I/O operations)
@@ -12,10 +13,11 @@ Design principles:
 - Graceful degradation to sequential on failure
 """
 
+import asyncio
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future
-from typing import Callable, Any, Optional, List
+from typing import Awaitable, Callable, Any, Optional, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
@@ -286,6 +288,145 @@ class CPUPool:
         self._executor.shutdown(wait=wait)
 
 
+class AsyncPool:
+    """
+    Event loop for async I/O-bound operations (LLM coroutines).
+
+    One background thread runs an asyncio loop shared by all coroutines,
+    so dozens of concurrent LLM calls cost no thread each. LLM calls take
+    a slot from a semaphore sized by BABEL_LLM_CONCURRENT and are spaced
+    by BABEL_LLM_RATE_LIMIT, like RateLimiter does for IOPool.
+
+    Cancellation propagates: a map() that times out or is interrupted
+    cancels its outstanding coroutines on the loop.
+    """
+
+    def __init__(self, config: OrchestratorConfig):
+        self._config = config
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="babel-async", daemon=True
+        )
+        self._thread.start()
+        self._semaphore: Optional[asyncio.Semaphore] = None  # Created on the loop
+        self._next_slot = 0.0
+        self._stats = PoolStats()
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    async def _call(self, fn: Callable[[Any], Awaitable[Any]], item: Any,
+                    timeout: Optional[float]) -> Any:
+        """Run one LLM coroutine within the concurrency and rate limits."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._config.llm_concurrent)
+
+        with self._lock:
+            self._stats.active_tasks += 1
+        started = time.monotonic()
+        try:
+            async with self._semaphore:
+                # Space call starts by the rate-limit interval
+                now = self._loop.time()
+                start = max(now, self._next_slot)
+                self._next_slot = start + 1.0 / self._config.llm_rate_limit
+                if start > now:
+                    await asyncio.sleep(start - now)
+
+                # Timeout covers the call itself, not the wait for a slot
+                result = await asyncio.wait_for(fn(item), timeout)
+        except BaseException:
+            with self._lock:
+                self._stats.active_tasks -= 1
+                self._stats.failed_tasks += 1
+            raise
+
+        with self._lock:
+            self._stats.active_tasks -= 1
+            self._stats.completed_tasks += 1
+            self._stats.total_duration_ms += (time.monotonic() - started) * 1000
+        return result
+
+    async def _gather(self, fn: Callable[[Any], Awaitable[Any]], items: List[Any],
+                      item_timeout: Optional[float], return_exceptions: bool) -> List[Any]:
+        tasks = [asyncio.ensure_future(self._call(fn, item, item_timeout)) for item in items]
+        try:
+            return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+        except BaseException:
+            # First failure (or cancellation of the map): stop the rest
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    def map(self, fn: Callable[[Any], Awaitable[Any]], items: List[Any],
+            timeout: Optional[float] = None, item_timeout: Optional[float] = None,
+            return_exceptions: bool = False) -> List[Any]:
+        """
+        Await fn(item) for all items concurrently on the loop.
+
+        Blocks until all complete. Returns results in same order as items;
+        with return_exceptions, failed items hold their exception instead
+        of failing the whole map.
+
+        Raises:
+            concurrent.futures.TimeoutError: If timeout expires (calls cancelled)
+        """
+        if not items:
+            return []
+
+        if self._shutdown:
+            raise RuntimeError("Pool is shut down")
+
+        future = asyncio.run_coroutine_threadsafe(
+            self._gather(fn, items, item_timeout, return_exceptions), self._loop
+        )
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def stats(self) -> PoolStats:
+        """Get pool statistics."""
+        with self._lock:
+            return PoolStats(
+                active_tasks=self._stats.active_tasks,
+                completed_tasks=self._stats.completed_tasks,
+                failed_tasks=self._stats.failed_tasks,
+                total_duration_ms=self._stats.total_duration_ms
+            )
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shutdown the pool, cancelling coroutines still running."""
+        if self._shutdown:
+            return
+        self._shutdown = True
+
+        async def cancel_all():
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if wait:
+            try:
+                asyncio.run_coroutine_threadsafe(cancel_all(), self._loop).result(
+                    timeout=self._config.shutdown_timeout
+                )
+            except Exception:
+                pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if wait:
+            self._thread.join(self._config.shutdown_timeout)
+            if not self._thread.is_alive():
+                # Like asyncio.run: lets loop-bound clients close on this loop
+                try:
+                    self._loop.run_until_complete(self._loop.shutdown_asyncgens())
+                except Exception:
+                    pass
+                self._loop.close()
+
+
 # Standalone execution for ProcessPool (must be picklable)
 def _execute_cpu_task(task: Task) -> TaskResult:
     """Execute a CPU-bound task (standalone for ProcessPool)."""
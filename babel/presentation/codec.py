@@ -8,6 +8,7 @@ Key properties:
 - DETERMINISTIC: Same ID always produces same code (hash-based)
 - PERSISTENT: Works across commands without storage (computation = persistence)
 - READABLE: AA-BB format is distinct and memorable
+- INDEXED: Optional code index (graph.db) makes decode a single lookup
 
 Usage:
     codec = IDCodec()
@@ -16,14 +17,19 @@ Usage:
     code = codec.encode("c4dded21")       # Returns "KM-XP" (always same)
     code = codec.encode("decision_abc")   # Returns "PL-QR" (always same)
 
-    # Decoding (input) - requires candidate scanning
+    # Decoding (input) - candidate scanning or indexed lookup
     full_id = codec.decode("KM-XP", candidate_ids)  # Returns "c4dded21"
 
-Code space: 26^4 = 456,976 combinations (sufficient for any project)
+    indexed = IDCodec(index=graph)                  # GraphStore code index
+    full_id = indexed.decode("KM-XP")               # Single lookup
+    matches = indexed.matches("KM-XP")              # >1 = collision
+
+Code space: 26^4 = 456,976 combinations (collisions possible, reported
+as ambiguity by matches() rather than resolved to the first hit)
 """
 
 import re
-from typing import List
+from typing import List, Optional, Protocol
 
 import xxhash
 
@@ -32,17 +38,30 @@ import xxhash
 CODE_PATTERN = re.compile(r'^[A-Z]{2}-[A-Z]{2}$')
 
 
+class CodeIndex(Protocol):
+    """Persistent code -> IDs lookup (implemented by GraphStore)."""
+
+    def lookup_code(self, code: str) -> List[str]:
+        ...
+
+
 class IDCodec:
     """
     Deterministic hash-based ID aliasing for ergonomic artifact references.
 
     Uses xxhash for fast, deterministic code generation.
-    Same ID always produces same code - no storage needed.
+    Same ID always produces same code - no storage needed for encoding.
+    Decoding without candidates uses the optional code index.
     """
 
-    def __init__(self):
-        """Initialize codec (stateless - no instance state needed)."""
-        pass  # Stateless - all computation is deterministic
+    def __init__(self, index: Optional[CodeIndex] = None):
+        """
+        Initialize codec.
+
+        Args:
+            index: Optional code index for decoding without candidate lists
+        """
+        self.index = index
 
     def encode(self, full_id: str) -> str:
         """
@@ -66,40 +85,54 @@ class IDCodec:
 
     def decode(self, code: str, candidate_ids: List[str] = None) -> str:
         """
-        Resolve code to full ID by scanning candidates.
+        Resolve code to full ID.
 
         Args:
             code: AA-BB format code (e.g., "KM-XP")
-            candidate_ids: List of full IDs to scan (required for resolution)
+            candidate_ids: List of full IDs to scan (None = use index)
 
         Returns:
-            Full ID if found, original code otherwise (passthrough)
+            Full ID if exactly one matches, original code otherwise (passthrough)
 
         Note:
-            Resolution works by encoding each candidate and comparing.
-            Without candidates, returns the code unchanged (passthrough).
+            Colliding codes also pass through unchanged - use matches()
+            to tell ambiguity apart from no match.
         """
         if not code:
             return code
 
-        # Normalize code format
-        code_upper = code.upper()
+        found = self.matches(code, candidate_ids)
+        if len(found) == 1:
+            return found[0]
 
-        # If not a valid code pattern, passthrough
-        if not self.is_short_code(code_upper):
-            return code
+        # No match or collision - passthrough
+        return code
 
-        # Without candidates, cannot resolve - passthrough
-        if not candidate_ids:
-            return code
+    def matches(self, code: str, candidate_ids: List[str] = None) -> List[str]:
+        """
+        Find every ID that encodes to code.
 
-        # Scan candidates to find match
-        for candidate in candidate_ids:
-            if self.encode(candidate) == code_upper:
-                return candidate
+        Args:
+            code: AA-BB format code (case-insensitive)
+            candidate_ids: IDs to scan; if None, the code index is queried
 
-        # No match found - passthrough
-        return code
+        Returns:
+            Matching IDs (empty if none, several on collision)
+        """
+        if not self.is_short_code(code):
+            return []
+
+        code_upper = code.upper()
+
+        if candidate_ids is not None:
+            # Scan candidates (dedupe, preserve order)
+            return [c for c in dict.fromkeys(candidate_ids) if self.encode(c) == code_upper]
+
+        if self.index is not None:
+            return self.index.lookup_code(code_upper)
+
+        # Without candidates or index, cannot resolve
+        return []
 
     def is_short_code(self, value: str) -> bool:
         """
@@ -13,17 +13,30 @@ Architecture:
 - Capture-time: Generate digest when artifact captured
 - Display-time: Show pre-computed digest (no truncation needed)
 - On-demand: Full content always available via `babel show`
+
+Digests are pure functions of the text, so they are memoized in a
+content-hash keyed LRU cache (DigestCache), optionally persisted so a
+new process never re-runs YAKE on unchanged text. YAKE itself is only
+imported when a digest actually has to be computed.
 """
 
+import importlib.util
+import os
 import re
+from collections import OrderedDict
+from pathlib import Path
 from typing import Optional, List
 
+import orjson
+import xxhash
+
 # YAKE is optional - graceful fallback if not installed
-try:
-    import yake
-    YAKE_AVAILABLE = True
-except ImportError:
-    YAKE_AVAILABLE = False
+# (imported lazily: importing it costs ~0.3s, most runs hit the cache)
+YAKE_AVAILABLE = importlib.util.find_spec("yake") is not None
+
+# Digest cache bounds (entries are one short string each)
+DIGEST_CACHE_SIZE = 4096
+DIGEST_CACHE_VERSION = 1
 
 
 # =============================================================================
@@ -113,6 +126,82 @@ def extract_technical_terms(text: str) -> List[str]:
     return unique
 
 
+# =============================================================================
+# Digest Cache
+# =============================================================================
+
+class DigestCache:
+    """
+    Content-hash keyed digest cache with LRU eviction.
+
+    Args:
+        path: JSON file to persist entries in (None = memory only)
+        max_entries: Entries kept; least recently used are evicted
+
+    Persistence is a cache (rebuildable): unreadable files start empty
+    and write failures are ignored.
+    """
+
+    def __init__(self, path: Optional[Path] = None, max_entries: int = DIGEST_CACHE_SIZE):
+        self.path = Path(path) if path else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._loaded = self.path is None
+        self._dirty = False
+
+    @staticmethod
+    def key(*parts) -> str:
+        """Hash key for the inputs a digest depends on."""
+        return xxhash.xxh64("\x1f".join(str(p) for p in parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        self._load()
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: str):
+        self._load()
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        self._dirty = True
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._entries)
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = orjson.loads(self.path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return
+        if isinstance(data, dict) and data.get("version") == DIGEST_CACHE_VERSION:
+            for key, value in data.get("entries", [])[-self.max_entries:]:
+                self._entries[key] = value
+
+    def save(self):
+        """Persist entries if changed (fail silently - cache is rebuildable)."""
+        if not self._dirty or self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_bytes(orjson.dumps({
+                "version": DIGEST_CACHE_VERSION,
+                "entries": list(self._entries.items()),
+            }))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except (OSError, TypeError):
+            pass
+
+
 # =============================================================================
 # Digest Generator
 # =============================================================================
@@ -130,27 +219,41 @@ class DigestGenerator:
                  [API calls, 50/min]"
     """
 
-    def __init__(self, language: str = "en", max_keywords: int = 3):
+    def __init__(
+        self,
+        language: str = "en",
+        max_keywords: int = 3,
+        cache: Optional[DigestCache] = None
+    ):
         """
         Initialize digest generator.
 
         Args:
             language: Language code for YAKE (default: "en")
             max_keywords: Maximum keywords to append (default: 3)
+            cache: Digest cache (default: in-memory LRU)
         """
         self.language = language
         self.max_keywords = max_keywords
+        self.cache = cache if cache is not None else DigestCache()
         self._extractor = None
-
-        # Initialize YAKE if available
-        if YAKE_AVAILABLE:
-            self._extractor = yake.KeywordExtractor(
-                lan=language,
-                n=2,              # Max 2-word phrases
-                top=10,           # Extract top 10, filter later
-                dedupLim=0.7,     # Deduplication threshold
-                features=None,    # Use default features
-            )
+        self._extractor_ready = False
+
+    @property
+    def extractor(self):
+        """YAKE extractor, created on first use (None if unavailable)."""
+        if not self._extractor_ready:
+            self._extractor_ready = True
+            if YAKE_AVAILABLE:
+                import yake
+                self._extractor = yake.KeywordExtractor(
+                    lan=self.language,
+                    n=2,              # Max 2-word phrases
+                    top=10,           # Extract top 10, filter later
+                    dedupLim=0.7,     # Deduplication threshold
+                    features=None,    # Use default features
+                )
+        return self._extractor
 
     def generate(
         self,
@@ -180,6 +283,12 @@ class DigestGenerator:
 
         max_kw = max_keywords or self.max_keywords
 
+        # Unchanged text never goes through keyword extraction twice
+        key = DigestCache.key(self.language, max_kw, content)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+
         # Extract first sentence (usually contains the decision/main point)
         sentences = split_sentences(content)
         first = sentences[0] if sentences else content
@@ -187,9 +296,9 @@ class DigestGenerator:
         # Get keywords to append
         keywords = self._extract_keywords(content, first, max_kw)
 
-        if keywords:
-            return f"{first} [{', '.join(keywords)}]"
-        return first
+        digest = f"{first} [{', '.join(keywords)}]" if keywords else first
+        self.cache.put(key, digest)
+        return digest
 
     def _extract_keywords(
         self,
@@ -204,9 +313,9 @@ class DigestGenerator:
         """
         first_lower = first_sentence.lower()
 
-        if self._extractor:
+        if self.extractor:
             # Use YAKE for keyword extraction
-            keywords = self._extractor.extract_keywords(content)
+            keywords = self.extractor.extract_keywords(content)
             terms = [kw for kw, score in keywords]
         else:
             # Fallback: extract technical terms
@@ -256,6 +365,24 @@ def get_generator() -> DigestGenerator:
     return _generator
 
 
+def use_digest_cache(path: Path) -> DigestCache:
+    """
+    Persist the singleton generator's digests at path.
+
+    Entries already computed in this process are kept. Call save() on
+    the returned cache (e.g. at exit) to write them.
+    """
+    generator = get_generator()
+    current = generator.cache
+    if current.path == Path(path):
+        return current
+    cache = DigestCache(path, max_entries=current.max_entries)
+    for key, value in current._entries.items():
+        cache.put(key, value)
+    generator.cache = cache
+    return cache
+
+
 def generate_digest(
     content: str,
     content_type: str = "decision",
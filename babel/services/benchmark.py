@@ -290,7 +290,7 @@ def run_benchmark(
             )
             local_provider = get_provider(test_config)
 
-            if isinstance(local_provider, MockProvider):
+            if isinstance(local_provider, MockProvider) or not local_provider.is_available:
                 results.local_available = False
                 results.local_error = f"Ollama not running at {local_cfg.base_url}"
             else:
@@ -15,15 +15,25 @@ Context-Aware Extraction:
 - Optional semantic enhancement when online
 """
 
+import asyncio
+import importlib.util
 import json
+import os
 import re
-from typing import Dict, Any, Optional, List, TYPE_CHECKING, Callable
+from functools import lru_cache
+from typing import Dict, Any, Iterable, Optional, List, Tuple, TYPE_CHECKING, Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from datetime import datetime, timezone
 
-from rapidfuzz import fuzz
+import orjson
+import xxhash
+from rapidfuzz import fuzz, process
 
+from ..core.budget import budget_from_env, line_tokens, pack_to_budget
+from ..core.horizon import estimate_tokens
+from ..core.jsonstream import JsonArrayStream
+from ..core.tokenizer import tokenize_text
 from ..presentation.symbols import sanitize_control_chars
 
 if TYPE_CHECKING:
@@ -54,14 +64,21 @@ class ExistingArtifact:
     artifact_type: str
     summary: str
     artifact_id: str = ""
+    tokens: Optional[int] = None  # Cached estimate_tokens(summary), if known
 
 
 # =============================================================================
 # Text Similarity (Offline-First per HC3)
 # =============================================================================
 
+# process.cdist returns a numpy matrix; without numpy, dedup falls back to
+# one process.extractOne scan per proposal (same scores, single-threaded)
+CDIST_AVAILABLE = importlib.util.find_spec("numpy") is not None
+
+
+@lru_cache(maxsize=8192)
 def normalize_text(text: str) -> str:
-    """Normalize text for comparison."""
+    """Normalize text for comparison (memoized: summaries recur every capture)."""
     # Lowercase, strip, collapse whitespace
     text = text.lower().strip()
     text = re.sub(r'\s+', ' ', text)
@@ -94,47 +111,228 @@ def calculate_similarity(text1: str, text2: str) -> float:
     return fuzz.token_set_ratio(norm1, norm2) / 100.0
 
 
+def find_similar(queries: List[str], choices: List[str], threshold: float) -> List[bool]:
+    """
+    For each query, whether any choice reaches the similarity threshold.
+
+    Same score as calculate_similarity, but all queries are compared in
+    one rapidfuzz.process.cdist call (multi-threaded, with a score cutoff)
+    instead of a Python loop per pair. Empty texts never match.
+
+    Args:
+        queries: Texts to check
+        choices: Texts to compare against
+        threshold: Similarity threshold (0.0-1.0)
+    """
+    norm_queries = [normalize_text(q) if q else "" for q in queries]
+    norm_choices = [c for c in (normalize_text(c) for c in choices if c) if c]
+    if not norm_choices:
+        return [False] * len(queries)
+
+    cutoff = threshold * 100
+    if CDIST_AVAILABLE:
+        import numpy
+        scores = process.cdist(
+            norm_queries, norm_choices,
+            scorer=fuzz.token_set_ratio,
+            score_cutoff=cutoff,
+            dtype=numpy.float64,
+            workers=-1
+        )
+        best = scores.max(axis=1)
+        return [bool(q) and float(s) >= cutoff for q, s in zip(norm_queries, best)]
+
+    return [
+        bool(q) and process.extractOne(
+            q, norm_choices, scorer=fuzz.token_set_ratio, score_cutoff=cutoff
+        ) is not None
+        for q in norm_queries
+    ]
+
+
 class ExtractionQueue:
     """
     Queue for offline extraction requests (TD4: local-first).
     
     When LLM unavailable, requests queue here.
     Process when connection restores.
+
+    The queue file is an append-only log. A small cursor file next to it
+    records how far the log has been processed and the content hashes of
+    pending items, so:
+    - count() is O(1) (no parsing of the log)
+    - identical texts queued twice are collapsed into one item
+    - processing advances the cursor; failed items are re-appended
+
+    The cursor is rebuildable (HC3): if it is missing or does not match
+    the log's size, it is recomputed from the log.
     """
-    
+
+    CURSOR_VERSION = 1
+
     def __init__(self, path: Path):
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.cursor_path = self.path.with_name(self.path.name + ".cursor")
     
-    def add(self, text: str, source_id: str):
-        """Add extraction request to queue."""
+    @staticmethod
+    def _key(text: str) -> str:
+        return xxhash.xxh64(text.encode('utf-8')).hexdigest()
+
+    def add(self, text: str, source_id: str) -> bool:
+        """
+        Add extraction request to queue.
+
+        Returns:
+            False if an identical text is already pending (not re-queued)
+        """
+        cursor = self._cursor()
+        key = self._key(text)
+        if key in cursor["pending"]:
+            return False
+
         item = QueuedExtraction(text=text, source_id=source_id)
-        with open(self.path, 'a') as f:
-            f.write(json.dumps({
-                'text': item.text,
-                'source_id': item.source_id,
-                'queued_at': item.queued_at
-            }) + '\n')
-    
+        self._append([item])
+        cursor["pending"].append(key)
+        self._write_cursor(cursor["offset"], cursor["pending"])
+        return True
+
     def get_all(self) -> List[QueuedExtraction]:
-        """Get all queued items."""
-        items = []
-        if self.path.exists():
-            with open(self.path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        data = json.loads(line)
-                        items.append(QueuedExtraction(**data))
-        return items
-    
+        """Get all pending items (oldest first)."""
+        return self.read_pending()[0]
+
+    def read_pending(self) -> Tuple[List[QueuedExtraction], int]:
+        """
+        Pending items and the log offset they end at.
+
+        Pass the offset to advance() once the items are processed, so
+        items appended meanwhile stay pending.
+        """
+        offset = self._cursor()["offset"]
+        items, end = self._read_from(offset)
+        return self._unique(items), end
+
+    def advance(self, end: int, retry: Iterable[QueuedExtraction] = ()):
+        """
+        Mark items up to a log offset processed (see read_pending).
+
+        Args:
+            end: Offset returned by read_pending
+            retry: Items that failed and should stay queued (re-appended)
+        """
+        retry = list(retry)
+        if retry:
+            self._append(retry)
+
+        remaining, size = self._read_from(end)
+        if not remaining:
+            self.clear()  # Fully drained: start a fresh log
+            return
+        self._write_cursor(end, [self._key(i.text) for i in self._unique(remaining)], size)
+
     def clear(self):
         """Clear queue after processing."""
-        if self.path.exists():
-            self.path.unlink()
+        for path in (self.path, self.cursor_path):
+            if path.exists():
+                path.unlink()
     
     def count(self) -> int:
-        return len(self.get_all())
+        """Number of pending items (reads only the cursor)."""
+        return len(self._cursor()["pending"])
+
+    # =========================================================================
+    # Log and Cursor Files
+    # =========================================================================
+
+    def _append(self, items: List[QueuedExtraction]):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps({
+                'text': item.text,
+                'source_id': item.source_id,
+                'queued_at': item.queued_at
+            }) + '\n' for item in items))
+
+    def _read_from(self, offset: int) -> Tuple[List[QueuedExtraction], int]:
+        """Items logged at or after a byte offset, and the offset read up to."""
+        if not self.path.exists():
+            return [], 0
+        items = []
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            data = f.read()
+        # Only complete lines count (an append may be in progress)
+        complete = data.rfind(b'\n') + 1
+        for line in data[:complete].splitlines():
+            line = line.strip()
+            if line:
+                items.append(QueuedExtraction(**json.loads(line)))
+        return items, offset + complete
+
+    def _unique(self, items: List[QueuedExtraction]) -> List[QueuedExtraction]:
+        """First occurrence of each distinct text."""
+        seen = set()
+        unique = []
+        for item in items:
+            key = self._key(item.text)
+            if key not in seen:
+                seen.add(key)
+                unique.append(item)
+        return unique
+
+    def _size(self) -> int:
+        try:
+            return self.path.stat().st_size
+        except OSError:
+            return 0
+
+    def _cursor(self) -> Dict[str, Any]:
+        """Processed offset and pending hashes, rebuilt if stale."""
+        size = self._size()
+        try:
+            cursor = orjson.loads(self.cursor_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            cursor = None
+        if not isinstance(cursor, dict) or cursor.get("version") != self.CURSOR_VERSION:
+            cursor = {}
+
+        offset = cursor.get("offset", 0)
+        if not isinstance(offset, int) or not 0 <= offset <= size:
+            offset = 0
+        if cursor.get("size") == size and offset == cursor.get("offset"):
+            return cursor
+
+        # Log changed behind the cursor (or no cursor yet): keep the offset
+        # if it still falls on a line boundary, then rebuild pending
+        if offset and not self._at_line_start(offset):
+            offset = 0
+        items, _ = self._read_from(offset)
+        pending = [self._key(i.text) for i in self._unique(items)]
+        self._write_cursor(offset, pending, size)
+        return {"offset": offset, "pending": pending, "size": size}
+
+    def _at_line_start(self, offset: int) -> bool:
+        try:
+            with open(self.path, 'rb') as f:
+                f.seek(offset - 1)
+                return f.read(1) == b'\n'
+        except OSError:
+            return False
+
+    def _write_cursor(self, offset: int, pending: List[str], size: Optional[int] = None):
+        """Persist the cursor atomically (fail silently - it is rebuildable)."""
+        if not self.path.exists():
+            return
+        try:
+            tmp = self.cursor_path.with_name(self.cursor_path.name + ".tmp")
+            tmp.write_bytes(orjson.dumps({
+                "version": self.CURSOR_VERSION,
+                "offset": offset,
+                "size": self._size() if size is None else size,
+                "pending": pending,
+            }))
+            os.replace(tmp, self.cursor_path)
+        except OSError:
+            pass
 
 
 class Extractor:
@@ -151,7 +349,9 @@ class Extractor:
     - Processes queue when LLM available
     """
     
-    SYSTEM_PROMPT = """You are an extraction assistant for an intent preservation system.
+    # Role, artifact types and rules shared by the single and batch prompts;
+    # each prompt then gives exactly one output format
+    EXTRACTION_INSTRUCTIONS = """You are an extraction assistant for an intent preservation system.
 
 Your role: Identify structured artifacts in natural conversation. Propose, don't decide.
 
@@ -174,7 +374,9 @@ EXTRACTION RULES:
 4. One artifact per distinct item. Don't merge.
 5. If nothing extractable, say so. Empty is valid.
 6. CRITICAL: Check EXISTING ARTIFACTS section. Do NOT extract duplicates of existing items.
-   If the text contains something very similar to an existing artifact, skip it.
+   If the text contains something very similar to an existing artifact, skip it."""
+
+    SYSTEM_PROMPT = EXTRACTION_INSTRUCTIONS + """
 
 OUTPUT FORMAT (JSON only, no markdown):
 {
@@ -208,13 +410,72 @@ If nothing to extract:
   }
 }"""
 
+    BATCH_SYSTEM_PROMPT = EXTRACTION_INSTRUCTIONS + """
+
+BATCH MODE:
+The user message contains several independent texts, each under a header
+"=== ITEM <n> ===". Extract from each text separately.
+
+OUTPUT FORMAT (JSON only, no markdown):
+{
+  "items": [
+    {
+      "item": 1,
+      "artifacts": [
+        {
+          "type": "decision",
+          "summary": "One-line summary (under 100 chars)",
+          "content": {
+            "what": "What was decided",
+            "why": "Rationale given",
+            "alternatives": ["Other options mentioned"],
+            "context": "Relevant context"
+          },
+          "confidence": 0.85,
+          "rationale": "Why I extracted this, what signals I saw"
+        }
+      ],
+      "meta": {
+        "extractable": true,
+        "ambiguities": ["Any unclear points"]
+      }
+    },
+    {
+      "item": 2,
+      "artifacts": [],
+      "meta": {
+        "extractable": false,
+        "reason": "Why nothing was found"
+      }
+    }
+  ]
+}
+
+Include every item number exactly once, with an empty artifacts list for
+an item with nothing to extract. Always answer with the "items" list,
+never with a single top-level "artifacts" list."""
+
     # Default similarity threshold for deduplication
     DEFAULT_SIMILARITY_THRESHOLD = 0.6
 
+    # Queue processing packs several texts into one prompt, so the system
+    # prompt is sent once per batch instead of once per text
+    BATCH_TOKEN_BUDGET = 6000        # Estimated tokens of item texts per prompt
+    BATCH_MAX_ITEMS = 10
+    BATCH_MAX_OUTPUT_TOKENS = 8192
+
+    # Existing artifacts shown to prevent duplicates are packed into this
+    # many tokens, most relevant to the captured text first
+    # (BABEL_EXTRACT_CONTEXT_TOKENS overrides)
+    DEFAULT_CONTEXT_TOKEN_BUDGET = 1500
+
     def __init__(self, provider: Optional['LLMProvider'] = None, queue_path: Optional[Path] = None,
                  on_llm_start: Optional[Callable[[], None]] = None,
                  on_llm_complete: Optional[Callable[['LLMResponse'], None]] = None,
-                 similarity_threshold: float = None):
+                 similarity_threshold: float = None,
+                 on_proposal: Optional[Callable[[Proposal], None]] = None,
+                 context_token_budget: int = None,
+                 on_llm_progress: Optional[Callable[[int, int], None]] = None):
         """
         Initialize extractor.
 
@@ -224,13 +485,25 @@ If nothing to extract:
             on_llm_start: Callback when LLM call begins (for UX feedback).
             on_llm_complete: Callback when LLM call completes (receives LLMResponse with tokens).
             similarity_threshold: Threshold for deduplication (0.0-1.0). Default 0.6.
+            on_proposal: Callback per non-duplicate proposal as it streams in
+                (before the LLM response is complete).
+            context_token_budget: Tokens of existing artifacts per prompt.
+                Default BABEL_EXTRACT_CONTEXT_TOKENS or 1500.
+            on_llm_progress: Callback (done, total) as concurrent batches
+                finish; concurrent calls report through it instead of
+                on_llm_start/on_llm_complete per call.
         """
         self.provider = provider
         self.queue = ExtractionQueue(queue_path) if queue_path else None
         self._on_llm_start = on_llm_start
         self._on_llm_complete = on_llm_complete
+        self._on_proposal = on_proposal
+        self._on_llm_progress = on_llm_progress
         self._last_response: Optional['LLMResponse'] = None
         self.similarity_threshold = similarity_threshold or self.DEFAULT_SIMILARITY_THRESHOLD
+        self.context_token_budget = context_token_budget or budget_from_env(
+            "BABEL_EXTRACT_CONTEXT_TOKENS", self.DEFAULT_CONTEXT_TOKEN_BUDGET
+        )
 
     @property
     def last_response(self) -> Optional['LLMResponse']:
@@ -259,9 +532,18 @@ If nothing to extract:
         existing_context = existing_context or []
 
         if self.is_available:
+            kept: List[Proposal] = []
+
+            def keep(proposal: Proposal):
+                # Deduplicated as each proposal arrives, so it can be shown early
+                if self._deduplicate_proposals([proposal], existing_context):
+                    kept.append(proposal)
+                    if self._on_proposal:
+                        self._on_proposal(proposal)
+
             try:
-                proposals = self._extract_with_llm(text, source_id, existing_context)
-                return self._deduplicate_proposals(proposals, existing_context)
+                self._extract_with_llm(text, source_id, existing_context, on_proposal=keep)
+                return kept
             except Exception:
                 # LLM failed — queue for later if possible
                 if self.queue:
@@ -281,8 +563,14 @@ If nothing to extract:
             return []
     
     def _extract_with_llm(self, text: str, source_id: str,
-                          existing_context: Optional[List[ExistingArtifact]] = None) -> List[Proposal]:
-        """Extract using configured LLM provider with context awareness."""
+                          existing_context: Optional[List[ExistingArtifact]] = None,
+                          on_proposal: Optional[Callable[[Proposal], None]] = None) -> List[Proposal]:
+        """
+        Extract using configured LLM provider with context awareness.
+
+        The response is streamed and its artifacts parsed as they
+        complete; on_proposal is called for each proposal in order.
+        """
         # Signal LLM call starting (for UX feedback)
         if self._on_llm_start:
             self._on_llm_start()
@@ -291,11 +579,31 @@ If nothing to extract:
         system_prompt = self.SYSTEM_PROMPT
         user_prompt = self._build_user_prompt(text, existing_context or [])
 
-        response = self.provider.complete(
+        artifacts = JsonArrayStream("artifacts")
+        proposals: List[Proposal] = []
+        chunks: List[str] = []
+        response = None
+        for item in self.provider.complete_stream(
             system=system_prompt,
             user=user_prompt,
             max_tokens=2048
-        )
+        ):
+            if not isinstance(item, str):
+                response = item  # Final record: full text and token usage
+                continue
+            chunks.append(item)
+            for artifact in artifacts.feed(item):
+                try:
+                    proposal = self._artifact_to_proposal(artifact, source_id)
+                except (AttributeError, KeyError, TypeError, ValueError):
+                    continue
+                proposals.append(proposal)
+                if on_proposal:
+                    on_proposal(proposal)
+
+        if response is None:
+            from .providers import LLMResponse
+            response = LLMResponse(text="".join(chunks))
 
         # Store response for token access
         self._last_response = response
@@ -304,16 +612,51 @@ If nothing to extract:
         if self._on_llm_complete:
             self._on_llm_complete(response)
 
-        return self._parse_response(response.text, source_id)
+        if artifacts.count == 0:
+            # Nothing recognised while streaming: parse the whole response
+            proposals = self._parse_artifacts(response.text, source_id)
+            if proposals is None:
+                self._discard_response(system_prompt, user_prompt, 2048)
+                proposals = []
+            if on_proposal:
+                for proposal in proposals:
+                    on_proposal(proposal)
+        elif self._load_json(response.text) is None:
+            # Artifacts streamed before the response broke off (truncated)
+            self._discard_response(system_prompt, user_prompt, 2048)
+        return proposals
+
+    async def _aextract_with_llm(self, text: str, source_id: str,
+                                 existing_context: Optional[List[ExistingArtifact]] = None
+                                 ) -> Tuple[List[Proposal], 'LLMResponse']:
+        """
+        Coroutine form of _extract_with_llm (fan-out over queued items).
+
+        Runs concurrently with other calls, so it fires no callbacks and
+        returns its response (token usage) with the proposals.
+        """
+        user_prompt = self._build_user_prompt(text, existing_context or [])
+        response = await self.provider.acomplete(
+            system=self.SYSTEM_PROMPT,
+            user=user_prompt,
+            max_tokens=2048
+        )
+
+        proposals = self._parse_artifacts(response.text, source_id)
+        if proposals is None:
+            self._discard_response(self.SYSTEM_PROMPT, user_prompt, 2048)
+            return [], response
+        return proposals, response
 
     def _build_user_prompt(self, text: str, existing_context: List[ExistingArtifact]) -> str:
         """Build user prompt with existing artifacts context."""
         prompt_parts = []
 
         # Add existing artifacts context if available
-        if existing_context:
+        context = self._pack_existing_context(text, existing_context)
+        if context:
             prompt_parts.append("EXISTING ARTIFACTS (do NOT extract duplicates):")
-            for artifact in existing_context[:20]:  # Limit to prevent token overflow
+            for artifact in context:
                 prompt_parts.append(f"- [{artifact.artifact_type}] {artifact.summary}")
             prompt_parts.append("")  # Blank line
 
@@ -323,74 +666,107 @@ If nothing to extract:
 
         return "\n".join(prompt_parts)
     
+    def _pack_existing_context(self, text: str,
+                               existing_context: List[ExistingArtifact]) -> List[ExistingArtifact]:
+        """
+        Existing artifacts that fit context_token_budget, by relevance.
+
+        Relevance is the number of words shared with the captured text
+        (duplicates share vocabulary); ties prefer the most recent.
+        """
+        if not existing_context:
+            return []
+        words = tokenize_text(text)
+        ranked = sorted(
+            range(len(existing_context)),
+            key=lambda i: (len(words & tokenize_text(existing_context[i].summary)), i),
+            reverse=True
+        )
+        selected, _ = pack_to_budget(
+            [existing_context[i] for i in ranked],
+            self.context_token_budget,
+            cost=lambda a: line_tokens(a.summary, a.tokens)
+        )
+        return selected
+
     def _parse_response(self, response: str, source_id: str) -> List[Proposal]:
         """Parse LLM response into proposals."""
+        return self._parse_artifacts(response, source_id) or []
+
+    def _parse_artifacts(self, response: str, source_id: str) -> Optional[List[Proposal]]:
+        """Parse LLM response into proposals (None if it is not usable JSON)."""
+        data = self._load_json(response)
         try:
-            # Handle potential markdown code blocks
-            clean = response.strip()
-            if clean.startswith("```"):
-                # Remove code fence
-                lines = clean.split('\n')
-                clean = '\n'.join(lines[1:-1]) if lines[-1] == "```" else '\n'.join(lines[1:])
-                clean = clean.strip()
-            
-            data = json.loads(clean)
-
-            proposals = []
-            for artifact in data.get("artifacts", []):
-                artifact_type = artifact.get("type", "unknown")
-
-                # Layer 1 (Security): Sanitize LLM output before storing
-                # Removes control chars that could manipulate display
-                summary = sanitize_control_chars(artifact.get("summary", ""))
-                rationale = sanitize_control_chars(artifact.get("rationale", ""))
-
-                proposals.append(Proposal(
-                    source_id=source_id,
-                    artifact_type=artifact_type,
-                    content={
-                        "summary": summary,
-                        "detail": artifact.get("content", {}),
-                        "extraction_rationale": rationale
-                    },
-                    confidence=float(artifact.get("confidence", 0.5)),
-                    rationale=rationale
-                ))
-            
-            return proposals
-            
-        except (json.JSONDecodeError, KeyError, ValueError):
-            return []
+            return [
+                self._artifact_to_proposal(artifact, source_id)
+                for artifact in data.get("artifacts", [])
+            ]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    def _load_json(self, response: str) -> Optional[Any]:
+        """Decode a JSON response (None if malformed or truncated)."""
+        try:
+            return json.loads(self._strip_code_fence(response))
+        except json.JSONDecodeError:
+            return None
+
+    def _discard_response(self, system: str, user: str, max_tokens: int):
+        """Drop an unparseable response from the provider's response cache, if any."""
+        invalidate = getattr(self.provider, "invalidate", None)
+        if callable(invalidate):
+            invalidate(system, user, max_tokens)
+
+    @staticmethod
+    def _strip_code_fence(response: str) -> str:
+        """Handle potential markdown code blocks around a JSON response."""
+        clean = response.strip()
+        if clean.startswith("```"):
+            # Remove code fence
+            lines = clean.split('\n')
+            clean = '\n'.join(lines[1:-1]) if lines[-1] == "```" else '\n'.join(lines[1:])
+            clean = clean.strip()
+        return clean
+
+    @staticmethod
+    def _artifact_to_proposal(artifact: Dict[str, Any], source_id: str) -> Proposal:
+        """Build a proposal from one extracted artifact."""
+        artifact_type = artifact.get("type", "unknown")
+
+        # Layer 1 (Security): Sanitize LLM output before storing
+        # Removes control chars that could manipulate display
+        summary = sanitize_control_chars(artifact.get("summary", ""))
+        rationale = sanitize_control_chars(artifact.get("rationale", ""))
+
+        return Proposal(
+            source_id=source_id,
+            artifact_type=artifact_type,
+            content={
+                "summary": summary,
+                "detail": artifact.get("content", {}),
+                "extraction_rationale": rationale
+            },
+            confidence=float(artifact.get("confidence", 0.5)),
+            rationale=rationale
+        )
 
     def _deduplicate_proposals(self, proposals: List[Proposal],
                                existing_context: List[ExistingArtifact]) -> List[Proposal]:
         """
         Remove proposals too similar to existing artifacts.
 
-        Uses text-based Jaccard similarity (offline-first per HC3).
-        No API calls required.
+        Uses text-based similarity (offline-first per HC3), scored for all
+        proposals at once (see find_similar). No API calls required.
         """
-        if not existing_context:
+        if not existing_context or not proposals:
             return proposals
 
-        deduplicated = []
-        existing_summaries = [a.summary for a in existing_context]
-
-        for proposal in proposals:
-            proposal_summary = proposal.content.get('summary', '')
-
-            # Check similarity against all existing artifacts
-            is_duplicate = False
-            for existing_summary in existing_summaries:
-                similarity = calculate_similarity(proposal_summary, existing_summary)
-                if similarity >= self.similarity_threshold:
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                deduplicated.append(proposal)
-
-        return deduplicated
+        duplicates = find_similar(
+            [p.content.get('summary', '') for p in proposals],
+            [a.summary for a in existing_context],
+            self.similarity_threshold
+        )
+        return [p for p, duplicate in zip(proposals, duplicates) if not duplicate]
 
     def _mock_extract(self, text: str, source_id: str) -> List[Proposal]:
         """Mock extraction for testing without LLM."""
@@ -482,37 +858,242 @@ If nothing to extract:
             return first_sentence[:97] + "..."
         return first_sentence
     
-    def process_queue(self) -> List[Proposal]:
+    def process_queue(self, orchestrator=None) -> List[Proposal]:
         """
         Process queued extractions (when coming back online).
 
-        Returns all proposals from queued items.
+        Returns all proposals from queued items, in queue order.
         Clears successfully processed items regardless of whether proposals were extracted.
         Failed items are re-queued for retry.
+
+        Args:
+            orchestrator: TaskOrchestrator to run extractions as concurrent
+                          LLM calls (BABEL_LLM_CONCURRENT applies).
+                          Sequential if None or disabled.
         """
         if not self.queue or not self.is_available:
             return []
 
+        items, end = self.queue.read_pending()
+        results = self._extract_queued(items, orchestrator)
+
         proposals = []
-        items = self.queue.get_all()
         failed_items = []
+        for item, item_proposals in zip(items, results):
+            if item_proposals is None:
+                # Keep failed items for retry
+                failed_items.append(item)
+            else:
+                # Item processed successfully (even if no proposals extracted)
+                proposals.extend(item_proposals)
 
+        self.queue.advance(end, retry=failed_items)
+        return proposals
+
+    def _extract_queued(self, items: List[QueuedExtraction],
+                        orchestrator=None) -> List[Optional[List[Proposal]]]:
+        """
+        Extract each queued item (None where extraction failed).
+
+        Items are packed into batch prompts (see _pack_batches); batches
+        run as concurrent LLM calls through the orchestrator if given.
+        """
+        batches = self._pack_batches(items)
+
+        if orchestrator and orchestrator.enabled and len(batches) > 1:
+            # Concurrent LLM calls on the orchestrator's event loop
+            # (BABEL_LLM_CONCURRENT at a time, no thread per waiting call).
+            # Progress is reported per finished batch and usage once, summed
+            done = 0
+
+            async def run_batch(batch):
+                nonlocal done
+                try:
+                    return await self._aextract_batch(batch)
+                finally:
+                    done += 1  # Coroutines share one loop thread: no lock needed
+                    if self._on_llm_progress:
+                        self._on_llm_progress(done, len(batches))
+
+            if self._on_llm_start:
+                self._on_llm_start()
+            outcomes = orchestrator.map_async(
+                run_batch,
+                batches,
+                item_timeout=orchestrator.config.task_timeout * max(len(b) for b in batches),
+                return_exceptions=True
+            )
+            batch_results = []
+            responses = []
+            for batch, outcome in zip(batches, outcomes):
+                if isinstance(outcome, BaseException):
+                    batch_results.append([None] * len(batch))
+                else:
+                    batch_results.append(outcome[0])
+                    responses.extend(outcome[1])
+            self._report_usage(responses)
+        else:
+            batch_results = [self._extract_batch(batch) for batch in batches]
+
+        return [result for results in batch_results for result in results]
+
+    def _report_usage(self, responses: List['LLMResponse']):
+        """Record and report the summed token usage of concurrent calls."""
+        from .providers import LLMResponse
+        total = LLMResponse(
+            text="",
+            input_tokens=sum(r.input_tokens for r in responses),
+            output_tokens=sum(r.output_tokens for r in responses),
+            cached=bool(responses) and all(r.cached for r in responses)
+        )
+        self._last_response = total
+        if self._on_llm_complete:
+            self._on_llm_complete(total)
+
+    def _pack_batches(self, items: List[QueuedExtraction]) -> List[List[QueuedExtraction]]:
+        """
+        Group items, in queue order, into batches within the token budget.
+
+        A text larger than the budget gets a batch of its own.
+        """
+        batches: List[List[QueuedExtraction]] = []
+        batch: List[QueuedExtraction] = []
+        tokens = 0
         for item in items:
+            item_tokens = estimate_tokens(item.text)
+            if batch and (tokens + item_tokens > self.BATCH_TOKEN_BUDGET
+                          or len(batch) >= self.BATCH_MAX_ITEMS):
+                batches.append(batch)
+                batch, tokens = [], 0
+            batch.append(item)
+            tokens += item_tokens
+        if batch:
+            batches.append(batch)
+        return batches
+
+    def _build_batch_prompt(self, batch: List[QueuedExtraction]) -> str:
+        """User prompt with each text under a numbered item header."""
+        prompt_parts = [f"Extract artifacts from each of these {len(batch)} texts:", ""]
+        for n, item in enumerate(batch, 1):
+            prompt_parts.append(f"=== ITEM {n} ===")
+            prompt_parts.append(item.text)
+            prompt_parts.append("")
+        return "\n".join(prompt_parts)
+
+    def _batch_max_tokens(self, batch: List[QueuedExtraction]) -> int:
+        return min(self.BATCH_MAX_OUTPUT_TOKENS, 2048 * len(batch))
+
+    def _parse_batch_response(self, response: str,
+                              batch: List[QueuedExtraction]) -> Dict[int, List[Proposal]]:
+        """
+        Demultiplex a batch response into proposals per item index.
+
+        Items missing from the response (or not parseable) are left out,
+        so the caller can extract them on their own.
+        """
+        try:
+            data = json.loads(self._strip_code_fence(response))
+            entries = data.get("items", [])
+        except (json.JSONDecodeError, AttributeError):
+            return {}
+
+        parsed: Dict[int, List[Proposal]] = {}
+        for entry in entries if isinstance(entries, list) else []:
             try:
-                item_proposals = self._extract_with_llm(item.text, item.source_id)
-                proposals.extend(item_proposals)
-                # Item processed successfully (even if no proposals extracted)
+                index = int(entry.get("item")) - 1
+                if not 0 <= index < len(batch) or index in parsed:
+                    continue
+                source_id = batch[index].source_id
+                parsed[index] = [
+                    self._artifact_to_proposal(artifact, source_id)
+                    for artifact in entry.get("artifacts", [])
+                ]
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+        return parsed
+
+    def _extract_batch(self, batch: List[QueuedExtraction]) -> List[Optional[List[Proposal]]]:
+        """
+        Extract a batch with one LLM call.
+
+        Items the response does not cover (or all of them, if the call
+        or its parsing fails) fall back to one call each.
+        """
+        parsed: Dict[int, List[Proposal]] = {}
+        if len(batch) > 1:
+            if self._on_llm_start:
+                self._on_llm_start()
+            try:
+                user_prompt = self._build_batch_prompt(batch)
+                response = self.provider.complete(
+                    system=self.BATCH_SYSTEM_PROMPT,
+                    user=user_prompt,
+                    max_tokens=self._batch_max_tokens(batch)
+                )
+                self._last_response = response
+                if self._on_llm_complete:
+                    self._on_llm_complete(response)
+                parsed = self._parse_batch_response(response.text, batch)
+                if not parsed:
+                    self._discard_response(self.BATCH_SYSTEM_PROMPT, user_prompt,
+                                           self._batch_max_tokens(batch))
             except Exception:
-                # Keep failed items for retry
-                failed_items.append(item)
+                pass  # Every item falls back to its own call
 
-        # Clear queue and re-add only failed items
-        self.queue.clear()
-        for item in failed_items:
-            self.queue.add(item.text, item.source_id)
+        results = []
+        for index, item in enumerate(batch):
+            if index in parsed:
+                results.append(parsed[index])
+                continue
+            try:
+                results.append(self._extract_with_llm(item.text, item.source_id))
+            except Exception:
+                results.append(None)
+        return results
+
+    async def _aextract_batch(self, batch: List[QueuedExtraction]
+                              ) -> Tuple[List[Optional[List[Proposal]]], List['LLMResponse']]:
+        """
+        Coroutine form of _extract_batch.
+
+        Fires no callbacks (batches run concurrently); returns the
+        responses of its calls for token accounting with the results.
+        """
+        parsed: Dict[int, List[Proposal]] = {}
+        responses = []
+        if len(batch) > 1:
+            try:
+                user_prompt = self._build_batch_prompt(batch)
+                response = await self.provider.acomplete(
+                    system=self.BATCH_SYSTEM_PROMPT,
+                    user=user_prompt,
+                    max_tokens=self._batch_max_tokens(batch)
+                )
+                responses.append(response)
+                parsed = self._parse_batch_response(response.text, batch)
+                if not parsed:
+                    self._discard_response(self.BATCH_SYSTEM_PROMPT, user_prompt,
+                                           self._batch_max_tokens(batch))
+            except asyncio.TimeoutError:
+                raise
+            except Exception:
+                pass  # Every item falls back to its own call
+
+        results = []
+        for index, item in enumerate(batch):
+            if index in parsed:
+                results.append(parsed[index])
+                continue
+            try:
+                proposals, response = await self._aextract_with_llm(item.text, item.source_id)
+                results.append(proposals)
+                responses.append(response)
+            except asyncio.TimeoutError:
+                raise
+            except Exception:
+                results.append(None)
+        return results, responses
 
-        return proposals
-    
     def format_for_confirmation(self, proposal: Proposal) -> str:
         """Format proposal for human confirmation (HC6: no jargon)."""
         # Confidence to human language
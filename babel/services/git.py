@@ -8,15 +8,20 @@ Enhanced with:
 - Structural change detection (add/modify/delete/rename)
 - Language-aware comment diff extraction
 - Deduplication via diff_id
+
+Git access goes through GitAccess (core/git_access.py): commit data comes
+from long-lived cat-file processes and batched log calls, memoized per
+GitIntegration instance (one command run).
 """
 
-import subprocess
 import os
 import re
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict, Set
+from typing import Optional, List, Tuple, Dict, Set, Iterable
 from dataclasses import dataclass, field
 
+from ..core.git_access import GitAccess, FileStatus
+
 
 # Language-specific comment patterns
 # We check added lines (+) against these patterns
@@ -104,6 +109,7 @@ class CommitInfo:
     # Enhanced fields
     structural: Optional[StructuralChanges] = None
     comment_diff: Optional[str] = None
+    date: str = ""  # Author date, ISO 8601 (P12: temporal attribution)
 
     @property
     def diff_id(self) -> str:
@@ -146,6 +152,7 @@ class GitIntegration:
         self.repo_path = Path(repo_path) if repo_path else Path.cwd()
         self.git_dir = self.repo_path / ".git"
         self.hooks_dir = self.git_dir / "hooks"
+        self.access = GitAccess(self.repo_path)
 
     @property
     def is_git_repo(self) -> bool:
@@ -154,72 +161,62 @@ class GitIntegration:
 
     def _run_git(self, args: List[str], check: bool = True) -> Optional[str]:
         """Run a git command and return stdout."""
-        try:
-            result = subprocess.run(
-                ["git"] + args,
-                cwd=self.repo_path,
-                capture_output=True,
-                text=True,
-                check=check
-            )
-            return result.stdout
-        except subprocess.CalledProcessError:
-            return None
-        except Exception:
-            return None
+        return self.access.run(args, check=check)
+
+    def recent_commits(self, count: int, no_merges: bool = True) -> List[CommitInfo]:
+        """
+        Most recent commits (message, author, date; no file lists), in one process.
+
+        Their metadata is memoized, so get_commit() on them is free.
+        """
+        if not self.is_git_repo:
+            return []
+        args = [f"-{count}"] + (["--no-merges"] if no_merges else [])
+        return [
+            CommitInfo(hash=r.sha, message=r.subject, body=r.body, author=r.author,
+                       email=r.email, files=[], date=r.date)
+            for r in self.access.log(args)
+        ]
+
+    @staticmethod
+    def _structural_from(entries: List[FileStatus]) -> StructuralChanges:
+        changes = StructuralChanges()
+        for entry in entries:
+            if entry.status == 'A':
+                changes.added.append(entry.path)
+            elif entry.status == 'M':
+                changes.modified.append(entry.path)
+            elif entry.status == 'D':
+                changes.deleted.append(entry.path)
+            elif entry.status.startswith('R'):
+                changes.renamed.append((entry.old_path, entry.path))
+        return changes
 
     def get_structural_changes(self, commit_hash: str = "HEAD") -> Optional[StructuralChanges]:
         """
         Extract structural changes (file status) from a commit.
         
         Returns metadata only, no content.
-        Handles initial commits (no parent) specially.
+        Initial commits list their files as added.
         """
         if not self.is_git_repo:
             return None
 
-        # First try normal diff-tree
-        output = self._run_git([
-            "diff-tree", "--no-commit-id", "-r", "--name-status", "-M", commit_hash
-        ])
-
-        # If empty, might be initial commit - try with --root flag
-        if output is not None and not output.strip():
-            output = self._run_git([
-                "diff-tree", "--no-commit-id", "-r", "--name-status", "--root", commit_hash
-            ])
-
-        if output is None:
+        entries = self.access.changes([commit_hash]).get(commit_hash)
+        if entries is None:
             return None
-
-        changes = StructuralChanges()
-
-        for line in output.strip().split('\n'):
-            if not line:
-                continue
-
-            parts = line.split('\t')
-            status = parts[0]
-
-            if status == 'A':
-                changes.added.append(parts[1])
-            elif status == 'M':
-                changes.modified.append(parts[1])
-            elif status == 'D':
-                changes.deleted.append(parts[1])
-            elif status.startswith('R'):
-                # Rename: R100 old_path new_path
-                if len(parts) >= 3:
-                    changes.renamed.append((parts[1], parts[2]))
-
-        return changes
+        return self._structural_from(entries)
 
     def get_commit_diff(self, commit_hash: str = "HEAD") -> Optional[str]:
         """Get the full diff for a commit."""
         if not self.is_git_repo:
             return None
 
-        return self._run_git(["show", "--format=", commit_hash])
+        sha = self.access.resolve(commit_hash)
+        if sha is None:
+            return None
+        # Keyed by SHA: a commit's diff cannot change during the run
+        return self.access.run(["show", "--format=", sha], memo=True)
 
     def extract_comment_diff(self, commit_hash: str = "HEAD", max_length: int = 8000) -> Optional[str]:
         """
@@ -236,9 +233,7 @@ class GitIntegration:
             return None
 
         # Get diff with file names
-        diff_output = self._run_git([
-            "show", "--format=", "--unified=0", commit_hash
-        ])
+        diff_output = self.access.patches([commit_hash]).get(commit_hash)
 
         if not diff_output:
             return None
@@ -317,57 +312,62 @@ class GitIntegration:
             commit_hash: Commit hash or reference
             include_diff: If True, includes structural changes and comment diff
         """
-        if not self.is_git_repo:
-            return None
-
-        try:
-            # Get basic commit info
-            result = self._run_git([
-                "log", "-1", "--format=%H|%s|%b|%an|%ae", commit_hash
-            ])
-
-            if result is None:
-                return None
+        commits = self.get_commits([commit_hash], include_diff)
+        return commits[0] if commits else None
 
-            parts = result.strip().split("|", 4)
-            if len(parts) < 5:
-                parts.extend([""] * (5 - len(parts)))
+    def get_commits(self, commit_hashes: Iterable[str], include_diff: bool = True) -> List[CommitInfo]:
+        """
+        Get information about many commits with a fixed number of git processes.
 
-            commit_hash_full, message, body, author, email = parts
+        Commit objects are read through cat-file; file changes (and, with
+        include_diff, patches) for all commits come from one log call each.
 
-            # Get changed files (simple list)
-            # Try normal diff-tree first, then with --root for initial commits
-            files_output = self._run_git([
-                "diff-tree", "--no-commit-id", "--name-only", "-r", commit_hash
-            ])
-            
-            if files_output is not None and not files_output.strip():
-                # Might be initial commit
-                files_output = self._run_git([
-                    "diff-tree", "--no-commit-id", "--name-only", "-r", "--root", commit_hash
-                ])
+        Args:
+            commit_hashes: Commit hashes or references
+            include_diff: If True, includes structural changes and comment diff
 
-            files = [f for f in (files_output or "").strip().split("\n") if f]
+        Returns:
+            CommitInfo per resolvable commit, in input order
+        """
+        if not self.is_git_repo:
+            return []
+
+        records = []
+        for commit_hash in commit_hashes:
+            record = self.access.commit(commit_hash)
+            if record is not None:
+                records.append(record)
+        shas = [r.sha for r in records]
+        changes = self.access.changes(shas)
+        if include_diff:
+            self.access.patches(shas)  # Prefetch for extract_comment_diff
+
+        commits = []
+        for record in records:
+            entries = changes.get(record.sha, [])
+            files = []
+            for entry in entries:
+                if entry.old_path:
+                    files.append(entry.old_path)
+                files.append(entry.path)
 
-            # Build base commit info
             commit = CommitInfo(
-                hash=commit_hash_full,
-                message=message,
-                body=body,
-                author=author,
-                email=email,
-                files=files
+                hash=record.sha,
+                message=record.subject,
+                body=record.body,
+                author=record.author,
+                email=record.email,
+                files=files,
+                date=record.date
             )
 
             # Optionally include enhanced diff info
             if include_diff:
-                commit.structural = self.get_structural_changes(commit_hash)
-                commit.comment_diff = self.extract_comment_diff(commit_hash)
+                commit.structural = self._structural_from(entries)
+                commit.comment_diff = self.extract_comment_diff(record.sha)
 
-            return commit
-
-        except Exception:
-            return None
+            commits.append(commit)
+        return commits
 
     def install_hooks(self) -> Tuple[bool, str]:
         """
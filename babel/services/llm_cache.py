@@ -0,0 +1,285 @@
+"""
+LLM Cache — Content-addressed cache for provider completions
+
+Extraction, why, review and coherence all send prompts through the
+configured provider. Identical prompts (same provider, model, system
+prompt, user prompt and max_tokens) get the stored response back:
+zero tokens, no network round-trip.
+
+Storage: SQLite in .babel/local/ (per user, git-ignored)
+- Size-bounded: least recently used entries are evicted past max_bytes
+- Metrics: hits, misses and tokens saved (persisted across runs)
+
+Like other projections, the cache is disposable (HC3): deleting the
+file only costs the next identical prompt a real LLM call.
+
+Only usable responses are kept: empty responses are never stored, and a
+caller that cannot parse a response drops it with invalidate(), so a
+truncated or malformed answer is retried instead of replayed.
+
+Environment:
+- BABEL_LLM_CACHE: Set to 0/false to bypass the cache
+- BABEL_LLM_CACHE_MB: Maximum cache size in MB (default: 50)
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Union
+
+import xxhash
+
+from .providers import LLMProvider, LLMResponse, MockProvider
+
+
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Evict down to this fraction of max_bytes, so eviction runs rarely
+EVICT_TO = 0.9
+
+
+class LLMCache:
+    """
+    Size-bounded, LRU-evicted store of LLM responses.
+
+    Thread-safe: completions may run in parallel from the IO pool.
+    """
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                input_tokens INTEGER NOT NULL,
+                output_tokens INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                last_used INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_responses_used ON responses(last_used);
+
+            CREATE TABLE IF NOT EXISTS metrics (
+                name TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            );
+        """)
+        row = self.conn.execute("SELECT MAX(last_used) FROM responses").fetchone()
+        self._tick = row[0] or 0
+
+    @staticmethod
+    def key(provider: str, model: str, system: str, user: str, max_tokens: int) -> str:
+        """Content address of a completion request."""
+        system_hash = xxhash.xxh3_128_hexdigest(system.encode('utf-8'))
+        user_hash = xxhash.xxh3_128_hexdigest(user.encode('utf-8'))
+        return xxhash.xxh3_128_hexdigest(
+            f"{provider}\x1f{model}\x1f{system_hash}\x1f{user_hash}\x1f{max_tokens}".encode('utf-8')
+        )
+
+    def get(self, key: str) -> Optional[LLMResponse]:
+        """
+        Stored response for a key (None on miss).
+
+        Records a hit (and the tokens it saved) or a miss.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT text, input_tokens, output_tokens FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self._count("misses", 1)
+                self.conn.commit()
+                return None
+
+            self._tick += 1
+            self.conn.execute(
+                "UPDATE responses SET last_used = ? WHERE key = ?", (self._tick, key)
+            )
+            self._count("hits", 1)
+            self._count("tokens_saved", row[1] + row[2])
+            self.conn.commit()
+            return LLMResponse(text=row[0], input_tokens=row[1], output_tokens=row[2])
+
+    def put(self, key: str, response: LLMResponse):
+        """Store a response, evicting least recently used entries if over budget."""
+        size = len(response.text.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._tick += 1
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, text, input_tokens, output_tokens, size, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, response.text, response.input_tokens, response.output_tokens,
+                 size, self._tick)
+            )
+            self._evict()
+            self.conn.commit()
+
+    def invalidate(self, key: str) -> bool:
+        """Drop the stored response for a key. Returns True if one was stored."""
+        with self._lock:
+            cursor = self.conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self.conn.commit()
+            return cursor.rowcount > 0
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        target = total - int(self.max_bytes * EVICT_TO)
+        freed = 0
+        evicted = []
+        for key, size in self.conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_used"
+        ):
+            if freed >= target:
+                break
+            evicted.append((key,))
+            freed += size
+        self.conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def _count(self, name: str, amount: int):
+        self.conn.execute(
+            "INSERT INTO metrics (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Entries, bytes stored, and hit/miss/tokens-saved counters."""
+        with self._lock:
+            entries, size = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+            metrics = dict(self.conn.execute("SELECT name, value FROM metrics").fetchall())
+        return {
+            "entries": entries,
+            "bytes": size,
+            "hits": metrics.get("hits", 0),
+            "misses": metrics.get("misses", 0),
+            "tokens_saved": metrics.get("tokens_saved", 0),
+        }
+
+    def clear(self):
+        """Drop all responses and metrics."""
+        with self._lock:
+            self.conn.execute("DELETE FROM responses")
+            self.conn.execute("DELETE FROM metrics")
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class CachedProvider(LLMProvider):
+    """
+    Provider wrapper that serves repeated prompts from an LLMCache.
+
+    Cache hits are returned with zero token usage (nothing was spent);
+    the tokens the original call used are counted as saved.
+    Other attributes (config, base_url, ...) pass through to the
+    wrapped provider.
+
+    Only responses accepted by cacheable are stored (default: non-empty
+    text); callers that fail to parse a response call invalidate().
+    """
+
+    def __init__(self, provider: LLMProvider, cache: LLMCache,
+                 cacheable: Optional[Callable[[LLMResponse], bool]] = None):
+        self.provider = provider
+        self.cache = cache
+        self.cacheable = cacheable or _has_text
+        config = getattr(provider, "config", None)
+        self.provider_name = getattr(config, "provider", "") or type(provider).__name__
+        self.model = getattr(config, "effective_model", "") or ""
+
+    @property
+    def is_available(self) -> bool:
+        return self.provider.is_available
+
+    def complete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        key = self.cache.key(self.provider_name, self.model, system, user, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return LLMResponse(text=cached.text, cached=True)
+
+        response = self.provider.complete(system, user, max_tokens=max_tokens)
+        if self.cacheable(response):
+            self.cache.put(key, response)
+        return response
+
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        # SQLite reads/writes run in a worker thread, off the event loop
+        key = self.cache.key(self.provider_name, self.model, system, user, max_tokens)
+        cached = await asyncio.to_thread(self.cache.get, key)
+        if cached is not None:
+            return LLMResponse(text=cached.text, cached=True)
+
+        response = await self.provider.acomplete(system, user, max_tokens=max_tokens)
+        if self.cacheable(response):
+            await asyncio.to_thread(self.cache.put, key, response)
+        return response
+
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        key = self.cache.key(self.provider_name, self.model, system, user, max_tokens)
+        cached = self.cache.get(key)
+        if cached is not None:
+            yield cached.text
+            yield LLMResponse(text=cached.text, cached=True)
+            return
+
+        for item in self.provider.complete_stream(system, user, max_tokens=max_tokens):
+            if isinstance(item, LLMResponse) and self.cacheable(item):
+                # Only a completed stream is cached
+                self.cache.put(key, item)
+            yield item
+
+    def invalidate(self, system: str, user: str, max_tokens: int = 2048) -> bool:
+        """Drop the cached response for a prompt (e.g. one the caller could not parse)."""
+        key = self.cache.key(self.provider_name, self.model, system, user, max_tokens)
+        return self.cache.invalidate(key)
+
+    def __getattr__(self, name):
+        # Only called for attributes not found on the wrapper
+        return getattr(self.provider, name)
+
+
+def _has_text(response: LLMResponse) -> bool:
+    return bool(response.text and response.text.strip())
+
+
+def with_response_cache(provider: LLMProvider, path: Path) -> LLMProvider:
+    """
+    Wrap a provider with the on-disk response cache.
+
+    The mock provider is returned as is (it costs nothing), as is any
+    provider when BABEL_LLM_CACHE is disabled or the cache can't be opened.
+    """
+    if isinstance(provider, MockProvider):
+        return provider
+    if os.environ.get("BABEL_LLM_CACHE", "1").strip().lower() in ("0", "false", "no", "off"):
+        return provider
+
+    try:
+        max_mb = float(os.environ.get("BABEL_LLM_CACHE_MB", DEFAULT_MAX_BYTES / (1024 * 1024)))
+    except ValueError:
+        max_mb = DEFAULT_MAX_BYTES / (1024 * 1024)
+
+    try:
+        cache = LLMCache(path, max_bytes=int(max_mb * 1024 * 1024))
+    except (OSError, sqlite3.Error):
+        return provider
+    return CachedProvider(provider, cache)
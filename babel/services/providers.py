@@ -1,13 +1,34 @@
 """
 LLM Providers — Abstraction for multiple AI providers
 
-Supports: Claude, OpenAI, Gemini
+Supports: Claude, OpenAI, Gemini (remote), Ollama (local)
 All providers implement same interface for extraction.
+
+Local providers talk HTTP through a shared keep-alive connection pool,
+and their availability probe runs in the background so that building
+a provider at CLI startup never waits on the network.
+
+complete_stream() yields the response text as it is generated, then a
+final LLMResponse (full text and token usage), so consumers can act on
+the first part of a response before the rest arrives.
+
+acomplete() is the coroutine form of complete(), for fan-out work run
+on the orchestrator's event loop (see TaskOrchestrator.map_async).
+SDK async clients are bound to one loop (LoopBoundClient) and closed
+on it, so switching loops does not leak their connections.
 """
 
+import asyncio
+import http.client
+import json
+import ssl
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
 from ..config import Config, LLMConfig
 
 
@@ -17,6 +38,7 @@ class LLMResponse:
     text: str
     input_tokens: int = 0
     output_tokens: int = 0
+    cached: bool = False  # Served from the response cache (no tokens spent)
 
     @property
     def total_tokens(self) -> int:
@@ -47,6 +69,29 @@ class LLMProvider(ABC):
         """
         pass
 
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        """
+        Get completion from LLM without blocking the event loop.
+
+        Providers without a native async client run complete() in a
+        worker thread.
+        """
+        return await asyncio.to_thread(self.complete, system, user, max_tokens=max_tokens)
+
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        """
+        Stream a completion from the LLM.
+
+        Yields text chunks as they are generated, then one final
+        LLMResponse with the full text and token usage. Providers
+        without streaming support yield the whole text as one chunk.
+        """
+        response = self.complete(system, user, max_tokens=max_tokens)
+        if response.text:
+            yield response.text
+        yield response
+
     @property
     @abstractmethod
     def is_available(self) -> bool:
@@ -54,12 +99,332 @@ class LLMProvider(ABC):
         pass
 
 
+# =============================================================================
+# HTTP Keep-Alive Pool (local providers)
+# =============================================================================
+
+class KeepAlivePool:
+    """
+    Thread-safe pool of persistent HTTP/1.1 connections to one server.
+
+    Each request borrows an idle connection (or opens one) and returns
+    it once the response body is read, so sequential requests reuse a
+    socket and concurrent requests (IO pool threads) each get their own.
+    A request on a reused connection that the server has since closed is
+    retried once on a fresh connection.
+    """
+
+    def __init__(self, base_url: str, max_idle: int = 8):
+        parts = urlsplit(base_url)
+        self.scheme = parts.scheme or "http"
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.max_idle = max_idle
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    def _connect(self, timeout: float) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+        return cls(self.host, self.port, timeout=timeout)
+
+    def _send(self, method: str, path: str, body: Optional[bytes],
+              headers: Optional[Dict[str, str]], timeout: float
+              ) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+        """Send a request on a pooled connection and read the response head."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        reused = conn is not None
+
+        while True:
+            if conn is None:
+                conn = self._connect(timeout)
+            else:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+            try:
+                conn.request(method, self.base_path + path, body=body, headers=headers or {})
+                return conn, conn.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                conn.close()
+                if not reused:
+                    raise
+                # Idle connection closed by the server: retry once, fresh
+                conn, reused = None, False
+            except BaseException:
+                conn.close()
+                raise
+
+    def _release(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse):
+        """Return a connection whose response was fully read to the pool."""
+        if not response.will_close:
+            with self._lock:
+                if len(self._idle) < self.max_idle:
+                    self._idle.append(conn)
+                    return
+        conn.close()
+
+    def request(self, method: str, path: str, body: Optional[bytes] = None,
+                headers: Optional[Dict[str, str]] = None,
+                timeout: float = 120.0) -> Tuple[int, str, bytes]:
+        """
+        Send a request and read the whole response.
+
+        Returns:
+            (status, reason, body)
+
+        Raises:
+            OSError / http.client.HTTPException on connection failure
+        """
+        conn, response = self._send(method, path, body, headers, timeout)
+        try:
+            data = response.read()
+        except BaseException:
+            conn.close()
+            raise
+        self._release(conn, response)
+        return response.status, response.reason, data
+
+    def stream(self, method: str, path: str, body: Optional[bytes] = None,
+               headers: Optional[Dict[str, str]] = None,
+               timeout: float = 120.0) -> Tuple[int, str, Iterator[bytes]]:
+        """
+        Send a request and read the response body line by line.
+
+        Returns:
+            (status, reason, lines). The connection goes back to the pool
+            once lines is exhausted; closing it early closes the connection.
+
+        Raises:
+            OSError / http.client.HTTPException on connection failure
+        """
+        conn, response = self._send(method, path, body, headers, timeout)
+
+        def lines() -> Iterator[bytes]:
+            done = False
+            try:
+                for line in response:
+                    yield line
+                done = True
+            finally:
+                if done:
+                    self._release(conn, response)
+                else:
+                    conn.close()
+
+        return response.status, response.reason, lines()
+
+    def close(self):
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pools: Dict[str, KeepAlivePool] = {}
+_pools_lock = threading.Lock()
+
+
+def get_http_pool(base_url: str) -> KeepAlivePool:
+    """Shared keep-alive pool for a server (one per base URL per process)."""
+    with _pools_lock:
+        pool = _pools.get(base_url)
+        if pool is None:
+            pool = _pools[base_url] = KeepAlivePool(base_url)
+        return pool
+
+
+async def async_http_request(base_url: str, method: str, path: str,
+                             body: Optional[bytes] = None,
+                             headers: Optional[Dict[str, str]] = None
+                             ) -> Tuple[int, str, bytes]:
+    """
+    Send one HTTP/1.1 request on asyncio streams and read the whole response.
+
+    For local servers: one short-lived connection per request, no thread.
+    Callers bound the time with asyncio.wait_for; cancellation closes
+    the connection.
+
+    Returns:
+        (status, reason, body)
+
+    Raises:
+        OSError / http.client.HTTPException on connection failure
+    """
+    parts = urlsplit(base_url)
+    https = parts.scheme == "https"
+    host = parts.hostname or "localhost"
+    port = parts.port or (443 if https else 80)
+
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=ssl.create_default_context() if https else None
+    )
+    try:
+        lines = [f"{method} {parts.path.rstrip('/')}{path} HTTP/1.1", f"Host: {parts.netloc}",
+                 "Connection: close", f"Content-Length: {len(body or b'')}"]
+        lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + (body or b""))
+        await writer.drain()
+
+        status_line = (await reader.readline()).decode("latin-1").split(" ", 2)
+        if len(status_line) < 2 or not status_line[1].isdigit():
+            raise http.client.BadStatusLine(" ".join(status_line))
+        status = int(status_line[1])
+        reason = status_line[2].strip() if len(status_line) > 2 else ""
+
+        response_headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            response_headers[name.strip().lower()] = value.strip()
+
+        if response_headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        elif "content-length" in response_headers:
+            data = await reader.readexactly(int(response_headers["content-length"]))
+        else:
+            data = await reader.read()
+    except (asyncio.IncompleteReadError, ValueError) as e:
+        raise http.client.HTTPException(f"Malformed response: {e}")
+    finally:
+        writer.close()
+    return status, reason, data
+
+
+class AvailabilityProbe:
+    """
+    Cached, background availability check for a local server.
+
+    start() launches the check without waiting; result() waits for it
+    (at most the probe timeout). A positive result is kept for the
+    process; a negative one is re-checked after retry_after seconds,
+    so a server started later is picked up.
+    """
+
+    def __init__(self, check, timeout: float, retry_after: float = 10.0):
+        self._check = check
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._result: Optional[bool] = None
+        self._checked_at = 0.0
+
+    def _run(self):
+        try:
+            result = bool(self._check(self.timeout))
+        except Exception:
+            result = False
+        with self._lock:
+            self._result = result
+            self._checked_at = time.monotonic()
+
+    def _stale(self) -> bool:
+        return self._result is False and time.monotonic() - self._checked_at > self.retry_after
+
+    def start(self):
+        """Begin checking in the background (no-op if checked or running)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            if self._result is not None and not self._stale():
+                return
+            self._result = None
+            self._thread = threading.Thread(target=self._run, name="babel-probe", daemon=True)
+            self._thread.start()
+
+    def result(self) -> bool:
+        """Availability, waiting for a running check to finish."""
+        self.start()
+        thread = self._thread
+        if thread is not None:
+            thread.join(self.timeout + 1.0)
+        return bool(self._result)
+
+    def peek(self) -> Optional[bool]:
+        """Availability if known and current, without waiting (None otherwise)."""
+        with self._lock:
+            if self._result is None or self._stale():
+                return None
+            return self._result
+
+    def mark_available(self):
+        """Record a successful request (no probe needed)."""
+        with self._lock:
+            self._result = True
+            self._checked_at = time.monotonic()
+
+
+_probes: Dict[str, AvailabilityProbe] = {}
+_probes_lock = threading.Lock()
+
+
+async def _open_until_loop_shutdown(client):
+    """
+    Hold an async client open until its event loop shuts down.
+
+    Loops finalize pending async generators on shutdown (asyncio.run,
+    AsyncPool.shutdown), which runs the finally clause on the client's
+    own loop while it can still await.
+    """
+    try:
+        yield
+    finally:
+        await client.close()
+
+
+class LoopBoundClient:
+    """
+    An SDK async client (AsyncAnthropic, AsyncOpenAI) for the running loop.
+
+    Their connections belong to the loop the client was created on, so a
+    call on another loop (each asyncio.run() has its own) gets a new
+    client. The old one is closed on its own loop: right away if that
+    loop is still running elsewhere, otherwise when it shut down.
+    """
+
+    def __init__(self, factory: Callable[[], Any]):
+        self._factory = factory
+        self._client = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._holder = None
+
+    async def get(self):
+        """Client for the running loop (created on first use there)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._release()
+            client = self._factory()
+            holder = _open_until_loop_shutdown(client)
+            await holder.__anext__()  # Registers with the loop's shutdown
+            self._client, self._loop, self._holder = client, loop, holder
+        return self._client
+
+    def _release(self):
+        loop, holder = self._loop, self._holder
+        self._client = self._loop = self._holder = None
+        if holder is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(holder.aclose(), loop)
+
+
 class ClaudeProvider(LLMProvider):
     """Anthropic Claude provider."""
     
     def __init__(self, config: LLMConfig):
         self.config = config
         self._client = None
+        self._async_client = LoopBoundClient(self._new_async_client)
         self._init_client()
     
     def _init_client(self):
@@ -70,6 +435,10 @@ class ClaudeProvider(LLMProvider):
             self._client = anthropic.Anthropic(api_key=self.config.api_key)
         except ImportError:
             pass
+
+    def _new_async_client(self):
+        import anthropic
+        return anthropic.AsyncAnthropic(api_key=self.config.api_key)
     
     @property
     def is_available(self) -> bool:
@@ -86,6 +455,23 @@ class ClaudeProvider(LLMProvider):
             messages=[{"role": "user", "content": user}]
         )
 
+        return self._to_response(message)
+
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        if not self._client:
+            raise RuntimeError("Claude client not initialized")
+
+        client = await self._async_client.get()
+        message = await client.messages.create(
+            model=self.config.effective_model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": user}]
+        )
+        return self._to_response(message)
+
+    @staticmethod
+    def _to_response(message) -> LLMResponse:
         # Extract token usage from response
         input_tokens = getattr(message.usage, 'input_tokens', 0)
         output_tokens = getattr(message.usage, 'output_tokens', 0)
@@ -96,6 +482,29 @@ class ClaudeProvider(LLMProvider):
             output_tokens=output_tokens
         )
 
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        if not self._client:
+            raise RuntimeError("Claude client not initialized")
+
+        chunks = []
+        with self._client.messages.stream(
+            model=self.config.effective_model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": user}]
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                yield text
+            message = stream.get_final_message()
+
+        yield LLMResponse(
+            text="".join(chunks),
+            input_tokens=getattr(message.usage, 'input_tokens', 0),
+            output_tokens=getattr(message.usage, 'output_tokens', 0)
+        )
+
 
 class OpenAIProvider(LLMProvider):
     """OpenAI GPT provider."""
@@ -103,6 +512,7 @@ class OpenAIProvider(LLMProvider):
     def __init__(self, config: LLMConfig):
         self.config = config
         self._client = None
+        self._async_client = LoopBoundClient(self._new_async_client)
         self._init_client()
     
     def _init_client(self):
@@ -113,6 +523,10 @@ class OpenAIProvider(LLMProvider):
             self._client = openai.OpenAI(api_key=self.config.api_key)
         except ImportError:
             pass
+
+    def _new_async_client(self):
+        import openai
+        return openai.AsyncOpenAI(api_key=self.config.api_key)
     
     @property
     def is_available(self) -> bool:
@@ -131,6 +545,25 @@ class OpenAIProvider(LLMProvider):
             ]
         )
 
+        return self._to_response(response)
+
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+
+        client = await self._async_client.get()
+        response = await client.chat.completions.create(
+            model=self.config.effective_model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ]
+        )
+        return self._to_response(response)
+
+    @staticmethod
+    def _to_response(response) -> LLMResponse:
         # Extract token usage from response
         usage = getattr(response, 'usage', None)
         input_tokens = getattr(usage, 'prompt_tokens', 0) if usage else 0
@@ -142,6 +575,39 @@ class OpenAIProvider(LLMProvider):
             output_tokens=output_tokens
         )
 
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        if not self._client:
+            raise RuntimeError("OpenAI client not initialized")
+
+        stream = self._client.chat.completions.create(
+            model=self.config.effective_model,
+            max_tokens=max_tokens,
+            messages=[
+                {"role": "system", "content": system},
+                {"role": "user", "content": user}
+            ],
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+
+        chunks = []
+        usage = None
+        for chunk in stream:
+            # Usage arrives on a final chunk without choices
+            usage = getattr(chunk, 'usage', None) or usage
+            if chunk.choices:
+                text = chunk.choices[0].delta.content
+                if text:
+                    chunks.append(text)
+                    yield text
+
+        yield LLMResponse(
+            text="".join(chunks),
+            input_tokens=getattr(usage, 'prompt_tokens', 0) if usage else 0,
+            output_tokens=getattr(usage, 'completion_tokens', 0) if usage else 0
+        )
+
 
 class GeminiProvider(LLMProvider):
     """Google Gemini provider."""
@@ -177,6 +643,20 @@ class GeminiProvider(LLMProvider):
             generation_config={"max_output_tokens": max_tokens}
         )
 
+        return self._to_response(response)
+
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        if not self._client:
+            raise RuntimeError("Gemini client not initialized")
+
+        response = await self._client.generate_content_async(
+            f"{system}\n\n---\n\n{user}",
+            generation_config={"max_output_tokens": max_tokens}
+        )
+        return self._to_response(response)
+
+    @staticmethod
+    def _to_response(response) -> LLMResponse:
         # Extract token usage from response metadata
         usage_metadata = getattr(response, 'usage_metadata', None)
         input_tokens = getattr(usage_metadata, 'prompt_token_count', 0) if usage_metadata else 0
@@ -188,63 +668,85 @@ class GeminiProvider(LLMProvider):
             output_tokens=output_tokens
         )
 
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        if not self._client:
+            raise RuntimeError("Gemini client not initialized")
+
+        response = self._client.generate_content(
+            f"{system}\n\n---\n\n{user}",
+            generation_config={"max_output_tokens": max_tokens},
+            stream=True
+        )
+
+        chunks = []
+        for chunk in response:
+            text = chunk.text
+            if text:
+                chunks.append(text)
+                yield text
+
+        # Usage metadata is complete once the stream is consumed
+        usage_metadata = getattr(response, 'usage_metadata', None)
+        yield LLMResponse(
+            text="".join(chunks),
+            input_tokens=getattr(usage_metadata, 'prompt_token_count', 0) if usage_metadata else 0,
+            output_tokens=getattr(usage_metadata, 'candidates_token_count', 0) if usage_metadata else 0
+        )
+
 
 class OllamaProvider(LLMProvider):
     """
     Ollama local LLM provider.
 
     Uses OpenAI-compatible API at localhost:11434/v1/chat/completions.
-    No external package required - uses stdlib urllib.
+    No external package required - uses stdlib http.client through a
+    shared keep-alive pool (safe for concurrent calls from the IO pool).
+    acomplete() uses asyncio streams instead, so concurrent calls on the
+    orchestrator's event loop hold no thread.
+    Availability is probed lazily, once per server, in the background.
     """
 
+    PROBE_TIMEOUT = 2.0      # /api/tags round-trip (local server)
+    REQUEST_TIMEOUT = 120.0  # Completion round-trip
+
     def __init__(self, config: LLMConfig):
         self.config = config
-        self._available: Optional[bool] = None  # Cached availability
+        self._pool = get_http_pool(self.base_url)
+        with _probes_lock:
+            probe = _probes.get(self.base_url)
+            if probe is None:
+                probe = _probes[self.base_url] = AvailabilityProbe(
+                    self._check_ollama_running, timeout=self.PROBE_TIMEOUT
+                )
+        self._probe = probe
 
     @property
     def base_url(self) -> str:
         """Get base URL for Ollama API."""
         return self.config.effective_base_url or "http://localhost:11434"
 
-    def _check_ollama_running(self) -> bool:
+    def _check_ollama_running(self, timeout: float = PROBE_TIMEOUT) -> bool:
         """Check if Ollama is running by querying the API."""
-        import urllib.request
-        import urllib.error
-
         try:
             # Try to reach Ollama's tags endpoint (lists models)
-            url = f"{self.base_url}/api/tags"
-            req = urllib.request.Request(url, method='GET')
-            with urllib.request.urlopen(req, timeout=5) as response:
-                return response.status == 200
-        except (urllib.error.URLError, urllib.error.HTTPError, OSError):
+            status, _, _ = self._pool.request("GET", "/api/tags", timeout=timeout)
+            return status == 200
+        except (OSError, http.client.HTTPException):
             return False
 
+    def start_probe(self):
+        """Start the availability check without waiting for it."""
+        self._probe.start()
+
     @property
     def is_available(self) -> bool:
-        """Check if Ollama is running and accessible."""
-        if self._available is None:
-            self._available = self._check_ollama_running()
-        return self._available
-
-    def complete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
-        """
-        Get completion from Ollama using OpenAI-compatible API.
-
-        Uses urllib (stdlib) to avoid external dependencies.
-        """
-        import urllib.request
-        import urllib.error
-        import json
-
-        if not self.is_available:
-            raise RuntimeError(
-                f"Ollama not running at {self.base_url}. "
-                "Start with: ollama serve"
-            )
-
-        url = f"{self.base_url}/v1/chat/completions"
+        """Check if Ollama is running and accessible (cached per server)."""
+        return self._probe.result()
 
+    def _completion_request(self, system: str, user: str, max_tokens: int,
+                            stream: bool) -> Tuple[bytes, Dict[str, str]]:
+        """Body and headers of a chat completion request."""
         payload = {
             "model": self.config.effective_model,
             "messages": [
@@ -252,48 +754,155 @@ class OllamaProvider(LLMProvider):
                 {"role": "user", "content": user}
             ],
             "max_tokens": max_tokens,
-            "stream": False
+            "stream": stream
         }
+        if stream:
+            payload["stream_options"] = {"include_usage": True}
 
         data = json.dumps(payload).encode('utf-8')
         headers = {
             'Content-Type': 'application/json',
         }
+        return data, headers
+
+    def _not_running(self) -> RuntimeError:
+        return RuntimeError(
+            f"Ollama not running at {self.base_url}. "
+            "Start with: ollama serve"
+        )
+
+    def _cannot_connect(self) -> RuntimeError:
+        return RuntimeError(
+            f"Cannot connect to Ollama at {self.base_url}. "
+            "Ensure Ollama is running: ollama serve"
+        )
 
-        req = urllib.request.Request(url, data=data, headers=headers, method='POST')
+    def _check_status(self, status: int, reason: str):
+        if status == 404:
+            raise RuntimeError(
+                f"Model '{self.config.effective_model}' not found. "
+                f"Pull with: ollama pull {self.config.effective_model}"
+            )
+        if status >= 400:
+            raise RuntimeError(f"Ollama API error: {status} {reason}")
 
+    def _parse_completion(self, body: bytes) -> LLMResponse:
         try:
-            with urllib.request.urlopen(req, timeout=120) as response:
-                result = json.loads(response.read().decode('utf-8'))
+            result = json.loads(body.decode('utf-8'))
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            raise RuntimeError(f"Invalid response from Ollama: {e}")
+        self._probe.mark_available()
 
-                # Extract response text
-                text = result.get('choices', [{}])[0].get('message', {}).get('content', '')
+        # Extract response text
+        text = result.get('choices', [{}])[0].get('message', {}).get('content', '')
 
-                # Extract token usage (Ollama provides this in OpenAI format)
-                usage = result.get('usage', {})
-                input_tokens = usage.get('prompt_tokens', 0)
-                output_tokens = usage.get('completion_tokens', 0)
+        # Extract token usage (Ollama provides this in OpenAI format)
+        usage = result.get('usage', {})
+        input_tokens = usage.get('prompt_tokens', 0)
+        output_tokens = usage.get('completion_tokens', 0)
 
-                return LLMResponse(
-                    text=text,
-                    input_tokens=input_tokens,
-                    output_tokens=output_tokens
-                )
+        return LLMResponse(
+            text=text,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens
+        )
 
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                raise RuntimeError(
-                    f"Model '{self.config.effective_model}' not found. "
-                    f"Pull with: ollama pull {self.config.effective_model}"
-                )
-            raise RuntimeError(f"Ollama API error: {e.code} {e.reason}")
-        except urllib.error.URLError as e:
-            raise RuntimeError(
-                f"Cannot connect to Ollama at {self.base_url}. "
-                "Ensure Ollama is running: ollama serve"
+    def complete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        """
+        Get completion from Ollama using OpenAI-compatible API.
+
+        Uses http.client (stdlib) to avoid external dependencies.
+        """
+        if not self.is_available:
+            raise self._not_running()
+
+        data, headers = self._completion_request(system, user, max_tokens, stream=False)
+        try:
+            status, reason, body = self._pool.request(
+                "POST", "/v1/chat/completions", body=data, headers=headers,
+                timeout=self.REQUEST_TIMEOUT
             )
-        except json.JSONDecodeError as e:
-            raise RuntimeError(f"Invalid response from Ollama: {e}")
+        except (OSError, http.client.HTTPException):
+            raise self._cannot_connect()
+
+        self._check_status(status, reason)
+        return self._parse_completion(body)
+
+    async def acomplete(self, system: str, user: str, max_tokens: int = 2048) -> LLMResponse:
+        """
+        Get completion from Ollama on the running event loop (asyncio streams).
+        """
+        available = self._probe.peek()
+        if available is None:
+            # Probe still running (or stale): wait for it off the loop
+            available = await asyncio.to_thread(self._probe.result)
+        if not available:
+            raise self._not_running()
+
+        data, headers = self._completion_request(system, user, max_tokens, stream=False)
+        try:
+            status, reason, body = await asyncio.wait_for(
+                async_http_request(
+                    self.base_url, "POST", "/v1/chat/completions", body=data, headers=headers
+                ),
+                self.REQUEST_TIMEOUT
+            )
+        except (OSError, http.client.HTTPException):
+            raise self._cannot_connect()
+
+        self._check_status(status, reason)
+        return self._parse_completion(body)
+
+    def complete_stream(self, system: str, user: str,
+                        max_tokens: int = 2048) -> Iterator[Union[str, LLMResponse]]:
+        """
+        Stream a completion as server-sent events (data: {chunk} lines,
+        ending with data: [DONE]). Usage comes with the last chunk.
+        """
+        if not self.is_available:
+            raise self._not_running()
+
+        data, headers = self._completion_request(system, user, max_tokens, stream=True)
+        try:
+            status, reason, lines = self._pool.stream(
+                "POST", "/v1/chat/completions", body=data, headers=headers,
+                timeout=self.REQUEST_TIMEOUT
+            )
+        except (OSError, http.client.HTTPException):
+            raise self._cannot_connect()
+
+        if status >= 400:
+            b"".join(lines)  # Drain so the connection can be reused
+            self._check_status(status, reason)
+        self._probe.mark_available()
+
+        chunks = []
+        usage = {}
+        for line in lines:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            event = line[5:].strip()
+            if event == b"[DONE]":
+                continue  # Drain to the end so the connection is reused
+            try:
+                result = json.loads(event.decode('utf-8'))
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                lines.close()
+                raise RuntimeError(f"Invalid response from Ollama: {e}")
+
+            usage = result.get('usage') or usage
+            for choice in result.get('choices') or []:
+                text = (choice.get('delta') or {}).get('content')
+                if text:
+                    chunks.append(text)
+                    yield text
+
+        yield LLMResponse(
+            text="".join(chunks),
+            input_tokens=usage.get('prompt_tokens', 0),
+            output_tokens=usage.get('completion_tokens', 0)
+        )
 
 
 class MockProvider(LLMProvider):
@@ -333,7 +942,9 @@ def get_provider(config: Config) -> LLMProvider:
         config: Application configuration
 
     Returns:
-        Configured provider, or MockProvider if none available
+        Configured provider, or MockProvider if no remote provider is
+        available. Local providers are always returned; check
+        is_available before use (it waits for the background probe).
     """
     llm = config.llm
 
@@ -352,18 +963,13 @@ def get_provider(config: Config) -> LLMProvider:
     active_config, is_local = llm.get_active_config()
 
     if is_local:
-        # Use local provider with local config
-        provider_name = active_config.provider
-        if provider_name in local_providers:
-            provider_class = local_providers[provider_name]
-            provider = provider_class(active_config)
-            if provider.is_available:
-                return provider
-        # Fallback: try any local provider
-        for provider_class in local_providers.values():
-            provider = provider_class(active_config)
-            if provider.is_available:
-                return provider
+        # Use local provider with local config. Returned without waiting
+        # on the network: its availability probe runs in the background,
+        # and callers check is_available when they actually need the LLM
+        provider_class = local_providers.get(active_config.provider, OllamaProvider)
+        provider = provider_class(active_config)
+        provider.start_probe()
+        return provider
     else:
         # Use remote provider with remote config
         provider_name = active_config.provider
@@ -388,7 +994,7 @@ def get_provider_status(config: Config) -> str:
         # Local provider status
         provider = get_provider(config)
 
-        if isinstance(provider, MockProvider):
+        if isinstance(provider, MockProvider) or not provider.is_available:
             # Ollama not running
             base_url = active_config.effective_base_url
             return f"Ollama not running at {base_url}. Start with: ollama serve"
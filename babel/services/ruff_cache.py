@@ -0,0 +1,219 @@
+"""
+Ruff Cache — Per-file findings for incremental clean scans
+
+Clean scan runs ruff over the working tree. Most files are unchanged
+between scans, so their findings are kept per file, keyed by content
+hash, in .babel/scan/clean/. A scan then only hands ruff the files
+whose content changed (or that are new) and merges the fresh findings
+with the cached ones; deleted files drop out.
+
+Change detection:
+- (mtime, size) unchanged: file is unchanged (no read)
+- Otherwise the content hash (xxh64) decides
+
+The cache key covers the selected rules, the ruff binary and ruff
+configuration files: if any of them change, the next scan is a full one.
+
+Findings are cached with the filename, location and code ruff reported,
+so finding IDs (derived from filename, row and code) and exclusions stay
+stable whether a file was checked this run or came from the cache.
+
+Like other scan state, the cache is disposable: deleting it only makes
+the next scan a full one.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import xxhash
+
+
+# Files ruff checks by default
+SOURCE_SUFFIXES = (".py", ".pyi", ".ipynb")
+
+# Directories never walked (ruff's default excludes plus common build output)
+SKIP_DIRS = frozenset({
+    "__pycache__", "__pypackages__", "_build", "buck-out", "build", "dist",
+    "node_modules", "site-packages", "venv", "env",
+})
+
+# Configuration files that change what ruff reports
+CONFIG_FILES = ("pyproject.toml", "ruff.toml", ".ruff.toml")
+
+CACHE_VERSION = 1
+
+
+def file_hash(path: Path) -> str:
+    """Content hash of a file."""
+    hasher = xxhash.xxh64()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
+
+
+def cache_key(root: Path, ruff_path: str, rules: List[str]) -> str:
+    """Key of everything besides file content that affects ruff output."""
+    parts = [",".join(sorted(rules)), ruff_path]
+    try:
+        parts.append(str(os.stat(ruff_path).st_mtime_ns))
+    except OSError:
+        pass
+    for name in CONFIG_FILES:
+        config = root / name
+        if config.is_file():
+            parts.append(f"{name}:{file_hash(config)}")
+    return xxhash.xxh64("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+
+def _trim(finding: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the fields clean scan reads (drops fix edits, URLs, ...)."""
+    trimmed = {
+        "code": finding.get("code"),
+        "message": finding.get("message"),
+        "filename": finding.get("filename"),
+        "location": finding.get("location") or {},
+    }
+    fix = finding.get("fix")
+    if fix:
+        trimmed["fix"] = {"applicability": fix.get("applicability")}
+    return trimmed
+
+
+class RuffFileCache:
+    """
+    Per-file ruff findings with the content hash they were computed for.
+
+    Usage:
+        cache = RuffFileCache(path, root, key)
+        changed = cache.plan()          # None: full scan needed
+        ... run ruff on changed files (or everything) ...
+        findings = cache.merge(ruff_findings, changed)
+        cache.save()
+    """
+
+    def __init__(self, path: Path, root: Path, key: str):
+        self.path = Path(path)
+        self.root = Path(root)
+        self.key = key
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._current: Dict[str, Tuple[int, int, Optional[str]]] = {}
+        self._valid = False
+        self._load()
+
+    def _load(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if data.get("version") == CACHE_VERSION and data.get("key") == self.key:
+            self._files = data.get("files", {})
+            self._valid = True
+
+    def _walk(self) -> Dict[str, os.stat_result]:
+        """Source files under root by relative POSIX path."""
+        found = {}
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [
+                d for d in dirnames
+                if not d.startswith(".") and d not in SKIP_DIRS
+            ]
+            for name in filenames:
+                if not name.endswith(SOURCE_SUFFIXES):
+                    continue
+                full = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(full)
+                except OSError:
+                    continue
+                found[Path(full).relative_to(self.root).as_posix()] = st
+        return found
+
+    def plan(self) -> Optional[List[str]]:
+        """
+        Relative paths ruff has to check this run.
+
+        Returns None when there is no usable cache (full scan needed).
+        Files ruff reported earlier that the walk does not cover (e.g.
+        outside the walked suffixes) are always rechecked while they exist.
+        """
+        changed = []
+        for rel, st in self._walk().items():
+            cached = self._files.get(rel)
+            stat = (st.st_mtime_ns, st.st_size)
+            if cached and (cached.get("mtime"), cached.get("size")) == stat:
+                self._current[rel] = (*stat, cached.get("hash"))
+                continue
+            digest = file_hash(self.root / rel)
+            self._current[rel] = (*stat, digest)
+            if not cached or cached.get("hash") != digest:
+                changed.append(rel)
+
+        for rel, cached in self._files.items():
+            if rel not in self._current and cached.get("hash") is None and (self.root / rel).exists():
+                changed.append(rel)
+
+        if not self._valid:
+            return None
+        return sorted(changed)
+
+    def _relative(self, filename: str) -> str:
+        path = Path(filename)
+        if path.is_absolute():
+            try:
+                return path.relative_to(self.root).as_posix()
+            except ValueError:
+                return path.as_posix()
+        return path.as_posix()
+
+    def merge(self, ruff_findings: List[Dict[str, Any]], scanned: Optional[List[str]]) -> List[Dict[str, Any]]:
+        """
+        Combine fresh ruff findings with cached ones for unchanged files.
+
+        Args:
+            ruff_findings: Findings from this run's ruff invocation
+            scanned: Relative paths ruff checked (None = whole tree)
+
+        Returns:
+            All findings, ordered by file
+        """
+        fresh: Dict[str, List[Dict[str, Any]]] = {}
+        for rf in ruff_findings:
+            fresh.setdefault(self._relative(rf.get("filename", "")), []).append(_trim(rf))
+
+        if scanned is None:
+            files = {}
+        else:
+            # Unchanged files still on disk keep their findings; deleted ones drop out
+            scanned_set = set(scanned)
+            files = {
+                rel: entry for rel, entry in self._files.items()
+                if rel not in scanned_set and rel in self._current
+            }
+            for rel, entry in files.items():
+                mtime, size, digest = self._current[rel]
+                entry.update(mtime=mtime, size=size, hash=digest)
+
+        for rel in (self._current if scanned is None else scanned):
+            mtime, size, digest = self._current.get(rel, (None, None, None))
+            files[rel] = {"mtime": mtime, "size": size, "hash": digest, "findings": []}
+        for rel, findings in fresh.items():
+            entry = files.setdefault(rel, {"mtime": None, "size": None, "hash": None, "findings": []})
+            entry["findings"] = findings
+
+        self._files = files
+        self._valid = True
+        return [rf for rel in sorted(files) for rf in files[rel]["findings"]]
+
+    def save(self):
+        """Persist the cache (failure only costs the next scan a full run)."""
+        data = {"version": CACHE_VERSION, "key": self.key, "files": self._files}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
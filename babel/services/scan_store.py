@@ -0,0 +1,283 @@
+"""
+Scan Store — SQLite store for scan results, findings and exclusions
+
+Replaces the per-call JSON rewrites of scan_cache.json and
+.babel/scan/<type>/{findings,exclusions}.json:
+- results: last result per scan type, looked up by (type, context hash)
+- findings: one row per finding, indexed by finding ID
+- exclusions: one row per excluded finding ID
+
+Status updates, exclusions and summaries are single-row statements or
+one aggregate query instead of load-everything/rewrite-everything.
+
+Storage: .babel/scan/scan.db (local scan state, like the JSON it replaces).
+Legacy JSON files are imported once when the store is first created.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import orjson
+
+from ..core.graph import prefix_upper_bound
+
+
+class ScanStore:
+    """
+    Scan results, findings and exclusions per scan type.
+
+    Finding IDs are matched by prefix where the UI does (display shows
+    8 characters, full IDs are 12), using indexed range queries.
+    """
+
+    def __init__(self, path: Path, legacy_cache: Optional[Path] = None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self.path.exists()
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+
+            CREATE TABLE IF NOT EXISTS results (
+                scan_type TEXT PRIMARY KEY,
+                context_hash TEXT NOT NULL,
+                data TEXT NOT NULL
+            );
+
+            CREATE TABLE IF NOT EXISTS findings (
+                scan_type TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                finding_id TEXT,
+                status TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (scan_type, seq)
+            );
+            CREATE INDEX IF NOT EXISTS idx_findings_id ON findings(scan_type, finding_id);
+
+            CREATE TABLE IF NOT EXISTS exclusions (
+                scan_type TEXT NOT NULL,
+                finding_id TEXT NOT NULL,
+                data TEXT NOT NULL,
+                PRIMARY KEY (scan_type, finding_id)
+            );
+        """)
+        if is_new:
+            self._import_legacy(legacy_cache)
+
+    # =========================================================================
+    # Results (context-hash cache)
+    # =========================================================================
+
+    def get_result(self, scan_type: str, context_hash: str) -> Optional[Dict[str, Any]]:
+        """Stored result for a scan type if computed for this context hash."""
+        row = self.conn.execute(
+            "SELECT data FROM results WHERE scan_type = ? AND context_hash = ?",
+            (scan_type, context_hash)
+        ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def put_result(self, scan_type: str, context_hash: str, data: Dict[str, Any]):
+        """Replace the stored result for a scan type."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO results (scan_type, context_hash, data) VALUES (?, ?, ?)",
+                (scan_type, context_hash, orjson.dumps(data).decode())
+            )
+            self.conn.commit()
+
+    # =========================================================================
+    # Findings
+    # =========================================================================
+
+    def get_findings(self, scan_type: str) -> List[Dict[str, Any]]:
+        """Findings of a scan type in saved order (status from its column)."""
+        rows = self.conn.execute(
+            "SELECT status, data FROM findings WHERE scan_type = ? ORDER BY seq",
+            (scan_type,)
+        ).fetchall()
+        return [dict(orjson.loads(data), status=status) for status, data in rows]
+
+    def replace_findings(self, scan_type: str, findings: Iterable[Dict[str, Any]]):
+        """Replace all findings of a scan type."""
+        rows = [
+            (scan_type, seq, f.get("finding_id"), f.get("status") or "pending", orjson.dumps(f).decode())
+            for seq, f in enumerate(findings)
+        ]
+        with self._lock:
+            self.conn.execute("DELETE FROM findings WHERE scan_type = ?", (scan_type,))
+            self.conn.executemany(
+                "INSERT INTO findings (scan_type, seq, finding_id, status, data) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self.conn.commit()
+
+    def _id_range(self, prefix: str) -> Tuple[str, List[Any]]:
+        """SQL condition and params matching finding IDs starting with prefix."""
+        if not prefix:
+            return "finding_id IS NOT NULL", []
+        return "finding_id >= ? AND finding_id < ?", [prefix, prefix_upper_bound(prefix)]
+
+    def find_finding(self, scan_type: str, prefix: str) -> Optional[Dict[str, Any]]:
+        """First finding (in saved order) whose ID starts with prefix."""
+        condition, params = self._id_range(prefix)
+        row = self.conn.execute(
+            f"SELECT status, data FROM findings WHERE scan_type = ? AND {condition} "
+            "ORDER BY seq LIMIT 1",
+            [scan_type, *params]
+        ).fetchone()
+        return dict(orjson.loads(row[1]), status=row[0]) if row else None
+
+    def update_status(self, scan_type: str, prefix: str, status: str) -> Optional[Dict[str, Any]]:
+        """Set the status of the first finding whose ID starts with prefix."""
+        condition, params = self._id_range(prefix)
+        with self._lock:
+            row = self.conn.execute(
+                f"SELECT seq, data FROM findings WHERE scan_type = ? AND {condition} "
+                "ORDER BY seq LIMIT 1",
+                [scan_type, *params]
+            ).fetchone()
+            if row is None:
+                return None
+            self.conn.execute(
+                "UPDATE findings SET status = ? WHERE scan_type = ? AND seq = ?",
+                (status, scan_type, row[0])
+            )
+            self.conn.commit()
+        return dict(orjson.loads(row[1]), status=status)
+
+    def delete_findings(self, scan_type: str, prefix: str) -> int:
+        """Delete findings whose ID starts with prefix."""
+        condition, params = self._id_range(prefix)
+        with self._lock:
+            cursor = self.conn.execute(
+                f"DELETE FROM findings WHERE scan_type = ? AND {condition}",
+                [scan_type, *params]
+            )
+            self.conn.commit()
+        return cursor.rowcount
+
+    def count_by_status(self, scan_type: str) -> Dict[str, int]:
+        """Finding counts per status."""
+        return dict(self.conn.execute(
+            "SELECT status, COUNT(*) FROM findings WHERE scan_type = ? GROUP BY status",
+            (scan_type,)
+        ).fetchall())
+
+    # =========================================================================
+    # Exclusions
+    # =========================================================================
+
+    def get_exclusions(self, scan_type: str) -> Dict[str, Dict[str, Any]]:
+        """Exclusions of a scan type by finding ID."""
+        rows = self.conn.execute(
+            "SELECT finding_id, data FROM exclusions WHERE scan_type = ?", (scan_type,)
+        ).fetchall()
+        return {finding_id: orjson.loads(data) for finding_id, data in rows}
+
+    def add_exclusion(self, scan_type: str, finding_id: str, data: Dict[str, Any]):
+        """Add (or replace) an exclusion."""
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO exclusions (scan_type, finding_id, data) VALUES (?, ?, ?)",
+                (scan_type, finding_id, orjson.dumps(data).decode())
+            )
+            self.conn.commit()
+
+    def has_exclusion(self, scan_type: str, finding_id: str) -> bool:
+        return self.conn.execute(
+            "SELECT 1 FROM exclusions WHERE scan_type = ? AND finding_id = ?",
+            (scan_type, finding_id)
+        ).fetchone() is not None
+
+    def count_exclusions(self, scan_type: str) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM exclusions WHERE scan_type = ?", (scan_type,)
+        ).fetchone()[0]
+
+    def remove_exclusion(self, scan_type: str, finding_id: str) -> bool:
+        """Remove an exclusion (False if not found)."""
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM exclusions WHERE scan_type = ? AND finding_id = ?",
+                (scan_type, finding_id)
+            )
+            self.conn.commit()
+        return cursor.rowcount > 0
+
+    def replace_exclusions(self, scan_type: str, exclusions: Dict[str, Dict[str, Any]]):
+        """Replace all exclusions of a scan type."""
+        with self._lock:
+            self.conn.execute("DELETE FROM exclusions WHERE scan_type = ?", (scan_type,))
+            self.conn.executemany(
+                "INSERT INTO exclusions (scan_type, finding_id, data) VALUES (?, ?, ?)",
+                [(scan_type, fid, orjson.dumps(data).decode()) for fid, data in exclusions.items()]
+            )
+            self.conn.commit()
+
+    # =========================================================================
+    # Summary
+    # =========================================================================
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """
+        Per scan type: total findings, pending (not resolved, not excluded)
+        and exclusion count, in one query.
+
+        Excluded findings match exclusions by prefix in either direction
+        (short display IDs may have been excluded).
+        """
+        rows = self.conn.execute("""
+            SELECT f.scan_type,
+                   COUNT(*),
+                   SUM(f.status != 'resolved' AND NOT EXISTS (
+                       SELECT 1 FROM exclusions e
+                       WHERE e.scan_type = f.scan_type AND f.finding_id IS NOT NULL
+                         AND (substr(f.finding_id, 1, length(e.finding_id)) = e.finding_id
+                              OR substr(e.finding_id, 1, length(f.finding_id)) = f.finding_id)
+                   )),
+                   (SELECT COUNT(*) FROM exclusions e2 WHERE e2.scan_type = f.scan_type)
+            FROM findings f
+            GROUP BY f.scan_type
+        """).fetchall()
+        return {
+            scan_type: {"total": total, "pending": pending, "excluded": excluded}
+            for scan_type, total, pending, excluded in rows
+        }
+
+    # =========================================================================
+    # Legacy import
+    # =========================================================================
+
+    def _import_legacy(self, legacy_cache: Optional[Path]):
+        """Import scan_cache.json and scan/<type>/*.json written by older versions."""
+        if legacy_cache and legacy_cache.exists():
+            try:
+                data = json.loads(legacy_cache.read_text())
+                for scan_type, result in data.items():
+                    self.put_result(scan_type, result.get("context_hash", ""), result)
+            except (ValueError, AttributeError, OSError):
+                pass
+
+        for type_dir in sorted(self.path.parent.iterdir()):
+            if not type_dir.is_dir():
+                continue
+            try:
+                findings_file = type_dir / "findings.json"
+                if findings_file.exists():
+                    data = json.loads(findings_file.read_text())
+                    self.replace_findings(type_dir.name, data.get("findings", []))
+                exclusions_file = type_dir / "exclusions.json"
+                if exclusions_file.exists():
+                    data = json.loads(exclusions_file.read_text())
+                    self.replace_exclusions(type_dir.name, data.get("exclusions", {}))
+            except (ValueError, AttributeError, OSError):
+                continue
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
@@ -20,13 +20,20 @@ Scan types:
 import ast
 import json
 import hashlib
+import os
+import posixpath
+import re
+import time
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, TYPE_CHECKING
+from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from ..core.events import DualEventStore
 from ..core.graph import GraphStore
+from ..core.intervals import IntervalIndex
+from .ruff_cache import RuffFileCache, cache_key as ruff_cache_key
+from .scan_store import ScanStore
 from ..presentation.symbols import get_symbols
 
 if TYPE_CHECKING:
@@ -44,6 +51,16 @@ VERIFIED_FALSE = "verified_false"    # False positive (actually used)
 UNCERTAIN = "uncertain"              # Could not determine (needs manual review)
 
 
+def _path_key(path: str) -> Tuple[str, ...]:
+    """Path as normalized components (separator- and ./-insensitive)."""
+    normalized = posixpath.normpath(path.replace('\\', '/'))
+    return tuple(part for part in normalized.split('/') if part not in ('', '.'))
+
+
+# Changed files passed to one ruff invocation (keeps command lines short)
+RUFF_BATCH_SIZE = 200
+
+
 # =============================================================================
 # Data Models
 # =============================================================================
@@ -214,6 +231,95 @@ class ScanResult:
         )
 
 
+# =============================================================================
+# Verification Helpers
+# =============================================================================
+
+_WORD = re.compile(r'\w+')
+
+
+class _FileUsage:
+    """
+    One source file, analysed once for all findings that point into it.
+
+    Word and name tables are built lazily on first use, so a file whose
+    findings are all settled by the pattern rules is never tokenized or
+    parsed.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.lines = content.split('\n')
+        self._exports: Optional[str] = None
+        self._word_lines: Optional[Dict[str, int]] = None
+        self._name_lines: Optional[Dict[str, int]] = None
+        self._parse_failed = False
+
+    def in_all_list(self, symbol: str) -> bool:
+        """Symbol appears as a string in the first __all__ list."""
+        if self._exports is None:
+            # Match __all__ = [...] or __all__ += [...]
+            match = re.search(r'__all__\s*[+]?=\s*\[([^\]]*)\]', self.content, re.DOTALL)
+            self._exports = match.group(1) if match else ""
+        # Handles: "symbol", 'symbol'
+        return bool(self._exports) and bool(
+            re.search(rf'''["']{re.escape(symbol)}["']''', self._exports)
+        )
+
+    def word_after(self, symbol: str, import_line: int) -> bool:
+        """
+        Symbol appears as a whole word on a non-comment line after the import.
+
+        Same result as a \\b-bounded regex search of each following line:
+        an identifier matches exactly when it is one of the line's maximal
+        word-character runs.
+        """
+        if not _WORD.fullmatch(symbol):
+            return Scanner._regex_search_after_import(self.lines, symbol, import_line)
+        if import_line <= 0 or import_line > len(self.lines):
+            return False
+
+        if self._word_lines is None:
+            last: Dict[str, int] = {}
+            for i, line in enumerate(self.lines):
+                if line.strip().startswith('#'):
+                    continue
+                for word in _WORD.findall(line):
+                    last[word] = i
+            self._word_lines = last
+        # import_line is 1-indexed, so index import_line is the next line
+        return self._word_lines.get(symbol, -1) >= import_line
+
+    def name_after(self, symbol: str, import_line: int) -> Optional[bool]:
+        """
+        Symbol is referenced as a Name node after the import (AST check).
+
+        Returns None if the file does not parse.
+        """
+        if self._name_lines is None and not self._parse_failed:
+            try:
+                tree = ast.parse(self.content)
+            except SyntaxError:
+                self._parse_failed = True
+            else:
+                # Last line each name is loaded on, from one walk of the tree
+                # (covers attribute access like symbol.method via its Name)
+                last: Dict[str, int] = {}
+                for node in ast.walk(tree):
+                    if isinstance(node, ast.Name) and node.lineno > last.get(node.id, 0):
+                        last[node.id] = node.lineno
+                self._name_lines = last
+        if self._parse_failed:
+            return None
+        return self._name_lines.get(symbol, 0) > import_line
+
+
+def _verify_batch(batch: Tuple[str, List[Tuple[str, Optional[int]]]]) -> List[str]:
+    """Verify one file's findings (module-level so CPU pool workers can run it)."""
+    file, checks = batch
+    return Scanner._verify_file(file, checks)
+
+
 # =============================================================================
 # Scanner
 # =============================================================================
@@ -242,6 +348,8 @@ class Scanner:
         self.cache_path = cache_path
         
         self._context_cache: Optional[ScanContext] = None
+        self._test_index: Optional[Dict[str, List[str]]] = None
+        self._store: Optional[ScanStore] = None
     
     # =========================================================================
     # Public Interface
@@ -312,12 +420,9 @@ class Scanner:
 
     def get_finding(self, scan_type: str, finding_id: str) -> Optional[ScanFinding]:
         """Get specific finding by ID (supports prefix matching)."""
-        findings = self._load_findings(scan_type)
-        for f in findings:
-            # Support prefix matching (display shows 8 chars, full ID is 12)
-            if f.finding_id and f.finding_id.startswith(finding_id):
-                return f
-        return None
+        # Prefix matching: display shows 8 chars, full ID is 12
+        found = self._scan_store().find_finding(scan_type, finding_id)
+        return ScanFinding.from_dict(found) if found else None
 
     def update_finding_status(
         self,
@@ -335,20 +440,9 @@ class Scanner:
         Returns:
             Updated finding or None if not found
         """
-        findings = self._load_findings(scan_type)
-        updated = None
-
-        for f in findings:
-            # Support prefix matching (display shows 8 chars, full ID is 12)
-            if f.finding_id and f.finding_id.startswith(finding_id):
-                f.status = status
-                updated = f
-                break
-
-        if updated:
-            self._save_findings(scan_type, findings)
-
-        return updated
+        # Prefix matching: display shows 8 chars, full ID is 12
+        updated = self._scan_store().update_status(scan_type, finding_id, status)
+        return ScanFinding.from_dict(updated) if updated else None
 
     def add_exclusion(
         self,
@@ -368,9 +462,9 @@ class Scanner:
         Returns:
             True if added, False if already excluded
         """
-        exclusions = self._load_exclusions(scan_type)
+        store = self._scan_store()
 
-        if finding_id in exclusions:
+        if store.has_exclusion(scan_type, finding_id):
             return False  # Already excluded
 
         exclusion_data = {
@@ -387,13 +481,10 @@ class Scanner:
 
         # Use full finding_id if we have the finding object
         full_id = finding.finding_id if finding and finding.finding_id else finding_id
-        exclusions[full_id] = exclusion_data
-        self._save_exclusions(scan_type, exclusions)
+        store.add_exclusion(scan_type, full_id, exclusion_data)
 
         # Remove from active findings (use prefix matching for consistency)
-        findings = self._load_findings(scan_type)
-        findings = [f for f in findings if not (f.finding_id and f.finding_id.startswith(finding_id))]
-        self._save_findings(scan_type, findings)
+        store.delete_findings(scan_type, finding_id)
 
         return True
 
@@ -403,14 +494,7 @@ class Scanner:
         Returns:
             True if removed, False if not found
         """
-        exclusions = self._load_exclusions(scan_type)
-
-        if finding_id not in exclusions:
-            return False
-
-        del exclusions[finding_id]
-        self._save_exclusions(scan_type, exclusions)
-        return True
+        return self._scan_store().remove_exclusion(scan_type, finding_id)
 
     def get_exclusions(self, scan_type: str) -> Dict[str, Dict[str, Any]]:
         """Get all exclusions for scan type."""
@@ -421,24 +505,23 @@ class Scanner:
 
         Returns dict with counts: pending, validated, resolved, excluded
         """
-        findings = self._load_findings(scan_type)
-        exclusions = self._load_exclusions(scan_type)
+        store = self._scan_store()
 
         counts = {
             "pending": 0,
             "validated": 0,
             "resolved": 0,
-            "excluded": len(exclusions),
+            "excluded": store.count_exclusions(scan_type),
             "verified_true": 0,
             "verified_false": 0,
             "uncertain": 0
         }
 
-        for f in findings:
-            if f.status in counts:
-                counts[f.status] += 1
+        for status, count in store.count_by_status(scan_type).items():
+            if status in counts:
+                counts[status] += count
             else:
-                counts["pending"] += 1  # Default to pending
+                counts["pending"] += count  # Default to pending
 
         return counts
 
@@ -446,15 +529,18 @@ class Scanner:
     # Verification (Hybrid Parser: regex fast-path + AST cross-check)
     # =========================================================================
 
-    def verify_findings(self, scan_type: str) -> Dict[str, Any]:
+    def verify_findings(self, scan_type: str, orchestrator=None) -> Dict[str, Any]:
         """
         Verify all findings using hybrid parser approach.
 
         Uses regex fast-path for obvious cases, AST cross-check for validation.
-        Updates findings.json with verification status.
+        Findings are grouped by file: each file is read and parsed once,
+        and files are verified in parallel on the orchestrator's CPU pool
+        when one is given. Stores verification status in the scan store.
 
         Args:
             scan_type: Type of scan (e.g., "clean")
+            orchestrator: TaskOrchestrator to fan files out across (optional)
 
         Returns:
             Dict with verification summary:
@@ -462,7 +548,9 @@ class Scanner:
                 "verified_true": count,
                 "verified_false": count,
                 "uncertain": count,
-                "findings": [updated findings]
+                "findings": [updated findings],
+                "files": files verified,
+                "files_per_sec": verification throughput
             }
         """
         findings = self._load_findings(scan_type)
@@ -471,28 +559,52 @@ class Scanner:
                 "verified_true": 0,
                 "verified_false": 0,
                 "uncertain": 0,
-                "findings": []
+                "findings": [],
+                "files": 0,
+                "files_per_sec": 0.0
             }
 
         results = {
             "verified_true": 0,
             "verified_false": 0,
             "uncertain": 0,
-            "findings": []
+            "findings": findings,
+            "files": 0,
+            "files_per_sec": 0.0
         }
 
+        # Group unprocessed findings by file (skip already processed ones)
+        by_file: Dict[str, List[ScanFinding]] = {}
         for finding in findings:
-            # Skip already processed findings
             if finding.status in (VERIFIED_TRUE, VERIFIED_FALSE, UNCERTAIN, "resolved"):
-                results[finding.status] = results.get(finding.status, 0) + 1
-                results["findings"].append(finding)
                 continue
+            if not finding.file or not finding.symbol:
+                finding.status = UNCERTAIN
+                continue
+            by_file.setdefault(finding.file, []).append(finding)
+
+        if by_file:
+            batches = [
+                (file, [(f.symbol, f.line) for f in file_findings])
+                for file, file_findings in by_file.items()
+            ]
+            started = time.perf_counter()
+            if orchestrator and orchestrator.enabled and len(batches) > 1:
+                statuses = orchestrator.map_parallel(_verify_batch, batches)
+            else:
+                statuses = [_verify_batch(batch) for batch in batches]
+            elapsed = time.perf_counter() - started
+
+            for file_findings, file_statuses in zip(by_file.values(), statuses):
+                for finding, status in zip(file_findings, file_statuses):
+                    finding.status = status
 
-            # Verify this finding
-            status = self._verify_single_finding(finding)
-            finding.status = status
-            results[status] += 1
-            results["findings"].append(finding)
+            results["files"] = len(batches)
+            results["files_per_sec"] = len(batches) / elapsed if elapsed > 0 else float(len(batches))
+
+        for finding in findings:
+            if finding.status in (VERIFIED_TRUE, VERIFIED_FALSE, UNCERTAIN, "resolved"):
+                results[finding.status] = results.get(finding.status, 0) + 1
 
         # Persist updated findings
         self._save_findings(scan_type, findings)
@@ -503,11 +615,6 @@ class Scanner:
         """
         Verify a single finding using hybrid parser.
 
-        Algorithm:
-        1. Pattern rules (fast reject false positives)
-        2. Regex negative search
-        3. AST cross-check for uncertain cases
-
         Args:
             finding: The finding to verify
 
@@ -516,46 +623,73 @@ class Scanner:
         """
         if not finding.file or not finding.symbol:
             return UNCERTAIN
+        return self._verify_file(finding.file, [(finding.symbol, finding.line)])[0]
 
-        try:
-            file_path = Path(finding.file)
-            if not file_path.exists():
-                return UNCERTAIN
-
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            lines = content.split('\n')
-
-            # RULE 1: __init__.py at top level = likely re-export
-            if self._is_init_reexport(finding.file, finding.line, lines):
-                return VERIFIED_FALSE
+    @staticmethod
+    def _verify_file(file: str, checks: List[Tuple[str, Optional[int]]]) -> List[str]:
+        """
+        Verify all findings of one file against a single read and parse.
 
-            # RULE 2: Symbol in __all__ = explicitly exported
-            if self._is_in_all_list(content, finding.symbol):
-                return VERIFIED_FALSE
+        Algorithm (per finding):
+        1. Pattern rules (fast reject false positives)
+        2. Regex negative search
+        3. AST cross-check for uncertain cases
 
-            # RULE 3: Import inside TYPE_CHECKING block
-            if self._is_type_checking_import(lines, finding.line):
-                # Check if used in type annotations
-                if self._symbol_in_annotations(content, finding.symbol):
-                    return VERIFIED_FALSE
+        Args:
+            file: Source file path
+            checks: (symbol, import line) per finding
 
-            # REGEX FAST-PATH: Search for symbol after import line
-            if self._regex_search_after_import(lines, finding.symbol, finding.line):
-                return VERIFIED_FALSE  # Found usage
+        Returns:
+            Status per check: VERIFIED_TRUE, VERIFIED_FALSE, or UNCERTAIN
+        """
+        try:
+            file_path = Path(file)
+            if not file_path.exists():
+                return [UNCERTAIN] * len(checks)
+            usage = _FileUsage(file_path.read_text(encoding='utf-8', errors='ignore'))
+        except Exception:
+            return [UNCERTAIN] * len(checks)
 
-            # AST CROSS-CHECK: For higher confidence
-            ast_used = self._ast_check_usage(content, finding.symbol, finding.line)
-            if ast_used is True:
+        statuses = []
+        for symbol, line in checks:
+            try:
+                statuses.append(Scanner._verify_usage(usage, file, symbol, line))
+            except Exception:
+                statuses.append(UNCERTAIN)
+        return statuses
+
+    @staticmethod
+    def _verify_usage(usage: '_FileUsage', file: str, symbol: str, line: Optional[int]) -> str:
+        """Hybrid verification of one import against an analysed file."""
+        # RULE 1: __init__.py at top level = likely re-export
+        if Scanner._is_init_reexport(file, line, usage.lines):
+            return VERIFIED_FALSE
+
+        # RULE 2: Symbol in __all__ = explicitly exported
+        if usage.in_all_list(symbol):
+            return VERIFIED_FALSE
+
+        # RULE 3: Import inside TYPE_CHECKING block
+        if Scanner._is_type_checking_import(usage.lines, line):
+            # Check if used in type annotations
+            if Scanner._symbol_in_annotations(usage.content, symbol):
                 return VERIFIED_FALSE
-            elif ast_used is False:
-                return VERIFIED_TRUE
-            else:
-                return UNCERTAIN
 
-        except Exception:
+        # REGEX FAST-PATH: Search for symbol after import line
+        if usage.word_after(symbol, line):
+            return VERIFIED_FALSE  # Found usage
+
+        # AST CROSS-CHECK: For higher confidence
+        ast_used = usage.name_after(symbol, line)
+        if ast_used is True:
+            return VERIFIED_FALSE
+        elif ast_used is False:
+            return VERIFIED_TRUE
+        else:
             return UNCERTAIN
 
-    def _is_init_reexport(self, file_path: str, line: int, lines: List[str]) -> bool:
+    @staticmethod
+    def _is_init_reexport(file_path: str, line: int, lines: List[str]) -> bool:
         """
         Check if this is a re-export pattern in __init__.py.
 
@@ -577,28 +711,17 @@ class Scanner:
 
         return False
 
-    def _is_in_all_list(self, content: str, symbol: str) -> bool:
+    @staticmethod
+    def _is_in_all_list(content: str, symbol: str) -> bool:
         """
         Check if symbol is in __all__ list.
 
         Symbols in __all__ are explicitly exported and should not be removed.
         """
-        import re
-
-        # Match __all__ = [...] or __all__ += [...]
-        all_pattern = r'__all__\s*[+]?=\s*\[([^\]]*)\]'
-        match = re.search(all_pattern, content, re.DOTALL)
-
-        if match:
-            all_content = match.group(1)
-            # Check if symbol appears as a string in the list
-            # Handles: "symbol", 'symbol'
-            if re.search(rf'''["']{re.escape(symbol)}["']''', all_content):
-                return True
+        return _FileUsage(content).in_all_list(symbol)
 
-        return False
-
-    def _is_type_checking_import(self, lines: List[str], import_line: int) -> bool:
+    @staticmethod
+    def _is_type_checking_import(lines: List[str], import_line: int) -> bool:
         """
         Check if import is inside a TYPE_CHECKING block.
 
@@ -619,7 +742,8 @@ class Scanner:
 
         return False
 
-    def _symbol_in_annotations(self, content: str, symbol: str) -> bool:
+    @staticmethod
+    def _symbol_in_annotations(content: str, symbol: str) -> bool:
         """
         Check if symbol appears in type annotations.
 
@@ -643,7 +767,8 @@ class Scanner:
 
         return False
 
-    def _regex_search_after_import(self, lines: List[str], symbol: str, import_line: int) -> bool:
+    @staticmethod
+    def _regex_search_after_import(lines: List[str], symbol: str, import_line: int) -> bool:
         """
         Regex fast-path: search for symbol usage after import line.
 
@@ -675,7 +800,8 @@ class Scanner:
 
         return False
 
-    def _ast_check_usage(self, content: str, symbol: str, import_line: int) -> Optional[bool]:
+    @staticmethod
+    def _ast_check_usage(content: str, symbol: str, import_line: int) -> Optional[bool]:
         """
         AST cross-check: verify symbol usage via AST parsing.
 
@@ -687,51 +813,33 @@ class Scanner:
         Returns:
             True if used, False if not used, None if AST parsing failed
         """
-        import ast
-
-        try:
-            tree = ast.parse(content)
-        except SyntaxError:
-            return None
-
-        # Collect all Name nodes after the import line
-        class NameCollector(ast.NodeVisitor):
-            def __init__(self):
-                self.names = []
-                self.target_line = import_line
-
-            def visit_Name(self, node):
-                if node.lineno > self.target_line:
-                    self.names.append(node.id)
-                self.generic_visit(node)
-
-            def visit_Attribute(self, node):
-                # Handle attribute access like symbol.method
-                if isinstance(node.value, ast.Name):
-                    if node.value.lineno > self.target_line:
-                        self.names.append(node.value.id)
-                self.generic_visit(node)
-
-        collector = NameCollector()
-        collector.visit(tree)
-
-        return symbol in collector.names
+        return _FileUsage(content).name_after(symbol, import_line)
 
     # =========================================================================
     # Removal (Safe deletion with git checkpoint)
     # =========================================================================
 
-    def remove_verified_imports(self, scan_type: str, run_tests: bool = True) -> Dict[str, Any]:
+    def remove_verified_imports(
+        self,
+        scan_type: str,
+        run_tests: bool = True,
+        orchestrator=None
+    ) -> Dict[str, Any]:
         """
         Remove verified unused imports with safety checkpoint.
 
         Only removes findings with VERIFIED_TRUE status.
         Creates git commit before modifications for rollback.
-        All-or-nothing: reverts on any failure OR test failure.
+        Reverts everything on removal failure. On test failure, only the
+        files covered by failing test files are reverted (their findings
+        stay verified) and the failing test files rerun against the kept
+        removals; if they still fail, or every modified file is affected,
+        all revert.
 
         Args:
             scan_type: Type of scan (e.g., "clean")
             run_tests: Whether to run affected tests after removal (default True)
+            orchestrator: TaskOrchestrator to run test files in parallel (optional)
 
         Returns:
             Dict with removal summary:
@@ -741,6 +849,7 @@ class Scanner:
                 "files_modified": [{"file": str, "removals": [...]}],
                 "checkpoint_sha": str,
                 "test_results": {...} (if tests were run),
+                "reverted_files": [str] (reverted after their tests failed),
                 "error": str (if failed)
             }
         """
@@ -817,26 +926,57 @@ class Scanner:
                 if file_result["removals"]:
                     files_modified.append(file_result)
 
-            # Save updated findings
-            self._save_findings(scan_type, findings)
-
             # Run affected tests if requested
             test_results = None
+            reverted_files = []
             if run_tests and files_modified:
                 modified_paths = [f["file"] for f in files_modified]
-                test_results = self._run_affected_tests(modified_paths)
+                test_results = self._run_affected_tests(modified_paths, orchestrator)
 
                 if not test_results["success"]:
-                    # Tests failed - auto-revert (all-or-nothing)
-                    self._git_revert_checkpoint(checkpoint_sha)
-                    return {
-                        "success": False,
-                        "removed_count": 0,
-                        "files_modified": [],
-                        "checkpoint_sha": checkpoint_sha,
-                        "test_results": test_results,
-                        "error": f"Tests failed, auto-reverted. {test_results.get('error', '')}"
-                    }
+                    failed = set(test_results.get("failed_sources") or [])
+                    if not failed or failed >= set(modified_paths):
+                        # Every modified file is implicated - auto-revert all
+                        self._git_revert_checkpoint(checkpoint_sha)
+                        return {
+                            "success": False,
+                            "removed_count": 0,
+                            "files_modified": [],
+                            "checkpoint_sha": checkpoint_sha,
+                            "test_results": test_results,
+                            "reverted_files": modified_paths,
+                            "error": f"Tests failed, auto-reverted. {test_results.get('error', '')}"
+                        }
+
+                    # Revert only files whose tests failed; keep the rest
+                    reverted_files = [p for p in modified_paths if p in failed]
+                    self._git_revert_files(checkpoint_sha, reverted_files)
+
+                    # A kept removal may be what broke them (e.g. a re-export
+                    # another file imports): rerun the failing tests against
+                    # the kept removals, and revert everything if they still fail
+                    failed_test_files = test_results.get("failed_test_files") or []
+                    retest = self._run_test_files(failed_test_files, orchestrator)
+                    if not all(run["success"] for run in retest):
+                        self._git_revert_checkpoint(checkpoint_sha)
+                        return {
+                            "success": False,
+                            "removed_count": 0,
+                            "files_modified": [],
+                            "checkpoint_sha": checkpoint_sha,
+                            "test_results": test_results,
+                            "reverted_files": modified_paths,
+                            "error": "Tests still failed after reverting their files, auto-reverted all."
+                        }
+                    for file_path in reverted_files:
+                        for finding in by_file[file_path]:
+                            if finding.status == "resolved":
+                                finding.status = VERIFIED_TRUE
+                    files_modified = [f for f in files_modified if f["file"] not in failed]
+                    total_removed = sum(len(f["removals"]) for f in files_modified)
+
+            # Save updated findings
+            self._save_findings(scan_type, findings)
 
             return {
                 "success": True,
@@ -844,6 +984,7 @@ class Scanner:
                 "files_modified": files_modified,
                 "checkpoint_sha": checkpoint_sha,
                 "test_results": test_results,
+                "reverted_files": reverted_files,
                 "error": None
             }
 
@@ -937,6 +1078,29 @@ class Scanner:
         except Exception:
             return False
 
+    def _git_revert_files(self, checkpoint_sha: str, files: List[str]) -> bool:
+        """
+        Restore specific files to their checkpoint state.
+
+        Args:
+            checkpoint_sha: SHA of checkpoint commit
+            files: Files to restore
+
+        Returns:
+            True if restored successfully
+        """
+        import subprocess
+
+        try:
+            result = subprocess.run(
+                ["git", "checkout", checkpoint_sha, "--"] + files,
+                capture_output=True,
+                cwd=str(Path.cwd())
+            )
+            return result.returncode == 0
+        except Exception:
+            return False
+
     def _remove_import_from_file(
         self,
         file_path: str,
@@ -1315,6 +1479,41 @@ class Scanner:
     # Test Execution (Affected tests only)
     # =========================================================================
 
+    def _project_root(self) -> Path:
+        """Project directory (parent of .babel/)."""
+        if self.cache_path:
+            # cache_path is typically .babel/scan_cache.json
+            return self.cache_path.parent.parent
+        return Path.cwd()
+
+    def _test_file_index(self) -> Dict[str, List[str]]:
+        """Test files by the module stem they test, from one walk of tests/.
+
+        Naming conventions: test_<module>.py, <module>_test.py (any depth).
+        Built once per scanner.
+        """
+        if self._test_index is not None:
+            return self._test_index
+
+        index: Dict[str, List[str]] = {}
+        tests_dir = self._project_root() / "tests"
+        for dirpath, dirnames, filenames in os.walk(tests_dir):
+            dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d != "__pycache__")
+            for name in sorted(filenames):
+                if not name.endswith(".py"):
+                    continue
+                stem = name[:-3]
+                if stem.startswith("test_"):
+                    module = stem[len("test_"):]
+                elif stem.endswith("_test"):
+                    module = stem[:-len("_test")]
+                else:
+                    continue
+                index.setdefault(module, []).append(os.path.join(dirpath, name))
+
+        self._test_index = index
+        return index
+
     def _find_test_files(self, source_files: List[str]) -> List[str]:
         """
         Find test files related to source files.
@@ -1328,35 +1527,30 @@ class Scanner:
         Returns:
             List of test file paths
         """
-        test_files = []
-        tests_dir = Path.cwd() / "tests"
+        return list(self._map_test_files(source_files))
 
+    def _map_test_files(self, source_files: List[str]) -> Dict[str, List[str]]:
+        """Test file -> modified source files it covers (first-seen order)."""
+        index = self._test_file_index()
+        covers: Dict[str, List[str]] = {}
         for source_file in source_files:
-            source_path = Path(source_file)
-            module_name = source_path.stem  # e.g., "scanner" from "scanner.py"
-
-            # Look for test files matching this module
-            patterns = [
-                f"test_{module_name}.py",
-                f"{module_name}_test.py",
-                f"**/test_{module_name}.py",
-                f"**/{module_name}_test.py",
-            ]
+            module_name = Path(source_file).stem  # e.g., "scanner" from "scanner.py"
+            for test_file in index.get(module_name, []):
+                covers.setdefault(test_file, []).append(source_file)
+        return covers
 
-            if tests_dir.exists():
-                for pattern in patterns:
-                    for test_file in tests_dir.glob(pattern):
-                        if str(test_file) not in test_files:
-                            test_files.append(str(test_file))
-
-        return test_files
-
-    def _run_affected_tests(self, files_modified: List[str]) -> Dict[str, Any]:
+    def _run_affected_tests(self, files_modified: List[str], orchestrator=None) -> Dict[str, Any]:
         """
         Run tests for affected files.
 
+        Each affected test file runs in its own pytest process; with an
+        orchestrator the processes run concurrently on its IO pool
+        (bounded by its worker count). Results map back to the source
+        files each test file covers.
+
         Args:
             files_modified: List of source files that were modified
+            orchestrator: TaskOrchestrator to run test files in parallel (optional)
 
         Returns:
             Dict with test results:
@@ -1366,13 +1560,14 @@ class Scanner:
                 "tests_passed": int,
                 "tests_failed": int,
                 "test_files": List[str],
+                "failed_test_files": List[str],
+                "failed_sources": List[str] (sources covered by a failing test file),
                 "output": str,
                 "error": str (if failed)
             }
         """
-        import subprocess
-
-        test_files = self._find_test_files(files_modified)
+        covers = self._map_test_files(files_modified)
+        test_files = list(covers)
 
         if not test_files:
             # No matching test files - consider success (nothing to test)
@@ -1382,75 +1577,80 @@ class Scanner:
                 "tests_passed": 0,
                 "tests_failed": 0,
                 "test_files": [],
+                "failed_test_files": [],
+                "failed_sources": [],
                 "output": "No matching test files found",
                 "error": None
             }
 
+        runs = self._run_test_files(test_files, orchestrator)
+
+        failed_test_files = [tf for tf, run in zip(test_files, runs) if not run["success"]]
+        failed_sources = []
+        for test_file in failed_test_files:
+            for source in covers[test_file]:
+                if source not in failed_sources:
+                    failed_sources.append(source)
+
+        output = "\n".join(run["output"] for run in runs if run["output"])
+        errors = [f"{Path(tf).name}: {run['error']}" for tf, run in zip(test_files, runs) if run["error"]]
+
+        return {
+            "success": not failed_test_files,
+            "tests_run": sum(run["tests_run"] for run in runs),
+            "tests_passed": sum(run["tests_passed"] for run in runs),
+            "tests_failed": sum(run["tests_failed"] for run in runs),
+            "test_files": test_files,
+            "failed_test_files": failed_test_files,
+            "failed_sources": failed_sources,
+            "output": output[-2000:] if len(output) > 2000 else output,  # Truncate
+            "error": "; ".join(errors) if errors else None
+        }
+
+    def _run_test_files(self, test_files: List[str], orchestrator=None) -> List[Dict[str, Any]]:
+        """Run test files (concurrently on the orchestrator's IO pool if given)."""
+        if orchestrator and orchestrator.enabled and len(test_files) > 1:
+            from ..orchestrator import TaskType
+            return orchestrator.map_parallel(
+                self._run_test_file, test_files, task_type=TaskType.IO_BOUND
+            )
+        return [self._run_test_file(test_file) for test_file in test_files]
+
+    def _run_test_file(self, test_file: str) -> Dict[str, Any]:
+        """Run pytest on one test file and parse its pass/fail counts."""
+        import subprocess
+
         try:
-            # Run pytest on affected test files
-            cmd = ["python3", "-m", "pytest"] + test_files + ["-v", "--tb=short"]
+            cmd = ["python3", "-m", "pytest", test_file, "-v", "--tb=short"]
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
-                cwd=str(Path.cwd()),
+                cwd=str(self._project_root()),
                 timeout=120  # 2 minute timeout
             )
-
-            # Parse pytest output for counts
-            output = result.stdout + result.stderr
-            tests_run = 0
-            tests_passed = 0
-            tests_failed = 0
-
-            # Look for pytest summary line: "X passed, Y failed"
-            import re
-            summary_match = re.search(
-                r'(\d+)\s+passed',
-                output
-            )
-            if summary_match:
-                tests_passed = int(summary_match.group(1))
-                tests_run += tests_passed
-
-            failed_match = re.search(
-                r'(\d+)\s+failed',
-                output
-            )
-            if failed_match:
-                tests_failed = int(failed_match.group(1))
-                tests_run += tests_failed
-
-            return {
-                "success": result.returncode == 0,
-                "tests_run": tests_run,
-                "tests_passed": tests_passed,
-                "tests_failed": tests_failed,
-                "test_files": test_files,
-                "output": output[-2000:] if len(output) > 2000 else output,  # Truncate
-                "error": None if result.returncode == 0 else f"Tests failed (exit code {result.returncode})"
-            }
-
         except subprocess.TimeoutExpired:
-            return {
-                "success": False,
-                "tests_run": 0,
-                "tests_passed": 0,
-                "tests_failed": 0,
-                "test_files": test_files,
-                "output": "",
-                "error": "Test execution timed out (120s)"
-            }
+            return {"success": False, "tests_run": 0, "tests_passed": 0, "tests_failed": 0,
+                    "output": "", "error": "Test execution timed out (120s)"}
         except Exception as e:
-            return {
-                "success": False,
-                "tests_run": 0,
-                "tests_passed": 0,
-                "tests_failed": 0,
-                "test_files": test_files,
-                "output": "",
-                "error": f"Test execution error: {str(e)}"
-            }
+            return {"success": False, "tests_run": 0, "tests_passed": 0, "tests_failed": 0,
+                    "output": "", "error": f"Test execution error: {str(e)}"}
+
+        # Look for pytest summary line: "X passed, Y failed"
+        output = result.stdout + result.stderr
+        passed_match = re.search(r'(\d+)\s+passed', output)
+        failed_match = re.search(r'(\d+)\s+failed', output)
+        tests_passed = int(passed_match.group(1)) if passed_match else 0
+        tests_failed = int(failed_match.group(1)) if failed_match else 0
+
+        return {
+            "success": result.returncode == 0,
+            "tests_run": tests_passed + tests_failed,
+            "tests_passed": tests_passed,
+            "tests_failed": tests_failed,
+            "output": output[-2000:] if len(output) > 2000 else output,
+            "error": None if result.returncode == 0 else f"Tests failed (exit code {result.returncode})"
+        }
 
     # =========================================================================
     # Auto-Capture (One capture per file for granularity)
@@ -1788,25 +1988,43 @@ class Scanner:
         else:
             rules = ["F401"]  # Unused imports only
 
-        # Build ruff command (no --fix, scan only informs)
-        cmd = [
-            ruff_path, "check",
-            "--output-format", "json",
-            "--select", ",".join(rules),
-            "."  # Current directory
-        ]
+        # Incremental: only files changed since the last scan go to ruff
+        root = Path.cwd()
+        cache_name = "ruff_files_deep.json" if deep else "ruff_files.json"
+        ruff_cache = RuffFileCache(
+            self._get_scan_storage_path("clean") / cache_name,
+            root,
+            ruff_cache_key(root, ruff_path, rules)
+        )
+        changed = ruff_cache.plan()
+        if changed is None:
+            targets = [["."]]  # No usable cache: whole tree
+        else:
+            targets = [
+                [str(root / rel) for rel in changed[i:i + RUFF_BATCH_SIZE]]
+                for i in range(0, len(changed), RUFF_BATCH_SIZE)
+            ]
 
-        # Run ruff
+        # Run ruff (no --fix, scan only informs)
+        outputs = []
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(Path.cwd())
-            )
-            # ruff exits with 1 if findings exist, 0 if clean
-            output = result.stdout if result.stdout else result.stderr
+            for paths in targets:
+                cmd = [
+                    ruff_path, "check",
+                    "--output-format", "json",
+                    "--select", ",".join(rules),
+                ]
+                if changed is not None:
+                    cmd.append("--force-exclude")  # Apply ruff excludes to explicit paths
+                result = subprocess.run(
+                    cmd + paths,
+                    capture_output=True,
+                    text=True,
+                    timeout=60,
+                    cwd=str(root)
+                )
+                # ruff exits with 1 if findings exist, 0 if clean
+                outputs.append(result.stdout if result.stdout else result.stderr)
         except subprocess.TimeoutExpired:
             return ScanResult(
                 scan_id=f"scan_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}",
@@ -1851,8 +2069,13 @@ class Scanner:
         findings = []
         excluded_count = 0
         try:
-            if output.strip():
-                ruff_findings = json.loads(output)
+            ruff_findings = []
+            for output in outputs:
+                if output.strip():
+                    ruff_findings.extend(json.loads(output))
+            ruff_findings = ruff_cache.merge(ruff_findings, changed)
+            ruff_cache.save()
+            if ruff_findings:
                 for rf in ruff_findings:
                     # Map ruff finding to ScanFinding
                     code = rf.get("code", "")
@@ -1949,6 +2172,8 @@ class Scanner:
             summary = f"Found {len(findings)} cleanup candidate(s)" + (" (deep scan)" if deep else "")
             if excluded_count > 0:
                 summary += f" ({excluded_count} excluded)"
+        if changed is not None:
+            summary += f" [{len(changed)} changed file(s) rechecked]"
 
         # Persist findings for management (validate/invalidate/resolve workflow)
         self._save_findings("clean", findings)
@@ -2113,7 +2338,7 @@ Return JSON:
     # =========================================================================
 
     def _get_scan_storage_path(self, scan_type: str) -> Path:
-        """Get storage directory for scan type findings.
+        """Get storage directory for per-type scan state (e.g. ruff file cache).
 
         Returns: .babel/scan/<type>/
         """
@@ -2135,36 +2360,20 @@ Return JSON:
         content = f"{file}:{line}:{code}"
         return hashlib.sha256(content.encode()).hexdigest()[:12]
 
+    def _scan_store(self) -> ScanStore:
+        """Scan results/findings/exclusions store (.babel/scan/scan.db), opened lazily."""
+        if self._store is None:
+            babel_root = self.cache_path.parent if self.cache_path else Path.cwd() / ".babel"
+            self._store = ScanStore(babel_root / "scan" / "scan.db", legacy_cache=self.cache_path)
+        return self._store
+
     def _load_findings(self, scan_type: str) -> List[ScanFinding]:
         """Load persisted findings for scan type."""
-        storage_path = self._get_scan_storage_path(scan_type)
-        findings_file = storage_path / "findings.json"
-
-        if not findings_file.exists():
-            return []
-
-        try:
-            data = json.loads(findings_file.read_text())
-            return [ScanFinding.from_dict(f) for f in data.get("findings", [])]
-        except (json.JSONDecodeError, IOError):
-            return []
+        return [ScanFinding.from_dict(f) for f in self._scan_store().get_findings(scan_type)]
 
     def _save_findings(self, scan_type: str, findings: List[ScanFinding]) -> None:
-        """Persist findings for scan type."""
-        storage_path = self._get_scan_storage_path(scan_type)
-        storage_path.mkdir(parents=True, exist_ok=True)
-        findings_file = storage_path / "findings.json"
-
-        data = {
-            "scan_type": scan_type,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "findings": [f.to_dict() for f in findings]
-        }
-
-        try:
-            findings_file.write_text(json.dumps(data, indent=2))
-        except IOError:
-            pass  # Graceful failure
+        """Persist findings for scan type (replaces the previous set)."""
+        self._scan_store().replace_findings(scan_type, [f.to_dict() for f in findings])
 
     def _load_exclusions(self, scan_type: str) -> Dict[str, Dict[str, Any]]:
         """Load exclusions for scan type.
@@ -2172,34 +2381,11 @@ Return JSON:
         Returns: Dict mapping finding_id to exclusion info:
             {finding_id: {"reason": "...", "excluded_at": "...", "file": "...", ...}}
         """
-        storage_path = self._get_scan_storage_path(scan_type)
-        exclusions_file = storage_path / "exclusions.json"
-
-        if not exclusions_file.exists():
-            return {}
-
-        try:
-            data = json.loads(exclusions_file.read_text())
-            return data.get("exclusions", {})
-        except (json.JSONDecodeError, IOError):
-            return {}
+        return self._scan_store().get_exclusions(scan_type)
 
     def _save_exclusions(self, scan_type: str, exclusions: Dict[str, Dict[str, Any]]) -> None:
-        """Persist exclusions for scan type."""
-        storage_path = self._get_scan_storage_path(scan_type)
-        storage_path.mkdir(parents=True, exist_ok=True)
-        exclusions_file = storage_path / "exclusions.json"
-
-        data = {
-            "scan_type": scan_type,
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-            "exclusions": exclusions
-        }
-
-        try:
-            exclusions_file.write_text(json.dumps(data, indent=2))
-        except IOError:
-            pass  # Graceful failure
+        """Persist exclusions for scan type (replaces the previous set)."""
+        self._scan_store().replace_exclusions(scan_type, exclusions)
 
     def _is_excluded(self, finding_id: str, exclusions: Dict[str, Dict[str, Any]]) -> bool:
         """Check if a finding is excluded (supports prefix matching)."""
@@ -2212,48 +2398,48 @@ Return JSON:
                 return True
         return False
 
-    def _find_containing_symbol(self, file_path: str, line: int) -> Optional[str]:
+    def _build_symbol_index(self) -> IntervalIndex:
+        """Index code symbol line ranges by normalized file path.
+
+        Built once per scan from the graph (only the four fields needed,
+        no full content decode), so each finding lookup is O(log n).
+        """
+        index = IntervalIndex()
+        for file_path, line_start, line_end, qualified_name in self.graph.get_symbol_ranges():
+            index.add(_path_key(file_path), line_start, line_end, qualified_name)
+        return index
+
+    def _find_containing_symbol(
+        self,
+        file_path: str,
+        line: int,
+        index: Optional[IntervalIndex] = None
+    ) -> Optional[str]:
         """Find the symbol containing a specific line.
 
-        Queries graph for code_symbol nodes and finds the one
-        that contains the given line (line_start <= line <= line_end).
+        Finds the smallest code_symbol whose range contains the line
+        (line_start <= line <= line_end). Paths are compared as normalized
+        components; a finding path (e.g. absolute, from ruff) matches the
+        longest indexed path it ends with.
 
         Args:
-            file_path: Relative file path
+            file_path: File path (relative or absolute)
             line: Line number (1-indexed)
+            index: Symbol index from _build_symbol_index (built if omitted)
 
         Returns:
             Symbol qualified name or None if not found
         """
-        code_symbols = self.graph.get_nodes_by_type("code_symbol")
-
-        best_match = None
-        best_range = float('inf')
-
-        for node in code_symbols:
-            content = node.content
-            sym_file = content.get('file_path', '')
-
-            # Normalize paths for comparison
-            if not sym_file or not file_path:
-                continue
-
-            # Check if file matches (handle relative paths)
-            if not (sym_file == file_path or file_path.endswith(sym_file) or sym_file.endswith(file_path)):
-                continue
-
-            line_start = content.get('line_start', 0)
-            line_end = content.get('line_end', 0)
-
-            # Check if line is within symbol range
-            if line_start <= line <= line_end:
-                # Prefer smallest containing symbol (most specific)
-                range_size = line_end - line_start
-                if range_size < best_range:
-                    best_match = content.get('qualified_name')
-                    best_range = range_size
+        if not file_path:
+            return None
+        if index is None:
+            index = self._build_symbol_index()
 
-        return best_match
+        key = _path_key(file_path)
+        for i in range(len(key)):
+            if key[i:] in index:
+                return index.innermost(key[i:], line)
+        return None
 
     def _find_linked_decisions(self, symbol_name: str) -> List[str]:
         """Find decisions linked to a symbol.
@@ -2283,12 +2469,14 @@ Return JSON:
 
         This provides context for AI review of findings.
         """
-        for finding in findings:
-            if not finding.file or not finding.line:
-                continue
+        located = [f for f in findings if f.file and f.line]
+        if not located:
+            return
+        index = self._build_symbol_index()
 
+        for finding in located:
             # Find containing symbol
-            containing = self._find_containing_symbol(finding.file, finding.line)
+            containing = self._find_containing_symbol(finding.file, finding.line, index)
             if containing:
                 finding.containing_symbol = containing
 
@@ -2303,38 +2491,18 @@ Return JSON:
 
     def _load_cache(self, scan_type: str, context_hash: str) -> Optional[ScanResult]:
         """Load cached scan result if valid."""
-        if not self.cache_path or not self.cache_path.exists():
+        if not self.cache_path:
             return None
-        
-        try:
-            data = json.loads(self.cache_path.read_text())
-            cached = data.get(scan_type)
-            
-            if cached and cached.get("context_hash") == context_hash:
-                result = ScanResult.from_dict(cached)
-                return result
-        except (json.JSONDecodeError, KeyError):
-            pass
-        
-        return None
-    
+
+        cached = self._scan_store().get_result(scan_type, context_hash)
+        return ScanResult.from_dict(cached) if cached else None
+
     def _save_cache(self, result: ScanResult):
         """Save scan result to cache."""
         if not self.cache_path:
             return
-        
-        try:
-            if self.cache_path.exists():
-                data = json.loads(self.cache_path.read_text())
-            else:
-                data = {}
-            
-            data[result.scan_type] = result.to_dict()
-            
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            self.cache_path.write_text(json.dumps(data, indent=2))
-        except (json.JSONDecodeError, IOError):
-            pass
+
+        self._scan_store().put_result(result.scan_type, result.context_hash, result.to_dict())
 
 
 # =============================================================================
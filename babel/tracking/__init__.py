@@ -7,15 +7,26 @@ Contains tracking systems for:
 - Coherence: Alignment checking (P9)
 - Ambiguity: Uncertainty detection (P10)
 - Principles: Framework alignment checking (P1-P11)
+- Proposals: Pending-proposal index for review (HC2)
+- Fold: Incremental, snapshot-backed tracker state
+- Summary: Persisted, watermark-checked status materialization
 """
 
+from .fold import FoldTracker
+from .summary import StatusSection, StatusSummary
+
 from .validation import ValidationStatus, DecisionValidation, ValidationTracker, format_validation_status, format_validation_summary
 from .tensions import TensionTracker, Challenge, format_challenge, format_tensions_summary
 from .coherence import CoherenceChecker, CoherenceResult, format_coherence_status
 from .ambiguity import OpenQuestion, QuestionTracker, detect_uncertainty, format_question, format_questions_summary
 from .principles import PrincipleStatus, PrincipleCheck, PrincipleResult, PrincipleChecker, format_principles_summary
+from .proposals import ProposalRecord, ProposalTracker
 
 __all__ = [
+    # Fold
+    "FoldTracker",
+    # Summary
+    "StatusSummary", "StatusSection",
     # Validation
     "ValidationStatus", "DecisionValidation", "ValidationTracker",
     "format_validation_status", "format_validation_summary",
@@ -27,4 +38,6 @@ __all__ = [
     "OpenQuestion", "QuestionTracker", "detect_uncertainty", "format_question", "format_questions_summary",
     # Principles (P1-P11)
     "PrincipleStatus", "PrincipleCheck", "PrincipleResult", "PrincipleChecker", "format_principles_summary",
+    # Proposals (HC2)
+    "ProposalRecord", "ProposalTracker",
 ]
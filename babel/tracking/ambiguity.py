@@ -20,10 +20,11 @@ from dataclasses import dataclass
 from typing import Optional, List, Dict, Any
 
 from ..core.events import (
-    DualEventStore, Event, EventType,
+    Event, EventType,
     raise_question, resolve_question
 )
 from ..core.scope import EventScope
+from .fold import FoldTracker
 from ..presentation.formatters import generate_summary, format_timestamp
 from ..presentation.symbols import get_symbols
 
@@ -122,51 +123,41 @@ class OpenQuestion:
 # Question Tracker
 # =============================================================================
 
-class QuestionTracker:
+class QuestionTracker(FoldTracker):
     """
     Track open questions (P10 compliant).
     
     P10: Holding ambiguity is epistemic maturity, not weakness.
     Open questions are first-class artifacts, not failures.
+
+    State is folded incrementally (see FoldTracker).
     """
-    
-    def __init__(self, events: DualEventStore):
-        self.events = events
-        self._cache: Optional[Dict[str, OpenQuestion]] = None
-    
+
+    EVENT_TYPES = (EventType.QUESTION_RAISED, EventType.QUESTION_RESOLVED)
+    ITEM_CLASS = OpenQuestion
+    SNAPSHOT_NAME = "questions"
+
     def _load_questions(self) -> Dict[str, OpenQuestion]:
-        """Load all questions from events."""
-        if self._cache is not None:
-            return self._cache
-        
-        questions: Dict[str, OpenQuestion] = {}
-        
-        # Load question events
-        question_events = self.events.read_by_type(EventType.QUESTION_RAISED)
-        for event in question_events:
-            question = OpenQuestion.from_event(event)
-            questions[question.id] = question
-        
-        # Load resolution events
-        resolution_events = self.events.read_by_type(EventType.QUESTION_RESOLVED)
-        for event in resolution_events:
-            question_id = event.data.get("question_id", "")
-            if question_id in questions:
-                questions[question_id].status = "resolved"
-                questions[question_id].resolution = {
-                    "id": event.id,
-                    "resolution": event.data.get("resolution", ""),
-                    "outcome": event.data.get("outcome", "answered"),
-                    "author": event.data.get("author", "unknown"),
-                    "timestamp": event.timestamp
-                }
-        
-        self._cache = questions
-        return questions
-    
-    def invalidate_cache(self):
-        """Invalidate cache after changes."""
-        self._cache = None
+        """Load all questions (snapshot + events since its watermark)."""
+        return self._load_state()
+
+    def _apply(self, questions: Dict[str, OpenQuestion], event: Event):
+        """Fold one question or resolution event."""
+        if event.type == EventType.QUESTION_RAISED:
+            if event.id not in questions:
+                questions[event.id] = OpenQuestion.from_event(event)
+            return
+
+        question = questions.get(event.data.get("question_id", ""))
+        if question is not None:
+            question.status = "resolved"
+            question.resolution = {
+                "id": event.id,
+                "resolution": event.data.get("resolution", ""),
+                "outcome": event.data.get("outcome", "answered"),
+                "author": event.data.get("author", "unknown"),
+                "timestamp": event.timestamp
+            }
     
     # =========================================================================
     # Question Operations
@@ -193,7 +184,6 @@ class QuestionTracker:
         
         # Questions are shared -- team needs visibility
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return OpenQuestion.from_event(event)
     
@@ -230,7 +220,6 @@ class QuestionTracker:
         )
         
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return True
     
@@ -11,18 +11,24 @@ Token efficiency via horizon.py:
 - Event horizon for old event compression
 """
 
+import asyncio
 import hashlib
 import json
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any, Tuple, TYPE_CHECKING
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Any, Set, Tuple, TYPE_CHECKING
+from dataclasses import dataclass, field, asdict
+
+import xxhash
 
 from ..core.events import EventStore, Event, EventType, record_coherence_check, detect_tension
 from ..core.graph import GraphStore, Node
 from ..presentation.formatters import format_artifact, format_status_line, generate_summary
 from ..presentation.symbols import get_symbols, SymbolSet
 from ..config import Config
-from ..core.horizon import DigestBuilder, ArtifactDigest, CoherenceContext, _extract_keywords
+from ..core.horizon import DigestBuilder, ArtifactDigest, _extract_keywords
+from ..core.minhash import (
+    MinHashLSH, minhash_signature, tokens_key, pack_signature, unpack_signature, jaccard
+)
 
 if TYPE_CHECKING:
     from ..services.providers import LLMProvider
@@ -168,6 +174,46 @@ class EntityStatus:
         )
 
 
+@dataclass
+class ArtifactState:
+    """
+    Persisted coherence evaluation of one artifact (graph.db).
+
+    Holds what only changes when the artifact, its purpose links, the
+    purpose or the constraint set change. Statuses are derived from it
+    on every check, since duplicates and the grace period vary.
+    """
+    id: str
+    node_type: str
+    summary: str
+    keywords: List[str]
+    created_at: str = ""  # Source event timestamp (grace period)
+    linked: bool = False  # Supported by a purpose (Tier 1)
+    conflicts: List[str] = field(default_factory=list)  # Conflicting constraint IDs (Tier 2)
+    severity: Optional[str] = None  # Graded whenever conflicts change
+    alignment: float = 0.5  # Keyword overlap with purpose (Tier 3)
+    reported: List[str] = field(default_factory=list)  # Conflicts already emitted as TENSION_DETECTED
+
+    def to_digest(self) -> ArtifactDigest:
+        return ArtifactDigest(
+            id=self.id,
+            artifact_type=self.node_type,
+            summary=self.summary,
+            keywords=self.keywords
+        )
+
+    @classmethod
+    def from_node(cls, node: Node, created_at: str = "") -> 'ArtifactState':
+        digest = ArtifactDigest.from_node(node)
+        return cls(
+            id=node.id,
+            node_type=node.type,
+            summary=digest.summary,
+            keywords=digest.keywords,
+            created_at=created_at
+        )
+
+
 @dataclass
 class ResolutionSuggestion:
     """
@@ -300,6 +346,35 @@ class CoherenceResult:
         return [e for e in self.entities if e.status in ("duplicate", "tension", "drift", "low_alignment")]
 
 
+# Graph meta key of the persisted Exclusions index
+EXCLUSIONS_META_KEY = "coherence_exclusions"
+
+
+@dataclass
+class Exclusions:
+    """
+    IDs kept out of coherence checks, folded from events.
+
+    Deprecated artifacts are skipped; detected tension records are
+    findings about artifacts, not artifacts, and their pairs are not
+    re-emitted.
+    """
+    deprecated: Set[str] = field(default_factory=set)
+    tensions: Dict[str, List[str]] = field(default_factory=dict)  # Tension node ID -> artifact IDs
+
+    def apply(self, event: Event):
+        """Fold one event (idempotent)."""
+        if event.type == EventType.ARTIFACT_DEPRECATED:
+            artifact_id = event.data.get("artifact_id", "")
+            if artifact_id:
+                self.deprecated.add(artifact_id)
+        elif event.type == EventType.TENSION_DETECTED:
+            artifact_a = event.data.get("artifact_a_id")
+            artifact_b = event.data.get("artifact_b_id")
+            if artifact_a and artifact_b:
+                self.tensions[f"tension_{event.id}"] = [artifact_a, artifact_b]
+
+
 class CoherenceChecker:
     """
     Checks alignment between purpose and artifacts.
@@ -308,6 +383,7 @@ class CoherenceChecker:
     - Checkpoint caching (reuse if nothing changed)
     - Incremental checks (only new artifacts)
     - Summary-only comparison (not full content)
+    - Persisted per-artifact state (only changed artifacts re-evaluated)
     """
     
     # Keywords suggesting different artifact purposes
@@ -351,23 +427,31 @@ class CoherenceChecker:
         if not purposes:
             return self._empty_result(trigger, triggered_by, "No purpose defined")
         
+        # Deprecated and tension IDs, caught up once for the whole run
+        exclusions = self._load_exclusions()
+
         # Try to use cached checkpoint
         if not force_full:
-            cached = self._try_cache()
+            cached = self._try_cache(exclusions)
             if cached:
                 return cached
         
         # Get last checkpoint for incremental check
         last_checkpoint = self._get_last_checkpoint()
         since = last_checkpoint.timestamp if last_checkpoint else None
-        
-        # Get artifacts to check
+
+        # Re-evaluate only what changed; everything else comes from graph.db
+        states, duplicates, conflicts_changed = self._refresh_state(purposes, exclusions)
+
+        # Incremental scope: new artifacts plus those whose conflicts moved
         if since and not force_full:
-            artifacts = self._get_artifacts_since(since)
-        else:
-            artifacts = self._get_all_artifacts()
-        
-        if not artifacts:
+            since_ids = self._get_artifact_ids_since(since)
+            states = [
+                s for s in states
+                if s.id in since_ids or s.id in conflicts_changed
+            ]
+
+        if not states:
             # No artifacts to check - project is coherent by default
             return self._create_result(
                 status="coherent",
@@ -382,8 +466,8 @@ class CoherenceChecker:
                 triggered_by=triggered_by
             )
         
-        # Run comparison
-        entities = self._check_artifacts(purposes, artifacts)
+        # Merge cached evaluations into entity statuses
+        entities = self._merge_entities(states, duplicates, exclusions)
         
         # Determine overall status
         status = self._determine_status(entities)
@@ -393,7 +477,7 @@ class CoherenceChecker:
             status=status,
             scope=CoherenceScope(
                 purpose_ids=[p.id for p in purposes],
-                artifact_ids=[a.id for a in artifacts],
+                artifact_ids=[s.id for s in states],
                 since=since
             ),
             signals=self._generate_signals(entities),
@@ -413,7 +497,7 @@ class CoherenceChecker:
             return None
         return self._checkpoint_to_result(checkpoint)
     
-    def _try_cache(self) -> Optional[CoherenceResult]:
+    def _try_cache(self, exclusions: Exclusions) -> Optional[CoherenceResult]:
         """Try to return cached result if still valid."""
         last = self._get_last_checkpoint()
         if not last:
@@ -421,7 +505,7 @@ class CoherenceChecker:
         
         # Check if any new artifacts since checkpoint
         since = last.timestamp  # Event timestamp, not data
-        new_artifacts = self._get_artifacts_since(since)
+        new_artifacts = self._get_artifacts_since(since, exclusions.deprecated)
         
         if not new_artifacts:
             # Cache is valid
@@ -436,9 +520,8 @@ class CoherenceChecker:
         checkpoints = self.events.read_by_type(EventType.COHERENCE_CHECKED)
         return checkpoints[-1] if checkpoints else None
     
-    def _get_artifacts_since(self, since: str) -> List[Node]:
+    def _get_artifacts_since(self, since: str, deprecated_ids: Set[str]) -> List[Node]:
         """Get artifacts created after timestamp, excluding deprecated ones."""
-        deprecated_ids = self._get_deprecated_ids()
         artifacts = []
 
         # Use type-indexed cache (O(1) lookup) instead of read_all() + filter
@@ -450,206 +533,393 @@ class CoherenceChecker:
                 artifacts.append(node)
 
         return artifacts
+
+    def _get_artifact_ids_since(self, since: str) -> set:
+        """IDs of artifacts confirmed after timestamp (no node loads)."""
+        return {
+            f"{event.data['artifact_type']}_{event.id}"
+            for event in self.events.read_by_type(EventType.ARTIFACT_CONFIRMED)
+            if event.timestamp > since
+        }
     
-    def _get_deprecated_ids(self) -> set:
+    def _load_exclusions(self) -> Exclusions:
         """
-        Get all deprecated artifact IDs.
+        Deprecated artifact and detected tension IDs.
 
-        Reads ARTIFACT_DEPRECATED events to build set of deprecated IDs.
-        Used to filter deprecated artifacts from coherence checks.
+        Persisted in graph meta against the event watermark, so a run
+        folds only the events appended since. Stores without a watermark
+        (single-file EventStore), a missing index or rewritten history
+        rebuild it from the two event types.
         """
-        deprecated = set()
-        events = self.events.read_by_type(EventType.ARTIFACT_DEPRECATED)
-        for event in events:
-            artifact_id = event.data.get("artifact_id", "")
-            if artifact_id:
-                deprecated.add(artifact_id)
-        return deprecated
-
-    def _get_all_artifacts(self) -> List[Node]:
-        """Get all artifacts except purposes and deprecated ones."""
-        deprecated_ids = self._get_deprecated_ids()
-        artifacts = []
-        for node_type in ['decision', 'constraint', 'principle', 'tension']:
-            for node in self.graph.get_nodes_by_type(node_type):
-                if node.id not in deprecated_ids:
-                    artifacts.append(node)
-        return artifacts
-    
-    def _check_artifacts(self, purposes: List[Node], artifacts: List[Node]) -> List[EntityStatus]:
+        watermark = self.events.watermark() if hasattr(self.events, "watermark") else None
+        stored = self.graph.get_meta(EXCLUSIONS_META_KEY) if watermark is not None else None
+
+        exclusions = None
+        if stored:
+            try:
+                new_events = (
+                    [] if stored["watermark"] == watermark
+                    else self.events.read_since(stored["watermark"], until=watermark)
+                )
+                if new_events is not None:
+                    exclusions = Exclusions(set(stored["deprecated"]), dict(stored["tensions"]))
+                    for event in new_events:
+                        exclusions.apply(event)
+            except (KeyError, TypeError):
+                exclusions = None  # Written by another version - rebuild
+
+        if exclusions is None:
+            exclusions = Exclusions()
+            for event_type in (EventType.ARTIFACT_DEPRECATED, EventType.TENSION_DETECTED):
+                for event in self.events.read_by_type(event_type):
+                    exclusions.apply(event)
+
+        if watermark is not None and (not stored or stored.get("watermark") != watermark):
+            self.graph.set_meta(EXCLUSIONS_META_KEY, {
+                "watermark": watermark,
+                "deprecated": sorted(exclusions.deprecated),
+                "tensions": exclusions.tensions,
+            })
+        return exclusions
+
+    def _refresh_state(self, purposes: List[Node],
+                       exclusions: Exclusions) -> Tuple[List[ArtifactState], Dict[str, str], set]:
         """
-        Check artifacts against purposes using four-tier approach.
+        Bring persisted per-artifact coherence state up to date.
 
-        Tier 0: Duplicate detection - same/similar summaries across artifacts
-        Tier 1: Graph edges (authoritative) - if linked to purpose → coherent
-        Tier 2: Keyword conflicts - check for constraint violations
-        Tier 3: Keyword alignment (informational) - low overlap → low_alignment
+        Only artifacts that are new, relinked, or affected by added or
+        deprecated constraints (or a changed purpose) are re-evaluated;
+        the rest is reused from graph.db. Duplicates are recomputed only
+        when the set of artifacts changed.
 
-        Each issue includes resolution_hint pointing to existing mechanisms.
+        Returns:
+            (states constraints first, duplicate_id -> original_id,
+             IDs whose conflict set changed)
         """
-        entities = []
-        purpose_ids = {p.id for p in purposes}
+        # Detected tension records are findings about artifacts, not artifacts
+        excluded = exclusions.deprecated | exclusions.tensions.keys()
+
+        # Constraints first: they matter most for conflict detection
+        order: List[Tuple[str, str]] = []
+        for node_type in ('constraint', 'decision', 'principle', 'tension'):
+            order.extend(
+                (node_id, node_type)
+                for node_id in self.graph.get_node_ids_by_type(node_type)
+                if node_id not in excluded
+            )
+
+        try:
+            stored = {
+                node_id: ArtifactState(**data)
+                for node_id, data in self.graph.get_coherence_states().items()
+            }
+        except TypeError:
+            stored = {}  # Written by another version - rebuild from scratch
+        current_ids = {node_id for node_id, _ in order}
+        removed = [node_id for node_id in stored if node_id not in current_ids]
+        old_constraints = {i for i, st in stored.items() if st.node_type == 'constraint'}
+
+        # Digest only artifacts not seen before (one query per type)
+        new_ids = current_ids - stored.keys()
+        for node_type in {t for node_id, t in order if node_id in new_ids}:
+            for node in self.graph.get_nodes_by_type(node_type):
+                if node.id in new_ids:
+                    stored[node.id] = ArtifactState.from_node(node, self._artifact_timestamp(node))
+
+        states = {node_id: stored[node_id] for node_id, _ in order}
+        constraint_keywords = {
+            node_id: state.keywords
+            for node_id, state in states.items()
+            if state.node_type == 'constraint'
+        }
+        constraint_summaries = {node_id: states[node_id].summary for node_id in constraint_keywords}
+        added = {i: kw for i, kw in constraint_keywords.items() if i not in old_constraints}
+        dropped = old_constraints - constraint_keywords.keys()
 
-        # Build efficient context using digests
-        context = self.digest_builder.build_coherence_context(purposes, artifacts)
+        # Inverted indexes: each artifact inspects only relevant constraints
+        all_index = self.digest_builder.conflict_index(constraint_keywords) if new_ids else None
+        added_index = self.digest_builder.conflict_index(added) if added else None
 
         # Build purpose keywords for alignment checking
         purpose_keywords = set()
         for p in purposes:
             text = p.content.get('purpose', p.content.get('summary', ''))
             purpose_keywords.update(_extract_keywords(text))
+        purpose_key = sorted(purpose_keywords)
+        purpose_changed = self.graph.get_meta("coherence_purpose_keywords") != purpose_key
+
+        linked_ids = self.graph.get_edge_targets([p.id for p in purposes], "supports")
+
+        updates = []
+        conflicts_changed = set()
+        for state in states.values():
+            fresh = state.id in new_ids
+            dirty = fresh
 
-        # Build artifact lookup for graph checks
-        artifact_lookup = {a.id: a for a in artifacts}
+            # Conflicts: full check once, then only against constraint changes
+            if fresh:
+                conflicts = self.digest_builder.check_conflicts_fast(
+                    state.to_digest(), all_index
+                )
+            else:
+                conflicts = [c for c in state.conflicts if c not in dropped]
+                if added_index:
+                    conflicts += self.digest_builder.check_conflicts_fast(
+                        state.to_digest(), added_index
+                    )
+            if conflicts != state.conflicts:
+                conflicts_changed.add(state.id)
+            if fresh or conflicts != state.conflicts:
+                state.conflicts = conflicts
+                state.reported = [c for c in state.reported if c in conflicts]
+                state.severity = (
+                    self._grade_tension_severity(state.to_digest(), conflicts, constraint_summaries)
+                    if conflicts else None
+                )
+                dirty = True
+
+            linked = state.id in linked_ids
+            if linked != state.linked:
+                state.linked = linked
+                dirty = True
+
+            if fresh or purpose_changed:
+                alignment = self._keyword_alignment(set(state.keywords), purpose_keywords)
+                if alignment != state.alignment:
+                    state.alignment = alignment
+                    dirty = True
+
+            if dirty:
+                updates.append(state)
+
+        # TIER 0 input: duplicates only change with the artifact set
+        ids_key = xxhash.xxh64("\x1f".join(states).encode('utf-8')).hexdigest()
+        cached = self.graph.get_meta("coherence_duplicates")
+        if cached and cached.get("key") == ids_key:
+            duplicates = cached["duplicates"]
+        else:
+            duplicates = self._detect_duplicates([st.to_digest() for st in states.values()])
+            self.graph.set_meta(
+                "coherence_duplicates",
+                {"key": ids_key, "duplicates": duplicates},
+                auto_commit=False
+            )
 
-        # TIER 0: Detect duplicates by summary similarity
-        duplicates = self._detect_duplicates(context.artifact_digests)
-        duplicate_ids = set()  # Track which IDs are part of duplicate pairs
+        self.graph.delete_coherence_states(removed, auto_commit=False)
+        self.graph.set_coherence_states(((st.id, asdict(st)) for st in updates), auto_commit=False)
+        if purpose_changed:
+            self.graph.set_meta("coherence_purpose_keywords", purpose_key, auto_commit=False)
+        self.graph.commit()
 
-        for dup_id, original_id in duplicates.items():
-            duplicate_ids.add(dup_id)
-            duplicate_ids.add(original_id)
+        return list(states.values()), duplicates, conflicts_changed
+
+    def _merge_entities(self, states: List[ArtifactState], duplicates: Dict[str, str],
+                        exclusions: Exclusions) -> List[EntityStatus]:
+        """
+        Derive entity statuses from artifact state using four-tier approach.
+
+        Tier 0: Duplicate detection - same/similar summaries across artifacts
+        Tier 1: Graph edges (authoritative) - if linked to purpose → coherent
+        Tier 2: Keyword conflicts - check for constraint violations
+        Tier 3: Keyword alignment (informational) - low overlap → low_alignment
+
+        Each issue includes resolution_hint pointing to existing mechanisms.
+        Conflicts surfaced for the first time are recorded as tensions
+        (see _record_tensions).
+        """
+        entities = []
+        unreported = []  # (state, conflict IDs) not yet recorded
+
+        # TIER 0: Duplicates by summary similarity
+        for state in states:
+            original_id = duplicates.get(state.id)
+            if original_id is None:
+                continue
             hint = RESOLUTION_HINTS["duplicate"].format(
-                deprecate_id=_short_id(dup_id),
+                deprecate_id=_short_id(state.id),
                 keep_id=_short_id(original_id)
             )
             entities.append(EntityStatus(
-                id=dup_id,
-                node_type=artifact_lookup.get(dup_id, artifacts[0]).type if artifact_lookup.get(dup_id) else "unknown",
-                summary=next((d.summary for d in context.artifact_digests if d.id == dup_id), ""),
+                id=state.id,
+                node_type=state.node_type,
+                summary=state.summary,
                 status="duplicate",
                 reason=f"Duplicate of [{_short_id(original_id)}]",
                 duplicate_of=original_id,
                 resolution_hint=hint
             ))
 
-        for digest in context.artifact_digests:
+        for state in states:
             # Skip if already marked as duplicate
-            if digest.id in duplicate_ids and digest.id in duplicates:
+            if state.id in duplicates:
                 continue
 
-            artifact = artifact_lookup.get(digest.id)
-
-            # TIER 1: Check graph edges (authoritative)
-            if artifact:
-                incoming = self.graph.get_incoming(artifact.id)
-                has_purpose_link = any(
-                    edge.source_id in purpose_ids and edge.relation == "supports"
-                    for edge, _ in incoming
-                )
-
-                if has_purpose_link:
-                    entities.append(EntityStatus(
-                        id=digest.id,
-                        node_type=digest.artifact_type,
-                        summary=digest.summary,
-                        status="coherent",
-                        reason="Linked to purpose"
-                    ))
-                    continue
-
-            # TIER 2: Fast conflict check using keywords
-            conflicts = self.digest_builder.check_conflicts_fast(
-                digest,
-                context.constraint_keywords
-            )
-
-            if conflicts:
-                # Grade severity based on conflict characteristics (P5: Adaptive Cycle Rate)
-                severity = self._grade_tension_severity(digest, conflicts, context)
-                hint = RESOLUTION_HINTS["tension"].format(id=_short_id(digest.id))
+            # TIER 1: Graph edges (authoritative)
+            if state.linked:
+                entities.append(EntityStatus(
+                    id=state.id,
+                    node_type=state.node_type,
+                    summary=state.summary,
+                    status="coherent",
+                    reason="Linked to purpose"
+                ))
+                continue
 
+            # TIER 2: Keyword conflicts (graded when they were computed)
+            if state.conflicts:
+                hint = RESOLUTION_HINTS["tension"].format(id=_short_id(state.id))
                 entities.append(EntityStatus(
-                    id=digest.id,
-                    node_type=digest.artifact_type,
-                    summary=digest.summary,
+                    id=state.id,
+                    node_type=state.node_type,
+                    summary=state.summary,
                     status="tension",
                     reason="May conflict with constraints",
-                    related_to=conflicts,
+                    related_to=list(state.conflicts),
                     resolution_hint=hint,
-                    severity=severity
+                    severity=state.severity
                 ))
 
-                # Emit TENSION_DETECTED event for auto-detection (P4: AI as pattern detector)
-                # This creates graph edges for tensions_with relation
-                for conflict_id in conflicts:
-                    tension_event = detect_tension(
-                        artifact_a_id=digest.id,
-                        artifact_b_id=conflict_id,
-                        severity=severity,
-                        reason=f"Keyword conflict detected between {digest.artifact_type} and constraint",
-                        detection_method="auto",
-                        author="coherence_checker"
-                    )
-                    self.events.append(tension_event)
-
+                new_conflicts = [c for c in state.conflicts if c not in state.reported]
+                if new_conflicts:
+                    unreported.append((state, new_conflicts))
                 continue
 
-            # TIER 3: Check keyword alignment (informational)
-            artifact_keywords = set(digest.keywords)
-            alignment = self._keyword_alignment(artifact_keywords, purpose_keywords)
-
+            # TIER 3: Keyword alignment (informational)
             # Skip low alignment check for recent artifacts (temporal grace period)
             # Recent artifacts haven't had time to be linked to purpose yet
-            is_recent = artifact and self._is_recent_artifact(artifact)
+            is_recent = self._within_grace(state.created_at)
 
-            if alignment < 0.2 and not is_recent:
-                hint = RESOLUTION_HINTS["low_alignment"].format(id=_short_id(digest.id))
+            if state.alignment < 0.2 and not is_recent:
+                hint = RESOLUTION_HINTS["low_alignment"].format(id=_short_id(state.id))
                 entities.append(EntityStatus(
-                    id=digest.id,
-                    node_type=digest.artifact_type,
-                    summary=digest.summary,
+                    id=state.id,
+                    node_type=state.node_type,
+                    summary=state.summary,
                     status="low_alignment",
                     reason="Weak keyword alignment with purpose",
                     resolution_hint=hint
                 ))
             else:
-                reason = "Recently created (grace period)" if is_recent and alignment < 0.2 else None
+                reason = "Recently created (grace period)" if is_recent and state.alignment < 0.2 else None
                 entities.append(EntityStatus(
-                    id=digest.id,
-                    node_type=digest.artifact_type,
-                    summary=digest.summary,
+                    id=state.id,
+                    node_type=state.node_type,
+                    summary=state.summary,
                     status="coherent",
                     reason=reason
                 ))
 
+        if unreported:
+            self._record_tensions(unreported, exclusions)
+
         return entities
 
+    def _record_tensions(self, unreported: List[Tuple[ArtifactState, List[str]]],
+                         exclusions: Exclusions):
+        """
+        Emit TENSION_DETECTED events for new conflicts (P4: AI as pattern detector).
+
+        Pairs already recorded as tensions are skipped, so repeated checks
+        (or a rebuilt coherence state) never duplicate them. New events
+        are written as one batch and projected in one graph transaction,
+        which creates their tensions_with edges.
+        """
+        recorded = {frozenset(ids) for ids in exclusions.tensions.values()}
+        tension_events = []
+        for state, conflict_ids in unreported:
+            for conflict_id in conflict_ids:
+                pair = frozenset((state.id, conflict_id))
+                if pair in recorded:
+                    continue
+                recorded.add(pair)
+                tension_events.append(detect_tension(
+                    artifact_a_id=state.id,
+                    artifact_b_id=conflict_id,
+                    severity=state.severity,
+                    reason=f"Keyword conflict detected between {state.node_type} and constraint",
+                    detection_method="auto",
+                    author="coherence_checker"
+                ))
+            state.reported = state.reported + conflict_ids
+
+        if tension_events:
+            self.events.append_batch(tension_events)
+        for event in tension_events:
+            self.graph._project_event(event, auto_commit=False)
+            exclusions.apply(event)
+        self.graph.set_coherence_states(
+            ((state.id, asdict(state)) for state, _ in unreported), auto_commit=False
+        )
+        self.graph.commit()
+
     def _detect_duplicates(self, digests: List[ArtifactDigest], threshold: float = 0.85) -> Dict[str, str]:
         """
         Detect duplicate artifacts by summary similarity.
 
         Returns dict mapping duplicate_id -> original_id (first seen wins).
         Uses Jaccard similarity on keywords for efficiency (no LLM needed).
+
+        Near-linear: exact summaries are matched through a dict, and only
+        MinHash LSH candidates (see core/minhash.py) get an exact Jaccard
+        check, instead of comparing every artifact with every other.
         """
         duplicates = {}
-        seen_summaries: List[Tuple[str, str, set]] = []  # (id, summary, keywords)
+        summary_index: Dict[str, int] = {}  # normalized summary -> seen position
+        seen: List[Tuple[str, set]] = []  # (id, keywords) of non-duplicates
+        lsh = MinHashLSH()
+        signatures = self._minhash_signatures(digests)
 
         for digest in digests:
             summary_lower = digest.summary.lower().strip()
             keywords = set(digest.keywords)
 
-            # Check against already seen
-            for seen_id, seen_summary, seen_keywords in seen_summaries:
-                # Exact match
-                if summary_lower == seen_summary.lower().strip():
-                    duplicates[digest.id] = seen_id
-                    break
-
-                # High keyword similarity
-                if seen_keywords and keywords:
-                    intersection = keywords & seen_keywords
-                    union = keywords | seen_keywords
-                    similarity = len(intersection) / len(union) if union else 0
-
-                    if similarity >= threshold:
-                        duplicates[digest.id] = seen_id
-                        break
-            else:
-                # Not a duplicate, add to seen
-                seen_summaries.append((digest.id, digest.summary, keywords))
+            # Earliest seen artifact matching exactly or by keyword similarity
+            matches = []
+            if summary_lower in summary_index:
+                matches.append(summary_index[summary_lower])
+            if keywords:
+                matches.extend(
+                    position for position in lsh.query(signatures[digest.id])
+                    if jaccard(keywords, seen[position][1]) >= threshold
+                )
+
+            if matches:
+                duplicates[digest.id] = seen[min(matches)][0]
+                continue
+
+            # Not a duplicate, add to seen
+            position = len(seen)
+            seen.append((digest.id, keywords))
+            summary_index.setdefault(summary_lower, position)
+            if keywords:
+                lsh.insert(position, signatures[digest.id])
 
         return duplicates
+
+    def _minhash_signatures(self, digests: List[ArtifactDigest]) -> Dict[str, List[int]]:
+        """
+        MinHash signatures per digest, persisted in graph.db.
+
+        Only artifacts that are new or whose keywords changed are hashed;
+        the rest are loaded from the stored signatures.
+        """
+        stored = self.graph.get_minhash_signatures(d.id for d in digests if d.keywords)
+        signatures = {}
+        updates = []
+        for digest in digests:
+            if not digest.keywords:
+                continue
+            key = tokens_key(digest.keywords)
+            row = stored.get(digest.id)
+            if row and row[0] == key:
+                signatures[digest.id] = unpack_signature(row[1])
+            else:
+                signature = minhash_signature(digest.keywords)
+                signatures[digest.id] = signature
+                updates.append((digest.id, key, pack_signature(signature)))
+        if updates:
+            self.graph.set_minhash_signatures(updates)
+        return signatures
     
     def _keyword_alignment(self, artifact_kw: set, purpose_kw: set) -> float:
         """Check keyword overlap as alignment proxy."""
@@ -665,7 +935,7 @@ class CoherenceChecker:
         self,
         digest: ArtifactDigest,
         conflicts: List[str],
-        context: CoherenceContext
+        constraint_summaries: Dict[str, str]
     ) -> str:
         """
         Grade tension severity based on conflict characteristics (P5: Adaptive Cycle Rate).
@@ -673,7 +943,7 @@ class CoherenceChecker:
         Args:
             digest: The artifact digest in tension
             conflicts: List of conflicting artifact IDs
-            context: Coherence context with constraint info
+            constraint_summaries: Constraint ID -> summary
 
         Returns:
             "critical" | "warning" | "info"
@@ -688,17 +958,11 @@ class CoherenceChecker:
             return "critical"
 
         # Check if any conflict is with a hard constraint
-        # Note: constraint_keywords is a dict mapping constraint_id -> keyword list
         for conflict_id in conflicts:
-            if conflict_id in context.constraint_keywords:
-                # Look up the constraint summary from artifact digests
-                for art_digest in context.artifact_digests:
-                    if art_digest.id == conflict_id:
-                        constraint_text = art_digest.summary.lower()
-                        # Hard constraint indicators
-                        if any(word in constraint_text for word in ['must', 'never', 'cannot', 'always', 'required']):
-                            return "critical"
-                        break
+            constraint_text = constraint_summaries.get(conflict_id, '').lower()
+            # Hard constraint indicators
+            if any(word in constraint_text for word in ['must', 'never', 'cannot', 'always', 'required']):
+                return "critical"
 
         # Check artifact type - some types are more critical
         if digest.artifact_type in ('constraint', 'principle'):
@@ -732,13 +996,26 @@ class CoherenceChecker:
         if not event:
             return False
 
+        return self._within_grace(event.timestamp, grace_seconds)
+
+    def _within_grace(self, timestamp: str, grace_seconds: int = 3600) -> bool:
+        """Check if an ISO timestamp lies within the grace period."""
+        if not timestamp:
+            return False
         try:
-            event_time = datetime.fromisoformat(event.timestamp.replace('Z', '+00:00'))
+            event_time = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
             now = datetime.now(timezone.utc)
             age_seconds = (now - event_time).total_seconds()
             return age_seconds < grace_seconds
         except (ValueError, TypeError):
             return False
+
+    def _artifact_timestamp(self, node: Node) -> str:
+        """Source event timestamp of an artifact (older graphs lack created_at)."""
+        if node.created_at:
+            return node.created_at
+        event = self.events.get(node.event_id) if node.event_id else None
+        return event.timestamp if event else ""
     
     def _determine_status(self, entities: List[EntityStatus]) -> str:
         """Determine overall status from entity statuses."""
@@ -937,6 +1214,29 @@ class CoherenceChecker:
         except Exception:
             return None
 
+    async def asuggest_resolution(self, entity: EntityStatus) -> Optional[ResolutionSuggestion]:
+        """
+        Coroutine form of suggest_resolution (for fan-out on the
+        orchestrator's event loop). Timeouts and cancellation propagate;
+        other failures return None.
+        """
+        if not self.provider or not getattr(self.provider, 'is_available', False):
+            return None
+
+        context = self._build_resolution_context(entity)
+
+        try:
+            response = await self.provider.acomplete(
+                system=RESOLUTION_SYSTEM_PROMPT,
+                user=context,
+                max_tokens=1000
+            )
+            return self._parse_resolution_response(response.text, entity)
+        except asyncio.TimeoutError:
+            raise
+        except Exception:
+            return None
+
     def _build_resolution_context(self, entity: EntityStatus) -> str:
         """
         Build enriched context for resolution AI.
@@ -0,0 +1,163 @@
+"""
+Fold — Incremental, snapshot-backed tracker state
+
+Trackers derive their state by folding events through a reducer.
+Instead of re-folding the full history after every write:
+- Appends are applied as they happen (DualEventStore.subscribe)
+- State is persisted as a snapshot with an event-store watermark,
+  so a new process only folds events appended since the snapshot
+
+Snapshots are projections (HC3: rebuildable). A missing, corrupt,
+outdated or rewritten-behind snapshot just triggers a full fold.
+
+Snapshots live in .babel/local/snapshots/ (git-ignored, per user).
+"""
+
+import os
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import orjson
+
+from ..core.events import DualEventStore, Event, EventType
+
+
+class FoldTracker:
+    """
+    Base class for trackers whose state is a fold over events.
+
+    Subclasses define:
+        EVENT_TYPES: Event types folded, in full-fold order
+        ITEM_CLASS: Dataclass stored per key (serialized via asdict)
+        SNAPSHOT_NAME: Snapshot file stem
+        SNAPSHOT_VERSION: Bump when the reducer changes meaning
+        _apply(state, event): Idempotent reducer (events may be re-read)
+    """
+
+    EVENT_TYPES: Tuple[EventType, ...] = ()
+    ITEM_CLASS: type = None
+    SNAPSHOT_NAME: str = ""
+    SNAPSHOT_VERSION: int = 1
+
+    def __init__(self, events: DualEventStore):
+        self.events = events
+        self._cache: Optional[Dict[str, Any]] = None
+
+        # Apply appends incrementally instead of re-folding history
+        subscribe = getattr(events, "subscribe", None)
+        if subscribe:
+            subscribe(self._on_append)
+
+    def _apply(self, state: Dict[str, Any], event: Event):
+        """Fold one event into state (must be idempotent)."""
+        raise NotImplementedError
+
+    def invalidate_cache(self):
+        """
+        Drop in-memory state.
+
+        Next access reloads the snapshot and folds only events appended
+        after its watermark (appends through this store are already
+        applied, so writes no longer need to invalidate).
+        """
+        self._cache = None
+
+    def _on_append(self, event: Event):
+        """Apply an appended event to loaded state."""
+        if self._cache is not None and event.type in self.EVENT_TYPES:
+            self._apply(self._cache, event)
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Load state: snapshot + catch-up, or full fold as fallback."""
+        if self._cache is not None:
+            return self._cache
+
+        # Watermark before reading: events appended meanwhile are re-read
+        # next time, which idempotent reducers tolerate
+        watermark = self.events.watermark()
+        state = None
+        dirty = True
+
+        snapshot = self._read_snapshot()
+        if snapshot is not None:
+            new_events = self.events.read_since(snapshot["watermark"])
+            if new_events is not None:
+                state = {k: self.ITEM_CLASS(**v) for k, v in snapshot["state"].items()}
+                for event in new_events:
+                    if event.type in self.EVENT_TYPES:
+                        self._apply(state, event)
+                dirty = bool(new_events)
+
+        if state is None:
+            state = {}
+            for event_type in self.EVENT_TYPES:
+                for event in self.events.read_by_type(event_type):
+                    self._apply(state, event)
+
+        if dirty:
+            self._write_snapshot(state, watermark)
+
+        self._cache = state
+        return state
+
+    # =========================================================================
+    # Snapshot Persistence
+    # =========================================================================
+
+    @property
+    def _snapshot_path(self) -> Optional[Path]:
+        return snapshot_path(self.events, self.SNAPSHOT_NAME)
+
+    def _read_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Read snapshot if present and current (None otherwise)."""
+        data = read_snapshot(self._snapshot_path, self.SNAPSHOT_VERSION)
+        if data is None or "watermark" not in data or "state" not in data:
+            return None
+        return data
+
+    def _write_snapshot(self, state: Dict[str, Any], watermark: Dict[str, Any]):
+        """Persist state atomically (fail silently - snapshot is rebuildable)."""
+        write_snapshot(self._snapshot_path, {
+            "version": self.SNAPSHOT_VERSION,
+            "watermark": watermark,
+            "state": {k: asdict(v) for k, v in state.items()},
+        })
+
+
+# =============================================================================
+# Snapshot Files (shared with other watermark-backed projections)
+# =============================================================================
+
+def snapshot_path(events: DualEventStore, name: str) -> Optional[Path]:
+    """Location of a named snapshot, next to the store's local events."""
+    local_dir = getattr(events, "local_dir", None)
+    if not local_dir or not name:
+        return None
+    return Path(local_dir) / "snapshots" / f"{name}.json"
+
+
+def read_snapshot(path: Optional[Path], version: int) -> Optional[Dict[str, Any]]:
+    """Load a snapshot written with the given version (None otherwise)."""
+    if path is None or not path.exists():
+        return None
+    try:
+        data = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(data, dict) or data.get("version") != version:
+        return None
+    return data
+
+
+def write_snapshot(path: Optional[Path], data: Dict[str, Any]):
+    """Write a snapshot atomically (fail silently - snapshots are rebuildable)."""
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(data))
+        os.replace(tmp, path)
+    except (OSError, TypeError):
+        pass
@@ -16,7 +16,7 @@ Uses existing trackers (validation, tensions, questions) — no direct DB access
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class PrincipleStatus(Enum):
@@ -36,6 +36,25 @@ class PrincipleCheck:
     message: str            # Human-readable explanation
     suggestion: Optional[str] = None  # Action to fix (if warning/violation)
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "principle": self.principle,
+            "name": self.name,
+            "status": self.status.value,
+            "message": self.message,
+            "suggestion": self.suggestion
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'PrincipleCheck':
+        return cls(
+            principle=data["principle"],
+            name=data["name"],
+            status=PrincipleStatus(data["status"]),
+            message=data.get("message", ""),
+            suggestion=data.get("suggestion")
+        )
+
 
 @dataclass
 class PrincipleResult:
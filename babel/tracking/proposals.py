@@ -0,0 +1,120 @@
+"""
+Proposals — Pending-proposal index (HC2 review queue)
+
+A proposal is pending while its STRUCTURE_PROPOSED event has neither an
+ARTIFACT_CONFIRMED nor a PROPOSAL_REJECTED pointing at it. Instead of
+diffing the three event types on every review/status call, the tracker
+folds them once (see FoldTracker) and keeps the pending set up to date
+as confirmations and rejections are appended:
+- count_pending(): O(1)
+- get_pending(offset, limit): paginated, oldest first
+
+Resolved proposals stay in state as small tombstones (no content), so
+re-reading their STRUCTURE_PROPOSED event cannot make them pending again.
+"""
+
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+from ..core.events import Event, EventType
+from .fold import FoldTracker
+
+
+@dataclass
+class ProposalRecord:
+    """Review state of one proposal."""
+    id: str
+    status: str = "pending"  # "pending" | "confirmed" | "rejected"
+    proposed: Optional[Dict[str, Any]] = None  # STRUCTURE_PROPOSED event, while pending
+
+
+class ProposalTracker(FoldTracker):
+    """
+    Track which proposals await human review (HC2).
+
+    State is folded incrementally (see FoldTracker); the ordered pending
+    view is derived from it once per load and then maintained on append.
+    """
+
+    EVENT_TYPES = (
+        EventType.STRUCTURE_PROPOSED,
+        EventType.ARTIFACT_CONFIRMED,
+        EventType.PROPOSAL_REJECTED,
+    )
+    ITEM_CLASS = ProposalRecord
+    SNAPSHOT_NAME = "proposals"
+
+    def __init__(self, events):
+        super().__init__(events)
+        self._pending: Optional[Dict[str, Event]] = None
+        self._pending_state: Optional[Dict[str, ProposalRecord]] = None
+
+    def _apply(self, records: Dict[str, ProposalRecord], event: Event):
+        """Fold one proposal, confirmation or rejection event."""
+        if event.type == EventType.STRUCTURE_PROPOSED:
+            if event.id not in records:
+                records[event.id] = ProposalRecord(id=event.id, proposed=event.to_dict())
+                if records is self._pending_state:
+                    self._pending[event.id] = event
+            return
+
+        proposal_id = event.data.get("proposal_id")
+        if not proposal_id:
+            return  # Direct capture, not a reviewed proposal
+
+        status = "confirmed" if event.type == EventType.ARTIFACT_CONFIRMED else "rejected"
+        record = records.get(proposal_id)
+        if record is None:
+            records[proposal_id] = ProposalRecord(id=proposal_id, status=status)
+        elif record.status == "pending":
+            record.status = status
+            record.proposed = None
+        if records is self._pending_state:
+            self._pending.pop(proposal_id, None)
+
+    def invalidate_cache(self):
+        super().invalidate_cache()
+        self._pending = None
+        self._pending_state = None
+
+    def _pending_view(self) -> Dict[str, Event]:
+        """Pending proposals by ID, oldest first."""
+        records = self._load_state()
+        if self._pending_state is not records:
+            pending = [
+                Event.from_dict(dict(r.proposed))
+                for r in records.values()
+                if r.status == "pending" and r.proposed
+            ]
+            pending.sort(key=lambda e: e.timestamp)
+            self._pending = {e.id: e for e in pending}
+            self._pending_state = records
+        return self._pending
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def count_pending(self) -> int:
+        """Number of proposals awaiting review."""
+        return len(self._pending_view())
+
+    def get_pending(self, offset: int = 0, limit: Optional[int] = None) -> List[Event]:
+        """
+        Pending STRUCTURE_PROPOSED events, oldest first.
+
+        Args:
+            offset: Number of proposals to skip
+            limit: Maximum proposals to return (None = all)
+        """
+        pending = self._pending_view().values()
+        stop = None if limit is None else offset + limit
+        return list(islice(pending, offset, stop))
+
+    def get_pending_proposal(self, proposal_id: str) -> Optional[Event]:
+        """Pending proposal by exact ID (None if unknown or resolved)."""
+        return self._pending_view().get(proposal_id)
+
+    def is_pending(self, proposal_id: str) -> bool:
+        return proposal_id in self._pending_view()
@@ -0,0 +1,171 @@
+"""
+StatusSummary — Persisted status materialization
+
+`babel status` reads one small snapshot instead of re-deriving the
+project overview from the full history on every call:
+- Event counters (per scope, commits, last coherence checkpoint) are
+  folded from the events appended since the snapshot's watermark
+- Derived sections (tracker counts, pending proposals, principles) each
+  declare the event types and files they read, and are recomputed only
+  when new events of those types arrived or those files changed
+
+An unchanged watermark costs two stat() calls and two tail hashes; a
+capture recomputes only the sections its event type feeds.
+Like tracker snapshots, the materialization is a projection (HC3):
+missing, corrupt or rewritten-behind state triggers a full rebuild.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.events import DualEventStore, Event, EventType
+from .fold import snapshot_path, read_snapshot, write_snapshot
+
+
+@dataclass
+class StatusSection:
+    """
+    One derived part of the status summary.
+
+    Attributes:
+        compute: Builds the section's fields (called only when stale)
+        event_types: Event types whose appends can change the section
+        sources: Non-event files the section also reads
+                 (e.g. vocabulary.json) - changes invalidate it
+    """
+    compute: Callable[[], Dict[str, Any]]
+    event_types: Tuple[EventType, ...] = ()
+    sources: Tuple[Path, ...] = ()
+
+
+class StatusSummary:
+    """
+    Watermark-checked status summary.
+
+    Args:
+        events: Event store the summary is derived from
+        sections: Derived sections by name
+    """
+
+    SNAPSHOT_NAME = "status"
+    SNAPSHOT_VERSION = 2
+
+    def __init__(self, events: DualEventStore, sections: Dict[str, StatusSection]):
+        self.events = events
+        self.sections = sections
+        self._cache: Optional[Dict[str, Any]] = None
+
+        # Appends move the watermark; drop memory so get() catches up
+        subscribe = getattr(events, "subscribe", None)
+        if subscribe:
+            subscribe(self._on_append)
+
+    def _on_append(self, event: Event):
+        self._cache = None
+
+    def get(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Current summary as a flat dict (counters + derived sections).
+
+        Args:
+            refresh: Ignore persisted state and recompute everything
+        """
+        watermark = self.events.watermark()
+        sources = {name: self._source_marks(section) for name, section in self.sections.items()}
+
+        state = None if refresh else (self._cache or self._read())
+        if state and state["watermark"] == watermark and state["sources"] == sources:
+            self._cache = state
+            return self._flatten(state)
+
+        counters = None
+        stale = set(self.sections)
+        if state:
+            new_events = self.events.read_since(state["watermark"], until=watermark)
+            if new_events is not None:
+                counters = dict(state["counters"])
+                appended = set()
+                for event in new_events:
+                    self._fold(counters, event)
+                    appended.add(event.type)
+                stale = {
+                    name for name, section in self.sections.items()
+                    if name not in state["derived"]
+                    or state["sources"].get(name) != sources[name]
+                    or appended.intersection(section.event_types)
+                }
+        if counters is None:
+            counters = self._full_counters()
+
+        derived = dict(state["derived"]) if state else {}
+        for name in stale:
+            derived[name] = self.sections[name].compute()
+
+        state = {
+            "version": self.SNAPSHOT_VERSION,
+            "watermark": watermark,
+            "sources": sources,
+            "counters": counters,
+            "derived": {name: derived[name] for name in self.sections},
+        }
+        write_snapshot(snapshot_path(self.events, self.SNAPSHOT_NAME), state)
+        self._cache = state
+        return self._flatten(state)
+
+    # =========================================================================
+    # Counters
+    # =========================================================================
+
+    @staticmethod
+    def _fold(counters: Dict[str, Any], event: Event):
+        """Fold one appended event into the counters."""
+        if event.is_shared:
+            counters["shared_events"] += 1
+        else:
+            counters["local_events"] += 1
+
+        if event.type == EventType.COMMIT_CAPTURED:
+            counters["commits_captured"] += 1
+        elif event.type == EventType.COHERENCE_CHECKED:
+            last = counters.get("coherence_checkpoint")
+            if last is None or event.timestamp >= last["timestamp"]:
+                counters["coherence_checkpoint"] = event.to_dict()
+
+    def _full_counters(self) -> Dict[str, Any]:
+        """Count from the full history (first run or rewritten files)."""
+        checkpoints = self.events.read_by_type(EventType.COHERENCE_CHECKED)
+        return {
+            "shared_events": len(self.events.read_shared()),
+            "local_events": len(self.events.read_local()),
+            "commits_captured": len(self.events.read_by_type(EventType.COMMIT_CAPTURED)),
+            "coherence_checkpoint": checkpoints[-1].to_dict() if checkpoints else None,
+        }
+
+    # =========================================================================
+    # Persistence
+    # =========================================================================
+
+    def _read(self) -> Optional[Dict[str, Any]]:
+        data = read_snapshot(snapshot_path(self.events, self.SNAPSHOT_NAME), self.SNAPSHOT_VERSION)
+        if data is None or not all(k in data for k in ("watermark", "sources", "counters", "derived")):
+            return None
+        return data
+
+    @staticmethod
+    def _source_marks(section: StatusSection) -> List[List[int]]:
+        marks = []
+        for path in section.sources:
+            try:
+                st = path.stat()
+                marks.append([st.st_mtime_ns, st.st_size])
+            except OSError:
+                marks.append([0, 0])
+        return marks
+
+    @staticmethod
+    def _flatten(state: Dict[str, Any]) -> Dict[str, Any]:
+        flat = dict(state["counters"])
+        for fields in state["derived"].values():
+            flat.update(fields)
+        return flat
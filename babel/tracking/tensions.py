@@ -24,10 +24,11 @@ from dataclasses import dataclass, field
 from typing import Optional, List, Dict, Any
 
 from ..core.events import (
-    DualEventStore, Event, EventType,
+    Event, EventType,
     raise_challenge, add_evidence, resolve_challenge
 )
 from ..core.scope import EventScope
+from .fold import FoldTracker
 from ..presentation.formatters import generate_summary, format_timestamp
 from ..presentation.symbols import get_symbols
 
@@ -105,7 +106,7 @@ class Challenge:
         }
 
 
-class TensionTracker:
+class TensionTracker(FoldTracker):
     """
     Track and manage challenges/tensions (P4 compliant).
     
@@ -114,45 +115,38 @@ class TensionTracker:
     - Evidence aggregation
     - Resolution tracking
     - Open tension queries
+
+    State is folded incrementally (see FoldTracker).
     """
-    
-    def __init__(self, events: DualEventStore):
-        self.events = events
-        self._cache: Optional[Dict[str, Challenge]] = None
-    
+
+    EVENT_TYPES = (
+        EventType.CHALLENGE_RAISED,
+        EventType.EVIDENCE_ADDED,
+        EventType.CHALLENGE_RESOLVED,
+    )
+    ITEM_CLASS = Challenge
+    SNAPSHOT_NAME = "tensions"
+
     def _load_challenges(self) -> Dict[str, Challenge]:
-        """Load all challenges from events."""
-        if self._cache is not None:
-            return self._cache
-        
-        challenges: Dict[str, Challenge] = {}
-        
-        # Load challenge events
-        challenge_events = self.events.read_by_type(EventType.CHALLENGE_RAISED)
-        for event in challenge_events:
-            challenge = Challenge.from_event(event)
-            challenges[challenge.id] = challenge
-        
-        # Load evidence events
-        evidence_events = self.events.read_by_type(EventType.EVIDENCE_ADDED)
-        for event in evidence_events:
-            challenge_id = event.data.get("challenge_id", "")
-            if challenge_id in challenges:
-                challenges[challenge_id].add_evidence_item(event)
-        
-        # Load resolution events
-        resolution_events = self.events.read_by_type(EventType.CHALLENGE_RESOLVED)
-        for event in resolution_events:
-            challenge_id = event.data.get("challenge_id", "")
-            if challenge_id in challenges:
-                challenges[challenge_id].set_resolution(event)
-        
-        self._cache = challenges
-        return challenges
-    
-    def invalidate_cache(self):
-        """Invalidate cache after changes."""
-        self._cache = None
+        """Load all challenges (snapshot + events since its watermark)."""
+        return self._load_state()
+
+    def _apply(self, challenges: Dict[str, Challenge], event: Event):
+        """Fold one challenge, evidence or resolution event."""
+        if event.type == EventType.CHALLENGE_RAISED:
+            if event.id not in challenges:
+                challenges[event.id] = Challenge.from_event(event)
+            return
+
+        challenge = challenges.get(event.data.get("challenge_id", ""))
+        if challenge is None:
+            return
+
+        if event.type == EventType.EVIDENCE_ADDED:
+            if all(e["id"] != event.id for e in challenge.evidence):
+                challenge.add_evidence_item(event)
+        elif event.type == EventType.CHALLENGE_RESOLVED:
+            challenge.set_resolution(event)
     
     # =========================================================================
     # Challenge Operations
@@ -185,7 +179,6 @@ class TensionTracker:
         
         # Challenges are shared — team needs to see disagreements
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return Challenge.from_event(event)
     
@@ -217,7 +210,6 @@ class TensionTracker:
         )
         
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return True
     
@@ -257,7 +249,6 @@ class TensionTracker:
         )
         
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return True
     
@@ -25,10 +25,11 @@ from typing import Optional, List, Dict, Any, Set
 from enum import Enum
 
 from ..core.events import (
-    DualEventStore, EventType,
+    Event, EventType,
     endorse_decision, evidence_decision, register_decision_for_validation
 )
 from ..core.scope import EventScope
+from .fold import FoldTracker
 from ..presentation.formatters import generate_summary
 from ..presentation.symbols import get_symbols
 
@@ -104,7 +105,7 @@ class DecisionValidation:
         }
 
 
-class ValidationTracker:
+class ValidationTracker(FoldTracker):
     """
     Track validation status for decisions (P9 compliant).
     
@@ -112,64 +113,60 @@ class ValidationTracker:
     - Consensus alone is groupthink
     - Evidence alone is noise
     - Both together = validated truth
+
+    State is folded incrementally (see FoldTracker).
     """
-    
-    def __init__(self, events: DualEventStore):
-        self.events = events
-        self._cache: Optional[Dict[str, DecisionValidation]] = None
-    
+
+    # Registrations first so summaries are available
+    EVENT_TYPES = (
+        EventType.DECISION_REGISTERED,
+        EventType.DECISION_ENDORSED,
+        EventType.DECISION_EVIDENCED,
+    )
+    ITEM_CLASS = DecisionValidation
+    SNAPSHOT_NAME = "validation"
+
     def _load_validations(self) -> Dict[str, DecisionValidation]:
-        """Load all validation data from events."""
-        if self._cache is not None:
-            return self._cache
+        """Load all validation data (snapshot + events since its watermark)."""
+        return self._load_state()
 
-        validations: Dict[str, DecisionValidation] = {}
+    def _apply(self, validations: Dict[str, DecisionValidation], event: Event):
+        """Fold one registration, endorsement or evidence event."""
+        decision_id = event.data.get("decision_id", "")
 
-        # Load registration events first (so summary is available)
-        registration_events = self.events.read_by_type(EventType.DECISION_REGISTERED)
-        for event in registration_events:
-            decision_id = event.data.get("decision_id", "")
-            if decision_id and decision_id not in validations:
+        if event.type == EventType.DECISION_REGISTERED:
+            if not decision_id:
+                return
+            if decision_id not in validations:
                 validations[decision_id] = DecisionValidation(
                     decision_id=decision_id,
                     summary=event.data.get("summary")
                 )
+            elif validations[decision_id].summary is None:
+                validations[decision_id].summary = event.data.get("summary")
+            return
 
-        # Load endorsement events
-        endorsement_events = self.events.read_by_type(EventType.DECISION_ENDORSED)
-        for event in endorsement_events:
-            decision_id = event.data.get("decision_id", "")
-            if decision_id not in validations:
-                validations[decision_id] = DecisionValidation(decision_id=decision_id)
-            
-            validations[decision_id].endorsements.append({
-                "id": event.id,
-                "author": event.data.get("author", "unknown"),
-                "comment": event.data.get("comment"),
-                "timestamp": event.timestamp
-            })
-        
-        # Load evidence events
-        evidence_events = self.events.read_by_type(EventType.DECISION_EVIDENCED)
-        for event in evidence_events:
-            decision_id = event.data.get("decision_id", "")
-            if decision_id not in validations:
-                validations[decision_id] = DecisionValidation(decision_id=decision_id)
-            
-            validations[decision_id].evidence.append({
-                "id": event.id,
-                "content": event.data.get("content", ""),
-                "evidence_type": event.data.get("evidence_type", "observation"),
-                "author": event.data.get("author", "unknown"),
-                "timestamp": event.timestamp
-            })
-        
-        self._cache = validations
-        return validations
-    
-    def invalidate_cache(self):
-        """Invalidate cache after changes."""
-        self._cache = None
+        if decision_id not in validations:
+            validations[decision_id] = DecisionValidation(decision_id=decision_id)
+        validation = validations[decision_id]
+
+        if event.type == EventType.DECISION_ENDORSED:
+            if all(e["id"] != event.id for e in validation.endorsements):
+                validation.endorsements.append({
+                    "id": event.id,
+                    "author": event.data.get("author", "unknown"),
+                    "comment": event.data.get("comment"),
+                    "timestamp": event.timestamp
+                })
+        elif event.type == EventType.DECISION_EVIDENCED:
+            if all(e["id"] != event.id for e in validation.evidence):
+                validation.evidence.append({
+                    "id": event.id,
+                    "content": event.data.get("content", ""),
+                    "evidence_type": event.data.get("evidence_type", "observation"),
+                    "author": event.data.get("author", "unknown"),
+                    "timestamp": event.timestamp
+                })
 
     def register_decision(self, decision_id: str, summary: str = None, persist: bool = True):
         """
@@ -200,7 +197,6 @@ class ValidationTracker:
                 )
                 # Registration is shared (visible to team)
                 self.events.append(event, scope=EventScope.SHARED)
-                self.invalidate_cache()
 
     # =========================================================================
     # Validation Operations
@@ -230,7 +226,6 @@ class ValidationTracker:
         
         # Endorsements are shared (team consensus)
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return True
     
@@ -255,7 +250,6 @@ class ValidationTracker:
         
         # Evidence is shared (external grounding)
         self.events.append(event, scope=EventScope.SHARED)
-        self.invalidate_cache()
         
         return True
     
@@ -41,6 +41,7 @@ from babel.core.graph import GraphStore, Edge
 from babel.config import Config
 from babel.presentation.codec import IDCodec
 from babel.presentation.symbols import get_symbols
+from babel.tracking.proposals import ProposalTracker
 
 
 class BabelTestFactory:
@@ -418,6 +419,9 @@ class BabelTestFactory:
         cli.validation = Mock()
         cli.validation.register_decision = Mock()
 
+        # Real pending-proposal index (derived from the real event store)
+        cli.proposals = ProposalTracker(self.events)
+
         return cli
 
     def create_command(self, command_class, cli: Optional[Mock] = None):
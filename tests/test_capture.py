@@ -109,6 +109,57 @@ class TestGetExistingArtifacts:
         assert len(existing) == 1
         assert existing[0].summary == "Dict summary test"
 
+    def test_extends_cached_list_with_new_confirmations(self, capture_command):
+        """Later calls add new confirmations without re-reading old ones."""
+        cmd, factory = capture_command
+
+        factory.add_decision(summary="First decision")
+        assert [a.summary for a in cmd._get_existing_artifacts()] == ["First decision"]
+
+        factory.add_decision(summary="Second decision")
+        existing = cmd._get_existing_artifacts()
+
+        assert [a.summary for a in existing] == ["First decision", "Second decision"]
+
+    def test_rebuilds_when_history_changes(self, capture_command):
+        """A cached list that no longer matches the history is rebuilt."""
+        cmd, factory = capture_command
+
+        factory.add_decision(summary="Original decision")
+        cmd._get_existing_artifacts()
+
+        for path in (factory.events.shared_path, factory.events.local_path):
+            if path.exists():
+                path.write_text(path.read_text().replace("Original decision", "Rewritten decision"))
+        factory.events.clear_cache()
+
+        existing = cmd._get_existing_artifacts()
+
+        assert [a.summary for a in existing] == ["Rewritten decision"]
+
+    def test_unchanged_history_not_reread(self, capture_command, monkeypatch):
+        """Without new events the cached list is returned as is."""
+        cmd, factory = capture_command
+
+        factory.add_decision(summary="Only decision")
+        cmd._get_existing_artifacts()
+        monkeypatch.setattr(factory.events, "read_since", Mock(side_effect=AssertionError))
+
+        assert [a.summary for a in cmd._get_existing_artifacts()] == ["Only decision"]
+
+    def test_cache_not_shared_between_instances(self, capture_command):
+        """Each command keeps its own existing-artifact cache."""
+        cmd, factory = capture_command
+
+        factory.add_decision(summary="Project decision")
+        cmd._get_existing_artifacts()
+
+        other = CaptureCommand.__new__(CaptureCommand)
+        other._cli = factory.create_cli_mock()
+
+        assert other._existing is not cmd._existing
+        assert [a.summary for a in other._get_existing_artifacts()] == ["Project decision"]
+
 
 # =============================================================================
 # Capture Tests (Main Entry Point)
@@ -136,3 +136,78 @@ class TestFormatWithCode:
         # Should match [XX-XX] pattern at start
         assert result.startswith("[")
         assert "] Use SQLite" in result
+
+
+def _colliding_ids(codec):
+    """Find two distinct IDs that encode to the same code."""
+    seen = {}
+    i = 0
+    while True:
+        candidate = f"decision_{i:08x}"
+        code = codec.encode(candidate)
+        if code in seen:
+            return seen[code], candidate
+        seen[code] = candidate
+        i += 1
+
+
+class TestCodecIndex:
+    """Indexed decoding (no candidate scanning) and collision reporting."""
+
+    def test_decode_uses_index_without_candidates(self, tmp_path):
+        """Decode resolves through the graph code index."""
+        from babel.core.graph import GraphStore
+
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.index_codes(["id_alpha", "id_beta"])
+        codec = IDCodec(index=graph)
+
+        assert codec.decode(codec.encode("id_beta")) == "id_beta"
+
+    def test_collision_reported_as_ambiguity(self, tmp_path):
+        """Colliding IDs are all returned by matches(), decode passes through."""
+        from babel.core.graph import GraphStore
+
+        codec = IDCodec()
+        first, second = _colliding_ids(codec)
+        code = codec.encode(first)
+
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.index_codes([first, second])
+        indexed = IDCodec(index=graph)
+
+        assert sorted(indexed.matches(code)) == sorted([first, second])
+        assert indexed.decode(code) == code
+
+    def test_collision_in_candidates_reported(self):
+        """Candidate scanning also reports every match."""
+        codec = IDCodec()
+        first, second = _colliding_ids(codec)
+        code = codec.encode(first)
+
+        assert codec.matches(code, [first, "other", second]) == [first, second]
+        assert codec.decode(code, [first, second]) == code
+
+    def test_appended_batch_indexed_without_watermark_reads(self, tmp_path):
+        """Appends index each event directly; the watermark advances once on flush."""
+        from unittest.mock import patch
+        from babel.cli import IntentCLI
+        from babel.core.events import Event, EventType
+
+        babel_dir = tmp_path / ".babel"
+        (babel_dir / "shared").mkdir(parents=True)
+        (babel_dir / "local").mkdir()
+        (babel_dir / "config.yaml").write_text("llm:\n  provider: none\n")
+        cli = IntentCLI(tmp_path)
+
+        batch = [Event(type=EventType.CONVERSATION_CAPTURED, data={"content": f"note {i}"}) for i in range(3)]
+        with patch.object(cli.events, "read_since", wraps=cli.events.read_since) as read_since:
+            cli.events.append_batch(batch)
+            assert read_since.call_count == 0
+            assert all(cli.codec.decode(cli.codec.encode(e.id)) == e.id for e in batch)
+
+            cli._flush_code_index()
+            cli._flush_code_index()
+            assert read_since.call_count == 1
+
+        assert cli.graph.get_meta("code_index_watermark") == cli.events.watermark()
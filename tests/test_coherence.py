@@ -7,11 +7,11 @@ Tests checkpoint caching, incremental checks, and detection logic.
 import pytest
 from datetime import datetime, timezone, timedelta
 
-from babel.core.events import EventStore, EventType, declare_purpose, confirm_artifact
+from babel.core.events import DualEventStore, EventStore, EventType, declare_purpose, confirm_artifact
 from babel.core.graph import GraphStore
 from babel.config import Config
 from babel.tracking.coherence import (
-    CoherenceChecker, CoherenceResult, CoherenceScope, EntityStatus,
+    CoherenceChecker, CoherenceResult, CoherenceScope, EntityStatus, EXCLUSIONS_META_KEY,
     format_coherence_status, _format_age,
 )
 from babel.presentation.symbols import UNICODE, ASCII
@@ -600,3 +600,291 @@ class TestTemporalGrace:
 
         # Should return False for missing event
         assert checker._is_recent_artifact(node) is False
+
+
+class TestDuplicateDetection:
+    """Test LSH-backed duplicate detection (Tier 0)."""
+
+    @staticmethod
+    def _add(events, graph, summary, proposal_id):
+        event = confirm_artifact(
+            proposal_id=proposal_id,
+            artifact_type="decision",
+            content={"summary": summary}
+        )
+        events.append(event)
+        graph._project_event(event)
+        return f"decision_{event.id}"
+
+    @staticmethod
+    def _digests(graph):
+        from babel.core.horizon import ArtifactDigest
+        return [ArtifactDigest.from_node(n) for n in graph.get_nodes_by_type("decision")]
+
+    def test_exact_and_near_duplicates_map_to_first_seen(self, project_with_purpose):
+        """Exact summaries and >= threshold keyword overlap are duplicates of the first."""
+        events, graph, config = project_with_purpose
+        first = self._add(events, graph, "Use SQLite for local event storage", "p1")
+        exact = self._add(events, graph, "use sqlite for local event storage ", "p2")
+        other = self._add(events, graph, "Render reports as static HTML pages", "p3")
+
+        checker = CoherenceChecker(events, graph, config)
+        duplicates = checker._detect_duplicates(self._digests(graph))
+
+        assert duplicates == {exact: first}
+        assert other not in duplicates
+
+    def test_covers_artifacts_beyond_digest_cap(self, project_with_purpose):
+        """Duplicates past the 20-digest prefix are still detected by check()."""
+        events, graph, config = project_with_purpose
+        for i in range(30):
+            self._add(events, graph, f"Unique topic{i} alpha{i} beta{i} gamma{i}", f"p{i}")
+        original = self._add(events, graph, "Cache parsed manifests between runs", "orig")
+        duplicate = self._add(events, graph, "Cache parsed manifests between runs", "dup")
+
+        checker = CoherenceChecker(events, graph, config)
+        result = checker.check(force_full=True)
+
+        dup_entities = [e for e in result.entities if e.status == "duplicate"]
+        assert [(e.id, e.duplicate_of) for e in dup_entities] == [(duplicate, original)]
+
+    def test_signatures_persist_in_graph(self, project_with_purpose):
+        """Signatures are stored once and reused on the next check."""
+        events, graph, config = project_with_purpose
+        node_id = self._add(events, graph, "Compress archived events with zstd", "p1")
+
+        checker = CoherenceChecker(events, graph, config)
+        digests = self._digests(graph)
+        checker._detect_duplicates(digests)
+
+        stored = graph.get_minhash_signatures([node_id])
+        assert node_id in stored
+
+        calls = []
+        original_set = graph.set_minhash_signatures
+        graph.set_minhash_signatures = lambda rows, **kw: calls.append(list(rows)) or original_set(rows, **kw)
+        checker._detect_duplicates(digests)
+        assert calls == []
+
+
+class TestMinHash:
+    """Test MinHash signatures and LSH candidate lookup."""
+
+    def test_identical_sets_share_signature(self):
+        from babel.core.minhash import minhash_signature
+        assert minhash_signature(["a", "b", "c"]) == minhash_signature(["c", "b", "a", "a"])
+
+    def test_lsh_finds_similar_not_disjoint(self):
+        from babel.core.minhash import MinHashLSH, minhash_signature
+        base = [f"w{i}" for i in range(20)]
+        lsh = MinHashLSH()
+        lsh.insert("base", minhash_signature(base))
+        lsh.insert("disjoint", minhash_signature([f"x{i}" for i in range(20)]))
+
+        candidates = lsh.query(minhash_signature(base[:19] + ["extra"]))
+
+        assert "base" in candidates
+        assert "disjoint" not in candidates
+
+    def test_signature_pack_round_trip(self):
+        from babel.core.minhash import minhash_signature, pack_signature, unpack_signature
+        signature = minhash_signature(["alpha", "beta"])
+        assert unpack_signature(pack_signature(signature)) == signature
+
+
+class TestIncrementalState:
+    """Test persisted per-artifact coherence state."""
+
+    @staticmethod
+    def _add(events, graph, artifact_type, summary, proposal_id):
+        event = confirm_artifact(
+            proposal_id=proposal_id,
+            artifact_type=artifact_type,
+            content={"summary": summary}
+        )
+        events.append(event)
+        graph._project_event(event)
+        return f"{artifact_type}_{event.id}"
+
+    @staticmethod
+    def _count_conflict_checks(checker):
+        calls = []
+        original = checker.digest_builder.check_conflicts_fast
+        checker.digest_builder.check_conflicts_fast = (
+            lambda digest, constraints: calls.append(digest.id) or original(digest, constraints)
+        )
+        return calls
+
+    def test_full_check_reuses_state(self, project_with_artifacts):
+        """Unchanged artifacts are not re-evaluated on a full check."""
+        events, graph, config = project_with_artifacts
+        checker = CoherenceChecker(events, graph, config)
+        first = checker.check(force_full=True)
+
+        calls = self._count_conflict_checks(checker)
+        second = checker.check(force_full=True)
+
+        assert calls == []
+        assert [e.to_dict() for e in second.entities] == [e.to_dict() for e in first.entities]
+
+    def test_tension_emitted_once(self, project_with_purpose):
+        """Repeated full checks don't re-emit known TENSION_DETECTED events."""
+        events, graph, config = project_with_purpose
+        self._add(events, graph, "constraint", "Must work offline", "p1")
+        self._add(events, graph, "decision", "Add real-time sync feature", "p2")
+        checker = CoherenceChecker(events, graph, config)
+
+        checker.check(force_full=True)
+        checker.check(force_full=True)
+
+        assert len(events.read_by_type(EventType.TENSION_DETECTED)) == 1
+
+    def test_new_constraint_rechecks_existing_artifacts(self, project_with_purpose):
+        """A new constraint is checked against existing artifacts, which enter the incremental scope."""
+        events, graph, config = project_with_purpose
+        decision_id = self._add(events, graph, "decision", "Add real-time sync feature", "p1")
+        checker = CoherenceChecker(events, graph, config)
+        assert checker.check().status == "coherent"
+
+        constraint_id = self._add(events, graph, "constraint", "Must work offline", "p2")
+        calls = self._count_conflict_checks(checker)
+        result = checker.check()
+
+        tensions = [e for e in result.entities if e.status == "tension"]
+        assert [(e.id, e.related_to) for e in tensions] == [(decision_id, [constraint_id])]
+        assert tensions[0].severity == "critical"
+        assert sorted(calls) == sorted([decision_id, constraint_id])
+
+    def test_deprecated_constraint_clears_conflict(self, project_with_purpose):
+        """Deprecating a constraint removes it from other artifacts' conflicts."""
+        from babel.core.events import deprecate_artifact
+        events, graph, config = project_with_purpose
+        constraint_id = self._add(events, graph, "constraint", "Must work offline", "p1")
+        self._add(events, graph, "decision", "Add real-time sync feature", "p2")
+        checker = CoherenceChecker(events, graph, config)
+        assert checker.check(force_full=True).status == "tension"
+
+        events.append(deprecate_artifact(constraint_id, "No longer needed"))
+        result = checker.check(force_full=True)
+
+        assert all(e.status != "tension" for e in result.entities)
+        assert constraint_id not in {e.id for e in result.entities}
+
+    def test_relinked_artifact_becomes_coherent(self, project_with_purpose):
+        """A new purpose link is picked up without re-digesting the artifact."""
+        from babel.core.graph import Edge
+        events, graph, config = project_with_purpose
+        self._add(events, graph, "constraint", "Must work offline", "p1")
+        decision_id = self._add(events, graph, "decision", "Add real-time sync feature", "p2")
+        checker = CoherenceChecker(events, graph, config)
+        checker.check(force_full=True)
+
+        purpose = graph.get_nodes_by_type("purpose")[0]
+        graph.add_edge(Edge(source_id=purpose.id, target_id=decision_id,
+                            relation="supports", event_id="manual"))
+        result = checker.check(force_full=True)
+
+        entity = next(e for e in result.entities if e.id == decision_id)
+        assert (entity.status, entity.reason) == ("coherent", "Linked to purpose")
+
+    def test_state_cleared_on_rebuild(self, project_with_artifacts):
+        """Coherence state is a projection: rebuild drops it."""
+        events, graph, config = project_with_artifacts
+        CoherenceChecker(events, graph, config).check(force_full=True)
+        assert graph.get_coherence_states()
+
+        graph.rebuild_from_events(events)
+
+        assert graph.get_coherence_states() == {}
+
+
+class TestTensionRecording:
+    """Test deduplicated, batched TENSION_DETECTED emission."""
+
+    @pytest.fixture
+    def conflicting(self, project_with_purpose):
+        events, graph, config = project_with_purpose
+        ids = []
+        for proposal_id, artifact_type, summary in [
+            ("p1", "constraint", "Must work offline"),
+            ("p2", "decision", "Add real-time sync feature"),
+        ]:
+            event = confirm_artifact(proposal_id=proposal_id, artifact_type=artifact_type,
+                                     content={"summary": summary})
+            events.append(event)
+            graph._project_event(event)
+            ids.append(f"{artifact_type}_{event.id}")
+        return events, graph, config, ids
+
+    def test_tensions_projected_into_graph(self, conflicting):
+        """Detected tensions get their tensions_with edges right away."""
+        events, graph, config, (constraint_id, decision_id) = conflicting
+        CoherenceChecker(events, graph, config).check()
+
+        assert [sorted(ids) for ids in graph.get_detected_tensions().values()] == [
+            sorted([constraint_id, decision_id])
+        ]
+
+    def test_recorded_pairs_not_reemitted(self, conflicting):
+        """Pairs with existing tensions_with edges are skipped even without state."""
+        events, graph, config, ids = conflicting
+        CoherenceChecker(events, graph, config).check()
+        graph.delete_coherence_states(ids)
+
+        result = CoherenceChecker(events, graph, config).check(force_full=True)
+
+        assert len(events.read_by_type(EventType.TENSION_DETECTED)) == 1
+        assert [e.status for e in result.entities if e.id == ids[1]] == ["tension"]
+
+    def test_tension_records_not_checked_as_artifacts(self, conflicting):
+        """Detected tension nodes stay out of the artifact set."""
+        events, graph, config, ids = conflicting
+        checker = CoherenceChecker(events, graph, config)
+        checker.check()
+
+        result = checker.check(force_full=True)
+
+        assert {e.id for e in result.entities} == set(ids)
+
+
+class TestExclusionIndex:
+    """Deprecated and tension IDs are folded from events since the watermark."""
+
+    @pytest.fixture
+    def dual_project(self, tmp_path):
+        events = DualEventStore(tmp_path)
+        graph = GraphStore(tmp_path / "graph.db")
+        purpose = declare_purpose("Build a tool that preserves intent")
+        events.append(purpose)
+        graph._project_event(purpose)
+        ids = []
+        for proposal_id, artifact_type, summary in [
+            ("p1", "constraint", "Must work offline"),
+            ("p2", "decision", "Add real-time sync feature"),
+        ]:
+            event = confirm_artifact(proposal_id=proposal_id, artifact_type=artifact_type,
+                                     content={"summary": summary})
+            events.append(event)
+            graph._project_event(event)
+            ids.append(f"{artifact_type}_{event.id}")
+        return events, graph, Config(), ids
+
+    def test_index_caught_up_from_new_events(self, dual_project, monkeypatch):
+        from babel.core.events import deprecate_artifact
+        events, graph, config, (constraint_id, decision_id) = dual_project
+        checker = CoherenceChecker(events, graph, config)
+        checker.check(force_full=True)  # Records the tension after indexing
+
+        events.append(deprecate_artifact(constraint_id, "No longer needed"))
+        scanned = []
+        real_read_by_type = events.read_by_type
+        monkeypatch.setattr(events, "read_by_type", lambda t: scanned.append(t) or real_read_by_type(t))
+        result = checker.check(force_full=True)
+
+        assert EventType.ARTIFACT_DEPRECATED not in scanned
+        assert EventType.TENSION_DETECTED not in scanned
+        assert constraint_id not in {e.id for e in result.entities}
+        stored = graph.get_meta(EXCLUSIONS_META_KEY)
+        assert stored["deprecated"] == [constraint_id]
+        assert [sorted(pair) for pair in stored["tensions"].values()] == [sorted([constraint_id, decision_id])]
+        assert len(events.read_by_type(EventType.TENSION_DETECTED)) == 1
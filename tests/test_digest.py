@@ -312,3 +312,65 @@ class TestEdgeCases:
 
         # Should return something reasonable
         assert isinstance(result, str)
+
+
+class TestDigestCache:
+    """Test content-hash keyed digest memoization."""
+
+    LONG_TEXT = (
+        "Use Redis for caching because rate limits require local storage "
+        "and reduce API calls from 1000/min to 50/min."
+    )
+
+    def test_unchanged_text_extracted_once(self):
+        """Repeated digests of the same text skip keyword extraction."""
+        from babel.presentation.digest import DigestGenerator
+
+        generator = DigestGenerator()
+        calls = []
+        original = generator._extract_keywords
+        generator._extract_keywords = lambda *a: calls.append(a) or original(*a)
+
+        first = generator.generate(self.LONG_TEXT)
+        second = generator.generate(self.LONG_TEXT)
+
+        assert first == second
+        assert len(calls) == 1
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted past the bound."""
+        from babel.presentation.digest import DigestCache
+
+        cache = DigestCache(max_entries=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        cache.get("a")
+        cache.put("c", "3")
+
+        assert cache.get("b") is None
+        assert (cache.get("a"), cache.get("c")) == ("1", "3")
+
+    def test_persisted_cache_warms_new_generator(self, tmp_path):
+        """A saved cache serves digests to the next process without YAKE."""
+        from babel.presentation.digest import DigestCache, DigestGenerator
+
+        path = tmp_path / "digests.json"
+        first = DigestGenerator(cache=DigestCache(path))
+        digest = first.generate(self.LONG_TEXT)
+        first.cache.save()
+
+        second = DigestGenerator(cache=DigestCache(path))
+        calls = []
+        second._extract_keywords = lambda *a: calls.append(a) or []
+
+        assert second.generate(self.LONG_TEXT) == digest
+        assert calls == []
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        """Unreadable cache files start empty (cache is rebuildable)."""
+        from babel.presentation.digest import DigestCache
+
+        path = tmp_path / "digests.json"
+        path.write_text("{not json")
+
+        assert DigestCache(path).get("anything") is None
@@ -293,4 +293,86 @@ class TestParentIdConsistency:
             content={"summary": "Use Postgres"}
         )
 
-        assert event.parent_id == "proposal_vwx234"
\ No newline at end of file
+        assert event.parent_id == "proposal_vwx234"
+
+class TestIncrementalReads:
+    """Watermark catch-up and append listeners for derived indexes."""
+
+    def test_read_since_returns_only_new_events(self, tmp_path):
+        """Events appended after a watermark are returned, older ones are not."""
+        from babel.core.events import DualEventStore
+
+        store = DualEventStore(tmp_path)
+        store.append(capture_conversation("Before"))
+        mark = store.watermark()
+        store.append(capture_conversation("After"))
+
+        new_events = store.read_since(mark)
+
+        assert [e.data['content'] for e in new_events] == ["After"]
+
+    def test_read_since_detects_rewrite(self, tmp_path):
+        """A rewritten file invalidates the watermark."""
+        from babel.core.events import DualEventStore
+
+        store = DualEventStore(tmp_path)
+        first = capture_conversation("Local thought")
+        store.append(first)
+        store.append(capture_conversation("Another"))
+        mark = store.watermark()
+
+        store.promote(first.id)  # Rewrites local file
+
+        assert store.read_since(mark) is None
+        assert store.read_since(None) is None
+
+    def test_read_since_stops_at_until(self, tmp_path):
+        """An upper watermark bounds the window that is read."""
+        from babel.core.events import DualEventStore
+
+        store = DualEventStore(tmp_path)
+        start = store.watermark()
+        store.append(capture_conversation("Inside"))
+        end = store.watermark()
+        store.append(capture_conversation("Outside"))
+
+        window = store.read_since(start, until=end)
+
+        assert [e.data['content'] for e in window] == ["Inside"]
+
+    def test_subscribers_notified_on_append(self, tmp_path):
+        """Listeners receive each appended event; failures don't block appends."""
+        from babel.core.events import DualEventStore
+
+        store = DualEventStore(tmp_path)
+        received = []
+
+        def failing(event):
+            raise RuntimeError("listener bug")
+
+        store.subscribe(failing)
+        store.subscribe(received.append)
+        event = store.append(capture_conversation("Notify me"))
+
+        assert received == [event]
+        assert store.read_all()[-1].id == event.id
+
+    def test_append_batch_writes_and_notifies(self, tmp_path):
+        """A batch is written in order, refreshes caches and notifies per event."""
+        from babel.core.events import DualEventStore
+
+        store = DualEventStore(tmp_path)
+        store.read_by_type(EventType.CONVERSATION_CAPTURED)  # Warm caches
+        received = []
+        store.subscribe(received.append)
+        batch = [
+            capture_conversation("First"),
+            declare_purpose("Shared purpose"),
+            capture_conversation("Second"),
+        ]
+
+        store.append_batch(batch)
+
+        assert received == batch
+        assert [e.data['content'] for e in store.read_by_type(EventType.CONVERSATION_CAPTURED)] == ["First", "Second"]
+        assert [e.id for e in store.read_all()] == [e.id for e in batch]
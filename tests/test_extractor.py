@@ -12,8 +12,14 @@ No real LLM calls — tests work without API keys or packages.
 
 import pytest
 import json
-
-from babel.services.extractor import Extractor, Proposal, ExtractionQueue
+import threading
+import time
+
+from babel.services import extractor as extractor_module
+from babel.services.extractor import (
+    Extractor, Proposal, ExtractionQueue, ExistingArtifact, QueuedExtraction,
+    calculate_similarity, find_similar
+)
 from babel.services.providers import MockProvider
 
 
@@ -141,6 +147,93 @@ class TestProposalFormat:
         assert "Must work offline" in text
 
 
+# ============================================================================
+# DEDUPLICATION TESTS
+# ============================================================================
+
+class TestDeduplication:
+    """P7: Proposals matching existing artifacts are dropped (offline, HC3)."""
+
+    EXISTING = [
+        ExistingArtifact("decision", "Use SQLite for local storage", "d1"),
+        ExistingArtifact("constraint", "Must work offline", "c1"),
+        ExistingArtifact("decision", "", "empty"),
+    ]
+
+    def _proposal(self, summary):
+        return Proposal("src", "decision", {"summary": summary}, 0.8, "test")
+
+    def test_drops_similar_keeps_new(self, mock_extractor):
+        proposals = [
+            self._proposal("use sqlite for LOCAL storage!"),
+            self._proposal("Add a caching layer for API responses"),
+            self._proposal("Storage for local SQLite use"),
+            self._proposal(""),
+        ]
+
+        kept = mock_extractor._deduplicate_proposals(proposals, self.EXISTING)
+
+        assert [p.content["summary"] for p in kept] == [
+            "Add a caching layer for API responses", ""
+        ]
+
+    @pytest.mark.parametrize("cdist", [True, False])
+    def test_find_similar_matches_pairwise_similarity(self, monkeypatch, cdist):
+        """Batched scoring (with or without numpy) agrees with calculate_similarity."""
+        if cdist and not extractor_module.CDIST_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(extractor_module, "CDIST_AVAILABLE", cdist)
+
+        queries = ["fix cache bug", "bug in cache fix", "rewrite parser", "", "..."]
+        choices = ["Fix the cache bug", "Document the API", ""]
+
+        for threshold in (0.5, 0.6, 0.85, 1.0):
+            expected = [
+                any(calculate_similarity(q, c) >= threshold for c in choices)
+                for q in queries
+            ]
+            assert find_similar(queries, choices, threshold) == expected
+
+    def test_find_similar_without_choices(self):
+        assert find_similar(["anything"], ["", "!!"], 0.5) == [False]
+
+
+class TestExistingContext:
+    """Existing artifacts in the prompt are packed to a token budget by relevance."""
+
+    def test_budget_configurable(self, monkeypatch):
+        assert Extractor(context_token_budget=300).context_token_budget == 300
+        monkeypatch.setenv("BABEL_EXTRACT_CONTEXT_TOKENS", "800")
+        assert Extractor().context_token_budget == 800
+
+    def test_relevant_artifacts_fill_budget(self, mock_extractor):
+        existing = [
+            ExistingArtifact("decision", f"Unrelated decision number {n}", f"u{n}")
+            for n in range(50)
+        ]
+        existing.insert(10, ExistingArtifact("decision", "Cache parsed events in memory", "cache"))
+        mock_extractor.context_token_budget = 40
+
+        prompt = mock_extractor._build_user_prompt("Should we cache the parsed events?", existing)
+
+        lines = [line for line in prompt.splitlines() if line.startswith("- [")]
+        assert lines[0] == "- [decision] Cache parsed events in memory"
+        assert 1 < len(lines) < len(existing)
+        # Ties prefer the most recent artifacts
+        assert lines[1] == "- [decision] Unrelated decision number 49"
+
+    def test_cached_token_counts_used(self, mock_extractor):
+        existing = [
+            ExistingArtifact("decision", "Small", "a", tokens=1),
+            ExistingArtifact("decision", "Claims to be huge", "b", tokens=5000),
+        ]
+
+        prompt = mock_extractor._build_user_prompt("text", existing)
+
+        assert "Small" in prompt
+        assert "Claims to be huge" not in prompt
+
+
 # ============================================================================
 # EXTRACTION QUEUE TESTS
 # ============================================================================
@@ -249,6 +342,277 @@ class TestExtractionQueue:
         assert proposals == []  # No proposals due to failure
         assert extractor.queue.count() == 1  # Item should remain for retry
 
+    def test_identical_texts_collapse(self, tmp_path):
+        """Queuing the same text twice keeps one pending item."""
+        queue = ExtractionQueue(tmp_path / "queue.jsonl")
+
+        assert queue.add("Same text", "src_1") is True
+        assert queue.add("Same text", "src_2") is False
+        queue.add("Other text", "src_3")
+
+        assert queue.count() == 2
+        assert [i.source_id for i in queue.get_all()] == ["src_1", "src_3"]
+
+    def test_count_reads_cursor_only(self, tmp_path, monkeypatch):
+        """count() does not parse the queue log."""
+        queue = ExtractionQueue(tmp_path / "queue.jsonl")
+        queue.add("Text 1", "src_1")
+        queue.add("Text 2", "src_2")
+
+        def fail(*args):
+            raise AssertionError("log parsed")
+        monkeypatch.setattr(queue, "_read_from", fail)
+
+        assert queue.count() == 2
+
+    def test_cursor_rebuilt_when_missing(self, tmp_path):
+        """Deleting the cursor file loses nothing (rebuilt from the log)."""
+        queue = ExtractionQueue(tmp_path / "queue.jsonl")
+        queue.add("Text 1", "src_1")
+        queue.add("Text 1", "src_1")
+        queue.add("Text 2", "src_2")
+
+        queue.cursor_path.unlink()
+
+        assert ExtractionQueue(tmp_path / "queue.jsonl").count() == 2
+
+    def test_advance_keeps_items_added_meanwhile(self, tmp_path):
+        """Items appended during processing stay pending; failures are re-appended."""
+        queue_path = tmp_path / "queue.jsonl"
+        queue = ExtractionQueue(queue_path)
+        queue.add("Text 1", "src_1")
+        queue.add("Text 2", "src_2")
+
+        items, end = queue.read_pending()
+        queue.add("Text 3", "src_3")
+        logged = queue_path.read_bytes()
+
+        queue.advance(end, retry=[items[1]])
+
+        assert [i.text for i in queue.get_all()] == ["Text 3", "Text 2"]
+        assert queue.count() == 2
+        assert queue_path.read_bytes().startswith(logged)  # Appended, not rewritten
+
+    def test_advance_drains_queue(self, tmp_path):
+        """A fully processed queue leaves no files behind."""
+        queue = ExtractionQueue(tmp_path / "queue.jsonl")
+        queue.add("Text", "src")
+
+        _, end = queue.read_pending()
+        queue.advance(end)
+
+        assert queue.count() == 0
+        assert not queue.path.exists()
+        assert not queue.cursor_path.exists()
+
+    def test_process_queue_through_orchestrator(self, tmp_path):
+        """Queued items are extracted as parallel LLM tasks, results in queue order."""
+        from babel.orchestrator import TaskOrchestrator
+        from babel.orchestrator.config import OrchestratorConfig
+        from babel.services.providers import LLMResponse
+
+        lock = threading.Lock()
+        active = []
+        peak = []
+
+        class EchoProvider(MockProvider):
+            def complete(self, system, user, max_tokens=None):
+                with lock:
+                    active.append(1)
+                    peak.append(len(active))
+                time.sleep(0.3)  # Longer than the 10 req/s rate-limit interval
+                with lock:
+                    active.pop()
+                if "fail" in user:
+                    raise Exception("LLM unavailable")
+                summary = user.split("Queued item ")[1].split()[0]
+                return LLMResponse(
+                    text=json.dumps({"artifacts": [{
+                        "type": "decision", "summary": f"Item {summary}",
+                        "content": {}, "confidence": 0.9, "rationale": "test"
+                    }]}),
+                    input_tokens=10,
+                    output_tokens=10
+                )
+
+        extractor = Extractor(provider=EchoProvider(), queue_path=tmp_path / "queue.jsonl")
+        extractor.BATCH_MAX_ITEMS = 1  # One prompt per item: exercise concurrent calls
+        for n in range(5):
+            extractor.queue.add(f"Queued item {n} text", f"src_{n}")
+        extractor.queue.add("Queued item 9 will fail", "src_9")
+
+        orchestrator = TaskOrchestrator(OrchestratorConfig(io_workers=4, llm_concurrent=2))
+        try:
+            proposals = extractor.process_queue(orchestrator=orchestrator)
+        finally:
+            orchestrator.shutdown(wait=True)
+
+        assert [p.content["summary"] for p in proposals] == [f"Item {n}" for n in range(5)]
+        assert [i.source_id for i in extractor.queue.get_all()] == ["src_9"]
+        assert max(peak) == 2  # Parallel, capped at llm_concurrent
+
+
+class BatchEchoProvider(MockProvider):
+    """Answers batch prompts item by item (one decision per text), logging calls."""
+
+    def __init__(self, batch_reply=None):
+        super().__init__()
+        self.batch_reply = batch_reply  # Override batch responses (text or callable)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _artifact(text):
+        return {"type": "decision", "summary": text.strip(), "content": {},
+                "confidence": 0.9, "rationale": "test"}
+
+    def complete(self, system, user, max_tokens=None):
+        from babel.services.providers import LLMResponse
+        with self._lock:
+            self.calls.append(user)
+        if "=== ITEM " not in user:
+            text = user.split("Extract artifacts from this text:\n\n", 1)[1]
+            return LLMResponse(text=json.dumps({"artifacts": [self._artifact(text)]}))
+        if self.batch_reply is not None:
+            reply = self.batch_reply(user) if callable(self.batch_reply) else self.batch_reply
+            return LLMResponse(text=reply)
+        sections = user.split("=== ITEM ")[1:]
+        items = []
+        for section in sections:
+            number, text = section.split(" ===\n", 1)
+            items.append({"item": int(number), "artifacts": [self._artifact(text)]})
+        return LLMResponse(text=json.dumps({"items": items}))
+
+
+def _queued_extractor(tmp_path, provider, count):
+    extractor = Extractor(provider=provider, queue_path=tmp_path / "queue.jsonl")
+    for n in range(count):
+        extractor.queue.add(f"Text {n}", f"src_{n}")
+    return extractor
+
+
+class TestBatchedExtraction:
+    """Queued texts share batch prompts; responses are split back per source."""
+
+    def test_queue_packed_into_batch_prompts(self, tmp_path):
+        provider = BatchEchoProvider()
+        extractor = _queued_extractor(tmp_path, provider, 25)
+
+        proposals = extractor.process_queue()
+
+        assert len(provider.calls) == 3  # 10 + 10 + 5, not 25 prompts
+        assert [p.content["summary"] for p in proposals] == [f"Text {n}" for n in range(25)]
+        assert [p.source_id for p in proposals] == [f"src_{n}" for n in range(25)]
+        assert extractor.queue.count() == 0
+
+    def test_batches_respect_token_budget(self, tmp_path):
+        extractor = Extractor(provider=BatchEchoProvider())
+        extractor.BATCH_TOKEN_BUDGET = 100
+        items = [QueuedExtraction(text="word " * 40, source_id=f"src_{n}")
+                 for n in range(5)]
+        items.insert(2, QueuedExtraction(text="word " * 250, source_id="big"))
+
+        batches = extractor._pack_batches(items)
+
+        assert [[i.source_id for i in b] for b in batches] == [
+            ["src_0", "src_1"], ["big"], ["src_2", "src_3"], ["src_4"]
+        ]
+
+    def test_unparseable_batch_falls_back_to_single_calls(self, tmp_path):
+        provider = BatchEchoProvider(batch_reply="Sorry, I can't do that.")
+        extractor = _queued_extractor(tmp_path, provider, 3)
+
+        proposals = extractor.process_queue()
+
+        assert [p.content["summary"] for p in proposals] == ["Text 0", "Text 1", "Text 2"]
+        assert len(provider.calls) == 4  # Batch, then one per item
+
+    def test_single_item_shaped_batch_reply_falls_back(self, tmp_path):
+        reply = json.dumps({"artifacts": [BatchEchoProvider._artifact("Text 0")]})
+        provider = BatchEchoProvider(batch_reply=reply)
+        extractor = _queued_extractor(tmp_path, provider, 2)
+
+        proposals = extractor.process_queue()
+
+        assert [(p.source_id, p.content["summary"]) for p in proposals] == [
+            ("src_0", "Text 0"), ("src_1", "Text 1")
+        ]
+        assert len(provider.calls) == 3  # Batch, then one per item
+
+    def test_batch_prompt_has_one_output_format(self):
+        assert Extractor.BATCH_SYSTEM_PROMPT.count("OUTPUT FORMAT") == 1
+        assert Extractor.SYSTEM_PROMPT.count("OUTPUT FORMAT") == 1
+        assert '"items"' in Extractor.BATCH_SYSTEM_PROMPT
+        assert Extractor.BATCH_SYSTEM_PROMPT.startswith(Extractor.EXTRACTION_INSTRUCTIONS)
+
+    def test_items_missing_from_response_extracted_alone(self, tmp_path):
+        reply = json.dumps({"items": [
+            {"item": 1, "artifacts": []},
+            {"item": 3, "artifacts": [BatchEchoProvider._artifact("Text 2")]},
+            {"item": 7, "artifacts": [BatchEchoProvider._artifact("Unknown item")]},
+        ]})
+        provider = BatchEchoProvider(batch_reply=reply)
+        extractor = _queued_extractor(tmp_path, provider, 3)
+
+        proposals = extractor.process_queue()
+
+        assert [(p.source_id, p.content["summary"]) for p in proposals] == [
+            ("src_1", "Text 1"), ("src_2", "Text 2")
+        ]
+        assert len(provider.calls) == 2  # Batch, then item 2 alone
+
+    def test_batches_run_concurrently_through_orchestrator(self, tmp_path):
+        from babel.orchestrator import TaskOrchestrator
+        from babel.orchestrator.config import OrchestratorConfig
+
+        provider = BatchEchoProvider()
+        extractor = _queued_extractor(tmp_path, provider, 30)
+        extractor.BATCH_MAX_ITEMS = 5
+
+        orchestrator = TaskOrchestrator(OrchestratorConfig(llm_concurrent=3, llm_rate_limit=100.0))
+        try:
+            proposals = extractor.process_queue(orchestrator=orchestrator)
+        finally:
+            orchestrator.shutdown(wait=True)
+
+        assert len(provider.calls) == 6
+        assert [p.source_id for p in proposals] == [f"src_{n}" for n in range(30)]
+
+    def test_concurrent_batches_report_once_with_summed_usage(self, tmp_path):
+        from babel.orchestrator import TaskOrchestrator
+        from babel.orchestrator.config import OrchestratorConfig
+        from babel.services.providers import LLMResponse
+
+        class UsageProvider(BatchEchoProvider):
+            def complete(self, system, user, max_tokens=None):
+                response = super().complete(system, user, max_tokens)
+                return LLMResponse(text=response.text, input_tokens=100, output_tokens=10)
+
+        events = []
+        provider = UsageProvider()
+        extractor = Extractor(
+            provider=provider, queue_path=tmp_path / "queue.jsonl",
+            on_llm_start=lambda: events.append("start"),
+            on_llm_complete=lambda response: events.append(response),
+            on_llm_progress=lambda done, total: events.append((done, total))
+        )
+        for n in range(9):
+            extractor.queue.add(f"Text {n}", f"src_{n}")
+        extractor.BATCH_MAX_ITEMS = 3
+
+        orchestrator = TaskOrchestrator(OrchestratorConfig(llm_concurrent=3, llm_rate_limit=100.0))
+        try:
+            extractor.process_queue(orchestrator=orchestrator)
+        finally:
+            orchestrator.shutdown(wait=True)
+
+        assert events[0] == "start"
+        assert events[1:4] == [(1, 3), (2, 3), (3, 3)]
+        assert len(events) == 5
+        assert events[4].input_tokens == 300
+        assert events[4].output_tokens == 30
+        assert extractor.last_response is events[4]
+
 
 # ============================================================================
 # EXTRACTOR AVAILABILITY TESTS
@@ -385,4 +749,103 @@ class TestProviderExtraction:
     
     def test_extractor_is_available_with_provider(self, provider_extractor):
         """Extractor reports available when provider is set."""
-        assert provider_extractor.is_available is True
\ No newline at end of file
+        assert provider_extractor.is_available is True
+
+# ============================================================================
+# STREAMING EXTRACTION TESTS
+# ============================================================================
+
+class StreamingProvider(MockProvider):
+    """MockProvider that streams a fixed response in small chunks, logging each."""
+
+    def __init__(self, text, chunk_size=7):
+        super().__init__()
+        self.text = text
+        self.chunk_size = chunk_size
+        self.log = []
+
+    def complete_stream(self, system, user, max_tokens=2048):
+        from babel.services.providers import LLMResponse
+        for i in range(0, len(self.text), self.chunk_size):
+            self.log.append("chunk")
+            yield self.text[i:i + self.chunk_size]
+        self.log.append("done")
+        yield LLMResponse(text=self.text, input_tokens=10, output_tokens=20)
+
+
+def _artifacts_response(*summaries):
+    return "```json\n" + json.dumps({
+        "artifacts": [
+            {"type": "decision", "summary": s, "content": {"why": "{braces} [and] \"quotes\""},
+             "confidence": 0.8, "rationale": "test"}
+            for s in summaries
+        ],
+        "meta": {"extractable": True}
+    }, indent=2) + "\n```"
+
+
+class TestStreamingExtraction:
+    """Proposals are parsed, deduplicated and shown while the response streams."""
+
+    def test_proposal_shown_before_response_completes(self):
+        provider = StreamingProvider(_artifacts_response("Use SQLite for storage", "Cache LLM calls"))
+        extractor = Extractor(
+            provider=provider,
+            on_proposal=lambda p: provider.log.append(p.content["summary"]),
+            on_llm_complete=lambda r: provider.log.append("complete")
+        )
+
+        proposals = extractor.extract("text", "src_1", allow_mock=False)
+
+        assert [p.content["summary"] for p in proposals] == ["Use SQLite for storage", "Cache LLM calls"]
+        first = provider.log.index("Use SQLite for storage")
+        assert provider.log.index("chunk", first) > first  # More text arrived after it
+        assert provider.log.index("done") < provider.log.index("complete")
+        assert extractor.last_response.total_tokens == 30
+
+    def test_duplicates_dropped_as_they_arrive(self):
+        provider = StreamingProvider(_artifacts_response("Use SQLite for storage", "Cache LLM calls"))
+        shown = []
+        extractor = Extractor(provider=provider, on_proposal=shown.append)
+        existing = [ExistingArtifact(artifact_type="decision", summary="Use SQLite for storage")]
+
+        proposals = extractor.extract("text", "src_1", allow_mock=False, existing_context=existing)
+
+        assert [p.content["summary"] for p in proposals] == ["Cache LLM calls"]
+        assert shown == proposals
+
+    def test_truncated_response_keeps_complete_artifacts(self):
+        text = _artifacts_response("Use SQLite for storage", "Cache LLM calls")
+        provider = StreamingProvider(text[:text.index("Cache LLM calls")])
+
+        proposals = Extractor(provider=provider).extract("text", "src_1", allow_mock=False)
+
+        assert [p.content["summary"] for p in proposals] == ["Use SQLite for storage"]
+
+
+class TestJsonArrayStream:
+    """Items of a top-level array member are returned as soon as they close."""
+
+    def test_items_match_full_parse_at_any_chunking(self):
+        from babel.core.jsonstream import JsonArrayStream
+        text = _artifacts_response("a \\ b", "c } d", "e")
+        expected = json.loads(text[len("```json\n"):-len("\n```")])["artifacts"]
+
+        for size in (1, 2, 5, 64, len(text)):
+            stream = JsonArrayStream("artifacts")
+            items = []
+            for i in range(0, len(text), size):
+                items.extend(stream.feed(text[i:i + size]))
+            assert items == expected
+            assert stream.count == 3
+
+    def test_ignores_same_key_nested_and_invalid_items(self):
+        from babel.core.jsonstream import JsonArrayStream
+        stream = JsonArrayStream("artifacts")
+
+        items = stream.feed(
+            'Here you go: {"meta": {"artifacts": [{"nested": 1}]}, '
+            '"artifacts": [{"ok": 1}, {"bad": tru}, {"ok": 2}]}'
+        )
+
+        assert items == [{"ok": 1}, {"ok": 2}]
@@ -17,7 +17,10 @@ SKIP CONDITIONS:
 import pytest
 import subprocess
 import os
+import sys
+import time
 
+from babel.core.git_access import CatFile
 from babel.services.git import GitIntegration, CommitInfo, format_commit_for_extraction
 
 
@@ -165,6 +168,84 @@ class TestCommitReading:
         assert first_again.message == "Initial commit"
 
 
+def _commit(repo, message, files, *extra):
+    for name, content in files.items():
+        (repo / name).write_text(content)
+    subprocess.run(["git", "add", "-A"], cwd=repo, capture_output=True, check=True)
+    subprocess.run(["git", "commit", "-m", message, *extra], cwd=repo, capture_output=True, check=True)
+
+
+@requires_git
+class TestBatchedAccess:
+    """Commit data for many commits comes from a fixed number of git processes."""
+
+    def test_many_commits_fixed_process_count(self, temp_git_repo):
+        for n in range(12):
+            _commit(temp_git_repo, f"Change {n}", {f"mod{n}.py": f"# Module {n}\n"})
+        git = GitIntegration(temp_git_repo)
+        shas = [c.hash for c in git.recent_commits(12)]
+
+        commits = git.get_commits(shas, include_diff=True)
+
+        assert [c.message for c in commits] == [f"Change {n}" for n in reversed(range(12))]
+        assert commits[0].files == ["mod11.py"]
+        assert commits[0].structural.added == ["mod11.py"]
+        assert commits[0].comment_diff == "[mod11.py] # Module 11"
+        # log for the list, cat-file, one log each for changes and patches
+        assert git.access.processes <= 5
+
+    def test_results_memoized_by_sha(self, temp_git_repo):
+        git = GitIntegration(temp_git_repo)
+        git.get_last_commit()
+        git.get_structural_changes("HEAD")
+        spawned = git.access.processes
+
+        git.get_last_commit()
+        git.get_structural_changes("HEAD")
+        git.extract_comment_diff("HEAD")
+
+        assert git.access.processes == spawned
+
+    def test_message_with_separator_characters(self, temp_git_repo):
+        """Subjects and bodies are read from the commit object, not split on '|'."""
+        _commit(temp_git_repo, "Use a | b", {"x.txt": "x"}, "-m", "Body | with pipes")
+        commit = GitIntegration(temp_git_repo).get_last_commit()
+
+        assert commit.message == "Use a | b"
+        assert commit.body == "Body | with pipes"
+        assert commit.author == "Test User"
+        assert commit.email == "test@test.com"
+        assert commit.date
+
+    def test_renames_and_root_commit(self, temp_git_repo):
+        subprocess.run(["git", "mv", "README.md", "GUIDE.md"], cwd=temp_git_repo, capture_output=True, check=True)
+        _commit(temp_git_repo, "Rename readme", {})
+        git = GitIntegration(temp_git_repo)
+
+        assert git.get_structural_changes("HEAD").renamed == [("README.md", "GUIDE.md")]
+        assert git.get_structural_changes("HEAD~1").added == ["README.md"]
+        assert git.get_commit("no-such-ref") is None
+
+    def test_stuck_cat_file_times_out_and_restarts(self, temp_git_repo):
+        """A query on a hung process fails within the timeout; the next one restarts it."""
+        cat = CatFile(temp_git_repo, contents=False, timeout=0.5)
+        cat._proc = subprocess.Popen(
+            [sys.executable, "-c", "import time; time.sleep(60)"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE
+        )
+        stuck = cat._proc
+
+        started = time.monotonic()
+        assert cat.query("HEAD") is None
+        assert time.monotonic() - started < 5
+        assert stuck.wait(timeout=5) is not None  # Killed
+
+        found = cat.query("HEAD")
+        assert found is not None and found[1] == "commit"
+        assert cat.starts == 1
+        cat.close()
+
+
 # ============================================================================
 # HOOK INSTALLATION TESTS (Requires git)
 # ============================================================================
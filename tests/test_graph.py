@@ -162,4 +162,107 @@ class TestOrphanDetection:
         
         orphans = graph.find_orphans()
         
-        assert len(orphans) == 0
\ No newline at end of file
+        assert len(orphans) == 0
+
+class TestCodeIndex:
+    """Persistent AA-BB code index stored in graph.db."""
+
+    def test_projected_nodes_indexed(self, tmp_path):
+        """Projected node IDs are resolvable by code."""
+        from babel.presentation.codec import IDCodec
+
+        graph = GraphStore(tmp_path / "graph.db")
+        event = declare_purpose("Indexed purpose")
+        graph._project_event(event)
+
+        code = IDCodec().encode(f"purpose_{event.id}")
+        assert f"purpose_{event.id}" in graph.lookup_code(code)
+
+    def test_rebuild_indexes_event_ids(self, tmp_path):
+        """Rebuild registers event IDs as well as node IDs."""
+        from babel.presentation.codec import IDCodec
+
+        events = EventStore(tmp_path / "events.jsonl")
+        graph = GraphStore(tmp_path / "graph.db")
+        event = declare_purpose("Rebuilt purpose")
+        events.append(event)
+
+        graph.rebuild_from_events(events)
+
+        assert event.id in graph.lookup_code(IDCodec().encode(event.id))
+
+    def test_index_survives_reopen(self, tmp_path):
+        """Code index persists alongside the projection."""
+        from babel.presentation.codec import IDCodec
+
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.index_codes(["abc12345"])
+        graph.close()
+
+        reopened = GraphStore(tmp_path / "graph.db")
+        assert reopened.lookup_code(IDCodec().encode("abc12345")) == ["abc12345"]
+
+
+class TestTokenCounts:
+    """Summary token counts are computed once, at projection."""
+
+    def test_counts_stored_at_projection(self, tmp_path):
+        from babel.core.horizon import estimate_tokens
+
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.add_node(Node(id="d1", type="decision",
+                            content={"summary": "Use SQLite for the graph projection"}, event_id="e1"))
+
+        row = graph.conn.execute("SELECT tokens FROM nodes WHERE id = 'd1'").fetchone()
+        assert row['tokens'] == estimate_tokens("Use SQLite for the graph projection")
+        assert graph.get_token_counts(["d1", "missing"]) == {"d1": row['tokens']}
+
+    def test_missing_counts_filled_once(self, tmp_path):
+        """Nodes projected without a count are estimated and written back."""
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.add_node(Node(id="d1", type="decision", content={"summary": "Offline first"}, event_id="e1"))
+        graph.conn.execute("UPDATE nodes SET tokens = NULL")
+
+        counts = graph.get_token_counts(["d1"])
+
+        row = graph.conn.execute("SELECT tokens FROM nodes WHERE id = 'd1'").fetchone()
+        assert counts == {"d1": 2}
+        assert row['tokens'] == 2
+
+
+class TestMaterializedStats:
+    """Node/edge totals maintained by triggers in the stats table."""
+
+    def test_totals_track_inserts_replaces_and_deletes(self, tmp_path):
+        """Re-adding a known node or edge is not counted twice."""
+        graph = GraphStore(tmp_path / "graph.db")
+        graph.add_node(Node(id="a", type="decision", content={}, event_id="e1"))
+        graph.add_node(Node(id="b", type="decision", content={}, event_id="e2"))
+        graph.add_node(Node(id="a", type="decision", content={"v": 2}, event_id="e1"))
+        graph.add_edge(Edge(source_id="a", target_id="b", relation="supports", event_id="e3"))
+        graph.add_edge(Edge(source_id="a", target_id="b", relation="supports", event_id="e3"))
+
+        assert graph.stats()["nodes"] == 2
+        assert graph.stats()["edges"] == 1
+
+        graph.conn.execute("DELETE FROM edges")
+        graph.conn.execute("DELETE FROM nodes WHERE id = 'b'")
+        assert graph.stats()["nodes"] == 1
+        assert graph.stats()["edges"] == 0
+
+    def test_totals_seeded_for_existing_database(self, tmp_path):
+        """Databases without total rows get them on open and after rebuild."""
+        events = EventStore(tmp_path / "events.jsonl")
+        graph = GraphStore(tmp_path / "graph.db")
+        events.append(declare_purpose("Counted purpose"))
+        graph.rebuild_from_events(events)
+        assert graph.stats()["nodes"] == 1
+
+        graph.conn.execute("DELETE FROM stats WHERE key IN ('node_count', 'edge_count')")
+        graph.conn.commit()
+        graph.close()
+
+        reopened = GraphStore(tmp_path / "graph.db")
+        assert reopened.stats()["nodes"] == 1
+        assert reopened.count_nodes_by_type('purpose') == 1
+        assert reopened.count_nodes_by_type('decision') == 0
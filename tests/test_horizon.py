@@ -10,10 +10,11 @@ from babel.core.events import EventStore, EventType, declare_purpose, confirm_ar
 from babel.core.graph import GraphStore
 from babel.core.horizon import (
     EventHorizon, DigestBuilder, ArtifactDigest, CoherenceContext,
-    EventDigest,
+    EventDigest, ConflictIndex, CONFLICT_PATTERNS,
     _extract_keywords, _keywords_conflict, estimate_tokens,
     ARTIFACT_DIGEST_LENGTH,
 )
+from babel.core.budget import budget_from_env, pack_to_budget
 
 
 @pytest.fixture
@@ -334,6 +335,75 @@ class TestDigestBuilder:
         assert len(conflicts) == 0
 
 
+# ============================================================================
+# CONFLICT INDEX TESTS
+# ============================================================================
+
+def _random_keywords(rng, count):
+    """Keyword list mixing conflict markers with filler words."""
+    markers = sorted(set().union(*(c | a for c, a in CONFLICT_PATTERNS)))
+    filler = [f"word{i}" for i in range(500)]
+    return rng.sample(markers, rng.randint(0, 2)) + rng.sample(filler, count)
+
+
+class TestConflictIndex:
+    """Test inverted keyword index for constraint conflicts."""
+
+    def test_matches_pairwise_check(self):
+        """Index returns exactly the constraints _keywords_conflict flags, in order."""
+        import random
+        rng = random.Random(7)
+        constraints = {f"con_{i}": _random_keywords(rng, 3) for i in range(200)}
+        index = ConflictIndex(constraints)
+
+        for _ in range(300):
+            keywords = _random_keywords(rng, 4)
+            expected = [
+                cid for cid, kw in constraints.items()
+                if _keywords_conflict(set(keywords), set(kw))
+            ]
+            assert index.conflicts(keywords) == expected
+
+    def test_index_cached_by_constraint_set(self, tmp_stores):
+        """Equal constraint sets reuse one index; a changed set builds a new one."""
+        _, graph = tmp_stores
+        builder = DigestBuilder(graph)
+
+        first = builder.conflict_index({"con_1": ["offline"]})
+        again = builder.conflict_index({"con_1": ["offline"]})
+        changed = builder.conflict_index({"con_1": ["offline"], "con_2": ["simple"]})
+
+        assert first is again
+        assert changed is not first
+
+    def test_benchmark_10k_artifacts_1k_constraints(self, tmp_stores):
+        """10k artifacts x 1k constraints: indexed check stays well under a second."""
+        import random
+        import time
+        _, graph = tmp_stores
+        builder = DigestBuilder(graph)
+        rng = random.Random(42)
+        constraints = {f"con_{i}": _random_keywords(rng, 3) for i in range(1000)}
+        artifacts = [
+            ArtifactDigest(id=f"dec_{i}", artifact_type="decision",
+                           summary="", keywords=_random_keywords(rng, 4))
+            for i in range(10000)
+        ]
+
+        start = time.perf_counter()
+        index = builder.conflict_index(constraints)
+        results = [builder.check_conflicts_fast(a, index) for a in artifacts]
+        elapsed = time.perf_counter() - start
+
+        # Pairwise would be 10M checks; spot-check results against it
+        for artifact, conflicts in list(zip(artifacts, results))[:50]:
+            assert conflicts == [
+                cid for cid, kw in constraints.items()
+                if _keywords_conflict(set(artifact.keywords), set(kw))
+            ]
+        assert elapsed < 2.0, f"Indexed conflict check took {elapsed:.2f}s"
+
+
 # ============================================================================
 # EVENT HORIZON TESTS
 # ============================================================================
@@ -448,6 +518,49 @@ class TestTokenEstimation:
         """Handles empty text."""
         assert estimate_tokens("") == 0
 
+    def test_punctuation_and_ids_not_undercounted(self):
+        """Paths and IDs cost a token per separator, unlike chars/4."""
+        text = "babel/core/graph.py:123"
+
+        assert estimate_tokens(text) > len(text) // 4
+
+    def test_long_words_cost_more(self):
+        """Long words split into several tokens; common words are one."""
+        assert estimate_tokens("the") == 1
+        assert estimate_tokens("internationalization") == 3
+
+
+class TestPackToBudget:
+    """Prompt context is filled to a token budget by relevance."""
+
+    def test_skips_items_that_do_not_fit(self):
+        """A large item is skipped; smaller, less relevant ones use the headroom."""
+        items = [("a", 60), ("b", 50), ("c", 30), ("d", 10)]
+
+        selected, used = pack_to_budget(items, 100, cost=lambda i: i[1])
+
+        assert [name for name, _ in selected] == ["a", "c", "d"]
+        assert used == 100
+
+    def test_orders_by_score(self):
+        """With a score, the most relevant items are packed first."""
+        items = [("low", 1.0), ("high", 3.0), ("mid", 2.0), ("mid2", 2.0)]
+
+        selected, _ = pack_to_budget(items, 30, cost=lambda i: 10, score=lambda i: i[1])
+
+        assert [name for name, _ in selected] == ["high", "mid", "mid2"]
+
+    def test_nothing_fits(self):
+        assert pack_to_budget(["x"], 5, cost=lambda i: 10) == ([], 0)
+
+    def test_budget_from_env(self, monkeypatch):
+        monkeypatch.setenv("BABEL_TEST_TOKENS", "750")
+        assert budget_from_env("BABEL_TEST_TOKENS", 100) == 750
+
+        for invalid in ("", "lots", "0", "-5"):
+            monkeypatch.setenv("BABEL_TEST_TOKENS", invalid)
+            assert budget_from_env("BABEL_TEST_TOKENS", 100) == 100
+
 
 # ============================================================================
 # INTEGRATION TESTS
@@ -0,0 +1,274 @@
+"""
+Tests for LLM response cache — Repeated prompts cost zero tokens
+
+These tests validate:
+- Content addressing: provider, model, prompts and max_tokens all matter
+- Size bound with least-recently-used eviction
+- Hit/miss/tokens-saved metrics persisted across runs
+- HC3: Cache is optional (mock provider and BABEL_LLM_CACHE=0 bypass it)
+"""
+
+import asyncio
+import threading
+
+from babel.config import RemoteLLMConfig
+from babel.services.llm_cache import LLMCache, CachedProvider, with_response_cache
+from babel.services.providers import LLMProvider, LLMResponse, MockProvider
+
+
+class CountingProvider(LLMProvider):
+    """Provider that answers with a numbered response and counts calls."""
+
+    def __init__(self, provider="claude", model=""):
+        self.config = RemoteLLMConfig(provider=provider, model=model or None)
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    @property
+    def is_available(self) -> bool:
+        return True
+
+    def complete(self, system, user, max_tokens=2048):
+        with self._lock:
+            self.calls += 1
+            n = self.calls
+        return LLMResponse(text=f"response {n}: {user}", input_tokens=100, output_tokens=20)
+
+
+class TestCachedProvider:
+    """Identical prompts are answered from the cache."""
+
+    def test_repeated_prompt_costs_nothing(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        first = provider.complete("system", "user prompt", max_tokens=500)
+        second = provider.complete("system", "user prompt", max_tokens=500)
+
+        assert inner.calls == 1
+        assert second.text == first.text
+        assert second.cached is True
+        assert second.total_tokens == 0
+        assert first.cached is False
+        assert first.total_tokens == 120
+
+    def test_key_covers_prompts_and_max_tokens(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        provider.complete("system", "user")
+        provider.complete("other system", "user")
+        provider.complete("system", "other user")
+        provider.complete("system", "user", max_tokens=100)
+
+        assert inner.calls == 4
+
+    def test_key_covers_provider_and_model(self, tmp_path):
+        cache = LLMCache(tmp_path / "llm_cache.db")
+        claude = CountingProvider("claude", "claude-sonnet-4-20250514")
+        other_model = CountingProvider("claude", "claude-3-5-haiku-20241022")
+        openai = CountingProvider("openai", "")
+
+        for inner in (claude, other_model, openai):
+            CachedProvider(inner, cache).complete("system", "user")
+
+        assert (claude.calls, other_model.calls, openai.calls) == (1, 1, 1)
+
+    def test_persists_across_runs_with_metrics(self, tmp_path):
+        path = tmp_path / "llm_cache.db"
+        CachedProvider(CountingProvider(), LLMCache(path)).complete("s", "u")
+
+        inner = CountingProvider()
+        cache = LLMCache(path)
+        CachedProvider(inner, cache).complete("s", "u")
+
+        assert inner.calls == 0
+        stats = cache.stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["tokens_saved"] == 120
+
+    def test_failures_are_not_cached(self, tmp_path):
+        class FlakyProvider(CountingProvider):
+            def complete(self, system, user, max_tokens=2048):
+                self.calls += 1
+                if self.calls == 1:
+                    raise RuntimeError("timeout")
+                return LLMResponse(text="ok")
+
+        inner = FlakyProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        try:
+            provider.complete("s", "u")
+        except RuntimeError:
+            pass
+        assert provider.complete("s", "u").text == "ok"
+        assert inner.calls == 2
+
+    def test_streamed_completion_is_cached(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        first = list(provider.complete_stream("system", "user prompt"))
+        second = list(provider.complete_stream("system", "user prompt"))
+
+        assert inner.calls == 1
+        assert second[0] == first[0] == "response 1: user prompt"
+        assert second[-1].cached is True
+        assert second[-1].total_tokens == 0
+        assert provider.complete("system", "user prompt").cached is True
+
+    def test_async_completion_shares_cache(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        first = asyncio.run(provider.acomplete("system", "user prompt"))
+        second = asyncio.run(provider.acomplete("system", "user prompt"))
+
+        assert inner.calls == 1
+        assert second.text == first.text
+        assert second.cached is True
+        assert provider.complete("system", "user prompt").cached is True
+
+    def test_abandoned_stream_not_cached(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        stream = provider.complete_stream("system", "user prompt")
+        next(stream)
+        stream.close()
+
+        assert provider.cache.stats()["entries"] == 0
+
+    def test_passes_through_provider_attributes(self, tmp_path):
+        inner = CountingProvider("ollama", "llama3.2")
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        assert provider.is_available is True
+        assert provider.config is inner.config
+
+    def test_concurrent_completions(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        threads = [
+            threading.Thread(target=provider.complete, args=("s", f"prompt {i % 5}"))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert provider.cache.stats()["entries"] == 5
+        assert inner.calls >= 5
+
+    def test_empty_response_not_cached(self, tmp_path):
+        class EmptyProvider(CountingProvider):
+            def complete(self, system, user, max_tokens=2048):
+                self.calls += 1
+                return LLMResponse(text="  ")
+
+        inner = EmptyProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        provider.complete("s", "u")
+        provider.complete("s", "u")
+
+        assert inner.calls == 2
+        assert provider.cache.stats()["entries"] == 0
+
+    def test_cacheable_predicate(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(
+            inner, LLMCache(tmp_path / "llm_cache.db"),
+            cacheable=lambda response: response.text.endswith("keep")
+        )
+
+        provider.complete("s", "drop")
+        provider.complete("s", "drop")
+        provider.complete("s", "keep")
+        provider.complete("s", "keep")
+
+        assert inner.calls == 3
+
+    def test_invalidate_drops_entry(self, tmp_path):
+        inner = CountingProvider()
+        provider = CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db"))
+
+        provider.complete("s", "u", max_tokens=500)
+        assert provider.invalidate("s", "u", max_tokens=500) is True
+        assert provider.invalidate("s", "u", max_tokens=500) is False
+
+        assert provider.complete("s", "u", max_tokens=500).cached is False
+        assert inner.calls == 2
+
+    def test_unparseable_extraction_not_replayed(self, tmp_path):
+        from babel.services.extractor import Extractor
+
+        class TruncatingProvider(CountingProvider):
+            def complete(self, system, user, max_tokens=2048):
+                self.calls += 1
+                return LLMResponse(text='{"artifacts": [{"type": "decis')
+
+        inner = TruncatingProvider()
+        extractor = Extractor(provider=CachedProvider(inner, LLMCache(tmp_path / "llm_cache.db")))
+
+        assert extractor.extract("We chose SQLite", "src_1", allow_mock=False) == []
+        assert extractor.extract("We chose SQLite", "src_1", allow_mock=False) == []
+
+        assert inner.calls == 2
+        assert extractor.provider.cache.stats()["entries"] == 0
+
+
+class TestEviction:
+    """Cache stays within its size bound, evicting least recently used."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = LLMCache(tmp_path / "llm_cache.db", max_bytes=250)
+        for name in ("a", "b", "c"):
+            cache.put(name, LLMResponse(text=name * 100))
+        # Third entry exceeds the bound: oldest (a) is evicted
+        assert cache.get("a") is None
+        assert cache.get("b") is not None  # b is now most recently used
+
+        cache.put("d", LLMResponse(text="d" * 100))
+
+        assert cache.get("c") is None
+        assert cache.get("b") is not None
+        assert cache.get("d") is not None
+        assert cache.stats()["bytes"] <= 250
+
+    def test_oversized_response_not_stored(self, tmp_path):
+        cache = LLMCache(tmp_path / "llm_cache.db", max_bytes=10)
+        cache.put("big", LLMResponse(text="x" * 11))
+
+        assert cache.get("big") is None
+        assert cache.stats()["entries"] == 0
+
+
+class TestWithResponseCache:
+    """HC3: Cache wraps real providers only, and can be turned off."""
+
+    def test_wraps_real_provider(self, tmp_path):
+        provider = with_response_cache(CountingProvider(), tmp_path / "llm_cache.db")
+        assert isinstance(provider, CachedProvider)
+
+    def test_mock_provider_not_wrapped(self, tmp_path):
+        mock = MockProvider()
+        assert with_response_cache(mock, tmp_path / "llm_cache.db") is mock
+
+    def test_disabled_by_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("BABEL_LLM_CACHE", "0")
+        inner = CountingProvider()
+
+        assert with_response_cache(inner, tmp_path / "llm_cache.db") is inner
+        assert not (tmp_path / "llm_cache.db").exists()
+
+    def test_size_from_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("BABEL_LLM_CACHE_MB", "0.5")
+        provider = with_response_cache(CountingProvider(), tmp_path / "llm_cache.db")
+
+        assert provider.cache.max_bytes == 512 * 1024
@@ -6,9 +6,12 @@ Tests verify:
 - Priority scheduling
 - Rate limiting only applies to LLM calls (is_llm_call=True)
 - Parallel execution actually runs in parallel
+- Async LLM fan-out shares one event loop, capped at llm_concurrent
 - HC1 compliance (single writer pattern)
 """
 
+import asyncio
+import concurrent.futures
 import pytest
 import time
 import threading
@@ -18,7 +21,7 @@ from babel.orchestrator import (
     io_task, cpu_task, reset_orchestrator,
 )
 from babel.orchestrator.config import OrchestratorConfig
-from babel.orchestrator.pools import IOPool, CPUPool
+from babel.orchestrator.pools import IOPool, CPUPool, AsyncPool
 from babel.orchestrator.scheduler import PriorityScheduler
 from babel.orchestrator.aggregator import ResultAggregator
 
@@ -173,6 +176,92 @@ class TestIOPool:
         pool.shutdown()
 
 
+class TestAsyncPool:
+    """Test async pool: LLM coroutines on one event loop."""
+
+    def test_concurrency_capped_without_thread_per_call(self):
+        """Many calls share one loop, at most llm_concurrent at a time."""
+        pool = AsyncPool(OrchestratorConfig(llm_concurrent=5, llm_rate_limit=1000.0))
+        active = []
+        peak = []
+        threads_before = threading.active_count()
+
+        async def call(n):
+            active.append(n)
+            peak.append(len(active))
+            peak.append(threading.active_count())
+            await asyncio.sleep(0.2)
+            active.remove(n)
+            return n * 2
+
+        start = time.time()
+        results = pool.map(call, list(range(20)))
+        elapsed = time.time() - start
+
+        assert results == [n * 2 for n in range(20)]
+        assert max(peak[0::2]) == 5
+        assert max(peak[1::2]) <= threads_before  # No thread per call
+        assert elapsed < 1.5  # 4 waves of 0.2s, not 20
+        assert pool.stats().completed_tasks == 20
+        pool.shutdown()
+
+    def test_item_timeout_cancels_call(self, config):
+        """A call past its timeout is cancelled; other results are kept."""
+        pool = AsyncPool(config)
+        cancelled = []
+
+        async def call(delay):
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                cancelled.append(delay)
+                raise
+            return delay
+
+        results = pool.map(call, [0.0, 5.0, 0.0], item_timeout=0.2, return_exceptions=True)
+
+        assert results[0] == 0.0 and results[2] == 0.0
+        assert isinstance(results[1], asyncio.TimeoutError)
+        assert cancelled == [5.0]
+        pool.shutdown()
+
+    def test_map_timeout_cancels_outstanding_calls(self, config):
+        """Giving up on the whole map cancels its coroutines on the loop."""
+        pool = AsyncPool(config)
+        cancelled = threading.Event()
+
+        async def call(n):
+            try:
+                await asyncio.sleep(5.0)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        with pytest.raises(concurrent.futures.TimeoutError):
+            pool.map(call, [1, 2], timeout=0.2)
+
+        assert cancelled.wait(2.0)
+        pool.shutdown()
+
+    def test_failure_propagates_and_cancels_rest(self, config):
+        """Without return_exceptions the first failure is raised."""
+        pool = AsyncPool(config)
+        finished = []
+
+        async def call(n):
+            if n == 0:
+                raise ValueError("bad item")
+            await asyncio.sleep(1.0)
+            finished.append(n)
+
+        with pytest.raises(ValueError, match="bad item"):
+            pool.map(call, [0, 1, 2])
+
+        time.sleep(1.2)
+        assert finished == []
+        pool.shutdown()
+
+
 class TestCPUPool:
     """Test CPU pool functionality."""
 
@@ -348,3 +437,33 @@ class TestOrchestratorIntegration:
         # Further submissions should fail
         with pytest.raises(RuntimeError):
             orch.submit(io_task(fn=lambda: None))
+
+    def test_map_async(self, orchestrator):
+        """map_async awaits coroutines in order on the orchestrator's loop."""
+        async def double(x):
+            await asyncio.sleep(0.01)
+            return x * 2
+
+        assert orchestrator.map_async(double, [1, 2, 3]) == [2, 4, 6]
+        assert orchestrator.get_metrics()["async_pool"]["completed_tasks"] == 3
+
+    def test_map_async_sequential_when_disabled(self):
+        """Disabled orchestrator awaits one coroutine at a time."""
+        orch = TaskOrchestrator(OrchestratorConfig(enabled=False))
+        active = []
+        peak = []
+
+        async def call(x):
+            active.append(x)
+            peak.append(len(active))
+            await asyncio.sleep(0.01)
+            active.remove(x)
+            if x == 2:
+                raise ValueError("bad")
+            return x
+
+        results = orch.map_async(call, [1, 2, 3], return_exceptions=True)
+
+        assert results[0] == 1 and results[2] == 3
+        assert isinstance(results[1], ValueError)
+        assert max(peak) == 1
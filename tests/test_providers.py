@@ -10,13 +10,21 @@ These tests validate:
 All tests use mocks. No real LLM packages or API keys required.
 """
 
+import asyncio
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
 
 from babel.config import Config, LLMConfig, LocalLLMConfig, RemoteLLMConfig
+from babel.orchestrator.config import OrchestratorConfig
+from babel.orchestrator.pools import AsyncPool
 from babel.services.providers import (
-    LLMProvider, MockProvider,
+    LLMProvider, MockProvider, LoopBoundClient,
     get_provider, get_provider_status,
-    ClaudeProvider, OpenAIProvider, GeminiProvider
+    ClaudeProvider, OpenAIProvider, GeminiProvider, OllamaProvider
 )
 
 
@@ -57,6 +65,23 @@ class TestMockProvider:
         assert response.output_tokens == 0
         assert response.total_tokens == 0
 
+    def test_stream_yields_text_then_usage(self):
+        """Providers without streaming yield the whole text, then the response."""
+        from babel.services.providers import LLMResponse
+
+        items = list(MockProvider().complete_stream("system", "user"))
+
+        assert len(items) == 2
+        assert json.loads(items[0])["artifacts"] == []
+        assert isinstance(items[1], LLMResponse)
+        assert items[1].text == items[0]
+
+    def test_acomplete_without_native_async(self):
+        """Providers without an async client run complete() off the loop."""
+        response = asyncio.run(MockProvider().acomplete("system", "user"))
+
+        assert json.loads(response.text)["artifacts"] == []
+
 
 class TestProviderFactory:
     """get_provider() factory function."""
@@ -226,3 +251,348 @@ class TestProviderIntegration:
         )
 
         assert result is not None
+
+
+# ============================================================================
+# OLLAMA (LOCAL STUB SERVER)
+# ============================================================================
+
+class _StubOllama(BaseHTTPRequestHandler):
+    """Minimal Ollama API: /api/tags and /v1/chat/completions (HTTP/1.1)."""
+
+    protocol_version = "HTTP/1.1"
+    tags_delay = 0.0
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _send(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        time.sleep(self.server.tags_delay)
+        self._send(200, {"models": []})
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if request["model"] == "missing":
+            self._send(404, {"error": "model not found"})
+            return
+        time.sleep(self.server.completion_delay)
+        content = request["messages"][1]["content"].upper()
+        if request.get("stream"):
+            self._stream(content)
+            return
+        self._send(200, {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 3},
+        })
+
+    def _stream(self, content):
+        """Server-sent events, one word per chunk, usage on the last chunk."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+
+        words = content.split(" ")
+        events = [
+            {"choices": [{"delta": {"content": word if i == 0 else " " + word}}]}
+            for i, word in enumerate(words)
+        ]
+        events.append({"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": len(words)}})
+        for event in events:
+            self._chunk(f"data: {json.dumps(event)}\n\n".encode("utf-8"))
+            time.sleep(self.server.chunk_delay)
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+    def _chunk(self, data):
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+        self.wfile.flush()
+
+
+@pytest.fixture
+def ollama_server():
+    """Local stub Ollama server; yields its base URL and server object."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubOllama)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections = 0
+    server.tags_delay = 0.0
+    server.completion_delay = 0.0
+    server.chunk_delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", server
+    server.shutdown()
+    server.server_close()
+
+
+def _local_config(base_url, model="llama3.2"):
+    return Config(llm=LLMConfig(
+        active="local",
+        local=LocalLLMConfig(provider="ollama", model=model, base_url=base_url)
+    ))
+
+
+class TestOllamaProvider:
+    """Local provider: keep-alive pool, lazy probe, concurrent calls."""
+
+    def test_completes_over_one_kept_alive_connection(self, ollama_server):
+        base_url, server = ollama_server
+        provider = get_provider(_local_config(base_url))
+
+        first = provider.complete("system", "hello")
+        second = provider.complete("system", "again")
+
+        assert isinstance(provider, OllamaProvider)
+        assert (first.text, first.input_tokens, first.output_tokens) == ("HELLO", 7, 3)
+        assert second.text == "AGAIN"
+        assert server.connections == 1  # Probe and both completions reuse one socket
+
+    def test_get_provider_does_not_wait_for_probe(self, ollama_server):
+        base_url, server = ollama_server
+        server.tags_delay = 1.0
+
+        started = time.monotonic()
+        provider = get_provider(_local_config(base_url))
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.5
+        assert provider.is_available is True  # Waits for the probe only now
+
+    def test_probe_cached_per_server(self, ollama_server):
+        base_url, server = ollama_server
+        OllamaProvider(_local_config(base_url).llm.local).is_available
+
+        server.tags_delay = 5.0  # A second probe would be slow
+        started = time.monotonic()
+        assert OllamaProvider(_local_config(base_url).llm.local).is_available is True
+        assert time.monotonic() - started < 0.5
+
+    def test_concurrent_completions(self, ollama_server):
+        base_url, server = ollama_server
+        server.completion_delay = 0.2
+        provider = get_provider(_local_config(base_url))
+        assert provider.is_available
+
+        results = {}
+
+        def call(n):
+            results[n] = provider.complete("system", f"prompt {n}").text
+
+        threads = [threading.Thread(target=call, args=(n,)) for n in range(4)]
+        started = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == {n: f"PROMPT {n}" for n in range(4)}
+        assert time.monotonic() - started < 0.6  # Overlapped, not 4 x 0.2s
+
+    def test_missing_model_error(self, ollama_server):
+        base_url, _ = ollama_server
+        provider = get_provider(_local_config(base_url, model="missing"))
+
+        with pytest.raises(RuntimeError, match="ollama pull missing"):
+            provider.complete("system", "hello")
+
+    def test_unreachable_server_is_unavailable(self):
+        # Bind and close a socket to get a port nothing listens on
+        import socket
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        config = _local_config(f"http://127.0.0.1:{port}")
+
+        provider = get_provider(config)
+
+        assert provider.is_available is False
+        assert "not running" in get_provider_status(config)
+        with pytest.raises(RuntimeError, match="not running"):
+            provider.complete("system", "hello")
+
+
+class TestOllamaStreaming:
+    """Local provider streams chunks over the keep-alive pool."""
+
+    def test_streams_chunks_then_usage(self, ollama_server):
+        from babel.services.providers import LLMResponse
+        base_url, _ = ollama_server
+        provider = get_provider(_local_config(base_url))
+
+        items = list(provider.complete_stream("system", "hello streaming world"))
+
+        *chunks, final = items
+        assert chunks == ["HELLO", " STREAMING", " WORLD"]
+        assert isinstance(final, LLMResponse)
+        assert (final.text, final.input_tokens, final.output_tokens) == ("HELLO STREAMING WORLD", 7, 3)
+
+    def test_first_chunk_before_response_completes(self, ollama_server):
+        base_url, server = ollama_server
+        server.chunk_delay = 0.2
+        provider = get_provider(_local_config(base_url))
+        assert provider.is_available
+
+        started = time.monotonic()
+        stream = provider.complete_stream("system", "one two three four five")
+        first = next(stream)
+        first_at = time.monotonic() - started
+        list(stream)
+
+        assert first == "ONE"
+        assert first_at < 0.5  # The whole response takes ~6 x 0.2s
+
+    def test_connection_reused_after_stream(self, ollama_server):
+        base_url, server = ollama_server
+        provider = get_provider(_local_config(base_url))
+
+        list(provider.complete_stream("system", "hello"))
+        assert provider.complete("system", "again").text == "AGAIN"
+
+        assert server.connections == 1
+
+    def test_abandoned_stream_closes_connection(self, ollama_server):
+        base_url, server = ollama_server
+        provider = get_provider(_local_config(base_url))
+
+        stream = provider.complete_stream("system", "one two three")
+        next(stream)
+        stream.close()
+
+        assert provider.complete("system", "again").text == "AGAIN"
+
+    def test_missing_model_error(self, ollama_server):
+        base_url, _ = ollama_server
+        provider = get_provider(_local_config(base_url, model="missing"))
+
+        with pytest.raises(RuntimeError, match="ollama pull missing"):
+            list(provider.complete_stream("system", "hello"))
+
+
+class TestOllamaAsync:
+    """Local provider completes on the event loop over asyncio streams."""
+
+    def test_acomplete(self, ollama_server):
+        base_url, _ = ollama_server
+        provider = get_provider(_local_config(base_url))
+
+        response = asyncio.run(provider.acomplete("system", "hello"))
+
+        assert (response.text, response.input_tokens, response.output_tokens) == ("HELLO", 7, 3)
+
+    def test_concurrent_acomplete_on_one_loop(self, ollama_server):
+        base_url, server = ollama_server
+        server.completion_delay = 0.2
+        provider = get_provider(_local_config(base_url))
+        assert provider.is_available
+
+        async def run():
+            return await asyncio.gather(*(
+                provider.acomplete("system", f"prompt {n}") for n in range(8)
+            ))
+
+        started = time.monotonic()
+        responses = asyncio.run(run())
+
+        assert [r.text for r in responses] == [f"PROMPT {n}" for n in range(8)]
+        assert time.monotonic() - started < 1.0  # Overlapped, not 8 x 0.2s
+
+    def test_timeout_propagates(self, ollama_server):
+        base_url, server = ollama_server
+        server.completion_delay = 2.0
+        provider = get_provider(_local_config(base_url))
+        assert provider.is_available
+
+        async def run():
+            return await asyncio.wait_for(provider.acomplete("system", "hello"), 0.2)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(run())
+
+    def test_missing_model_error(self, ollama_server):
+        base_url, _ = ollama_server
+        provider = get_provider(_local_config(base_url, model="missing"))
+
+        with pytest.raises(RuntimeError, match="ollama pull missing"):
+            asyncio.run(provider.acomplete("system", "hello"))
+
+    def test_async_request_reads_chunked_body(self, ollama_server):
+        from babel.services.providers import async_http_request
+        base_url, _ = ollama_server
+        body = json.dumps({
+            "model": "llama3.2", "stream": True,
+            "messages": [{"role": "system", "content": ""}, {"role": "user", "content": "a b"}],
+        }).encode("utf-8")
+
+        status, _, data = asyncio.run(async_http_request(base_url, "POST", "/v1/chat/completions", body))
+
+        assert status == 200
+        assert data.endswith(b"data: [DONE]\n\n")
+        assert data.count(b"data: ") == 4  # Two words, usage, DONE
+
+
+class _FakeAsyncClient:
+    def __init__(self):
+        self.closed_on = None
+
+    async def close(self):
+        self.closed_on = asyncio.get_running_loop()
+
+
+class TestLoopBoundClient:
+    """SDK async clients are closed on their own loop, never leaked."""
+
+    def test_closed_when_asyncio_run_ends(self):
+        clients = []
+        slot = LoopBoundClient(lambda: clients.append(_FakeAsyncClient()) or clients[-1])
+
+        async def call():
+            assert await slot.get() is await slot.get()  # One client per loop
+            return asyncio.get_running_loop()
+
+        first_loop = asyncio.run(call())
+        assert clients[0].closed_on is first_loop
+
+        asyncio.run(call())
+        assert len(clients) == 2
+        assert clients[1].closed_on is not None
+
+    def test_replaced_client_closed_on_running_loop(self):
+        client = _FakeAsyncClient()
+        slot = LoopBoundClient(lambda: client)
+        pool = AsyncPool(OrchestratorConfig(llm_rate_limit=1000.0))
+        try:
+            pool.map(lambda _: slot.get(), [1])
+            slot._factory = _FakeAsyncClient
+
+            asyncio.run(slot.get())
+
+            deadline = time.monotonic() + 5
+            while client.closed_on is None and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert client.closed_on is pool._loop
+        finally:
+            pool.shutdown()
+
+    def test_closed_on_pool_shutdown(self):
+        client = _FakeAsyncClient()
+        slot = LoopBoundClient(lambda: client)
+        pool = AsyncPool(OrchestratorConfig(llm_rate_limit=1000.0))
+        pool.map(lambda _: slot.get(), [1])
+
+        pool.shutdown()
+
+        assert client.closed_on is pool._loop
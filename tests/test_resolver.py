@@ -0,0 +1,89 @@
+"""
+Tests for IDResolver and PrefixIndex — Index-backed ID resolution
+
+Validates:
+- Prefix queries answered from sorted indexes (unique vs ambiguous)
+- Graph prefix lookup on node ID, event ID, and ID after type prefix
+- Short code collisions surfaced as ambiguity
+"""
+
+from babel.core.resolver import IDResolver, PrefixIndex, ResolveStatus
+from babel.presentation.codec import IDCodec
+
+
+class TestPrefixIndex:
+    """Sorted array + bisect prefix matching."""
+
+    def test_unique_prefix_resolves(self):
+        """A prefix shared by one ID resolves to it."""
+        index = PrefixIndex(["abc123", "abd456", "xyz789"])
+        assert index.resolve("abc") == "abc123"
+
+    def test_ambiguous_prefix_returns_none(self):
+        """A prefix shared by several IDs is ambiguous."""
+        index = PrefixIndex(["abc123", "abc456"])
+        assert index.resolve("abc") is None
+        assert index.with_prefix("abc") == ["abc123", "abc456"]
+
+    def test_exact_match_wins_over_longer_ids(self):
+        """Exact ID resolves even when it prefixes other IDs."""
+        index = PrefixIndex(["abc", "abcdef"])
+        assert index.resolve("abc") == "abc"
+
+    def test_overlaps_matches_short_and_full_shas(self):
+        """Abbreviated and full SHAs overlap in both directions."""
+        full = "a1b2c3d4e5f60718293a4b5c6d7e8f9012345678"
+        index = PrefixIndex(["a1b2c3d", "ffff0000ffff0000ffff0000ffff0000ffff0000"])
+
+        assert index.overlaps(full)
+        assert index.overlaps("ffff0000")
+        assert not index.overlaps("0123456789")
+
+
+class TestGraphPrefixResolution:
+    """IDResolver prefix strategy via indexed range queries."""
+
+    def test_resolves_by_event_id_prefix(self, babel_factory):
+        """Event ID prefix finds the projected decision."""
+        node_id = babel_factory.add_decision("Use SQLite for storage")
+        event_id = node_id.split('_', 1)[1]
+
+        result = IDResolver(babel_factory.graph).resolve(event_id[:6])
+
+        assert result.status == ResolveStatus.FOUND
+        assert result.node.id == node_id
+
+    def test_type_filter_applies(self, babel_factory):
+        """Prefix matches outside the requested type are ignored."""
+        node_id = babel_factory.add_decision("Use SQLite for storage")
+        event_id = node_id.split('_', 1)[1]
+
+        result = IDResolver(babel_factory.graph).resolve(event_id[:6], artifact_type="constraint")
+
+        assert result.status == ResolveStatus.NOT_FOUND
+
+    def test_code_collision_is_ambiguous(self, babel_factory):
+        """Two nodes sharing a short code are reported as ambiguous."""
+        from babel.core.graph import Node
+
+        graph = babel_factory.graph
+        codec = IDCodec(index=graph)
+
+        # Birthday search for two decision IDs with the same code
+        seen = {}
+        for i in range(100000):
+            node_id = f"decision_{i:07x}"
+            code = codec.encode(node_id)
+            if code in seen:
+                first, second = seen[code], node_id
+                break
+            seen[code] = node_id
+
+        for node_id in (first, second):
+            graph.add_node(Node(id=node_id, type="decision",
+                                content={"summary": node_id}, event_id=node_id[9:]))
+
+        result = IDResolver(graph).resolve(code, codec=codec)
+
+        assert result.status == ResolveStatus.AMBIGUOUS
+        assert {n.id for n in result.candidates} == {first, second}
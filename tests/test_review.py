@@ -125,6 +125,76 @@ class TestGetPendingProposals:
         assert len(pending) == 0
 
 
+class TestPendingProposalIndex:
+    """Pending set maintained by ProposalTracker instead of per-call set diffs."""
+
+    def test_count_and_pages(self, review_command):
+        """Count is served from the index; pages are ordered oldest first."""
+        cmd, factory = review_command
+        ids = [factory.add_proposal(f"Proposal {i}") for i in range(5)]
+
+        assert cmd.proposals.count_pending() == 5
+        assert [e.id for e in cmd._get_pending_proposals(offset=1, limit=2)] == ids[1:3]
+        assert [e.id for e in cmd._get_pending_proposals(offset=4, limit=10)] == ids[4:]
+
+    def test_resolution_updates_loaded_index(self, review_command):
+        """Appends adjust the in-memory pending set without a reload."""
+        from babel.core.events import reject_proposal
+
+        cmd, factory = review_command
+        keep = factory.add_proposal("Keep me")
+        drop = factory.add_proposal("Drop me")
+        assert cmd.proposals.count_pending() == 2
+
+        factory.events.append(reject_proposal(proposal_id=drop, reason="No"))
+        later = factory.add_proposal("Added later")
+
+        assert [e.id for e in cmd._get_pending_proposals()] == [keep, later]
+
+    def test_snapshot_does_not_revive_resolved(self, review_command):
+        """A fresh tracker (new process) sees resolved proposals as resolved."""
+        from babel.core.events import reject_proposal
+        from babel.tracking.proposals import ProposalTracker
+
+        cmd, factory = review_command
+        resolved = factory.add_proposal("Resolved")
+        assert cmd.proposals.count_pending() == 1
+        factory.events.append(reject_proposal(proposal_id=resolved, reason="No"))
+        pending = factory.add_proposal("Still pending")
+
+        fresh = ProposalTracker(factory.events)
+
+        assert [e.id for e in fresh.get_pending()] == [pending]
+        assert not fresh.is_pending(resolved)
+
+    def test_list_paginates(self, review_command, capsys):
+        """--list --limit shows one page with a hint for the next one."""
+        cmd, factory = review_command
+        for i in range(3):
+            factory.add_proposal(f"Paged proposal {i}")
+
+        cmd.review(list_only=True, limit=2)
+
+        out = capsys.readouterr().out
+        assert "Paged proposal 1" in out
+        assert "Paged proposal 2" not in out
+        assert "3 pending" in out
+        assert "--offset 2" in out
+
+    def test_list_offset_past_end(self, review_command, capsys):
+        """An offset past the last proposal reports an empty page, not a range."""
+        cmd, factory = review_command
+        for i in range(3):
+            factory.add_proposal(f"Paged proposal {i}")
+
+        cmd.review(list_only=True, limit=10, offset=10)
+
+        out = capsys.readouterr().out
+        assert "No proposals at offset 10 (3 pending)" in out
+        assert "Showing" not in out
+        assert "--offset" not in out
+
+
 # =============================================================================
 # List Proposals Tests
 # =============================================================================
@@ -0,0 +1,144 @@
+"""
+Tests for ScanStore — Scan results, findings and exclusions in SQLite
+
+These tests validate:
+- Result cache is looked up by (scan type, context hash)
+- Finding status updates and deletions match IDs by prefix
+- Summary counts pending findings net of exclusions in one query
+- Legacy JSON state (scan_cache.json, findings/exclusions.json) is imported once
+"""
+
+import json
+
+from babel.services.scan_store import ScanStore
+
+
+def _finding(finding_id, status="pending", **extra):
+    data = {"title": f"Finding {finding_id}", "finding_id": finding_id, **extra}
+    if status != "pending":
+        data["status"] = status
+    return data
+
+
+class TestResults:
+    """Scan results are served only for the context they were computed for."""
+
+    def test_lookup_by_context_hash(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.put_result("health", "hash1", {"scan_type": "health", "summary": "ok"})
+
+        assert store.get_result("health", "hash1")["summary"] == "ok"
+        assert store.get_result("health", "hash2") is None
+        assert store.get_result("security", "hash1") is None
+
+    def test_replaces_previous_result(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.put_result("health", "hash1", {"summary": "old"})
+        store.put_result("health", "hash2", {"summary": "new"})
+
+        assert store.get_result("health", "hash1") is None
+        assert store.get_result("health", "hash2")["summary"] == "new"
+
+
+class TestFindings:
+    """Findings keep their order; status changes touch one row."""
+
+    def test_replace_and_load_in_order(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.replace_findings("clean", [_finding("bbb111"), _finding("aaa222", "validated")])
+
+        loaded = store.get_findings("clean")
+
+        assert [f["finding_id"] for f in loaded] == ["bbb111", "aaa222"]
+        assert [f["status"] for f in loaded] == ["pending", "validated"]
+        assert store.get_findings("security") == []
+
+    def test_update_status_by_prefix(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.replace_findings("clean", [_finding("abc123456789"), _finding("abd000000000")])
+
+        updated = store.update_status("clean", "abc12345", "resolved")
+
+        assert updated["finding_id"] == "abc123456789"
+        assert updated["status"] == "resolved"
+        assert store.count_by_status("clean") == {"pending": 1, "resolved": 1}
+        assert store.update_status("clean", "zzz", "resolved") is None
+
+    def test_delete_by_prefix(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.replace_findings("clean", [_finding("abc1"), _finding("abc2"), _finding("abd1")])
+
+        assert store.delete_findings("clean", "abc") == 2
+        assert [f["finding_id"] for f in store.get_findings("clean")] == ["abd1"]
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "scan" / "scan.db"
+        ScanStore(path).replace_findings("clean", [_finding("abc1")])
+
+        assert ScanStore(path).find_finding("clean", "abc")["finding_id"] == "abc1"
+
+
+class TestSummary:
+    """Status summary for all scan types in one query."""
+
+    def test_pending_net_of_resolved_and_excluded(self, tmp_path):
+        store = ScanStore(tmp_path / "scan" / "scan.db")
+        store.replace_findings("clean", [
+            _finding("aaaa11112222"),
+            _finding("bbbb11112222", "resolved"),
+            _finding("cccc11112222", "validated"),
+            _finding("dddd11112222"),
+        ])
+        store.add_exclusion("clean", "dddd1111", {"reason": "Re-export"})  # Short display ID
+        store.add_exclusion("clean", "eeee11112222", {"reason": "Gone"})
+        store.replace_findings("security", [_finding("ffff11112222")])
+
+        assert store.summary() == {
+            "clean": {"total": 4, "pending": 2, "excluded": 2},
+            "security": {"total": 1, "pending": 1, "excluded": 0},
+        }
+
+
+class TestLegacyImport:
+    """JSON state written by earlier versions is imported on first use."""
+
+    def test_imports_json_files(self, tmp_path):
+        babel_dir = tmp_path / ".babel"
+        clean_dir = babel_dir / "scan" / "clean"
+        clean_dir.mkdir(parents=True)
+        (babel_dir / "scan_cache.json").write_text(json.dumps({
+            "health": {"scan_type": "health", "context_hash": "h1", "summary": "cached"}
+        }))
+        (clean_dir / "findings.json").write_text(json.dumps({
+            "scan_type": "clean",
+            "findings": [_finding("abc1", "validated"), _finding("abc2")]
+        }))
+        (clean_dir / "exclusions.json").write_text(json.dumps({
+            "scan_type": "clean",
+            "exclusions": {"zzz1": {"reason": "False positive"}}
+        }))
+
+        store = ScanStore(babel_dir / "scan" / "scan.db", legacy_cache=babel_dir / "scan_cache.json")
+
+        assert store.get_result("health", "h1")["summary"] == "cached"
+        assert [f["status"] for f in store.get_findings("clean")] == ["validated", "pending"]
+        assert store.get_exclusions("clean") == {"zzz1": {"reason": "False positive"}}
+
+    def test_imports_only_once(self, tmp_path):
+        scan_dir = tmp_path / "scan"
+        (scan_dir / "clean").mkdir(parents=True)
+        (scan_dir / "clean" / "findings.json").write_text(json.dumps({"findings": [_finding("abc1")]}))
+        ScanStore(scan_dir / "scan.db").replace_findings("clean", [])
+
+        assert ScanStore(scan_dir / "scan.db").get_findings("clean") == []
+
+    def test_corrupt_legacy_files_ignored(self, tmp_path):
+        scan_dir = tmp_path / "scan"
+        (scan_dir / "clean").mkdir(parents=True)
+        (scan_dir / "clean" / "findings.json").write_text("{not json")
+        cache = tmp_path / "scan_cache.json"
+        cache.write_text("[]")
+
+        store = ScanStore(scan_dir / "scan.db", legacy_cache=cache)
+
+        assert store.summary() == {}
@@ -1197,6 +1197,94 @@ def process():
         assert len(loaded) == 1
         assert loaded[0].status == VERIFIED_TRUE
 
+    def _pending(self, file_path, symbol, line):
+        return ScanFinding(
+            severity="info",
+            category="unused-import",
+            title="Test",
+            description="Test",
+            suggestion="Test",
+            finding_id=f"test_{file_path.stem}_{symbol}",
+            file=str(file_path),
+            line=line,
+            symbol=symbol,
+            status="pending"
+        )
+
+    def _two_files(self, temp_python_file):
+        first = temp_python_file('''import json
+import os
+from typing import List, Dict
+
+def process() -> List:
+    return os.getcwd()
+''', name="first.py")
+        second = temp_python_file('''import re
+import sys
+
+# sys is only mentioned in a comment
+def run(:
+''', name="second.py")
+        return [
+            self._pending(first, "json", 1),
+            self._pending(first, "os", 2),
+            self._pending(first, "List", 3),
+            self._pending(first, "Dict", 3),
+            self._pending(second, "re", 1),
+            self._pending(second, "sys", 2),
+        ]
+
+    def test_parses_each_file_once(self, setup_scanner, temp_python_file):
+        """Findings are grouped by file: one read and one parse per file."""
+        import ast as ast_module
+        scanner, _, _ = setup_scanner
+        scanner._save_findings("clean", self._two_files(temp_python_file))
+
+        real_parse = ast_module.parse
+        with patch("babel.services.scanner.ast.parse", side_effect=real_parse) as parse:
+            result = scanner.verify_findings("clean")
+
+        assert parse.call_count == 2
+        assert result["files"] == 2
+        assert result["files_per_sec"] > 0
+        statuses = {f.symbol: f.status for f in result["findings"]}
+        assert statuses == {
+            "json": VERIFIED_TRUE,
+            "os": VERIFIED_FALSE,
+            "List": VERIFIED_FALSE,
+            "Dict": VERIFIED_TRUE,
+            "re": UNCERTAIN,  # File does not parse
+            "sys": UNCERTAIN,
+        }
+
+    def test_matches_single_finding_verification(self, setup_scanner, temp_python_file):
+        """Batched verification agrees with verifying each finding alone."""
+        scanner, _, _ = setup_scanner
+        findings = self._two_files(temp_python_file)
+        expected = [scanner._verify_single_finding(f) for f in findings]
+        scanner._save_findings("clean", findings)
+
+        result = scanner.verify_findings("clean")
+
+        assert [f.status for f in result["findings"]] == expected
+
+    def test_files_verified_on_cpu_pool(self, setup_scanner, temp_python_file):
+        """Files fan out across the orchestrator's process pool."""
+        from babel.orchestrator import TaskOrchestrator, OrchestratorConfig
+        scanner, _, _ = setup_scanner
+        findings = self._two_files(temp_python_file)
+        expected = [scanner._verify_single_finding(f) for f in findings]
+        scanner._save_findings("clean", findings)
+
+        orchestrator = TaskOrchestrator(OrchestratorConfig(cpu_workers=2))
+        try:
+            result = scanner.verify_findings("clean", orchestrator=orchestrator)
+        finally:
+            orchestrator.shutdown()
+
+        assert [f.status for f in result["findings"]] == expected
+        assert result["uncertain"] == 2
+
 
 # =============================================================================
 # Remove Verified Imports Tests
@@ -1376,6 +1464,158 @@ def foo():
         assert result["test_results"] is None
 
 
+# =============================================================================
+# Affected Tests
+# =============================================================================
+
+class TestAffectedTests:
+    """Test-file index and per-file test results."""
+
+    @pytest.fixture
+    def project_tests(self, setup_scanner):
+        scanner, _, _ = setup_scanner
+        tests_dir = scanner._project_root() / "tests"
+        (tests_dir / "unit").mkdir(parents=True)
+        for name in ("test_alpha.py", "beta_test.py", "unit/test_alpha.py", "unit/test_gamma.py", "conftest.py"):
+            (tests_dir / name).write_text("def test_ok():\n    pass\n")
+        return scanner, tests_dir
+
+    def test_index_built_once_from_project_tests(self, project_tests, tmp_path, monkeypatch):
+        scanner, tests_dir = project_tests
+        monkeypatch.chdir(tmp_path)  # Not the project directory
+
+        import babel.services.scanner as scanner_module
+        real_walk = scanner_module.os.walk
+        with patch.object(scanner_module.os, "walk", side_effect=real_walk) as walk:
+            alpha = scanner._find_test_files(["src/pkg/alpha.py"])
+            others = scanner._find_test_files(["beta.py", "gamma.py", "delta.py"])
+
+        assert walk.call_count == 1
+        assert sorted(alpha) == sorted([str(tests_dir / "test_alpha.py"), str(tests_dir / "unit" / "test_alpha.py")])
+        assert sorted(others) == sorted([str(tests_dir / "beta_test.py"), str(tests_dir / "unit" / "test_gamma.py")])
+
+    def test_failures_map_back_to_sources(self, project_tests):
+        scanner, tests_dir = project_tests
+
+        def run(test_file):
+            ok = "gamma" not in test_file
+            return {"success": ok, "tests_run": 1, "tests_passed": int(ok), "tests_failed": int(not ok),
+                    "output": "", "error": None if ok else "Tests failed (exit code 1)"}
+
+        with patch.object(scanner, "_run_test_file", side_effect=run):
+            result = scanner._run_affected_tests(["pkg/alpha.py", "pkg/gamma.py", "pkg/beta.py"])
+
+        assert result["success"] is False
+        assert result["tests_run"] == 4
+        assert result["tests_failed"] == 1
+        assert result["failed_test_files"] == [str(tests_dir / "unit" / "test_gamma.py")]
+        assert result["failed_sources"] == ["pkg/gamma.py"]
+
+    def test_test_files_run_in_parallel(self, project_tests):
+        import threading
+        import time
+        from babel.orchestrator import TaskOrchestrator, OrchestratorConfig
+        scanner, _ = project_tests
+        lock = threading.Lock()
+        running = [0, 0]  # current, peak
+
+        def run(test_file):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            time.sleep(0.2)
+            with lock:
+                running[0] -= 1
+            return {"success": True, "tests_run": 1, "tests_passed": 1, "tests_failed": 0,
+                    "output": "", "error": None}
+
+        orchestrator = TaskOrchestrator(OrchestratorConfig(io_workers=4))
+        try:
+            with patch.object(scanner, "_run_test_file", side_effect=run):
+                result = scanner._run_affected_tests(["alpha.py", "beta.py", "gamma.py"], orchestrator)
+        finally:
+            orchestrator.shutdown()
+
+        assert result["success"] is True
+        assert result["tests_passed"] == 4
+        assert running[1] > 1
+
+    @patch('babel.services.scanner.Scanner._git_create_checkpoint')
+    @patch('babel.services.scanner.Scanner._git_revert_checkpoint')
+    @patch('babel.services.scanner.Scanner._git_revert_files')
+    @patch('babel.services.scanner.Scanner._run_affected_tests')
+    def test_reverts_only_files_with_failing_tests(self, mock_tests, mock_revert_files, mock_revert,
+                                                   mock_checkpoint, setup_scanner, temp_python_file):
+        scanner, _, _ = setup_scanner
+        mock_checkpoint.return_value = "checkpoint123"
+        good = temp_python_file("import json\n\ndef a():\n    return 1\n", name="good.py")
+        bad = temp_python_file("import os\n\ndef b():\n    return 2\n", name="bad.py")
+        mock_tests.return_value = {
+            "success": False, "tests_run": 2, "tests_passed": 1, "tests_failed": 1,
+            "test_files": ["test_bad.py"], "failed_test_files": ["test_bad.py"],
+            "failed_sources": [str(bad)], "error": "Tests failed"
+        }
+        findings = [
+            ScanFinding(severity="info", category="unused-import", title="T", description="D",
+                        suggestion="S", finding_id=f"f_{path.stem}", file=str(path), line=1,
+                        symbol=symbol, status=VERIFIED_TRUE)
+            for path, symbol in ((good, "json"), (bad, "os"))
+        ]
+        scanner._save_findings("clean", findings)
+
+        passing = {"success": True, "tests_run": 1, "tests_passed": 1, "tests_failed": 0,
+                   "output": "", "error": None}
+        with patch.object(scanner, "_run_test_file", return_value=passing) as retest:
+            result = scanner.remove_verified_imports("clean", run_tests=True)
+
+        retest.assert_called_once_with("test_bad.py")
+        mock_revert.assert_not_called()
+        mock_revert_files.assert_called_once_with("checkpoint123", [str(bad)])
+        assert result["success"] is True
+        assert result["removed_count"] == 1
+        assert [f["file"] for f in result["files_modified"]] == [str(good)]
+        assert result["reverted_files"] == [str(bad)]
+        statuses = {f.symbol: f.status for f in scanner._load_findings("clean")}
+        assert statuses == {"json": "resolved", "os": VERIFIED_TRUE}
+
+    @patch('babel.services.scanner.Scanner._git_create_checkpoint')
+    @patch('babel.services.scanner.Scanner._git_revert_checkpoint')
+    @patch('babel.services.scanner.Scanner._git_revert_files')
+    @patch('babel.services.scanner.Scanner._run_affected_tests')
+    def test_reverts_all_when_tests_fail_after_partial_revert(self, mock_tests, mock_revert_files, mock_revert,
+                                                              mock_checkpoint, setup_scanner, temp_python_file):
+        """A kept removal that breaks another file's tests (e.g. a re-export) reverts everything."""
+        scanner, _, _ = setup_scanner
+        mock_checkpoint.return_value = "checkpoint123"
+        good = temp_python_file("import json\n\ndef a():\n    return 1\n", name="good.py")
+        bad = temp_python_file("import os\n\ndef b():\n    return 2\n", name="bad.py")
+        mock_tests.return_value = {
+            "success": False, "tests_run": 2, "tests_passed": 1, "tests_failed": 1,
+            "test_files": ["test_bad.py"], "failed_test_files": ["test_bad.py"],
+            "failed_sources": [str(bad)], "error": "Tests failed"
+        }
+        findings = [
+            ScanFinding(severity="info", category="unused-import", title="T", description="D",
+                        suggestion="S", finding_id=f"f_{path.stem}", file=str(path), line=1,
+                        symbol=symbol, status=VERIFIED_TRUE)
+            for path, symbol in ((good, "json"), (bad, "os"))
+        ]
+        scanner._save_findings("clean", findings)
+
+        failing = {"success": False, "tests_run": 1, "tests_passed": 0, "tests_failed": 1,
+                   "output": "", "error": "Tests failed (exit code 1)"}
+        with patch.object(scanner, "_run_test_file", return_value=failing):
+            result = scanner.remove_verified_imports("clean", run_tests=True)
+
+        mock_revert_files.assert_called_once_with("checkpoint123", [str(bad)])
+        mock_revert.assert_called_once_with("checkpoint123")
+        assert result["success"] is False
+        assert result["removed_count"] == 0
+        assert sorted(result["reverted_files"]) == sorted([str(good), str(bad)])
+        statuses = {f.symbol: f.status for f in scanner._load_findings("clean")}
+        assert statuses == {"json": VERIFIED_TRUE, "os": VERIFIED_TRUE}
+
+
 # =============================================================================
 # Finding Persistence Tests
 # =============================================================================
@@ -1755,3 +1995,246 @@ class TestCleanScan:
 
         # Finding should be excluded
         assert len(result.findings) == 0
+
+
+# =============================================================================
+# Containing Symbol Tests
+# =============================================================================
+
+from babel.core.graph import Node
+from babel.core.intervals import IntervalIndex
+
+
+def _add_symbol(graph, qualified_name, file_path, line_start, line_end):
+    graph.add_node(Node(
+        id=f"code_symbol_{qualified_name}",
+        type="code_symbol",
+        content={
+            "symbol_type": "function",
+            "name": qualified_name.split(".")[-1],
+            "qualified_name": qualified_name,
+            "file_path": file_path,
+            "line_start": line_start,
+            "line_end": line_end,
+            "docstring": "x" * 200,
+        },
+        event_id=f"evt_{qualified_name}"
+    ))
+
+
+class TestIntervalIndex:
+    """Innermost containing interval lookup."""
+
+    def test_nested_intervals_return_innermost(self):
+        index = IntervalIndex()
+        index.add("f", 1, 100, "Class")
+        index.add("f", 10, 20, "Class.method")
+        index.add("f", 30, 40, "Class.other")
+
+        assert index.innermost("f", 5) == "Class"
+        assert index.innermost("f", 10) == "Class.method"
+        assert index.innermost("f", 20) == "Class.method"
+        assert index.innermost("f", 21) == "Class"
+        assert index.innermost("f", 35) == "Class.other"
+        assert index.innermost("f", 100) == "Class"
+
+    def test_outside_and_unknown_key(self):
+        index = IntervalIndex()
+        index.add("f", 10, 20, "func")
+
+        assert index.innermost("f", 9) is None
+        assert index.innermost("f", 21) is None
+        assert index.innermost("g", 15) is None
+
+    def test_overlapping_prefers_smallest_then_first(self):
+        index = IntervalIndex()
+        index.add("f", 1, 10, "a")
+        index.add("f", 5, 15, "b")
+        index.add("f", 5, 14, "c")
+        index.add("f", 5, 14, "d")
+
+        assert index.innermost("f", 3) == "a"
+        assert index.innermost("f", 7) == "a"  # a spans 9 lines, c spans 9: a added first
+        assert index.innermost("f", 12) == "c"
+        assert index.innermost("f", 15) == "b"
+
+    def test_matches_linear_scan(self):
+        import random
+        rng = random.Random(7)
+        index = IntervalIndex()
+        intervals = []
+        for n in range(200):
+            start = rng.randint(1, 500)
+            end = start + rng.randint(0, 60)
+            intervals.append((start, end, n))
+            index.add("f", start, end, n)
+
+        for line in range(0, 570):
+            best, best_size = None, None
+            for start, end, n in intervals:
+                if start <= line <= end and (best_size is None or end - start < best_size):
+                    best, best_size = n, end - start
+            assert index.innermost("f", line) == best
+
+
+class TestFindContainingSymbol:
+    """Findings are linked to the smallest symbol containing their line."""
+
+    def test_links_findings_to_innermost_symbol(self, setup_scanner):
+        scanner, _, graph = setup_scanner
+        _add_symbol(graph, "pkg.mod.Service", "pkg/mod.py", 5, 50)
+        _add_symbol(graph, "pkg.mod.Service.run", "pkg/mod.py", 10, 20)
+        _add_symbol(graph, "pkg.other.run", "pkg/other.py", 10, 20)
+
+        findings = [
+            ScanFinding(severity="info", category="clean", title="t", description="d",
+                        suggestion="s", file=file, line=line)
+            for file, line in [
+                ("pkg/mod.py", 15),
+                ("/home/user/project/pkg/mod.py", 30),  # Absolute path from ruff
+                ("./pkg/other.py", 12),
+                ("pkg/mod.py", 2),
+                ("pkg/unknown.py", 12),
+            ]
+        ]
+        scanner._link_findings_to_symbols(findings)
+
+        assert [f.containing_symbol for f in findings] == [
+            "pkg.mod.Service.run", "pkg.mod.Service", "pkg.other.run", None, None
+        ]
+
+    def test_paths_compared_by_component(self, setup_scanner):
+        scanner, _, graph = setup_scanner
+        _add_symbol(graph, "mod.func", "mod.py", 1, 10)
+        _add_symbol(graph, "pkg.mod.func", "pkg\\mod.py", 1, 10)  # Indexed on Windows
+
+        assert scanner._find_containing_symbol("pkg/mod.py", 5) == "pkg.mod.func"
+        assert scanner._find_containing_symbol("/abs/mod.py", 5) == "mod.func"
+        assert scanner._find_containing_symbol("xmod.py", 5) is None
+
+    def test_symbol_ranges_skip_incomplete_nodes(self, setup_scanner):
+        _, _, graph = setup_scanner
+        _add_symbol(graph, "mod.func", "mod.py", 1, 10)
+        graph.add_node(Node(id="code_symbol_bad", type="code_symbol",
+                            content={"qualified_name": "bad", "file_path": "mod.py"},
+                            event_id="evt_bad"))
+
+        assert graph.get_symbol_ranges() == [("mod.py", 1, 10, "mod.func")]
+
+
+# =============================================================================
+# Incremental Clean Scan Tests
+# =============================================================================
+
+from pathlib import Path
+
+
+class TestIncrementalCleanScan:
+    """Clean scan only hands ruff the files that changed since the last scan."""
+
+    @pytest.fixture
+    def fake_ruff(self, tmp_path, monkeypatch):
+        """Working tree plus a stand-in ruff reporting each `import unused_*`."""
+        root = tmp_path / "tree"
+        (root / "pkg").mkdir(parents=True)
+        monkeypatch.chdir(root)
+        calls = []
+
+        def run(cmd, capture_output, text, timeout, cwd):
+            paths = [p for p in cmd[cmd.index("--select") + 2:] if p != "--force-exclude"]
+            calls.append(paths)
+            if paths == ["."]:
+                paths = [str(p) for p in sorted(Path(cwd).rglob("*.py"))]
+            findings = []
+            for path in paths:
+                for row, line in enumerate(Path(path).read_text().splitlines(), 1):
+                    if line.startswith("import unused_"):
+                        findings.append({
+                            "code": "F401",
+                            "message": f"`{line.split()[1]}` imported but unused",
+                            "filename": str(Path(path).resolve()),
+                            "location": {"row": row, "column": 1},
+                            "fix": {"applicability": "safe", "edits": []},
+                        })
+            return Mock(stdout=json.dumps(findings), stderr="", returncode=1 if findings else 0)
+
+        with patch("shutil.which", return_value="/usr/bin/ruff"), \
+                patch("subprocess.run", side_effect=run):
+            yield root, calls
+
+    def test_rechecks_only_changed_files(self, setup_scanner, fake_ruff):
+        scanner, _, _ = setup_scanner
+        root, calls = fake_ruff
+        (root / "pkg" / "a.py").write_text("import unused_a\n")
+        (root / "pkg" / "b.py").write_text("import os\nimport unused_b\n")
+        (root / "pkg" / "c.py").write_text("x = 1\n")
+
+        first = scanner._scan_clean()
+        assert calls == [["."]]
+        assert sorted(f.symbol for f in first.findings) == ["unused_a", "unused_b"]
+
+        (root / "pkg" / "c.py").write_text("import unused_c\n")
+        (root / "pkg" / "d.py").write_text("import unused_d\n")
+        second = scanner._scan_clean()
+
+        assert calls[1] == [str(root / "pkg" / "c.py"), str(root / "pkg" / "d.py")]
+        assert sorted(f.symbol for f in second.findings) == [
+            "unused_a", "unused_b", "unused_c", "unused_d"
+        ]
+        # Cached findings keep their IDs
+        first_ids = {f.symbol: f.finding_id for f in first.findings}
+        assert all(
+            f.finding_id == first_ids[f.symbol]
+            for f in second.findings if f.symbol in first_ids
+        )
+
+    def test_unchanged_tree_skips_ruff(self, setup_scanner, fake_ruff):
+        scanner, _, _ = setup_scanner
+        root, calls = fake_ruff
+        (root / "pkg" / "a.py").write_text("import unused_a\n")
+
+        scanner._scan_clean()
+        result = scanner._scan_clean()
+
+        assert calls == [["."]]
+        assert [f.symbol for f in result.findings] == ["unused_a"]
+        assert "0 changed file(s)" in result.summary
+
+    def test_fixed_and_deleted_files_drop_findings(self, setup_scanner, fake_ruff):
+        scanner, _, _ = setup_scanner
+        root, calls = fake_ruff
+        (root / "pkg" / "a.py").write_text("import unused_a\n")
+        (root / "pkg" / "b.py").write_text("import unused_b\n")
+        scanner._scan_clean()
+
+        (root / "pkg" / "a.py").write_text("x = 1\n")
+        (root / "pkg" / "b.py").unlink()
+        result = scanner._scan_clean()
+
+        assert calls[1] == [str(root / "pkg" / "a.py")]
+        assert result.findings == []
+        assert scanner._load_findings("clean") == []
+
+    def test_exclusions_apply_to_cached_findings(self, setup_scanner, fake_ruff):
+        scanner, _, _ = setup_scanner
+        root, _ = fake_ruff
+        (root / "pkg" / "a.py").write_text("import unused_a\n")
+        (root / "pkg" / "b.py").write_text("import unused_b\n")
+        first = scanner._scan_clean()
+        excluded = next(f for f in first.findings if f.symbol == "unused_a")
+
+        scanner._save_exclusions("clean", {excluded.finding_id: {"reason": "Re-export"}})
+        result = scanner._scan_clean()
+
+        assert [f.symbol for f in result.findings] == ["unused_b"]
+
+    def test_rule_change_forces_full_scan(self, setup_scanner, fake_ruff):
+        scanner, _, _ = setup_scanner
+        root, calls = fake_ruff
+        (root / "pkg" / "a.py").write_text("import unused_a\n")
+
+        scanner._scan_clean()
+        (root / "pyproject.toml").write_text("[tool.ruff]\nline-length = 100\n")
+        scanner._scan_clean()
+
+        assert calls == [["."], ["."]]
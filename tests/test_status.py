@@ -500,6 +500,7 @@ class TestStatusIntegration:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.5
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -532,6 +533,7 @@ class TestStatusIntegration:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.5
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -561,6 +563,7 @@ class TestStatusIntegration:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.5
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -591,6 +594,7 @@ class TestStatusIntegration:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.5
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -603,6 +607,98 @@ class TestStatusIntegration:
         assert "{" in captured.out or "project" in captured.out.lower()
 
 
+# =============================================================================
+# Materialized Summary Tests
+# =============================================================================
+
+class TestMaterializedSummary:
+    """Status reads a persisted summary refreshed by watermark check."""
+
+    def _fresh_command(self, cmd):
+        """New StatusCommand on the same CLI (simulates a new process)."""
+        other = StatusCommand.__new__(StatusCommand)
+        other._cli = cmd._cli
+        return other
+
+    def test_unchanged_project_reuses_summary(self, status_command):
+        """Derived sections are not recomputed while events are unchanged."""
+        cmd, factory = status_command
+        factory.add_purpose("Stable purpose")
+
+        first = cmd._collect_status_data()
+        second = self._fresh_command(cmd)._collect_status_data()
+
+        assert cmd._cli.tensions.count_open.call_count == 1
+        assert second["events"] == first["events"]
+
+    def test_appended_events_refresh_summary(self, status_command):
+        """New events are folded in; only sections they feed are recomputed."""
+        cmd, factory = status_command
+        factory.add_purpose("First purpose")
+        before = cmd._collect_status_data()
+
+        factory.add_purpose("Second purpose")
+        after = self._fresh_command(cmd)._collect_status_data()
+
+        assert after["events"]["total"] == before["events"]["total"] + 1
+        assert cmd._summary()["purposes"] == 2
+        assert cmd._cli.tensions.count_open.call_count == 1  # Purposes don't feed tensions
+
+    def test_section_recomputed_for_its_event_types(self, status_command):
+        """A challenge recomputes open tensions but not unrelated sections."""
+        from babel.core.events import raise_challenge
+
+        cmd, factory = status_command
+        purpose_id = factory.add_purpose("Purpose")
+        cmd._collect_status_data()
+        cmd._cli.tensions.count_open.return_value = 1
+        questions_calls = cmd._cli.questions.count_open.call_count
+
+        factory.events.append(raise_challenge(purpose_id, "purpose", "Too vague"))
+        summary = self._fresh_command(cmd)._summary()
+
+        assert summary["open_tensions"] == 1
+        assert cmd._cli.tensions.count_open.call_count == 2
+        assert cmd._cli.questions.count_open.call_count == questions_calls
+
+    def test_vocabulary_change_recomputes_principles(self, status_command):
+        """Principles also depend on vocabulary.json, outside the event log."""
+        cmd, factory = status_command
+        cmd._collect_status_data()
+
+        vocabulary = factory.babel_dir / "shared" / "vocabulary.json"
+        vocabulary.parent.mkdir(parents=True, exist_ok=True)
+        vocabulary.write_text("{}")
+        with patch.object(StatusCommand, "_compute_principles_section",
+                          return_value={"principles": []}) as principles:
+            self._fresh_command(cmd)._summary()
+
+        principles.assert_called_once()
+        assert cmd._cli.tensions.count_open.call_count == 1
+
+    def test_last_coherence_checkpoint_folded(self, status_command):
+        """Latest coherence checkpoint is tracked without re-reading history."""
+        from babel.core.events import record_coherence_check
+
+        cmd, factory = status_command
+        first = record_coherence_check("cp1", "coherent", {}, [], [], "manual")
+        factory.events.append(first)
+        assert cmd._summary()["coherence_checkpoint"]["id"] == first.id
+
+        second = record_coherence_check("cp2", "tension", {}, [], [], "manual")
+        factory.events.append(second)
+        assert self._fresh_command(cmd)._summary()["coherence_checkpoint"]["id"] == second.id
+
+    def test_refresh_bypasses_summary(self, status_command):
+        """--force recomputes even when the watermark is unchanged."""
+        cmd, factory = status_command
+
+        cmd._collect_status_data()
+        cmd._collect_status_data(refresh=True)
+
+        assert cmd._cli.tensions.count_open.call_count == 2
+
+
 # =============================================================================
 # Edge Cases
 # =============================================================================
@@ -627,6 +723,7 @@ class TestEdgeCases:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.0
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -659,6 +756,7 @@ class TestEdgeCases:
                     mock_result.warning_count = 0
                     mock_result.violation_count = 0
                     mock_result.score = 0.5
+                    mock_result.checks = []
 
                     mock_checker = Mock()
                     mock_checker.check_all.return_value = mock_result
@@ -15,6 +15,7 @@ import pytest
 from unittest.mock import Mock, patch
 from dataclasses import asdict
 
+from babel.commands import suggest_links as suggest_links_module
 from babel.commands.suggest_links import SuggestLinksCommand, LinkSuggestion
 
 
@@ -299,6 +300,73 @@ class TestFindMatches:
             assert s.score > 0
 
 
+class TestFindAllMatches:
+    """Test _find_all_matches batch scoring."""
+
+    COMMITS = [
+        {'sha': 'c1', 'message': 'Implement SQLite storage', 'date': ''},
+        {'sha': 'c2', 'message': 'Enforce API rate limits in cache layer', 'date': ''},
+        {'sha': 'c3', 'message': 'Bump version', 'date': ''},
+    ]
+    DECISIONS = [
+        {'id': 'd1', 'summary': 'Use SQLite for storage', 'type': 'decision', 'domain': ''},
+        {'id': 'd2', 'summary': 'Rate limit API calls', 'type': 'constraint', 'domain': 'cache'},
+        {'id': 'd3', 'summary': 'Prefer explicit configuration', 'type': 'principle', 'domain': ''},
+        {'id': 'd4', 'summary': 'Add caching for storage reads', 'type': 'decision', 'domain': 'CACHE'},
+    ]
+
+    @staticmethod
+    def _expected(command, min_score):
+        """Pairwise reference (_calculate_match_score), commit then decision order."""
+        expected = []
+        for commit in TestFindAllMatches.COMMITS:
+            for decision in TestFindAllMatches.DECISIONS:
+                score, reasons = command._calculate_match_score(commit, decision)
+                if score >= min_score:
+                    expected.append((commit['sha'], decision['id'], score, reasons))
+        return expected
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_matches_pairwise_scoring(self, suggest_command, monkeypatch, numpy_available):
+        """Batch scores and reasons equal the per-pair calculation."""
+        if numpy_available and not suggest_links_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(suggest_links_module, "NUMPY_AVAILABLE", numpy_available)
+
+        for min_score in (0.0, 0.1, 0.3, 0.5):
+            suggestions, total = suggest_command._find_all_matches(
+                self.COMMITS, self.DECISIONS, min_score
+            )
+            expected = self._expected(suggest_command, min_score)
+
+            assert [(s.commit_sha, s.decision_id, s.score, s.reasons) for s in suggestions] == expected
+            assert total == len(expected)
+
+    @pytest.mark.parametrize("numpy_available", [True, False])
+    def test_per_commit_keeps_best(self, suggest_command, monkeypatch, numpy_available):
+        """per_commit keeps the highest scores per commit but counts all matches."""
+        if numpy_available and not suggest_links_module.NUMPY_AVAILABLE:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(suggest_links_module, "NUMPY_AVAILABLE", numpy_available)
+
+        suggestions, total = suggest_command._find_all_matches(
+            self.COMMITS, self.DECISIONS, 0.0, per_commit=2
+        )
+
+        assert total == len(self.COMMITS) * len(self.DECISIONS)
+        for commit in self.COMMITS:
+            kept = [s for s in suggestions if s.commit_sha == commit['sha']]
+            expected = sorted(
+                (e for e in self._expected(suggest_command, 0.0) if e[0] == commit['sha']),
+                key=lambda e: e[2], reverse=True
+            )[:2]
+            assert [(s.decision_id, s.score) for s in kept] == [(e[1], e[2]) for e in expected]
+
+    def test_empty_inputs(self, suggest_command):
+        assert suggest_command._find_all_matches([], self.DECISIONS, 0.3) == ([], 0)
+        assert suggest_command._find_all_matches(self.COMMITS, [], 0.3) == ([], 0)
+
+
 # =============================================================================
 # Get Linkable Decisions Tests
 # =============================================================================
@@ -438,3 +438,29 @@ class TestDecisionValidationModel:
         
         validation = tracker.get_validation("d1")
         assert validation.endorsers == {"alice", "bob"}
+
+
+class TestIncrementalState:
+    """Validation state follows appends and survives process restarts."""
+
+    def test_status_updates_without_invalidation(self, tracker):
+        """Endorse + evidence reach VALIDATED with no cache invalidation."""
+        tracker.register_decision("d1", "Use SQLite")
+        assert tracker.get_status("d1") == ValidationStatus.PROPOSED
+
+        tracker.endorse("d1", "alice")
+        tracker.add_evidence("d1", "Load test passed")
+
+        assert tracker.get_status("d1") == ValidationStatus.VALIDATED
+
+    def test_snapshot_restores_state(self, events):
+        """A new tracker restores state from snapshot without duplicates."""
+        first = ValidationTracker(events)
+        first.endorse("d1", "alice")
+        first.get_status("d1")  # Loads and snapshots
+
+        second = ValidationTracker(DualEventStore(events.project_dir))
+        validation = second.get_validation("d1")
+
+        assert validation.endorsement_count == 1
+        assert validation.summary is None
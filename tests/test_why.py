@@ -397,6 +397,62 @@ class TestBuildArtifactData:
         assert data['via_artifact'] == 'AB-CD'
 
 
+# =============================================================================
+# Prompt Context Packing Tests
+# =============================================================================
+
+class TestPackContext:
+    """Test _pack_context fills the synthesis token budget by relevance."""
+
+    def test_returns_all_matches_for_packing(self, why_command):
+        """Context gathering no longer cuts at a fixed count."""
+        cmd, factory = why_command
+        for n in range(15):
+            factory.add_decision(summary=f"Storage decision {n}", link_to_purpose=False)
+
+        assert len(cmd._gather_context("storage")) == 15
+
+    def test_packs_most_relevant_within_budget(self, why_command):
+        """Packed artifacts are the highest-scored ones that fit the budget."""
+        cmd, factory = why_command
+        for n in range(15):
+            factory.add_decision(summary=f"Storage decision {n}", link_to_purpose=False)
+        artifacts = cmd._gather_context("storage decision")
+        cmd.context_token_budget = 40
+
+        packed = cmd._pack_context(artifacts)
+
+        assert 1 < len(packed) < len(artifacts)
+        assert packed == artifacts[:len(packed)]
+
+    def test_relationships_count_toward_budget(self, why_command):
+        """Related summaries shown in the prompt are part of an artifact's cost."""
+        cmd, factory = why_command
+        decision_id = factory.add_decision(summary="Storage engine choice", link_to_purpose=False)
+        constraint_id = factory.add_constraint(
+            summary="Storage must stay under fifty megabytes on every supported platform",
+            link_to_purpose=False
+        )
+        factory.link_artifacts(decision_id, constraint_id, relation="constrains")
+        artifacts = [a for a in cmd._gather_context("engine") if a['match_type'] == 'direct']
+        alone = cmd._build_artifact_data(artifacts[0]['node'], score=1)
+        alone['relationships'] = []
+
+        cmd.context_token_budget = 15
+
+        assert cmd._pack_context([alone]) == [alone]
+        assert cmd._pack_context(artifacts) == []
+
+    def test_budget_from_environment(self, why_command, monkeypatch):
+        """BABEL_WHY_CONTEXT_TOKENS overrides the default budget."""
+        cmd, _ = why_command
+        assert cmd.context_token_budget == WhyCommand.DEFAULT_CONTEXT_TOKEN_BUDGET
+
+        monkeypatch.setenv("BABEL_WHY_CONTEXT_TOKENS", "500")
+
+        assert WhyCommand(cmd._cli).context_token_budget == 500
+
+
 # =============================================================================
 # Find Decision Node Tests
 # =============================================================================